@@ -0,0 +1,202 @@
+"""
+Benchmark: detectarea conflictelor pentru o sesiune completă de examene
+
+Compară implementarea anterioară a ScheduleService.check_conflicts (comparare
+pe perechi, o interogare Room/Teacher per conflict găsit, o apelare per sală și
+per cadru didactic) cu detectorul cu linie de baleiere, care găsește într-o
+singură trecere conflictele pentru toate sălile, cadrele didactice și grupele,
+și cu citirea din indexul persistent al conflictelor (schedule_conflicts), folosit
+acum de check_conflicts. Măsoară și costul actualizării incrementale a indexului
+la modificarea unei planificări.
+
+Rulare (din rădăcina proiectului):
+
+    python benchmarks/bench_conflict_detection.py
+
+Dimensiunea se configurează prin BENCH_SCHEDULES, BENCH_DAYS, BENCH_ROOMS,
+BENCH_TEACHERS și BENCH_GROUPS.
+"""
+import os
+import random
+import sys
+import tempfile
+import time as timer
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.models.schedule import schedule_assistants
+from src.common.services import ScheduleService, rebuild_conflicts
+from src.common.services.conflict_detection import detect_conflicts
+
+SCHEDULES = int(os.environ.get("BENCH_SCHEDULES", 3000))
+DAYS = int(os.environ.get("BENCH_DAYS", 20))
+ROOMS = int(os.environ.get("BENCH_ROOMS", 40))
+TEACHERS = int(os.environ.get("BENCH_TEACHERS", 250))
+GROUPS = int(os.environ.get("BENCH_GROUPS", 150))
+
+def legacy_check_conflicts(db_session, date_val=None, teacher_id=None, room_id=None):
+    """Implementarea anterioară a ScheduleService.check_conflicts (pentru comparație)"""
+    conflicts = []
+    query = db_session.query(Schedule)
+
+    if date_val:
+        query = query.filter(Schedule.date == date_val)
+
+    schedules = query.all()
+
+    if room_id:
+        room_schedules = [s for s in schedules if s.room_id == room_id]
+
+        for i in range(len(room_schedules)):
+            for j in range(i + 1, len(room_schedules)):
+                s1 = room_schedules[i]
+                s2 = room_schedules[j]
+
+                if (s1.start_time and s1.end_time and s2.start_time and s2.end_time and
+                    ((s1.start_time <= s2.start_time and s1.end_time > s2.start_time) or
+                     (s1.start_time < s2.end_time and s1.end_time >= s2.end_time) or
+                     (s1.start_time >= s2.start_time and s1.end_time <= s2.end_time))):
+
+                    room = db_session.query(Room).filter(Room.id == room_id).first()
+                    conflicts.append(('room', room_id, s1.date, min(s1.id, s2.id), max(s1.id, s2.id), room.name))
+
+    if teacher_id:
+        teacher_schedules = [s for s in schedules if s.teacher_id == teacher_id or teacher_id in [a.id for a in s.assistants]]
+
+        for i in range(len(teacher_schedules)):
+            for j in range(i + 1, len(teacher_schedules)):
+                s1 = teacher_schedules[i]
+                s2 = teacher_schedules[j]
+
+                if (s1.start_time and s1.end_time and s2.start_time and s2.end_time and
+                    ((s1.start_time <= s2.start_time and s1.end_time > s2.start_time) or
+                     (s1.start_time < s2.end_time and s1.end_time >= s2.end_time) or
+                     (s1.start_time >= s2.start_time and s1.end_time <= s2.end_time))):
+
+                    teacher = db_session.query(Teacher).filter(Teacher.id == teacher_id).first()
+                    conflicts.append(('teacher', teacher_id, s1.date, min(s1.id, s2.id), max(s1.id, s2.id), teacher.full_name))
+
+    return conflicts
+
+def seed(engine):
+    rng = random.Random(42)
+    session = sessionmaker(bind=engine)()
+
+    session.execute(insert(Room), [
+        {'name': f"C{i}", 'short_name': f"C{i}", 'capacity': 40, 'building': "C", 'floor': 1} for i in range(ROOMS)
+    ])
+    session.execute(insert(Teacher), [
+        {'first_name': f"Prenume{i}", 'last_name': "Nume", 'department': "Calculatoare", 'email': f"cd{i}@usv.ro"} for i in range(TEACHERS)
+    ])
+    session.execute(insert(Group), [
+        {'name': f"G{i}", 'study_year': 3, 'specialization': "Calculatoare", 'number_of_students': 25} for i in range(GROUPS)
+    ])
+    session.execute(insert(Subject), [
+        {'name': f"Disciplina {i}", 'short_name': f"D{i}", 'credits': 5, 'semester': 1} for i in range(GROUPS)
+    ])
+
+    schedules = []
+    assistants = []
+    for schedule_id in range(1, SCHEDULES + 1):
+        start = rng.randrange(8, 18)
+        schedules.append({
+            'id': schedule_id,
+            'subject_id': rng.randrange(1, GROUPS + 1),
+            'teacher_id': rng.randrange(1, TEACHERS + 1),
+            'room_id': rng.randrange(1, ROOMS + 1),
+            'group_id': rng.randrange(1, GROUPS + 1),
+            'date': date(2025, 6, 2) + timedelta(days=rng.randrange(DAYS)),
+            'start_time': time(start, 0),
+            'end_time': time(start + 2, 0),
+            'status': 'approved'
+        })
+        assistants.append({'schedule_id': schedule_id, 'teacher_id': rng.randrange(1, TEACHERS + 1)})
+
+    session.execute(insert(Schedule), schedules)
+    session.execute(insert(schedule_assistants), [a for a, s in zip(assistants, schedules) if a['teacher_id'] != s['teacher_id']])
+    # Inserările în bloc ocolesc sesiunea, deci indexul conflictelor este reconstruit
+    rebuild_conflicts(session)
+    session.commit()
+    session.close()
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        seed(engine)
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(1))
+        Session = sessionmaker(bind=engine)
+
+        print(f"schedules={SCHEDULES}, days={DAYS}, rooms={ROOMS}, teachers={TEACHERS}, groups={GROUPS}")
+
+        # Implementarea anterioară: o apelare per zi și per resursă
+        session = Session()
+        days = sorted({row[0] for row in session.query(Schedule.date).distinct()})
+        statements.clear()
+        start = timer.perf_counter()
+        legacy = set()
+        for day in days:
+            for room_id in range(1, ROOMS + 1):
+                legacy.update(c[:5] for c in legacy_check_conflicts(session, date_val=day, room_id=room_id))
+            for teacher_id in range(1, TEACHERS + 1):
+                legacy.update(c[:5] for c in legacy_check_conflicts(session, date_val=day, teacher_id=teacher_id))
+        legacy_time = timer.perf_counter() - start
+        legacy_statements = len(statements)
+        session.close()
+
+        # Detectorul cu linie de baleiere: o singură trecere peste toată sesiunea
+        session = Session()
+        statements.clear()
+        start = timer.perf_counter()
+        sweep_conflicts = detect_conflicts(ScheduleService(db_session=session).load_schedule_intervals())
+        sweep_time = timer.perf_counter() - start
+        sweep_statements = len(statements)
+        session.close()
+
+        # Indexul persistent: check_conflicts citește doar conflictele înregistrate
+        session = Session()
+        statements.clear()
+        start = timer.perf_counter()
+        conflicts = ScheduleService(db_session=session).check_conflicts()
+        index_time = timer.perf_counter() - start
+        index_statements = len(statements)
+        session.close()
+
+        sweep = {tuple(c) for c in sweep_conflicts}
+        index = {
+            (c['type'].replace('_conflict', ''), c.get('room_id') or c.get('teacher_id') or c.get('group_id'), c['date'], c['schedule_id1'], c['schedule_id2'])
+            for c in conflicts
+        }
+        sweep_without_groups = {(c[0], c[1], c[2], c[3], c[4]) for c in sweep if c[0] != 'group'}
+
+        # Costul actualizării incrementale: mutarea unor planificări în alt interval orar
+        session = Session()
+        rng = random.Random(7)
+        updates = 100
+        start = timer.perf_counter()
+        for _ in range(updates):
+            schedule = session.get(Schedule, rng.randrange(1, SCHEDULES + 1))
+            hour = rng.randrange(8, 18)
+            schedule.start_time, schedule.end_time = time(hour, 0), time(hour + 2, 0)
+            session.commit()
+        update_time = (timer.perf_counter() - start) / updates
+        session.close()
+
+        print(f"{'implementation':<16}{'seconds':>10}{'statements':>12}{'conflicts':>11}")
+        print(f"{'pairwise':<16}{legacy_time:>10.3f}{legacy_statements:>12}{len(legacy):>11}")
+        print(f"{'sweep':<16}{sweep_time:>10.3f}{sweep_statements:>12}{len(sweep):>11}")
+        print(f"{'index read':<16}{index_time:>10.3f}{index_statements:>12}{len(index):>11}")
+        print(f"room/teacher conflicts identical: {legacy == sweep_without_groups}, index identical to sweep: {index == sweep}")
+        print(f"index maintenance per schedule update: {update_time * 1000:.2f} ms")
+
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: exportul Excel pentru toată facultatea
+
+Compară implementarea anterioară a ExportService.export_to_excel (toate rândurile
+în listă de dicționare, DataFrame pandas, BytesIO, getvalue()) cu exportul scris
+pe disc (ExportService._write_excel, folosit de cached_export: citire în loturi
+cu yield_per, registru openpyxl write-only). Raportează timpul și memoria Python
+de vârf (tracemalloc) pentru fiecare variantă.
+
+Rulare (din rădăcina proiectului):
+
+    python benchmarks/bench_excel_export.py
+
+Numărul de planificări se configurează prin BENCH_SCHEDULES (tracemalloc încetinește
+ambele variante de câteva ori; timpii sunt comparabili între ei, nu absoluți).
+"""
+import io
+import os
+import sys
+import tempfile
+import time as timer
+import tracemalloc
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.services import ExportService, rebuild_listings
+
+SCHEDULES = int(os.environ.get("BENCH_SCHEDULES", 20000))
+
+def seed(session):
+    session.add_all([Subject(name=f"Disciplina {i}", short_name=f"D{i}", credits=5, semester=2) for i in range(200)])
+    session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(300)])
+    session.add_all([Room(name=f"C{i}", short_name=f"C{i}", capacity=40, building="C", floor=2) for i in range(60)])
+    session.add_all([Group(name=f"G{i}", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(200)])
+    session.commit()
+
+    session.execute(insert(Schedule), [
+        {'subject_id': index % 200 + 1, 'teacher_id': index % 300 + 1, 'group_id': index % 200 + 1,
+         'room_id': index % 60 + 1, 'date': date(2025, 6, 2) + timedelta(days=index % 30),
+         'start_time': time(8 + index % 10, 0), 'end_time': time(10 + index % 10, 0), 'status': 'approved'}
+        for index in range(SCHEDULES)
+    ])
+    rebuild_listings(session)
+    session.commit()
+
+def legacy_export_to_excel(export_service):
+    """Implementarea anterioară a exportului Excel (pentru comparație)"""
+    data = []
+    for row in export_service.db_session.execute(export_service._listings_statement()).all():
+        data.append({
+            'ID': row.schedule_id,
+            'Disciplina': row.subject_name,
+            'Acronim': row.subject_short_name,
+            'Cadru didactic': f"{row.teacher_first_name} {row.teacher_last_name}",
+            'Grupa': row.group_name,
+            'Data': row.date,
+            'Ora început': row.start_time.strftime('%H:%M') if row.start_time else '',
+            'Ora sfârșit': row.end_time.strftime('%H:%M') if row.end_time else '',
+            'Sala': row.room_name or '',
+            'Status': row.status
+        })
+
+    df = pd.DataFrame(data)
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Planificare Examene', index=False)
+
+    return len(output.getvalue())
+
+def measure(label, function):
+    tracemalloc.start()
+    started = timer.perf_counter()
+    size = function()
+    elapsed = timer.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<30} {elapsed:8.2f} s  vârf {peak / 2 ** 20:8.1f} MiB  ({size / 2 ** 20:.1f} MiB)")
+    return peak
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        seed(session)
+
+        export_service = ExportService(db_session=session)
+        print(f"{SCHEDULES} planificări")
+
+        legacy = measure("pandas + BytesIO", lambda: legacy_export_to_excel(export_service))
+        path = os.path.join(directory, 'export.xlsx')
+        written = measure("write-only pe disc", lambda: export_service._write_excel(path, export_service._listings_statement()) and os.path.getsize(path))
+        print(f"{'memorie de vârf':<30} {legacy / written:8.1f}x mai mică")
+
+        session.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: trimiterea unei notificări către toți utilizatorii cu un rol
+
+Compară varianta anterioară (încărcarea utilizatorilor ca obiecte ORM și câte un
+session.add() pentru fiecare notificare și email) cu NotificationService.fan_out,
+care inserează notificările și email-urile cu câte o instrucțiune
+INSERT ... SELECT din users.
+
+Rulare (din rădăcina proiectului):
+
+    python benchmarks/bench_notification_fan_out.py
+
+Numărul de destinatari se configurează prin BENCH_USERS.
+"""
+import os
+import sys
+import tempfile
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Notification, User
+from src.common.services import NotificationService
+from src.common.services.email_outbox import enqueue_email
+
+USERS = int(os.environ.get("BENCH_USERS", 10000))
+
+def legacy_fan_out(session, message):
+    """Varianta anterioară: câte un obiect Notification pentru fiecare utilizator"""
+    users = session.query(User).filter(User.role == 'SG').all()
+    notifications = []
+    for user in users:
+        notification = Notification(user_id=user.id, title="Notificare nouă", message=message, type='info')
+        session.add(notification)
+        notifications.append((notification, user.email))
+    session.flush()
+    for notification, email in notifications:
+        enqueue_email(session, email, "Notificare nouă", message, notification_id=notification.id)
+    session.commit()
+    return len(users)
+
+def measure(label, function, statements):
+    statements.clear()
+    started = timer.perf_counter()
+    count = function()
+    elapsed = timer.perf_counter() - started
+    print(f"{label:<40} {elapsed:8.3f} s  ({count} notificări, {len(statements)} instrucțiuni SQL)")
+    return elapsed
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        session.execute(insert(User), [
+            {'first_name': "Prenume", 'last_name': f"Nume{i}", 'email': f"sg{i}@usv.ro", 'role': 'SG'} for i in range(USERS)
+        ])
+        session.commit()
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        print(f"{USERS} șefi de grupă")
+        legacy = measure("ORM: session.add() per utilizator", lambda: legacy_fan_out(session, "Termen propuneri"), statements)
+        session.expunge_all()
+        bulk = measure("INSERT ... SELECT din users", lambda: NotificationService(db_session=session).notify_group_leaders("Termen propuneri"), statements)
+        print(f"{'':<40} {legacy / bulk:8.1f}x")
+
+        session.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
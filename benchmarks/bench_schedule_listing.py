@@ -0,0 +1,126 @@
+"""
+Benchmark: listarea planificărilor din modelul de citire (schedule_listings)
+
+Compară parcurgerea tuturor paginilor cu get_schedules_page (JOIN-uri pentru
+disciplină, cadru didactic, sală și grupă + interogarea asistenților, apoi
+Schedule.to_dict()) cu get_listings_page, care citește rândurile aplatizate, și
+citirea rândurilor pentru export prin JOIN-ul anterior cu citirea din modelul de
+citire. Măsoară și costul actualizării unui rând la modificarea unei planificări.
+
+Rulare (din rădăcina proiectului):
+
+    python benchmarks/bench_schedule_listing.py
+
+Dimensiunea se configurează prin BENCH_SCHEDULES și BENCH_PAGE_SIZE.
+"""
+import os
+import random
+import sys
+import tempfile
+import time as timer
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.models.schedule import schedule_assistants
+from src.common.services import ScheduleService, ExportService, rebuild_listings
+
+SCHEDULES = int(os.environ.get("BENCH_SCHEDULES", 5000))
+PAGE_SIZE = int(os.environ.get("BENCH_PAGE_SIZE", 100))
+
+def seed(session):
+    rng = random.Random(42)
+    session.add_all([Subject(name=f"Disciplina {i}", short_name=f"D{i}", credits=5, semester=2) for i in range(120)])
+    session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", title="Lect.", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(150)])
+    session.add_all([Room(name=f"C{i}", short_name=f"C{i}", capacity=40, building="C", floor=2) for i in range(40)])
+    session.add_all([Group(name=f"G{i}", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(100)])
+    session.commit()
+
+    first_day = date(2025, 6, 2)
+    rows = []
+    for _ in range(SCHEDULES):
+        start = rng.randrange(8, 18)
+        rows.append({
+            'subject_id': rng.randint(1, 120), 'teacher_id': rng.randint(1, 150), 'group_id': rng.randint(1, 100),
+            'room_id': rng.randint(1, 40), 'date': first_day + timedelta(days=rng.randrange(20)),
+            'start_time': time(start, 0), 'end_time': time(start + 2, 0), 'status': 'approved'
+        })
+    session.execute(insert(Schedule), rows)
+    session.execute(insert(schedule_assistants), [
+        {'schedule_id': schedule_id, 'teacher_id': rng.randint(1, 150)}
+        for schedule_id in rng.sample(range(1, SCHEDULES + 1), SCHEDULES // 2)
+    ])
+    # Inserările în bloc ocolesc sesiunea, deci modelul de citire este reconstruit
+    rebuild_listings(session)
+    session.commit()
+
+def walk(fetch):
+    cursor, count = None, 0
+    while True:
+        items, cursor = fetch(cursor)
+        count += len(items)
+        if cursor is None:
+            return count
+
+def legacy_export_rows(session):
+    """Citirea anterioară a rândurilor de export (JOIN pe cinci tabele)"""
+    return session.query(
+        Schedule.id, Schedule.date, Schedule.start_time, Schedule.end_time, Schedule.status,
+        Subject.name, Subject.short_name, Teacher.first_name, Teacher.last_name, Room.name, Group.name
+    ).join(Subject, Schedule.subject_id == Subject.id)\
+     .join(Teacher, Schedule.teacher_id == Teacher.id)\
+     .join(Group, Schedule.group_id == Group.id)\
+     .outerjoin(Room, Schedule.room_id == Room.id).all()
+
+def measure(label, function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        result = function()
+        elapsed = timer.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<45} {best:8.3f} s  ({result} rânduri)")
+    return best
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        seed(session)
+
+        service = ScheduleService(db_session=session)
+        export_service = ExportService(db_session=session)
+
+        print(f"{SCHEDULES} planificări, pagini de {PAGE_SIZE}")
+
+        def orm_pages():
+            session.expunge_all()
+            return walk(lambda cursor: (lambda page: ([s.to_dict() for s in page[0]], page[1]))(
+                service.get_schedules_page(cursor=cursor, limit=PAGE_SIZE)))
+
+        orm = measure("listare ORM + to_dict (toate paginile)", orm_pages)
+        listing = measure("listare din schedule_listings", lambda: walk(lambda cursor: service.get_listings_page(cursor=cursor, limit=PAGE_SIZE)))
+        print(f"{'':<45} {orm / listing:8.1f}x")
+
+        joined = measure("export: JOIN pe cinci tabele", lambda: len(legacy_export_rows(session)))
+        flat = measure("export: schedule_listings", lambda: len(session.execute(export_service._listings_statement()).all()))
+        print(f"{'':<45} {joined / flat:8.1f}x")
+
+        ids = session.execute(select(Schedule.id).limit(200)).scalars().all()
+        started = timer.perf_counter()
+        for schedule_id in ids:
+            schedule = session.get(Schedule, schedule_id)
+            schedule.start_time, schedule.end_time = time(7, 0), time(8, 0)
+            session.commit()
+        print(f"{'actualizare planificare (cu rândul ei)':<45} {(timer.perf_counter() - started) / len(ids) * 1000:8.2f} ms")
+
+        session.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
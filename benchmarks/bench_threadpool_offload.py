@@ -0,0 +1,94 @@
+"""
+Benchmark: latența cererilor rapide în prezența apelurilor sincrone lente
+
+Compară două variante ale aceluiași endpoint lent (un apel blocant de SLOW_MS
+milisecunde, ca o interogare SQLAlchemy sau un apel requests):
+
+* inline  - apelul blocant rulează direct în endpoint-ul async (pe event loop)
+* offload - apelul blocant este trimis în pool-ul "db" prin run_in_pool
+
+Cererile sosesc la intervale fixe (buclă deschisă), intercalat cu cereri către
+un endpoint rapid, și se raportează p50/p99 pentru acestea. Rulare (din rădăcina proiectului):
+
+    PYTHONPATH=src python benchmarks/bench_threadpool_offload.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import httpx
+from fastapi import FastAPI
+
+from common.utils import LatencyRecorder
+from fastapi_app.concurrency import run_in_pool, get_threadpool_metrics, shutdown_threadpools
+
+SLOW_MS = int(os.environ.get("BENCH_SLOW_MS", 50))
+SLOW_REQUESTS = int(os.environ.get("BENCH_SLOW_REQUESTS", 100))
+FAST_REQUESTS = int(os.environ.get("BENCH_FAST_REQUESTS", 400))
+DURATION_S = float(os.environ.get("BENCH_DURATION_S", 2))
+
+app = FastAPI()
+
+def blocking_call():
+    time.sleep(SLOW_MS / 1000)
+    return {"ok": True}
+
+@app.get("/slow/inline")
+async def slow_inline():
+    return blocking_call()
+
+@app.get("/slow/offload")
+async def slow_offload():
+    return await run_in_pool(blocking_call)
+
+@app.get("/fast")
+async def fast():
+    return {"ok": True}
+
+async def run_scenario(variant: str) -> dict:
+    fast_latency = LatencyRecorder(window=FAST_REQUESTS)
+    slow_latency = LatencyRecorder(window=SLOW_REQUESTS)
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        async def request(path: str, offset: float, recorder: LatencyRecorder):
+            # Trafic în buclă deschisă: latența se măsoară față de momentul planificat
+            # al sosirii, deci include și timpul în care event loop-ul a fost blocat
+            await asyncio.sleep(max(0.0, start + offset - loop.time()))
+            response = await client.get(path)
+            recorder.observe(loop.time() - (start + offset))
+            response.raise_for_status()
+
+        tasks = [request(f"/slow/{variant}", index * DURATION_S / SLOW_REQUESTS, slow_latency) for index in range(SLOW_REQUESTS)]
+        tasks += [request("/fast", index * DURATION_S / FAST_REQUESTS, fast_latency) for index in range(FAST_REQUESTS)]
+
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - start
+
+    return {
+        'variant': variant,
+        'elapsed_s': round(elapsed, 3),
+        'fast': fast_latency.snapshot(),
+        'slow': slow_latency.snapshot()
+    }
+
+def main():
+    print(f"slow={SLOW_MS}ms x {SLOW_REQUESTS}, fast x {FAST_REQUESTS}, over {DURATION_S}s")
+    print(f"{'variant':<10}{'elapsed_s':>10}{'fast_p50_ms':>14}{'fast_p99_ms':>14}{'slow_p99_ms':>14}")
+
+    for variant in ('inline', 'offload'):
+        result = asyncio.run(run_scenario(variant))
+        print(f"{result['variant']:<10}{result['elapsed_s']:>10}{result['fast']['p50_ms']:>14}"
+              f"{result['fast']['p99_ms']:>14}{result['slow']['p99_ms']:>14}")
+
+    print(get_threadpool_metrics())
+    shutdown_threadpools()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark: plasarea automată a unei sesiuni complete de examene
+
+Generează facultăți sintetice: grupe organizate în serii (grupele unei serii au
+aceleași discipline și același titular, cu examenul în aceeași zi aprobată), cadre
+didactice partajate între serii, asistenți pentru aproximativ jumătate dintre
+examene și săli de capacități diferite. Toate examenele sunt aprobate, fără sală și
+oră. ScheduleService.solve_exam_period plasează sesiunea, iar rezultatul salvat
+este verificat cu ScheduleService.check_conflicts.
+
+Rulare (din rădăcina proiectului):
+
+    python benchmarks/bench_timetable_solver.py
+
+Dimensiunea se configurează prin BENCH_FACULTIES, BENCH_SERIES (serii per
+facultate), BENCH_GROUPS_PER_SERIES, BENCH_EXAMS_PER_GROUP, BENCH_ROOMS și
+BENCH_TIME_BUDGET.
+"""
+import os
+import random
+import sys
+import tempfile
+from collections import Counter
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, ExamPeriod, Group, Room, Subject, Teacher, Schedule
+from src.common.models.schedule import schedule_assistants
+from src.common.services import ScheduleService, RoomAvailabilityIndex
+from src.common.services.timetable_solver import TimetableSolver
+
+FACULTIES = int(os.environ.get("BENCH_FACULTIES", 3))
+SERIES = int(os.environ.get("BENCH_SERIES", 28))
+GROUPS_PER_SERIES = int(os.environ.get("BENCH_GROUPS_PER_SERIES", 5))
+EXAMS_PER_GROUP = int(os.environ.get("BENCH_EXAMS_PER_GROUP", 7))
+ROOMS = int(os.environ.get("BENCH_ROOMS", 70))
+TIME_BUDGET = float(os.environ.get("BENCH_TIME_BUDGET", 10))
+
+TEACHERS_PER_FACULTY = 100
+PERIOD_START = date(2025, 6, 2)
+PERIOD_END = date(2025, 6, 22)
+
+def seed(engine):
+    rng = random.Random(42)
+    session = sessionmaker(bind=engine)()
+
+    days = [
+        PERIOD_START + timedelta(days=offset)
+        for offset in range((PERIOD_END - PERIOD_START).days + 1)
+        if (PERIOD_START + timedelta(days=offset)).weekday() != 6
+    ]
+
+    session.execute(insert(ExamPeriod), [{
+        'id': 1, 'academic_year': "2024-2025", 'semester': 2, 'name': "Sesiunea de vară",
+        'exam_start_date': PERIOD_START, 'exam_end_date': PERIOD_END
+    }])
+    session.execute(insert(Room), [
+        {'name': f"S{i}", 'short_name': f"S{i}", 'capacity': rng.choice((20, 30, 30, 40, 60, 100)), 'building': "C", 'floor': 1}
+        for i in range(ROOMS)
+    ])
+    session.execute(insert(Teacher), [
+        {'first_name': f"Prenume{i}", 'last_name': "Nume", 'department': f"Facultatea {i // TEACHERS_PER_FACULTY}", 'email': f"cd{i}@usv.ro"}
+        for i in range(FACULTIES * TEACHERS_PER_FACULTY)
+    ])
+
+    groups, subjects, schedules, assistants = [], [], [], []
+
+    for faculty in range(FACULTIES):
+        teachers = range(faculty * TEACHERS_PER_FACULTY + 1, (faculty + 1) * TEACHERS_PER_FACULTY + 1)
+
+        for series in range(SERIES):
+            # Examenele seriei, la cel puțin două zile distanță
+            exam_days = sorted(rng.sample(days[::2], EXAMS_PER_GROUP))
+            series_subjects = []
+
+            for exam_day in exam_days:
+                subjects.append({'id': len(subjects) + 1, 'name': f"Disciplina {len(subjects)}", 'short_name': f"D{len(subjects)}", 'credits': 5, 'semester': 2})
+                series_subjects.append((subjects[-1]['id'], rng.choice(teachers), exam_day))
+
+            for _ in range(GROUPS_PER_SERIES):
+                groups.append({
+                    'id': len(groups) + 1, 'name': f"G{len(groups)}", 'study_year': series % 4 + 1,
+                    'specialization': f"Facultatea {faculty}", 'number_of_students': rng.randrange(18, 36)
+                })
+
+                for subject_id, teacher_id, exam_day in series_subjects:
+                    schedules.append({
+                        'id': len(schedules) + 1, 'subject_id': subject_id, 'teacher_id': teacher_id,
+                        'group_id': groups[-1]['id'], 'exam_period_id': 1, 'date': exam_day, 'status': 'approved'
+                    })
+                    assistant_id = rng.choice(teachers)
+                    if rng.random() < 0.5 and assistant_id != teacher_id:
+                        assistants.append({'schedule_id': schedules[-1]['id'], 'teacher_id': assistant_id})
+
+    session.execute(insert(Group), groups)
+    session.execute(insert(Subject), subjects)
+    session.execute(insert(Schedule), schedules)
+    session.execute(insert(schedule_assistants), assistants)
+    session.commit()
+    session.close()
+
+    return len(schedules)
+
+def teacher_overload(engine, slots_per_day):
+    """Cererea cadrelor didactice peste numărul de intervale dintr-o zi (cu datele aprobate nu poate fi plasată)"""
+    with engine.connect() as connection:
+        rows = connection.execute(select(Schedule.id, Schedule.teacher_id, Schedule.date)).all()
+        assistant_rows = connection.execute(select(schedule_assistants.c.schedule_id, schedule_assistants.c.teacher_id)).all()
+
+    days = {schedule_id: exam_day for schedule_id, _, exam_day in rows}
+    load = Counter((teacher_id, exam_day) for _, teacher_id, exam_day in rows)
+    load.update((teacher_id, days[schedule_id]) for schedule_id, teacher_id in assistant_rows)
+
+    return sum(max(0, count - slots_per_day) for count in load.values())
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        exams = seed(engine)
+
+        print(f"faculties={FACULTIES}, groups={FACULTIES * SERIES * GROUPS_PER_SERIES}, exams={exams}, rooms={ROOMS}, time_budget={TIME_BUDGET}s")
+        print(f"teacher-slots over daily capacity with approved dates: {teacher_overload(engine, len(TimetableSolver([], []).slots))}")
+        print(f"{'mode':<16}{'seconds':>10}{'placed':>9}{'unplaced':>10}  reasons")
+
+        Session = sessionmaker(bind=engine)
+
+        for flexible_dates in (False, True):
+            session = Session()
+            service = ScheduleService(db_session=session, availability_index=RoomAvailabilityIndex())
+            result = service.solve_exam_period(1, time_budget=TIME_BUDGET, flexible_dates=flexible_dates)
+            reasons = dict(Counter(item.reason for item in result.unplaced))
+            mode = 'flexible dates' if flexible_dates else 'approved dates'
+            print(f"{mode:<16}{result.elapsed:>10.2f}{len(result.placements):>9}{len(result.unplaced):>10}  {reasons}")
+            session.close()
+
+        # Salvăm plasarea cu datele aprobate și o verificăm cu detectorul de conflicte
+        session = Session()
+        service = ScheduleService(db_session=session, availability_index=RoomAvailabilityIndex())
+        service.solve_exam_period(1, time_budget=TIME_BUDGET, apply=True)
+        conflicts = service.check_conflicts()
+        print(f"conflicts after apply: {len(conflicts)}")
+        session.close()
+
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
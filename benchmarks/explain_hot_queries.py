@@ -0,0 +1,162 @@
+"""
+Verificare: planurile de execuție ale interogărilor frecvente pe planificări
+
+Populează o bază de date cu BENCH_SCHEDULES planificări (implicit 100 000), rulează
+ANALYZE și obține planul fiecărei interogări frecvente din ScheduleService și
+ExportService. Scriptul se termină cu cod 1 dacă vreo interogare parcurge complet
+tabelele schedules sau schedule_assistants (regresie la Seq Scan).
+
+Rulare (din rădăcina proiectului):
+
+    python benchmarks/explain_hot_queries.py
+
+Implicit se folosește o bază SQLite temporară. Pentru PostgreSQL se setează
+DATABASE_URL către o bază de date dedicată (tabelele sunt create dacă lipsesc, iar
+datele sunt adăugate doar dacă tabela schedules este goală), după `alembic upgrade head`.
+"""
+import os
+import random
+import sys
+import tempfile
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, func, insert, select, text
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.models.schedule import schedule_assistants
+from src.common.services.schedule_service import (
+    build_schedules_statement, build_overlap_statement, apply_schedule_cursor, encode_schedule_cursor
+)
+from src.common.utils import explain_statement, find_full_scans, DEFAULT_PAGE_SIZE
+
+SCHEDULES = int(os.environ.get("BENCH_SCHEDULES", 100000))
+DAYS = int(os.environ.get("BENCH_DAYS", 365))
+ROOMS = int(os.environ.get("BENCH_ROOMS", 60))
+TEACHERS = int(os.environ.get("BENCH_TEACHERS", 400))
+GROUPS = int(os.environ.get("BENCH_GROUPS", 300))
+CHUNK = 10000
+
+CHECKED_TABLES = ('schedules', 'schedule_assistants')
+FIRST_DAY = date(2025, 1, 6)
+
+def seed(connection):
+    """Adaugă resursele și planificările (≈10% propuneri fără sală și oră, ≈50% cu asistent)"""
+    rng = random.Random(42)
+
+    connection.execute(insert(Room), [
+        {'name': f"C{i}", 'short_name': f"C{i}", 'capacity': 40, 'building': "C", 'floor': 1} for i in range(ROOMS)
+    ])
+    connection.execute(insert(Teacher), [
+        {'first_name': f"Prenume{i}", 'last_name': "Nume", 'department': "Calculatoare", 'email': f"cd{i}@usv.ro"} for i in range(TEACHERS)
+    ])
+    connection.execute(insert(Group), [
+        {'name': f"G{i}", 'study_year': 3, 'specialization': "Calculatoare", 'number_of_students': 25} for i in range(GROUPS)
+    ])
+    connection.execute(insert(Subject), [
+        {'name': f"Disciplina {i}", 'short_name': f"D{i}", 'credits': 5, 'semester': 1} for i in range(GROUPS)
+    ])
+
+    for offset in range(0, SCHEDULES, CHUNK):
+        schedules = []
+        assistants = []
+
+        for schedule_id in range(offset + 1, min(offset + CHUNK, SCHEDULES) + 1):
+            teacher_id = rng.randrange(1, TEACHERS + 1)
+            proposed = rng.random() < 0.1
+            start = rng.randrange(8, 18)
+            schedules.append({
+                'id': schedule_id,
+                'subject_id': rng.randrange(1, GROUPS + 1),
+                'teacher_id': teacher_id,
+                'room_id': None if proposed else rng.randrange(1, ROOMS + 1),
+                'group_id': rng.randrange(1, GROUPS + 1),
+                'date': FIRST_DAY + timedelta(days=rng.randrange(DAYS)),
+                'start_time': None if proposed else time(start, 0),
+                'end_time': None if proposed else time(start + 2, 0),
+                'status': 'proposed' if proposed else 'approved'
+            })
+
+            assistant_id = rng.randrange(1, TEACHERS + 1)
+            if rng.random() < 0.5 and assistant_id != teacher_id:
+                assistants.append({'schedule_id': schedule_id, 'teacher_id': assistant_id})
+
+        connection.execute(insert(Schedule), schedules)
+        if assistants:
+            connection.execute(insert(schedule_assistants), assistants)
+
+def hot_queries(connection):
+    """
+    Interogările frecvente, construite cu aceleași funcții ca în servicii
+
+    Returns:
+        Dicționar nume -> obiect Select
+    """
+    middle = connection.execute(
+        select(Schedule).order_by(Schedule.id).offset(SCHEDULES // 2).limit(1)
+    ).first()
+    cursor = encode_schedule_cursor(middle)
+    week = (FIRST_DAY + timedelta(days=DAYS // 2), FIRST_DAY + timedelta(days=DAYS // 2 + 6))
+    page = DEFAULT_PAGE_SIZE + 1
+
+    return {
+        'listare, prima pagină': apply_schedule_cursor(build_schedules_statement(), None).limit(page),
+        'listare, pagină din mijloc': apply_schedule_cursor(build_schedules_statement(), cursor).limit(page),
+        'listare după grupă': apply_schedule_cursor(build_schedules_statement(group_id=middle.group_id), None).limit(page),
+        'listare după cadru didactic (titular sau asistent)':
+            apply_schedule_cursor(build_schedules_statement(teacher_id=middle.teacher_id), None).limit(page),
+        'listare după stare (propuneri)': apply_schedule_cursor(build_schedules_statement(status='proposed'), None).limit(page),
+        'interval de o săptămână': build_schedules_statement(start_date=week[0], end_date=week[1]),
+        'suprapuneri în sală': build_overlap_statement(Schedule.room_id, middle.room_id or 1, middle.date, time(10, 0), time(12, 0)),
+        'suprapuneri cadru didactic': build_overlap_statement(Schedule.teacher_id, middle.teacher_id, middle.date, time(10, 0), time(12, 0)),
+        'intervale pentru conflicte, o zi': select(
+            Schedule.id, Schedule.date, Schedule.start_time, Schedule.end_time,
+            Schedule.room_id, Schedule.teacher_id, Schedule.group_id
+        ).where(Schedule.date == middle.date),
+        'propunere: planificarea existentă pentru disciplină și grupă': select(Schedule).where(
+            Schedule.subject_id == middle.subject_id, Schedule.group_id == middle.group_id
+        ).limit(1),
+        # Aceeași formă ca interogarea din ExportService.export_to_excel/export_to_pdf
+        'export pentru o grupă': select(
+            Schedule.id, Subject.name, Teacher.last_name, Group.name, Room.name, Schedule.date, Schedule.start_time
+        ).join(Subject, Schedule.subject_id == Subject.id)
+         .join(Teacher, Schedule.teacher_id == Teacher.id)
+         .join(Group, Schedule.group_id == Group.id)
+         .outerjoin(Room, Schedule.room_id == Room.id)
+         .where(Schedule.group_id == middle.group_id, Schedule.date >= week[0])
+    }
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = os.environ.get("DATABASE_URL", f"sqlite:///{os.path.join(directory, 'explain.db')}")
+        engine = create_engine(database_url)
+        Base.metadata.create_all(engine)
+
+        with engine.begin() as connection:
+            if connection.execute(select(func.count()).select_from(Schedule)).scalar() == 0:
+                seed(connection)
+            connection.execute(text("ANALYZE"))
+
+        failures = 0
+
+        with engine.connect() as connection:
+            count = connection.execute(select(func.count()).select_from(Schedule)).scalar()
+            print(f"dialect={engine.dialect.name}, schedules={count}")
+
+            for name, statement in hot_queries(connection).items():
+                plan = explain_statement(connection, statement)
+                full_scans = find_full_scans(plan, CHECKED_TABLES)
+                failures += bool(full_scans)
+
+                print(f"\n[{'SEQ SCAN' if full_scans else 'ok'}] {name}")
+                for line in plan:
+                    print(f"    {line}")
+
+        engine.dispose()
+
+    print(f"\n{failures} interogări cu parcurgere completă")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -103,15 +103,25 @@ const actions = {
       commit('SET_LOADING', true)
       commit('CLEAR_ERROR')
       
-      const response = await axios.get('/api/schedule', {
-        headers: {
-          Authorization: `Bearer ${rootState.auth.token}`
-        }
-      })
-      
-      commit('SET_SCHEDULES', response.data)
-      
-      return response.data
+      // Lista este paginată cu cursor; parcurgem toate paginile
+      const schedules = []
+      let cursor = null
+      
+      do {
+        const response = await axios.get('/api/schedule', {
+          headers: {
+            Authorization: `Bearer ${rootState.auth.token}`
+          },
+          params: cursor ? { cursor } : {}
+        })
+        
+        schedules.push(...response.data.schedules)
+        cursor = response.data.next_cursor
+      } while (cursor)
+      
+      commit('SET_SCHEDULES', schedules)
+      
+      return schedules
     } catch (error) {
       commit('SET_ERROR', error.response?.data?.error || 'Eroare la obținerea planificărilor')
       throw error
@@ -0,0 +1,54 @@
+"""
+Mediul Alembic pentru migrațiile schemei comune (modelele din src.common.models)
+"""
+from logging.config import fileConfig
+import os
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from src.common.models import Base
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# URL-ul bazei de date vine din mediu, ca pentru aplicațiile Flask și FastAPI
+config.set_main_option(
+    'sqlalchemy.url',
+    os.environ.get('DATABASE_URL', 'postgresql://fiesc_admin:secure_password@db:5432/exam_scheduling')
+)
+
+target_metadata = Base.metadata
+
+def run_migrations_offline() -> None:
+    """Generează SQL-ul migrațiilor fără conexiune la baza de date"""
+    context.configure(
+        url=config.get_main_option('sqlalchemy.url'),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={'paramstyle': 'named'},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    """Rulează migrațiile pe o conexiune la baza de date"""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix='sqlalchemy.',
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,94 @@
+"""Interval tsrange și constrângeri de excludere pentru planificări (PostgreSQL)
+
+Adaugă coloana generată schedules.time_range și constrângerile de excludere GiST
+care împiedică suprapunerea planificărilor active în aceeași sală sau cu același
+cadru didactic titular, doar cu SCHEDULE_DB_CONFLICT_CHECKS=True (ca la
+metadata.create_all). Pe alte baze de date (ex. SQLite) sau cu opțiunea dezactivată
+migrația nu face nimic, iar verificarea rămâne în aplicație.
+
+Presupune că tabelele există deja (create cu metadata.create_all). Suprapunerile
+existente trebuie rezolvate înainte; upgrade-ul le caută și, dacă există, se oprește
+cu lista lor, fără să modifice schema. Pentru activarea ulterioară a opțiunii pe o
+bază deja migrată, instrucțiunile se generează cu:
+
+    SCHEDULE_DB_CONFLICT_CHECKS=True alembic upgrade 0001 --sql
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-05-12 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from src.common.models.schedule import SCHEDULE_TIME_RANGE_DDL, SCHEDULE_TIME_RANGE_DROP_DDL, db_conflict_checks_enabled
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Perechile de planificări active care s-ar încălca una pe alta (aceleași condiții ca
+# constrângerile de excludere, intervale semi-deschise în aceeași zi)
+OVERLAPS_SQL = """
+SELECT 'room' AS type, a.room_id AS resource_id, a.id AS schedule_id1, b.id AS schedule_id2
+FROM schedules a JOIN schedules b
+  ON a.id < b.id AND a.room_id = b.room_id AND a.date = b.date
+ AND a.start_time < b.end_time AND b.start_time < a.end_time
+WHERE a.status <> 'rejected' AND b.status <> 'rejected'
+  AND a.end_time IS NOT NULL AND b.end_time IS NOT NULL
+UNION ALL
+SELECT 'teacher', a.teacher_id, a.id, b.id
+FROM schedules a JOIN schedules b
+  ON a.id < b.id AND a.teacher_id = b.teacher_id AND a.date = b.date
+ AND a.start_time < b.end_time AND b.start_time < a.end_time
+WHERE a.status <> 'rejected' AND b.status <> 'rejected'
+  AND a.end_time IS NOT NULL AND b.end_time IS NOT NULL
+ORDER BY 1, 2, 3, 4
+"""
+
+# Numărul maxim de suprapuneri afișate în mesajul de eroare
+MAX_REPORTED_OVERLAPS = 50
+
+
+def check_overlaps() -> None:
+    """Oprește upgrade-ul dacă planificările existente încalcă deja constrângerile"""
+    overlaps = op.get_bind().execute(sa.text(OVERLAPS_SQL)).all()
+    if not overlaps:
+        return
+
+    lines = [
+        f"  {row.type} {row.resource_id}: planificările {row.schedule_id1} și {row.schedule_id2}"
+        for row in overlaps[:MAX_REPORTED_OVERLAPS]
+    ]
+    if len(overlaps) > MAX_REPORTED_OVERLAPS:
+        lines.append(f"  ... încă {len(overlaps) - MAX_REPORTED_OVERLAPS}")
+
+    raise RuntimeError(
+        f"Constrângerile de excludere nu pot fi create: {len(overlaps)} suprapuneri existente "
+        "(rezolvați-le sau respingeți una dintre planificări, apoi reluați upgrade-ul):\n" + "\n".join(lines)
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql' or not db_conflict_checks_enabled():
+        return
+
+    if not context.is_offline_mode():
+        check_overlaps()
+
+    for statement in SCHEDULE_TIME_RANGE_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for statement in SCHEDULE_TIME_RANGE_DROP_DDL:
+        op.execute(statement)
@@ -0,0 +1,76 @@
+"""Indecși compuși pentru filtrele frecvente pe planificări
+
+Creează indecșii declarați în src/common/models/schedule.py pe bazele existente.
+Pe PostgreSQL indecșii sunt creați cu CREATE INDEX CONCURRENTLY (fără blocarea
+scrierilor), iar indecșii care servesc paginarea folosesc start_time NULLS FIRST,
+ca în SCHEDULE_PAGE_ORDER.
+
+Planurile de execuție pot fi verificate cu benchmarks/explain_hot_queries.py.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-05-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PAGE_ORDER = object()
+
+# (nume, tabel, coloane); PAGE_ORDER înseamnă (date, start_time, id)
+INDEXES = (
+    ('ix_schedules_date_start_time', 'schedules', [PAGE_ORDER]),
+    ('ix_schedules_status_date', 'schedules', ['status', PAGE_ORDER]),
+    ('ix_schedules_group_id_date', 'schedules', ['group_id', 'date', 'start_time']),
+    ('ix_schedules_teacher_id_date', 'schedules', ['teacher_id', 'date', 'start_time']),
+    ('ix_schedules_room_id_date', 'schedules', ['room_id', 'date', 'start_time']),
+    ('ix_schedules_subject_id_group_id', 'schedules', ['subject_id', 'group_id']),
+    ('ix_schedule_assistants_teacher_id', 'schedule_assistants', ['teacher_id', 'schedule_id'])
+)
+
+
+def _columns(columns, postgresql):
+    result = []
+    for column in columns:
+        if column is PAGE_ORDER:
+            result += ['date', sa.text('start_time NULLS FIRST') if postgresql else 'start_time', 'id']
+        else:
+            result.append(column)
+    return result
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    if not postgresql:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, _columns(columns, False))
+        return
+
+    # CREATE INDEX CONCURRENTLY nu poate rula într-o tranzacție
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, _columns(columns, True), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    if not postgresql:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
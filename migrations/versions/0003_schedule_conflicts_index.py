@@ -0,0 +1,47 @@
+"""Tabela schedule_conflicts (indexul persistent al conflictelor)
+
+Creează tabela declarată în src/common/models/schedule_conflict.py. Tabela este
+goală după upgrade; conflictele existente se încarcă o singură dată cu:
+
+    python -m src.common.services.conflict_index_cli rebuild
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-05-26 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'schedule_conflicts',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now()),
+        sa.Column('type', sa.String(20), nullable=False),
+        sa.Column('resource_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('schedule_id1', sa.Integer(), sa.ForeignKey('schedules.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('schedule_id2', sa.Integer(), sa.ForeignKey('schedules.id', ondelete='CASCADE'), nullable=False),
+        sa.UniqueConstraint('schedule_id1', 'schedule_id2', 'type', 'resource_id', name='uq_schedule_conflicts_pair')
+    )
+    op.create_index('ix_schedule_conflicts_schedule_id2', 'schedule_conflicts', ['schedule_id2'])
+    op.create_index('ix_schedule_conflicts_date_type_resource', 'schedule_conflicts', ['date', 'type', 'resource_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_schedule_conflicts_date_type_resource', table_name='schedule_conflicts')
+    op.drop_index('ix_schedule_conflicts_schedule_id2', table_name='schedule_conflicts')
+    op.drop_table('schedule_conflicts')
@@ -0,0 +1,38 @@
+"""Coloana schedules.exam_period_id (sesiunea de examene a planificării)
+
+Adaugă coloana declarată în src/common/models/schedule.py și cheia străină către
+exam_periods. Coloana este nulabilă, deci planificările existente rămân fără
+sesiune. Trebuie aplicată înaintea migrației 0004, care copiază coloana în
+schedule_listings.
+
+Revision ID: 0003a
+Revises: 0003
+Create Date: 2025-05-26 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003a'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch_alter_table reface tabela în SQLite, care nu poate adăuga o cheie
+    # străină unei tabele existente; în PostgreSQL emite ALTER TABLE obișnuit
+    with op.batch_alter_table('schedules') as batch_op:
+        batch_op.add_column(sa.Column('exam_period_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_schedules_exam_period_id', 'exam_periods', ['exam_period_id'], ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('schedules') as batch_op:
+        batch_op.drop_constraint('fk_schedules_exam_period_id', type_='foreignkey')
+        batch_op.drop_column('exam_period_id')
@@ -0,0 +1,92 @@
+"""Tabela schedule_listings (modelul de citire al planificărilor)
+
+Creează tabela declarată în src/common/models/schedule_listing.py și o populează
+din planificările existente, pentru ca listarea și exporturile să nu citească o
+tabelă goală după upgrade. Consistența poate fi verificată ulterior cu:
+
+    python -m src.common.services.schedule_read_model_cli check
+
+Revision ID: 0004
+Revises: 0003a
+Create Date: 2025-06-02 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.common.services.schedule_read_model import rebuild_listings
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PAGE_ORDER = object()
+
+# (nume, coloane); PAGE_ORDER înseamnă (date, start_time, schedule_id)
+INDEXES = (
+    ('ix_schedule_listings_date_start_time', [PAGE_ORDER]),
+    ('ix_schedule_listings_status_date', ['status', PAGE_ORDER]),
+    ('ix_schedule_listings_group_id_date', ['group_id', 'date', 'start_time']),
+    ('ix_schedule_listings_teacher_id_date', ['teacher_id', 'date', 'start_time']),
+    ('ix_schedule_listings_subject_id', ['subject_id']),
+    ('ix_schedule_listings_room_id', ['room_id']),
+    ('ix_schedule_listings_refreshed_at', ['refreshed_at'])
+)
+
+
+def _columns(columns, postgresql):
+    result = []
+    for column in columns:
+        if column is PAGE_ORDER:
+            result += ['date', sa.text('start_time NULLS FIRST') if postgresql else 'start_time', 'schedule_id']
+        else:
+            result.append(column)
+    return result
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    op.create_table(
+        'schedule_listings',
+        sa.Column('schedule_id', sa.Integer(), sa.ForeignKey('schedules.id', ondelete='CASCADE'), primary_key=True, autoincrement=False),
+        sa.Column('subject_id', sa.Integer(), nullable=False),
+        sa.Column('teacher_id', sa.Integer(), nullable=False),
+        sa.Column('room_id', sa.Integer(), nullable=True),
+        sa.Column('group_id', sa.Integer(), nullable=False),
+        sa.Column('exam_period_id', sa.Integer(), nullable=True),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('start_time', sa.Time(), nullable=True),
+        sa.Column('end_time', sa.Time(), nullable=True),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Column('subject_name', sa.String(255)),
+        sa.Column('subject_short_name', sa.String(50)),
+        sa.Column('teacher_title', sa.String(20)),
+        sa.Column('teacher_first_name', sa.String(100)),
+        sa.Column('teacher_last_name', sa.String(100)),
+        sa.Column('room_name', sa.String(100)),
+        sa.Column('group_name', sa.String(50)),
+        sa.Column('assistants', sa.Text(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False, server_default=sa.func.now())
+    )
+
+    for name, columns in INDEXES:
+        op.create_index(name, 'schedule_listings', _columns(columns, postgresql))
+
+    # Populăm tabela din planificările existente, în tranzacția migrației; tabelele
+    # versiunilor sunt create (cu versiunile inițiale) de migrațiile 0005 și 0007
+    rebuild_listings(op.get_bind(), bump_versions=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='schedule_listings')
+    op.drop_table('schedule_listings')
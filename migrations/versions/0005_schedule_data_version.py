@@ -0,0 +1,37 @@
+"""Tabela schedule_data_version (versiunea datelor planificărilor)
+
+Creează tabela declarată în src/common/models/schedule_data_version.py cu rândul
+ei unic. Versiunea este incrementată la fiecare modificare a modelului de citire
+schedule_listings și face parte din cheia cache-ului de exporturi.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-06-09 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    table = op.create_table(
+        'schedule_data_version',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now())
+    )
+    op.bulk_insert(table, [{'id': 1, 'version': 1}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('schedule_data_version')
@@ -0,0 +1,51 @@
+"""Tabela export_jobs (sarcinile de export asincron)
+
+Creează tabela declarată în src/common/models/export_job.py. Fișierele generate
+sunt păstrate în EXPORT_JOB_DIR, nu în baza de date.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-06-16 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'export_jobs',
+        sa.Column('id', sa.String(32), primary_key=True),
+        sa.Column('format', sa.String(10), nullable=False),
+        sa.Column('group_id', sa.Integer(), nullable=True),
+        sa.Column('teacher_id', sa.Integer(), nullable=True),
+        sa.Column('start_date', sa.Date(), nullable=True),
+        sa.Column('end_date', sa.Date(), nullable=True),
+        sa.Column('cache_key', sa.String(64), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('requested_by', sa.Integer(), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('size', sa.BigInteger(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=True)
+    )
+    op.create_index('ix_export_jobs_cache_key_status', 'export_jobs', ['cache_key', 'status'])
+    op.create_index('ix_export_jobs_expires_at', 'export_jobs', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_export_jobs_expires_at', table_name='export_jobs')
+    op.drop_index('ix_export_jobs_cache_key_status', table_name='export_jobs')
+    op.drop_table('export_jobs')
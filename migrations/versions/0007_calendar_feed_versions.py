@@ -0,0 +1,45 @@
+"""Tabela calendar_feed_versions (versiunile feed-urilor iCalendar)
+
+Creează tabela declarată în src/common/models/calendar_feed_version.py și câte un
+rând (versiunea 1) pentru fiecare grupă și cadru didactic existent, ca feed-urile
+să aibă Last-Modified încă de la prima cerere. Versiunile sunt incrementate de
+modelul de citire schedule_listings la fiecare scriere care atinge feed-ul.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-06-23 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'calendar_feed_versions',
+        sa.Column('kind', sa.String(10), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('kind', 'entity_id')
+    )
+
+    for kind, table in (('group', 'groups'), ('teacher', 'teachers')):
+        op.execute(
+            f"INSERT INTO calendar_feed_versions (kind, entity_id, version, changed_at) "
+            f"SELECT '{kind}', id, 1, CURRENT_TIMESTAMP FROM {table}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('calendar_feed_versions')
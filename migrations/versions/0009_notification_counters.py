@@ -0,0 +1,42 @@
+"""Tabela notification_counters (numărul de notificări necitite per utilizator)
+
+Creează tabela declarată în src/common/models/notification_counter.py și o
+completează din notificările necitite existente. Contoarele sunt actualizate de
+src/common/services/notification_counters.py în tranzacția fiecărei scrieri pe
+notificări.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-07-07 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, Sequence[str], None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'notification_counters',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('unread', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False)
+    )
+
+    op.execute(
+        "INSERT INTO notification_counters (user_id, unread, updated_at) "
+        "SELECT user_id, COUNT(*), CURRENT_TIMESTAMP FROM notifications WHERE read IS NULL GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('notification_counters')
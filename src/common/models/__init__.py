@@ -9,6 +9,13 @@ from src.common.models.notification import Notification
 from src.common.models.excel_template import ExcelTemplate
 from src.common.models.exam_period import ExamPeriod
 from src.common.models.audit_log import AuditLog
+from src.common.models.schedule_conflict import ScheduleConflict
+from src.common.models.schedule_listing import ScheduleListing
+from src.common.models.schedule_data_version import ScheduleDataVersion
+from src.common.models.export_job import ExportJob
+from src.common.models.calendar_feed_version import CalendarFeedVersion
+from src.common.models.email_outbox import EmailOutbox
+from src.common.models.notification_counter import NotificationCounter
 
 # Exportă toate modelele pentru a fi utilizate în alte module
 __all__ = [
@@ -24,5 +31,12 @@ __all__ = [
     'Notification',
     'ExcelTemplate',
     'ExamPeriod',
-    'AuditLog'
+    'AuditLog',
+    'ScheduleConflict',
+    'ScheduleListing',
+    'ScheduleDataVersion',
+    'ExportJob',
+    'CalendarFeedVersion',
+    'EmailOutbox',
+    'NotificationCounter'
 ]
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, PrimaryKeyConstraint
+
+from src.common.models.base import Base
+
+class CalendarFeedVersion(Base):
+    """
+    Model pentru versiunile feed-urilor iCalendar (tabela calendar_feed_versions)
+
+    Câte un rând pentru fiecare feed (kind = 'group' sau 'teacher', entity_id =
+    ID-ul grupei sau al cadrului didactic). Versiunea este incrementată în
+    tranzacția oricărei scrieri care atinge o planificare a grupei sau a cadrului
+    didactic (titular sau asistent), înainte și după modificare (vezi
+    src/common/services/schedule_read_model.py); changed_at este momentul
+    ultimei incrementări și devine Last-Modified al feed-ului.
+    """
+    __tablename__ = 'calendar_feed_versions'
+
+    kind = Column(String(10), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    version = Column(BigInteger, nullable=False, default=1)
+    changed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint('kind', 'entity_id'),
+    )
+
+    def __repr__(self):
+        return f"<CalendarFeedVersion {self.kind}:{self.entity_id} {self.version}>"
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Index
+
+from src.common.models.base import Base
+
+class EmailOutbox(Base):
+    """
+    Model pentru email-urile de trimis (tabela email_outbox)
+
+    Rândurile sunt adăugate în aceeași tranzacție cu notificările pe care le
+    însoțesc, deci un email există dacă și numai dacă notificarea a fost salvată.
+    Trimiterea este făcută de un proces separat (vezi
+    src/common/services/email_outbox.py), cu stările: pending (de trimis la
+    next_attempt_at), sending (preluat de un worker până la locked_until), sent
+    și dead (abandonat după prea multe încercări sau o eroare permanentă).
+    """
+    __tablename__ = 'email_outbox'
+
+    id = Column(Integer, primary_key=True)
+    notification_id = Column(Integer, ForeignKey('notifications.id', ondelete='SET NULL'), nullable=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False, default='pending')
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Preluarea email-urilor scadente, în ordinea sosirii
+        Index('ix_email_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),
+    )
+
+    def __repr__(self):
+        return f"<EmailOutbox {self.id} {self.to_email} {self.status}>"
@@ -0,0 +1,57 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Date, DateTime, Text, ForeignKey, Index
+
+from src.common.models.base import Base
+
+class ExportJob(Base):
+    """
+    Model pentru sarcinile de export asincron (tabela export_jobs)
+
+    O sarcină are formatul și filtrele exportului, cheia lui din cache-ul de
+    exporturi (format + filtre + versiunea datelor) și starea: queued, running,
+    succeeded sau failed. Fișierul generat este păstrat pe disc până la
+    expires_at (vezi src/common/services/export_jobs.py).
+    """
+    __tablename__ = 'export_jobs'
+
+    id = Column(String(32), primary_key=True)
+    format = Column(String(10), nullable=False)
+    group_id = Column(Integer, nullable=True)
+    teacher_id = Column(Integer, nullable=True)
+    start_date = Column(Date, nullable=True)
+    end_date = Column(Date, nullable=True)
+    cache_key = Column(String(64), nullable=False)
+    status = Column(String(20), nullable=False, default='queued')
+    requested_by = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    error = Column(Text, nullable=True)
+    size = Column(BigInteger, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Căutarea unei sarcini identice (deduplicare) și curățarea celor expirate
+        Index('ix_export_jobs_cache_key_status', 'cache_key', 'status'),
+        Index('ix_export_jobs_expires_at', 'expires_at'),
+    )
+
+    def to_dict(self):
+        """Convertește modelul într-un dicționar"""
+        return {
+            'id': self.id,
+            'format': self.format,
+            'group_id': self.group_id,
+            'teacher_id': self.teacher_id,
+            'start_date': self.start_date.isoformat() if self.start_date else None,
+            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'status': self.status,
+            'error': self.error,
+            'size': self.size,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None
+        }
+
+    def __repr__(self):
+        return f"<ExportJob {self.id} {self.format} {self.status}>"
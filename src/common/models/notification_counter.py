@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+
+from src.common.models.base import Base
+
+class NotificationCounter(Base):
+    """
+    Model pentru numărul de notificări necitite ale fiecărui utilizator
+    (tabela notification_counters)
+
+    Contorul este actualizat în tranzacția fiecărei scrieri care creează, citește
+    sau șterge notificări (vezi src/common/services/notification_counters.py),
+    deci badge-ul de notificări nu mai numără rândurile din notifications. Un
+    utilizator fără rând nu are notificări necitite.
+    """
+    __tablename__ = 'notification_counters'
+
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    unread = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<NotificationCounter {self.user_id}: {self.unread}>"
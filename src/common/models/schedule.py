@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Integer, Date, Time, ForeignKey, Table
+from sqlalchemy import Column, String, Integer, Date, Time, ForeignKey, Table, Index, DDL, event
 from sqlalchemy.orm import relationship
+import os
 
 from src.common.models.base import BaseModel, Base
 
@@ -8,7 +9,10 @@ schedule_assistants = Table(
     'schedule_assistants',
     Base.metadata,
     Column('schedule_id', Integer, ForeignKey('schedules.id'), primary_key=True),
-    Column('teacher_id', Integer, ForeignKey('teachers.id'), primary_key=True)
+    Column('teacher_id', Integer, ForeignKey('teachers.id'), primary_key=True),
+    # Cheia primară începe cu schedule_id; filtrul „cadrul didactic este asistent”
+    # caută după teacher_id și are nevoie de indexul invers
+    Index('ix_schedule_assistants_teacher_id', 'teacher_id', 'schedule_id')
 )
 
 class Schedule(BaseModel):
@@ -19,6 +23,7 @@ class Schedule(BaseModel):
     teacher_id = Column(Integer, ForeignKey('teachers.id'), nullable=False)
     room_id = Column(Integer, ForeignKey('rooms.id'), nullable=True)  # Poate fi null până la aprobare
     group_id = Column(Integer, ForeignKey('groups.id'), nullable=False)
+    exam_period_id = Column(Integer, ForeignKey('exam_periods.id', name='fk_schedules_exam_period_id'), nullable=True)
     date = Column(Date, nullable=False)
     start_time = Column(Time, nullable=True)  # Poate fi null până la aprobare
     end_time = Column(Time, nullable=True)    # Poate fi null până la aprobare
@@ -29,6 +34,7 @@ class Schedule(BaseModel):
     teacher = relationship("Teacher", back_populates="schedules")
     room = relationship("Room", back_populates="schedules")
     group = relationship("Group", back_populates="schedules")
+    exam_period = relationship("ExamPeriod", back_populates="schedules")
     assistants = relationship("Teacher", secondary=schedule_assistants, backref="assisted_schedules")
     
     def to_dict(self):
@@ -40,3 +46,74 @@ class Schedule(BaseModel):
         data['group_name'] = self.group.name if self.group else None
         data['assistants'] = [{'id': a.id, 'name': a.full_name} for a in self.assistants]
         return data
+
+def _is_not_postgresql(ddl, target, bind, **kwargs) -> bool:
+    return bind.dialect.name != 'postgresql'
+
+def _page_order_index(name: str, *leading) -> None:
+    """
+    Declară un index care se termină cu ordinea de paginare (date, start_time, id)
+
+    SCHEDULE_PAGE_ORDER pune NULL-urile din start_time primele. În SQLite acesta este
+    comportamentul implicit al unui index crescător, în PostgreSQL trebuie cerut
+    explicit (NULLS FIRST), altfel indexul nu poate servi ORDER BY ... LIMIT.
+    """
+    Index(name, *leading, Schedule.date, Schedule.start_time, Schedule.id).ddl_if(callable_=_is_not_postgresql)
+    Index(name, *leading, Schedule.date, Schedule.start_time.asc().nulls_first(), Schedule.id).ddl_if(dialect='postgresql')
+
+# Indecși pentru combinațiile de filtre folosite de ScheduleService și ExportService
+# (aceleași definiții sunt create pe bazele existente de migrația 0002):
+# - listarea paginată, intervalele de date și încărcarea intervalelor pentru conflicte
+_page_order_index('ix_schedules_date_start_time')
+# - filtrul după stare combinat cu paginarea (ex. planificările propuse)
+_page_order_index('ix_schedules_status_date', Schedule.status)
+# - orarul unei grupe și al unui cadru didactic titular, pe un interval de date
+Index('ix_schedules_group_id_date', Schedule.group_id, Schedule.date, Schedule.start_time)
+Index('ix_schedules_teacher_id_date', Schedule.teacher_id, Schedule.date, Schedule.start_time)
+# - ocuparea unei săli într-o zi (verificarea suprapunerilor, săli disponibile)
+Index('ix_schedules_room_id_date', Schedule.room_id, Schedule.date, Schedule.start_time)
+# - propunerea unei date caută planificarea existentă pentru disciplină și grupă
+Index('ix_schedules_subject_id_group_id', Schedule.subject_id, Schedule.group_id)
+
+# Mod opțional pentru PostgreSQL: fiecare planificare are un interval tsrange
+# (date + start_time, date + end_time) calculat de baza de date, iar constrângerile
+# de excludere GiST împiedică două planificări active care se suprapun în aceeași
+# sală sau cu același cadru didactic titular. Conflictele sunt respinse la
+# INSERT/UPDATE, fără verificări (și curse) în aplicație.
+SCHEDULE_ROOM_EXCLUSION = 'schedules_room_no_overlap'
+SCHEDULE_TEACHER_EXCLUSION = 'schedules_teacher_no_overlap'
+
+SCHEDULE_TIME_RANGE_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    # Propunerile fără oră nu au interval (NULL) și nu participă la constrângeri
+    "ALTER TABLE schedules ADD COLUMN IF NOT EXISTS time_range tsrange GENERATED ALWAYS AS ("
+    "CASE WHEN start_time IS NOT NULL AND end_time IS NOT NULL "
+    "THEN tsrange(date + start_time, date + end_time, '[)') END) STORED",
+    f"ALTER TABLE schedules ADD CONSTRAINT {SCHEDULE_ROOM_EXCLUSION} "
+    "EXCLUDE USING gist (room_id WITH =, time_range WITH &&) "
+    "WHERE (status <> 'rejected' AND room_id IS NOT NULL AND time_range IS NOT NULL)",
+    f"ALTER TABLE schedules ADD CONSTRAINT {SCHEDULE_TEACHER_EXCLUSION} "
+    "EXCLUDE USING gist (teacher_id WITH =, time_range WITH &&) "
+    "WHERE (status <> 'rejected' AND time_range IS NOT NULL)"
+)
+
+SCHEDULE_TIME_RANGE_DROP_DDL = (
+    f"ALTER TABLE schedules DROP CONSTRAINT IF EXISTS {SCHEDULE_TEACHER_EXCLUSION}",
+    f"ALTER TABLE schedules DROP CONSTRAINT IF EXISTS {SCHEDULE_ROOM_EXCLUSION}",
+    "ALTER TABLE schedules DROP COLUMN IF EXISTS time_range"
+)
+
+def db_conflict_checks_enabled() -> bool:
+    """
+    Verifică dacă modul cu constrângeri de excludere este activat (SCHEDULE_DB_CONFLICT_CHECKS)
+    """
+    return os.environ.get('SCHEDULE_DB_CONFLICT_CHECKS', 'False') == 'True'
+
+# La crearea tabelei cu metadata.create_all (ex. baze de test PostgreSQL);
+# bazele existente primesc aceleași obiecte prin migrația Alembic
+for _statement in SCHEDULE_TIME_RANGE_DDL:
+    event.listen(
+        Schedule.__table__,
+        'after_create',
+        DDL(_statement).execute_if(dialect='postgresql', callable_=lambda *args, **kwargs: db_conflict_checks_enabled())
+    )
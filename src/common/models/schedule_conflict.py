@@ -0,0 +1,28 @@
+from sqlalchemy import Column, String, Integer, Date, ForeignKey, Index, UniqueConstraint
+
+from src.common.models.base import BaseModel
+
+class ScheduleConflict(BaseModel):
+    """
+    Model pentru indexul persistent al conflictelor de planificare
+
+    Fiecare rând este o pereche de planificări active (nerespinse, cu oră) care se
+    suprapun pe aceeași resursă ('room', 'teacher' sau 'group') în aceeași zi.
+    Tabela este actualizată incremental la fiecare modificare a unei planificări
+    (vezi src/common/services/conflict_index.py).
+    """
+    __tablename__ = 'schedule_conflicts'
+
+    type = Column(String(20), nullable=False)  # room, teacher, group
+    resource_id = Column(Integer, nullable=False)
+    date = Column(Date, nullable=False)
+    schedule_id1 = Column(Integer, ForeignKey('schedules.id', ondelete='CASCADE'), nullable=False)  # schedule_id1 < schedule_id2
+    schedule_id2 = Column(Integer, ForeignKey('schedules.id', ondelete='CASCADE'), nullable=False)
+
+    __table_args__ = (
+        # Servește și ștergerea conflictelor unei planificări după schedule_id1
+        UniqueConstraint('schedule_id1', 'schedule_id2', 'type', 'resource_id', name='uq_schedule_conflicts_pair'),
+        Index('ix_schedule_conflicts_schedule_id2', 'schedule_id2'),
+        # Citirea conflictelor unei zile sau ale unei resurse
+        Index('ix_schedule_conflicts_date_type_resource', 'date', 'type', 'resource_id'),
+    )
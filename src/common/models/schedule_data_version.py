@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime, func
+
+from src.common.models.base import Base
+
+class ScheduleDataVersion(Base):
+    """
+    Model pentru versiunea datelor planificărilor (tabela schedule_data_version)
+
+    Tabela are un singur rând (id = 1). Versiunea este incrementată în tranzacția
+    fiecărei scrieri care modifică modelul de citire schedule_listings (vezi
+    src/common/services/schedule_read_model.py), deci două citiri cu aceeași
+    versiune văd aceleași date. Exporturile o folosesc în cheia cache-ului.
+    """
+    __tablename__ = 'schedule_data_version'
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<ScheduleDataVersion {self.version}>"
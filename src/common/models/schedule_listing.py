@@ -0,0 +1,59 @@
+from sqlalchemy import Column, String, Integer, Date, Time, DateTime, Text, ForeignKey, Index, func
+
+from src.common.models.base import Base
+
+class ScheduleListing(Base):
+    """
+    Model pentru modelul de citire al planificărilor (tabela schedule_listings)
+
+    Fiecare rând este o planificare aplatizată: coloanele ei, numele disciplinei,
+    cadrului didactic, grupei și sălii, și lista asistenților (JSON). Listarea și
+    exporturile citesc din această tabelă fără JOIN-uri. Rândurile sunt actualizate
+    la fiecare modificare a planificării sau a entităților referite (vezi
+    src/common/services/schedule_read_model.py), iar refreshed_at este momentul
+    ultimei actualizări.
+    """
+    __tablename__ = 'schedule_listings'
+
+    schedule_id = Column(Integer, ForeignKey('schedules.id', ondelete='CASCADE'), primary_key=True, autoincrement=False)
+    subject_id = Column(Integer, nullable=False)
+    teacher_id = Column(Integer, nullable=False)
+    room_id = Column(Integer, nullable=True)
+    group_id = Column(Integer, nullable=False)
+    exam_period_id = Column(Integer, nullable=True)
+    date = Column(Date, nullable=False)
+    start_time = Column(Time, nullable=True)
+    end_time = Column(Time, nullable=True)
+    status = Column(String(20), nullable=False)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+
+    subject_name = Column(String(255))
+    subject_short_name = Column(String(50))
+    teacher_title = Column(String(20))
+    teacher_first_name = Column(String(100))
+    teacher_last_name = Column(String(100))
+    room_name = Column(String(100))
+    group_name = Column(String(50))
+    assistants = Column(Text, nullable=False, default='[]')  # [{"id": 1, "name": "..."}]
+
+    refreshed_at = Column(DateTime, nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index('ix_schedule_listings_group_id_date', 'group_id', 'date', 'start_time'),
+        Index('ix_schedule_listings_teacher_id_date', 'teacher_id', 'date', 'start_time'),
+        # Rândurile de reîmprospătat la redenumirea unei discipline sau săli
+        Index('ix_schedule_listings_subject_id', 'subject_id'),
+        Index('ix_schedule_listings_room_id', 'room_id'),
+        # Indicatorul de prospețime: max(refreshed_at)
+        Index('ix_schedule_listings_refreshed_at', 'refreshed_at'),
+    )
+
+def _is_not_postgresql(ddl, target, bind, **kwargs) -> bool:
+    return bind.dialect.name != 'postgresql'
+
+# Listarea paginată și filtrul după stare, cu ordinea de paginare (date, start_time
+# NULLS FIRST, schedule_id), ca indecșii _page_order_index ai tabelei schedules
+for _name, _leading in (('ix_schedule_listings_date_start_time', ()), ('ix_schedule_listings_status_date', (ScheduleListing.status,))):
+    Index(_name, *_leading, ScheduleListing.date, ScheduleListing.start_time, ScheduleListing.schedule_id).ddl_if(callable_=_is_not_postgresql)
+    Index(_name, *_leading, ScheduleListing.date, ScheduleListing.start_time.asc().nulls_first(), ScheduleListing.schedule_id).ddl_if(dialect='postgresql')
@@ -1,16 +1,64 @@
 from src.common.services.auth_service import AuthService
-from src.common.services.schedule_service import ScheduleService
+from src.common.services.schedule_service import ScheduleService, ProposalItem
 from src.common.services.notification_service import NotificationService
+from src.common.services.notification_broker import (
+    MemoryNotificationBroker, NotificationEvent, NotificationSubscription, BrokerFullError, notification_broker
+)
+from src.common.services.notification_counters import UnreadCountCache, unread_count_cache
+from src.common.services.email_outbox import EmailOutboxWorker
+from src.common.services.email_sender import BatchingEmailSender, EmailDeliveryError, MemoryEmailTransport, SendGridTransport
 from src.common.services.export_service import ExportService
+from src.common.services.pdf_renderer import PdfRendererPool, PdfRenderTimeoutError
+from src.common.services.export_cache import ExportCache, export_cache
+from src.common.services.export_jobs import ExportJobService
+from src.common.services.calendar_feed import CalendarFeedService, CalendarFeedCache
 from src.common.services.orar_integration_service import OrarIntegrationService
 from src.common.services.excel_service import ExcelService
+from src.common.services.async_schedule_service import AsyncScheduleService
+from src.common.services.async_notification_service import AsyncNotificationService
+from src.common.services.conflict_detection import ScheduleConflictError, PlacementCandidate, detect_conflicts
+from src.common.services.room_availability import RoomAvailabilityIndex, room_availability
+from src.common.services.conflict_index import rebuild_conflicts, verify_conflicts
+from src.common.services.schedule_read_model import rebuild_listings, verify_listings, data_version
 
 # Exportă toate serviciile pentru a fi utilizate în alte module
 __all__ = [
     'AuthService',
     'ScheduleService',
+    'ProposalItem',
     'NotificationService',
+    'MemoryNotificationBroker',
+    'NotificationEvent',
+    'NotificationSubscription',
+    'BrokerFullError',
+    'notification_broker',
+    'UnreadCountCache',
+    'unread_count_cache',
+    'EmailOutboxWorker',
+    'BatchingEmailSender',
+    'EmailDeliveryError',
+    'MemoryEmailTransport',
+    'SendGridTransport',
     'ExportService',
+    'PdfRendererPool',
+    'PdfRenderTimeoutError',
+    'ExportCache',
+    'export_cache',
+    'ExportJobService',
+    'CalendarFeedService',
+    'CalendarFeedCache',
     'OrarIntegrationService',
-    'ExcelService'
+    'ExcelService',
+    'AsyncScheduleService',
+    'AsyncNotificationService',
+    'ScheduleConflictError',
+    'PlacementCandidate',
+    'detect_conflicts',
+    'RoomAvailabilityIndex',
+    'room_availability',
+    'rebuild_conflicts',
+    'verify_conflicts',
+    'rebuild_listings',
+    'verify_listings',
+    'data_version'
 ]
@@ -0,0 +1,67 @@
+from typing import List, Dict, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select, func
+
+from src.common.models import Notification
+from src.common.services.notification_service import build_user_notifications_statement, build_pagination
+from src.common.services.notification_counters import unread_count_cache, unread_count_statement
+
+class AsyncNotificationService:
+    """Variantă asincronă a operațiilor de citire din NotificationService"""
+    
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+    
+    async def get_user_notifications(self, user_id: int, unread_only: bool = False, page: int = 1, per_page: int = 10) -> Tuple[List[Notification], Dict[str, int]]:
+        """
+        Obține o pagină din notificările unui utilizator
+        
+        Args:
+            user_id: ID-ul utilizatorului
+            unread_only: Dacă se returnează doar notificările necitite
+            page: Numărul paginii (începând de la 1)
+            per_page: Numărul de notificări per pagină
+            
+        Returns:
+            Tuple cu lista de notificări și metadatele de paginare
+        """
+        try:
+            statement = build_user_notifications_statement(user_id, unread_only)
+            
+            total_items = (await self.db_session.execute(
+                select(func.count()).select_from(statement.order_by(None).subquery())
+            )).scalar_one()
+            
+            result = await self.db_session.execute(
+                statement.offset((page - 1) * per_page).limit(per_page)
+            )
+            
+            return list(result.scalars().all()), build_pagination(page, per_page, total_items)
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea notificărilor: {str(e)}")
+            return [], build_pagination(page, per_page, 0)
+    
+    async def get_unread_count(self, user_id: int) -> int:
+        """
+        Obține numărul de notificări necitite ale unui utilizator, din cache sau
+        din notification_counters (vezi NotificationService.get_unread_count)
+        
+        Args:
+            user_id: ID-ul utilizatorului
+            
+        Returns:
+            Numărul de notificări necitite (0 în caz de eroare)
+        """
+        unread = unread_count_cache.get(user_id)
+        if unread is not None:
+            return unread
+        
+        try:
+            generation = unread_count_cache.generation
+            unread = max((await self.db_session.execute(unread_count_statement(user_id))).scalar() or 0, 0)
+            unread_count_cache.put(user_id, unread, generation)
+            return unread
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea numărului de notificări necitite: {str(e)}")
+            return 0
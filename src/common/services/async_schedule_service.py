@@ -0,0 +1,120 @@
+from typing import List, Optional, Tuple
+from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select
+
+from src.common.models import Schedule
+from src.common.services.schedule_service import (
+    build_schedules_statement, schedule_load_options, apply_schedule_cursor, encode_schedule_cursor
+)
+from src.common.utils.pagination import clamp_page_size
+
+# Relațiile citite de Schedule.to_dict() și de schemele de răspuns. Într-o sesiune
+# asincronă nu există încărcare lazy, deci sunt încărcate întotdeauna explicit.
+SCHEDULE_RELATIONS = schedule_load_options('eager')
+
+class AsyncScheduleService:
+    """Variantă asincronă a operațiilor de citire din ScheduleService"""
+    
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+    
+    async def get_schedules(self, 
+                            group_id: Optional[int] = None, 
+                            teacher_id: Optional[int] = None, 
+                            subject_id: Optional[int] = None, 
+                            status: Optional[str] = None,
+                            start_date: Optional[date] = None,
+                            end_date: Optional[date] = None) -> List[Schedule]:
+        """
+        Obține planificările examenelor cu filtrare opțională
+        
+        Args:
+            group_id: ID-ul grupei (opțional)
+            teacher_id: ID-ul cadrului didactic (opțional)
+            subject_id: ID-ul disciplinei (opțional)
+            status: Statusul planificării (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            
+        Returns:
+            Listă de obiecte Schedule, cu relațiile încărcate
+        """
+        try:
+            statement = build_schedules_statement(
+                group_id=group_id,
+                teacher_id=teacher_id,
+                subject_id=subject_id,
+                status=status,
+                start_date=start_date,
+                end_date=end_date
+            ).options(*SCHEDULE_RELATIONS)
+            
+            result = await self.db_session.execute(statement)
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea planificărilor: {str(e)}")
+            return []
+    
+    async def get_schedules_page(self,
+                                 group_id: Optional[int] = None,
+                                 teacher_id: Optional[int] = None,
+                                 subject_id: Optional[int] = None,
+                                 status: Optional[str] = None,
+                                 start_date: Optional[date] = None,
+                                 end_date: Optional[date] = None,
+                                 cursor: Optional[str] = None,
+                                 limit: Optional[int] = None) -> Tuple[List[Schedule], Optional[str]]:
+        """
+        Obține o pagină de planificări, ordonate după (date, start_time, id)
+        
+        Parametrii și rezultatul sunt aceiași ca la ScheduleService.get_schedules_page.
+        
+        Raises:
+            InvalidCursorError: Dacă cursorul este invalid
+        """
+        limit = clamp_page_size(limit)
+        
+        statement = apply_schedule_cursor(build_schedules_statement(
+            group_id=group_id,
+            teacher_id=teacher_id,
+            subject_id=subject_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date
+        ), cursor)
+        
+        try:
+            result = await self.db_session.execute(
+                statement.options(*SCHEDULE_RELATIONS).limit(limit + 1)
+            )
+            schedules = list(result.scalars().all())
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea planificărilor: {str(e)}")
+            return [], None
+        
+        if len(schedules) > limit:
+            schedules = schedules[:limit]
+            return schedules, encode_schedule_cursor(schedules[-1])
+        
+        return schedules, None
+    
+    async def get_schedule_by_id(self, schedule_id: int) -> Optional[Schedule]:
+        """
+        Obține o planificare după ID
+        
+        Args:
+            schedule_id: ID-ul planificării
+            
+        Returns:
+            Obiectul Schedule sau None dacă planificarea nu există
+        """
+        try:
+            statement = select(Schedule).where(Schedule.id == schedule_id).options(*SCHEDULE_RELATIONS)
+            
+            result = await self.db_session.execute(statement)
+            return result.scalars().first()
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea planificării după ID: {str(e)}")
+            return None
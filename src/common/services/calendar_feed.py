@@ -0,0 +1,314 @@
+"""
+Feed-uri iCalendar (RFC 5545) cu examenele unei grupe sau ale unui cadru didactic
+
+Fiecare feed are o versiune în calendar_feed_versions, incrementată de modelul de
+citire schedule_listings în tranzacția oricărei scrieri care atinge o planificare
+a grupei sau a cadrului didactic (titular sau asistent), inclusiv mutarea
+planificării la altă grupă, ștergerea ei și redenumirea entităților afișate.
+Versiunea formează ETag-ul feed-ului, iar momentul incrementării devine
+Last-Modified, deci o cerere condiționată costă o singură interogare pe cheia
+primară, fără citirea planificărilor.
+
+Conținutul generat este păstrat într-un cache LRU în memoria procesului, valid cât
+timp versiunea feed-ului nu se schimbă; o scriere pe planificările unei grupe nu
+invalidează feed-urile celorlalte grupe.
+
+Clienții de calendar nu pot trimite token-uri JWT, așa că adresele feed-urilor
+sunt semnate (HMAC-SHA256 cu SECRET_KEY al aplicației).
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import hashlib
+import hmac
+import json
+import os
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.common.models import CalendarFeedVersion, Group, Teacher, ScheduleListing
+from src.common.services.schedule_read_model import LISTING_PAGE_COLUMNS, build_listings_statement, teacher_full_name
+
+# Tipurile de feed: grupă sau cadru didactic (titular sau asistent)
+FEED_KINDS = ('group', 'teacher')
+
+# Numărul maxim de feed-uri păstrate în cache-ul din memoria procesului
+CALENDAR_FEED_CACHE_SIZE = int(os.environ.get('CALENDAR_FEED_CACHE_SIZE', 1000))
+
+# Se schimbă când se schimbă conținutul generat, ca ETag-urile vechi să nu mai fie valide
+CALENDAR_FEED_LAYOUT_VERSION = 1
+
+CALENDAR_TIMEZONE = 'Europe/Bucharest'
+CALENDAR_UID_DOMAIN = 'planificare.fiesc.usv.ro'
+CALENDAR_PRODID = '-//USV FIESC//Planificare examene//RO'
+
+# Ora României (EET/EEST), cu regulile UE de trecere la ora de vară
+CALENDAR_VTIMEZONE = (
+    'BEGIN:VTIMEZONE',
+    f'TZID:{CALENDAR_TIMEZONE}',
+    'BEGIN:DAYLIGHT',
+    'TZOFFSETFROM:+0200',
+    'TZOFFSETTO:+0300',
+    'TZNAME:EEST',
+    'DTSTART:19700329T030000',
+    'RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU',
+    'END:DAYLIGHT',
+    'BEGIN:STANDARD',
+    'TZOFFSETFROM:+0300',
+    'TZOFFSETTO:+0200',
+    'TZNAME:EET',
+    'DTSTART:19701025T040000',
+    'RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU',
+    'END:STANDARD',
+    'END:VTIMEZONE'
+)
+
+# Starea evenimentului pentru fiecare stare a planificării (cele respinse nu apar)
+CALENDAR_EVENT_STATUS = {
+    'approved': 'CONFIRMED',
+    'proposed': 'TENTATIVE'
+}
+
+class FeedState(NamedTuple):
+    """Versiunea unui feed și momentul ultimei modificări (None înainte de prima)"""
+    version: int
+    changed_at: Optional[datetime]
+
+def feed_etag(kind: str, entity_id: int, version: int) -> str:
+    """ETag-ul unei versiuni a feed-ului"""
+    return f"ics-{CALENDAR_FEED_LAYOUT_VERSION}-{kind}-{entity_id}-{version}"
+
+def feed_token(secret_key: str, kind: str, entity_id: int) -> str:
+    """
+    Calculează token-ul din adresa unui feed
+
+    Args:
+        secret_key: Cheia secretă a aplicației
+        kind: Tipul feed-ului ('group' sau 'teacher')
+        entity_id: ID-ul grupei sau al cadrului didactic
+
+    Returns:
+        Semnătura HMAC-SHA256 (hex, 32 de caractere) a feed-ului
+    """
+    message = f"calendar:{kind}:{entity_id}".encode('utf-8')
+    return hmac.new(secret_key.encode('utf-8'), message, hashlib.sha256).hexdigest()[:32]
+
+def verify_feed_token(secret_key: str, kind: str, entity_id: int, token: Optional[str]) -> bool:
+    """Verifică token-ul din adresa unui feed (comparare în timp constant)"""
+    return bool(token) and hmac.compare_digest(feed_token(secret_key, kind, entity_id), token)
+
+def _escape(value: str) -> str:
+    """Escapează un text pentru valorile de tip TEXT din RFC 5545"""
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+def _fold(line: str) -> str:
+    """Împarte o linie în bucăți de cel mult 75 de octeți (RFC 5545, secțiunea 3.1)"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line
+
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Nu tăiem un caracter UTF-8 pe mai mulți octeți
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode('utf-8'))
+        start, limit = end, 74
+    return '\r\n '.join(parts)
+
+def _utc(value: Optional[datetime]) -> str:
+    return (value or datetime.utcnow()).strftime('%Y%m%dT%H%M%SZ')
+
+def _event_lines(listing) -> List[str]:
+    """Liniile VEVENT ale unei planificări (rând al modelului de citire)"""
+    subject = listing.subject_name or ''
+    if listing.subject_short_name:
+        subject = f"{subject} ({listing.subject_short_name})"
+
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:schedule-{listing.schedule_id}@{CALENDAR_UID_DOMAIN}',
+        f'DTSTAMP:{_utc(listing.updated_at or listing.created_at)}'
+    ]
+
+    if listing.start_time:
+        lines.append(f"DTSTART;TZID={CALENDAR_TIMEZONE}:{datetime.combine(listing.date, listing.start_time):%Y%m%dT%H%M%S}")
+        if listing.end_time:
+            lines.append(f"DTEND;TZID={CALENDAR_TIMEZONE}:{datetime.combine(listing.date, listing.end_time):%Y%m%dT%H%M%S}")
+    else:
+        # Fără oră stabilită: eveniment pe toată ziua
+        lines.append(f"DTSTART;VALUE=DATE:{listing.date:%Y%m%d}")
+        lines.append(f"DTEND;VALUE=DATE:{listing.date + timedelta(days=1):%Y%m%d}")
+
+    description = [
+        f"Grupa: {listing.group_name}",
+        f"Cadru didactic: {teacher_full_name(listing.teacher_title, listing.teacher_first_name, listing.teacher_last_name)}"
+    ]
+    assistants = json.loads(listing.assistants)
+    if assistants:
+        description.append("Asistenți: " + ", ".join(assistant['name'] for assistant in assistants))
+
+    lines.append(f'SUMMARY:{_escape(f"Examen {subject}")}')
+    if listing.room_name:
+        lines.append(f'LOCATION:{_escape(listing.room_name)}')
+    lines.append(f'DESCRIPTION:{_escape(chr(10).join(description))}')
+    lines.append(f'STATUS:{CALENDAR_EVENT_STATUS.get(listing.status, "TENTATIVE")}')
+    if listing.updated_at:
+        lines.append(f'LAST-MODIFIED:{_utc(listing.updated_at)}')
+    lines.append('END:VEVENT')
+    return lines
+
+def render_calendar(name: str, listings: Iterable) -> bytes:
+    """
+    Generează documentul iCalendar pentru rândurile modelului de citire
+
+    Args:
+        name: Numele calendarului (X-WR-CALNAME)
+        listings: Rândurile planificărilor, în ordinea dorită
+
+    Returns:
+        Documentul text/calendar, codificat UTF-8, cu terminatori CRLF
+    """
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{CALENDAR_PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{_escape(name)}',
+        f'X-WR-TIMEZONE:{CALENDAR_TIMEZONE}',
+        *CALENDAR_VTIMEZONE
+    ]
+    for listing in listings:
+        lines.extend(_event_lines(listing))
+    lines.append('END:VCALENDAR')
+
+    return ''.join(_fold(line) + '\r\n' for line in lines).encode('utf-8')
+
+class CalendarFeedCache:
+    """
+    Cache LRU în memorie pentru feed-urile generate, cheiat după (kind, entity_id)
+
+    O intrare este folosită doar pentru versiunea feed-ului cu care a fost generată.
+    """
+
+    def __init__(self, max_entries: int = CALENDAR_FEED_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[tuple[str, int], tuple[int, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, entity_id: int, version: int) -> Optional[bytes]:
+        """Întoarce feed-ul generat pentru versiunea dată sau None"""
+        with self._lock:
+            entry = self._entries.get((kind, entity_id))
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((kind, entity_id))
+            self.hits += 1
+            return entry[1]
+
+    def put(self, kind: str, entity_id: int, version: int, body: bytes) -> None:
+        """Păstrează feed-ul generat pentru versiunea dată"""
+        with self._lock:
+            current = self._entries.get((kind, entity_id))
+            # Un fir care a citit o versiune mai veche nu suprascrie una mai nouă
+            if current is not None and current[0] > version:
+                return
+            self._entries[(kind, entity_id)] = (version, body)
+            self._entries.move_to_end((kind, entity_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Returnează dimensiunea cache-ului și statisticile procesului curent"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': sum(len(body) for _, body in self._entries.values()),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+# Cache-ul partajat de toate instanțele CalendarFeedService din proces
+calendar_feed_cache = CalendarFeedCache()
+
+class CalendarFeedService:
+    """
+    Serviciu pentru feed-urile iCalendar ale grupelor și cadrelor didactice
+    """
+
+    def __init__(self, db_session: Session, cache: Optional[CalendarFeedCache] = None):
+        self.db_session = db_session
+        self.cache = cache if cache is not None else calendar_feed_cache
+
+    def get_feed_state(self, kind: str, entity_id: int) -> Optional[FeedState]:
+        """
+        Obține versiunea curentă a unui feed (o interogare pe cheia primară)
+
+        Args:
+            kind: Tipul feed-ului ('group' sau 'teacher')
+            entity_id: ID-ul grupei sau al cadrului didactic
+
+        Returns:
+            Starea feed-ului (versiunea 0 dacă nu a fost modificat niciodată) sau
+            None în caz de eroare
+        """
+        try:
+            row = self.db_session.execute(
+                select(CalendarFeedVersion.version, CalendarFeedVersion.changed_at)
+                .where(CalendarFeedVersion.kind == kind, CalendarFeedVersion.entity_id == entity_id)
+            ).first()
+            return FeedState(row.version, row.changed_at) if row else FeedState(0, None)
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea versiunii feed-ului: {e}")
+            return None
+
+    def get_feed(self, kind: str, entity_id: int, state: FeedState) -> Optional[bytes]:
+        """
+        Obține documentul iCalendar al unui feed, din cache sau generat
+
+        Args:
+            kind: Tipul feed-ului ('group' sau 'teacher')
+            entity_id: ID-ul grupei sau al cadrului didactic
+            state: Starea feed-ului obținută cu get_feed_state
+
+        Returns:
+            Documentul iCalendar sau None dacă entitatea nu există sau în caz de eroare
+        """
+        body = self.cache.get(kind, entity_id, state.version)
+        if body is not None:
+            return body
+
+        try:
+            if kind == 'group':
+                group = self.db_session.get(Group, entity_id)
+                if group is None:
+                    return None
+                name = f"Examene {group.name}"
+                statement = build_listings_statement(group_id=entity_id)
+            else:
+                teacher = self.db_session.get(Teacher, entity_id)
+                if teacher is None:
+                    return None
+                name = f"Examene {teacher.full_name}"
+                statement = build_listings_statement(teacher_id=entity_id)
+
+            listings = self.db_session.execute(
+                statement.where(ScheduleListing.status != 'rejected').order_by(*LISTING_PAGE_COLUMNS)
+            ).all()
+        except SQLAlchemyError as e:
+            print(f"Eroare la generarea feed-ului iCalendar: {e}")
+            return None
+
+        body = render_calendar(name, listings)
+        self.cache.put(kind, entity_id, state.version, body)
+        return body
@@ -0,0 +1,232 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from datetime import date, time
+from sqlalchemy.exc import IntegrityError
+import heapq
+
+from src.common.models.schedule import SCHEDULE_ROOM_EXCLUSION, SCHEDULE_TEACHER_EXCLUSION
+
+# Tipurile de resurse pentru care se detectează suprapuneri. Asistenții sunt tot
+# cadre didactice, deci un asistent ocupat în două examene simultane produce un
+# conflict de tip 'teacher', la fel ca titularul.
+CONFLICT_TYPES = ('room', 'teacher', 'group')
+
+class ScheduleInterval(NamedTuple):
+    """Intervalul ocupat de o planificare și resursele pe care le folosește"""
+    schedule_id: int
+    date: date
+    start_time: Optional[time]
+    end_time: Optional[time]
+    room_id: Optional[int]
+    teacher_ids: Tuple[int, ...]
+    group_id: Optional[int]
+
+class Conflict(NamedTuple):
+    """Suprapunerea a două planificări care folosesc aceeași resursă"""
+    type: str
+    resource_id: int
+    date: date
+    schedule_id1: int
+    schedule_id2: int
+
+class PlacementCandidate(NamedTuple):
+    """O plasare de încercare pentru o planificare existentă (evaluare „what-if”)"""
+    schedule_id: int
+    room_id: Optional[int]
+    date: date
+    start_time: time
+    end_time: time
+    # None păstrează asistenții actuali ai planificării
+    assistant_ids: Optional[Tuple[int, ...]] = None
+
+class CandidateConflict(NamedTuple):
+    """
+    Suprapunerea unei plasări de încercare cu o planificare existentă
+    (candidate None) sau cu o altă plasare de încercare (indexul ei în lot)
+    """
+    type: str
+    resource_id: int
+    schedule_id: int
+    candidate: Optional[int] = None
+
+# Numărul maxim de plasări de încercare evaluate într-o cerere
+MAX_WHAT_IF_CANDIDATES = 500
+
+class ScheduleConflictError(Exception):
+    """Excepție ridicată când o planificare s-ar suprapune cu alta pe aceeași resursă"""
+
+    def __init__(self, conflict_type: str, schedule_id: Optional[int] = None, conflicting_ids: Optional[List[int]] = None):
+        super().__init__(f"Conflict de {conflict_type} pentru planificarea {schedule_id}")
+        self.conflict_type = conflict_type
+        self.schedule_id = schedule_id
+        self.conflicting_ids = conflicting_ids or []
+
+# Constrângerile de excludere PostgreSQL și tipul de conflict pe care îl semnalează
+EXCLUSION_CONSTRAINT_TYPES = {
+    SCHEDULE_ROOM_EXCLUSION: 'room',
+    SCHEDULE_TEACHER_EXCLUSION: 'teacher'
+}
+
+def conflict_from_integrity_error(error: IntegrityError, schedule_id: Optional[int] = None) -> Optional[ScheduleConflictError]:
+    """
+    Convertește o violare a constrângerilor de excludere într-un ScheduleConflictError
+
+    Args:
+        error: Excepția ridicată de SQLAlchemy la INSERT/UPDATE
+        schedule_id: ID-ul planificării modificate (opțional)
+
+    Returns:
+        ScheduleConflictError sau None dacă eroarea nu provine dintr-o constrângere de excludere
+    """
+    diag = getattr(error.orig, 'diag', None)
+    constraint_name = getattr(diag, 'constraint_name', None)
+
+    if constraint_name is None:
+        # Drivere care nu expun diag: căutăm numele constrângerii în mesaj
+        message = str(error.orig)
+        constraint_name = next((name for name in EXCLUSION_CONSTRAINT_TYPES if name in message), None)
+
+    conflict_type = EXCLUSION_CONSTRAINT_TYPES.get(constraint_name)
+
+    if conflict_type is None:
+        return None
+
+    return ScheduleConflictError(conflict_type, schedule_id)
+
+def _resource_entries(interval: ScheduleInterval, types: Sequence[str]) -> Iterable[Tuple[str, int]]:
+    if 'room' in types and interval.room_id is not None:
+        yield 'room', interval.room_id
+
+    if 'teacher' in types:
+        # Un cadru didactic poate apărea și ca titular, și ca asistent
+        for teacher_id in set(interval.teacher_ids):
+            yield 'teacher', teacher_id
+
+    if 'group' in types and interval.group_id is not None:
+        yield 'group', interval.group_id
+
+def detect_conflicts(intervals: Iterable[ScheduleInterval],
+                     types: Sequence[str] = CONFLICT_TYPES,
+                     resources: Optional[Dict[str, int]] = None) -> List[Conflict]:
+    """
+    Detectează toate suprapunerile de planificări pe aceeași resursă și în aceeași zi
+
+    Fiecare planificare produce câte o intrare (tip, resursă, zi, start, end) pentru
+    fiecare resursă folosită. Intrările sunt sortate o singură dată, apoi fiecare
+    grup (tip, resursă, zi) este parcurs cu o linie de baleiere: un heap cu
+    intervalele încă active, ordonat după ora de sfârșit. Complexitatea este
+    O(n log n + k), unde k este numărul de conflicte raportate.
+
+    Intervalele sunt semi-deschise: un examen care se termină la 12:00 nu se
+    suprapune cu unul care începe la 12:00. Planificările fără oră de început sau
+    de sfârșit (propuneri) sunt ignorate.
+
+    Args:
+        intervals: Intervalele planificărilor
+        types: Tipurile de resurse verificate (submulțime din CONFLICT_TYPES)
+        resources: Restrânge verificarea la anumite resurse, ex. {'room': 3}; tipurile
+            care lipsesc din dicționar nu sunt verificate (opțional)
+
+    Returns:
+        Lista conflictelor, cu schedule_id1 < schedule_id2, ordonată după zi, tip,
+        resursă și planificări
+    """
+    entries = []
+
+    for interval in intervals:
+        if interval.start_time is None or interval.end_time is None:
+            continue
+
+        for conflict_type, resource_id in _resource_entries(interval, types):
+            if resources is not None and resources.get(conflict_type) != resource_id:
+                continue
+
+            entries.append((interval.date, conflict_type, resource_id, interval.start_time, interval.end_time, interval.schedule_id))
+
+    entries.sort()
+
+    conflicts = []
+    current_key = None
+    active: List[Tuple[time, int]] = []
+
+    for day, conflict_type, resource_id, start_time, end_time, schedule_id in entries:
+        key = (day, conflict_type, resource_id)
+
+        if key != current_key:
+            current_key = key
+            active = []
+
+        # Eliminăm intervalele care s-au terminat înainte de începutul celui curent
+        while active and active[0][0] <= start_time:
+            heapq.heappop(active)
+
+        for _, other_id in active:
+            if other_id != schedule_id:
+                first, second = sorted((other_id, schedule_id))
+                conflicts.append(Conflict(conflict_type, resource_id, day, first, second))
+
+        heapq.heappush(active, (end_time, schedule_id))
+
+    conflicts.sort()
+    return conflicts
+
+def evaluate_candidates(intervals: Iterable[ScheduleInterval],
+                        candidates: Sequence[PlacementCandidate]) -> List[List[CandidateConflict]]:
+    """
+    Evaluează plasări de încercare față de ocuparea existentă și unele față de altele
+
+    Plasările pentru planificări diferite sunt considerate aplicate împreună: o
+    planificare din lot este verificată în poziția ei de încercare, nu în cea
+    curentă. Mai multe plasări pentru aceeași planificare sunt alternative și nu
+    sunt comparate între ele. Toate perechile sunt găsite cu detect_conflicts,
+    într-o singură trecere.
+
+    Args:
+        intervals: Ocuparea existentă (planificările active din zilele plasărilor) și
+            intervalele curente ale planificărilor din lot, din care se preiau
+            titularul, asistenții și grupa
+        candidates: Plasările de încercare
+
+    Returns:
+        Pentru fiecare plasare, în ordinea primită, lista conflictelor ei
+
+    Raises:
+        KeyError: Dacă o plasare se referă la o planificare care lipsește din intervals
+    """
+    current = {interval.schedule_id: interval for interval in intervals}
+    moved = {candidate.schedule_id for candidate in candidates}
+    trial = []
+
+    for index, candidate in enumerate(candidates):
+        base = current[candidate.schedule_id]
+        teacher_ids = base.teacher_ids if candidate.assistant_ids is None else (base.teacher_ids[0], *candidate.assistant_ids)
+        # ID-urile negative identifică plasările de încercare: -1 pentru prima, -2 pentru a doua etc.
+        trial.append(ScheduleInterval(-(index + 1), candidate.date, candidate.start_time, candidate.end_time,
+                                      candidate.room_id, teacher_ids, base.group_id))
+
+    results: List[List[CandidateConflict]] = [[] for _ in candidates]
+    snapshot = [interval for schedule_id, interval in current.items() if schedule_id not in moved]
+
+    for conflict in detect_conflicts([*snapshot, *trial]):
+        first, second = conflict.schedule_id1, conflict.schedule_id2
+
+        # schedule_id1 < schedule_id2, deci o pereche fără ID negativ nu implică plasări de încercare
+        if first > 0:
+            continue
+
+        first_index = -first - 1
+
+        if second > 0:
+            results[first_index].append(CandidateConflict(conflict.type, conflict.resource_id, second))
+            continue
+
+        second_index = -second - 1
+        if candidates[first_index].schedule_id == candidates[second_index].schedule_id:
+            continue
+
+        results[first_index].append(CandidateConflict(conflict.type, conflict.resource_id, candidates[second_index].schedule_id, second_index))
+        results[second_index].append(CandidateConflict(conflict.type, conflict.resource_id, candidates[first_index].schedule_id, first_index))
+
+    for conflicts in results:
+        conflicts.sort(key=lambda c: (c.type, c.resource_id, c.schedule_id, -1 if c.candidate is None else c.candidate))
+
+    return results
@@ -0,0 +1,319 @@
+"""
+Indexul persistent al conflictelor de planificare (tabela schedule_conflicts)
+
+Conflictele sunt păstrate ca perechi de planificări, pe găleți (resursă, zi). La
+fiecare flush al unei sesiuni care creează, modifică sau șterge o planificare,
+conflictele planificărilor atinse sunt recalculate doar în gălețile resurselor lor
+(sala, titularul, asistenții și grupa, în ziua planificării), în aceeași tranzacție.
+Citirea listei de conflicte este astfel proporțională cu numărul de conflicte, nu
+cu numărul de planificări.
+
+Două tranzacții simultane care adaugă câte una dintre două planificări suprapuse
+ar citi fiecare găleata fără planificarea celeilalte. În PostgreSQL, refresh_conflicts
+blochează de aceea fiecare găleată atinsă (pg_advisory_xact_lock, până la commit)
+înainte de a o citi: a doua tranzacție așteaptă commit-ul primei și, la nivelul de
+izolare implicit READ COMMITTED, vede planificarea ei. SQLite serializează oricum
+scrierile.
+
+Scrierile care ocolesc unitatea de lucru a sesiunii (UPDATE/INSERT în bloc) trebuie
+să apeleze explicit refresh_conflicts. Indexul poate fi reconstruit și verificat din
+linia de comandă (din rădăcina proiectului, cu DATABASE_URL setat):
+
+    python -m src.common.services.conflict_index_cli rebuild [--start-date 2025-06-01] [--end-date 2025-06-30]
+    python -m src.common.services.conflict_index_cli check
+"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from datetime import date
+import hashlib
+from sqlalchemy import delete, event, func, insert, inspect, or_, and_, select
+from sqlalchemy.orm import Session
+
+from src.common.models import Schedule, ScheduleConflict
+from src.common.models.schedule import schedule_assistants
+from src.common.services.conflict_detection import ScheduleInterval, Conflict, detect_conflicts
+
+# Câmpurile unei planificări care pot schimba conflictele ei
+INDEXED_FIELDS = ('date', 'start_time', 'end_time', 'room_id', 'teacher_id', 'group_id', 'status', 'assistants')
+
+# Planificările care pot intra în conflict: nerespinse și cu oră (ca în constrângerile de excludere)
+ACTIVE_SCHEDULE = (
+    Schedule.status != 'rejected',
+    Schedule.start_time.is_not(None),
+    Schedule.end_time.is_not(None)
+)
+
+def load_intervals(db, *conditions) -> List[ScheduleInterval]:
+    """
+    Încarcă intervalele planificărilor care îndeplinesc condițiile date
+
+    Sunt citite doar coloanele necesare (fără obiecte ORM), iar asistenții
+    tuturor planificărilor sunt încărcați într-o singură interogare.
+
+    Args:
+        db: Sesiunea sau conexiunea folosită
+        conditions: Condiții SQLAlchemy pe Schedule
+
+    Returns:
+        Listă de obiecte ScheduleInterval
+    """
+    rows = db.execute(
+        select(
+            Schedule.id, Schedule.date, Schedule.start_time, Schedule.end_time,
+            Schedule.room_id, Schedule.teacher_id, Schedule.group_id
+        ).where(*conditions)
+    ).all()
+
+    assistant_rows = db.execute(
+        select(schedule_assistants.c.schedule_id, schedule_assistants.c.teacher_id)
+        .join(Schedule, Schedule.id == schedule_assistants.c.schedule_id)
+        .where(*conditions)
+    ).all()
+
+    assistants: Dict[int, List[int]] = {}
+    for schedule_id, teacher_id in assistant_rows:
+        assistants.setdefault(schedule_id, []).append(teacher_id)
+
+    return [
+        ScheduleInterval(
+            schedule_id=row.id,
+            date=row.date,
+            start_time=row.start_time,
+            end_time=row.end_time,
+            room_id=row.room_id,
+            teacher_ids=(row.teacher_id, *assistants.get(row.id, ())),
+            group_id=row.group_id
+        )
+        for row in rows
+    ]
+
+def _conflict_rows(conflicts: Iterable[Conflict]) -> List[dict]:
+    return [
+        {
+            'type': conflict.type,
+            'resource_id': conflict.resource_id,
+            'date': conflict.date,
+            'schedule_id1': conflict.schedule_id1,
+            'schedule_id2': conflict.schedule_id2
+        }
+        for conflict in conflicts
+    ]
+
+def forget_conflicts(db, schedule_ids: Iterable[int]) -> None:
+    """
+    Șterge din index conflictele planificărilor date
+
+    Args:
+        db: Sesiunea sau conexiunea, în tranzacția modificării
+        schedule_ids: ID-urile planificărilor
+    """
+    ids = set(schedule_ids)
+    if ids:
+        db.execute(delete(ScheduleConflict).where(or_(
+            ScheduleConflict.schedule_id1.in_(ids),
+            ScheduleConflict.schedule_id2.in_(ids)
+        )))
+
+def bucket_lock_key(resource_type: str, resource_id: int, day: date) -> int:
+    """
+    Cheia (bigint) a lock-ului consultativ PostgreSQL pentru o găleată (resursă, zi)
+    """
+    digest = hashlib.blake2b(f"schedule_conflicts:{resource_type}:{resource_id}:{day.isoformat()}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+def lock_buckets(db, buckets: Iterable[Tuple[str, int, date]]) -> None:
+    """
+    Blochează gălețile date până la sfârșitul tranzacției (doar PostgreSQL)
+
+    Lock-urile sunt luate mereu în ordinea cheilor, ca să nu apară blocaje circulare
+    între două tranzacții care ating aceleași găleți.
+
+    Args:
+        db: Sesiunea sau conexiunea, în tranzacția modificării
+        buckets: Perechi (tip resursă, ID resursă, zi)
+    """
+    dialect = db.dialect if hasattr(db, 'dialect') else db.get_bind().dialect
+    keys = sorted({bucket_lock_key(*bucket) for bucket in buckets})
+
+    if dialect.name != 'postgresql' or not keys:
+        return
+
+    for key in keys:
+        db.execute(select(func.pg_advisory_xact_lock(key)))
+
+def refresh_conflicts(db, schedule_ids: Iterable[int]) -> int:
+    """
+    Recalculează conflictele planificărilor date, doar în gălețile (resursă, zi) atinse
+
+    Conflictele existente ale planificărilor sunt șterse; pentru fiecare zi sunt
+    citite doar planificările care folosesc una dintre sălile, cadrele didactice
+    (titulari sau asistenți) sau grupele planificărilor modificate. Planificările
+    șterse sau respinse rămân fără conflicte.
+
+    Args:
+        db: Sesiunea sau conexiunea, în tranzacția modificării
+        schedule_ids: ID-urile planificărilor create, modificate sau șterse
+
+    Returns:
+        Numărul de conflicte înregistrate pentru planificările date
+    """
+    ids = set(schedule_ids)
+    if not ids:
+        return 0
+
+    forget_conflicts(db, ids)
+
+    changed: Dict[date, List[ScheduleInterval]] = {}
+    for interval in load_intervals(db, Schedule.id.in_(ids), *ACTIVE_SCHEDULE):
+        changed.setdefault(interval.date, []).append(interval)
+
+    conflicts: Set[Conflict] = set()
+    resources: Dict[date, Tuple[Set[int], Set[int], Set[int]]] = {}
+
+    for day, intervals in changed.items():
+        resources[day] = (
+            {interval.room_id for interval in intervals if interval.room_id is not None},
+            {interval.group_id for interval in intervals},
+            {teacher_id for interval in intervals for teacher_id in interval.teacher_ids}
+        )
+
+    # Gălețile sunt citite abia după ce toate sunt blocate (vezi docstring-ul modulului)
+    lock_buckets(db, [
+        (resource_type, resource_id, day)
+        for day, used in resources.items()
+        for resource_type, resource_ids in zip(('room', 'group', 'teacher'), used)
+        for resource_id in resource_ids
+    ])
+
+    for day, (rooms, groups, teachers) in resources.items():
+
+        bucket = load_intervals(
+            db,
+            Schedule.date == day,
+            *ACTIVE_SCHEDULE,
+            or_(
+                Schedule.room_id.in_(rooms),
+                Schedule.group_id.in_(groups),
+                Schedule.teacher_id.in_(teachers),
+                Schedule.id.in_(select(schedule_assistants.c.schedule_id).where(schedule_assistants.c.teacher_id.in_(teachers)))
+            )
+        )
+
+        conflicts.update(
+            conflict for conflict in detect_conflicts(bucket)
+            if conflict.schedule_id1 in ids or conflict.schedule_id2 in ids
+        )
+
+    if conflicts:
+        db.execute(insert(ScheduleConflict), _conflict_rows(sorted(conflicts)))
+
+    return len(conflicts)
+
+def _date_conditions(column, start_date: Optional[date], end_date: Optional[date]) -> list:
+    conditions = []
+    if start_date:
+        conditions.append(column >= start_date)
+    if end_date:
+        conditions.append(column <= end_date)
+    return conditions
+
+def rebuild_conflicts(db, start_date: Optional[date] = None, end_date: Optional[date] = None) -> int:
+    """
+    Reconstruiește indexul conflictelor dintr-un interval de date (implicit toate zilele)
+
+    Args:
+        db: Sesiunea sau conexiunea folosită (apelantul face commit)
+        start_date: Data de început (opțional)
+        end_date: Data de sfârșit (opțional)
+
+    Returns:
+        Numărul de conflicte înregistrate
+    """
+    db.execute(delete(ScheduleConflict).where(*_date_conditions(ScheduleConflict.date, start_date, end_date)))
+
+    conflicts = detect_conflicts(load_intervals(db, *ACTIVE_SCHEDULE, *_date_conditions(Schedule.date, start_date, end_date)))
+
+    if conflicts:
+        db.execute(insert(ScheduleConflict), _conflict_rows(conflicts))
+
+    return len(conflicts)
+
+def query_conflicts(db,
+                    date_val: Optional[date] = None,
+                    start_date: Optional[date] = None,
+                    end_date: Optional[date] = None,
+                    resources: Optional[Dict[str, int]] = None) -> List[Conflict]:
+    """
+    Citește conflictele din index
+
+    Args:
+        db: Sesiunea sau conexiunea folosită
+        date_val: O singură zi (opțional)
+        start_date: Data de început (opțional)
+        end_date: Data de sfârșit (opțional)
+        resources: Restrânge rezultatul la anumite resurse, ex. {'room': 3} (opțional)
+
+    Returns:
+        Lista conflictelor, în ordinea întoarsă de detect_conflicts
+    """
+    conditions = _date_conditions(ScheduleConflict.date, start_date, end_date)
+
+    if date_val:
+        conditions.append(ScheduleConflict.date == date_val)
+
+    if resources:
+        conditions.append(or_(*(
+            and_(ScheduleConflict.type == conflict_type, ScheduleConflict.resource_id == resource_id)
+            for conflict_type, resource_id in resources.items()
+        )))
+
+    rows = db.execute(
+        select(
+            ScheduleConflict.type, ScheduleConflict.resource_id, ScheduleConflict.date,
+            ScheduleConflict.schedule_id1, ScheduleConflict.schedule_id2
+        ).where(*conditions).order_by(
+            ScheduleConflict.type, ScheduleConflict.resource_id, ScheduleConflict.date,
+            ScheduleConflict.schedule_id1, ScheduleConflict.schedule_id2
+        )
+    ).all()
+
+    return [Conflict(*row) for row in rows]
+
+def verify_conflicts(db,
+                     start_date: Optional[date] = None,
+                     end_date: Optional[date] = None) -> Tuple[List[Conflict], List[Conflict]]:
+    """
+    Compară indexul cu conflictele recalculate din planificări
+
+    Args:
+        db: Sesiunea sau conexiunea folosită
+        start_date: Data de început (opțional)
+        end_date: Data de sfârșit (opțional)
+
+    Returns:
+        (conflictele lipsă din index, conflictele din index care nu mai există)
+    """
+    expected = set(detect_conflicts(load_intervals(db, *ACTIVE_SCHEDULE, *_date_conditions(Schedule.date, start_date, end_date))))
+    stored = set(query_conflicts(db, start_date=start_date, end_date=end_date))
+
+    return sorted(expected - stored), sorted(stored - expected)
+
+def _schedule_changed(schedule: Schedule) -> bool:
+    state = inspect(schedule)
+    return any(state.attrs[field].history.has_changes() for field in INDEXED_FIELDS)
+
+@event.listens_for(Session, 'before_flush')
+def _forget_deleted_schedules(session, flush_context, instances):
+    """Elimină conflictele planificărilor șterse înainte ca rândurile lor să dispară"""
+    deleted_ids = [obj.id for obj in session.deleted if isinstance(obj, Schedule)]
+
+    if deleted_ids:
+        forget_conflicts(session.connection(), deleted_ids)
+
+@event.listens_for(Session, 'after_flush')
+def _refresh_flushed_schedules(session, flush_context):
+    """Recalculează conflictele planificărilor create sau modificate în flush"""
+    schedule_ids = [obj.id for obj in session.new if isinstance(obj, Schedule)]
+    schedule_ids += [obj.id for obj in session.dirty if isinstance(obj, Schedule) and _schedule_changed(obj)]
+
+    if schedule_ids:
+        refresh_conflicts(session.connection(), schedule_ids)
@@ -0,0 +1,55 @@
+"""
+Reconstruirea și verificarea indexului conflictelor de planificare
+
+Rulare (din rădăcina proiectului, cu DATABASE_URL setat):
+
+    python -m src.common.services.conflict_index_cli rebuild [--start-date 2025-06-01] [--end-date 2025-06-30]
+    python -m src.common.services.conflict_index_cli check
+
+Comanda check se termină cu codul 1 dacă indexul diferă de conflictele
+recalculate din planificări.
+"""
+from typing import List, Optional
+from datetime import date, datetime
+import argparse
+import os
+import sys
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.services.conflict_index import rebuild_conflicts, verify_conflicts
+
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Reconstruirea și verificarea indexului conflictelor de planificare")
+    parser.add_argument('command', choices=('rebuild', 'check'))
+    parser.add_argument('--start-date', type=_parse_date)
+    parser.add_argument('--end-date', type=_parse_date)
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL', 'postgresql://fiesc_admin:secure_password@db:5432/exam_scheduling'))
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    session = sessionmaker(bind=engine)()
+
+    try:
+        if args.command == 'rebuild':
+            count = rebuild_conflicts(session, args.start_date, args.end_date)
+            session.commit()
+            print(f"Index reconstruit: {count} conflicte")
+            return 0
+
+        missing, stale = verify_conflicts(session, args.start_date, args.end_date)
+        for label, conflicts in (('lipsă', missing), ('învechit', stale)):
+            for conflict in conflicts:
+                print(f"{label}: {conflict.type} {conflict.resource_id} {conflict.date} {conflict.schedule_id1}-{conflict.schedule_id2}")
+
+        print(f"Index {'consistent' if not missing and not stale else 'inconsistent'}: {len(missing)} lipsă, {len(stale)} învechite")
+        return 0 if not missing and not stale else 1
+    finally:
+        session.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,356 @@
+"""
+Trimiterea asincronă a email-urilor prin tabela email_outbox (transactional outbox)
+
+NotificationService nu mai trimite email-uri în cererea HTTP: adaugă câte un rând
+în email_outbox în aceeași tranzacție cu notificarea, iar un proces separat
+(EmailOutboxWorker, pornit cu email_outbox_cli) le trimite:
+
+- email-urile scadente sunt preluate în loturi de cel mult EMAIL_OUTBOX_BATCH și
+  marcate 'sending' până la locked_until; un worker oprit în timpul trimiterii
+  nu pierde email-urile, ele sunt preluate din nou după expirarea termenului;
+- email-urile identice sunt trimise împreună, într-o singură cerere
+  (BatchingEmailSender, vezi email_sender), iar cererile rulează în cel mult
+  EMAIL_OUTBOX_WORKERS fire de execuție;
+- o eroare temporară reprogramează email-ul cu întârziere exponențială
+  (EMAIL_OUTBOX_BACKOFF, dublată la fiecare încercare, cel mult
+  EMAIL_OUTBOX_BACKOFF_MAX); după EMAIL_OUTBOX_MAX_ATTEMPTS încercări sau la o
+  eroare permanentă (adresă respinsă) email-ul este marcat 'dead' și poate fi
+  repus în coadă din linia de comandă;
+- email-urile trimise sunt șterse după EMAIL_OUTBOX_RETENTION secunde.
+
+Un email poate fi trimis de două ori dacă workerul se oprește între trimitere și
+marcarea lui ca trimis; pentru notificări acest lucru este acceptabil.
+"""
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timedelta
+import os
+import random
+import threading
+import time
+from sqlalchemy import and_, delete, func, insert, literal, or_, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.common.models import EmailOutbox
+from src.common.services.email_sender import BatchingEmailSender, DeliveryResult, OutgoingEmail
+from src.common.utils import BoundedExecutor
+
+# Numărul de cereri de trimitere simultane ale unui worker
+EMAIL_OUTBOX_WORKERS = int(os.environ.get('EMAIL_OUTBOX_WORKERS', 4))
+
+# Numărul maxim de email-uri preluate într-un lot
+EMAIL_OUTBOX_BATCH = int(os.environ.get('EMAIL_OUTBOX_BATCH', 100))
+
+# Numărul de încercări după care un email este abandonat
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('EMAIL_OUTBOX_MAX_ATTEMPTS', 8))
+
+# Întârzierea (secunde) după prima încercare eșuată și întârzierea maximă
+EMAIL_OUTBOX_BACKOFF = int(os.environ.get('EMAIL_OUTBOX_BACKOFF', 30))
+EMAIL_OUTBOX_BACKOFF_MAX = int(os.environ.get('EMAIL_OUTBOX_BACKOFF_MAX', 3600))
+
+# Durata (secunde) cât un email preluat aparține workerului care l-a preluat
+EMAIL_OUTBOX_LEASE = int(os.environ.get('EMAIL_OUTBOX_LEASE', 300))
+
+# Intervalul (secunde) între verificări când coada este goală
+EMAIL_OUTBOX_POLL_INTERVAL = float(os.environ.get('EMAIL_OUTBOX_POLL_INTERVAL', 5))
+
+# Durata (secunde) cât sunt păstrate email-urile trimise
+EMAIL_OUTBOX_RETENTION = int(os.environ.get('EMAIL_OUTBOX_RETENTION', 7 * 24 * 3600))
+
+# Intervalul minim (secunde) între două curățări ale email-urilor trimise
+PURGE_INTERVAL = 3600
+
+OUTBOX_PENDING = 'pending'
+OUTBOX_SENDING = 'sending'
+OUTBOX_SENT = 'sent'
+OUTBOX_DEAD = 'dead'
+
+def enqueue_email(db: Session, to_email: str, subject: str, body: str, notification_id: Optional[int] = None) -> EmailOutbox:
+    """
+    Adaugă un email în email_outbox, în tranzacția curentă (fără commit)
+
+    Args:
+        db: Sesiunea tranzacției care creează notificarea
+        to_email: Adresa destinatarului
+        subject: Subiectul email-ului
+        body: Conținutul email-ului (text)
+        notification_id: ID-ul notificării însoțite (opțional)
+
+    Returns:
+        Rândul adăugat în sesiune
+    """
+    now = datetime.utcnow()
+    email = EmailOutbox(
+        notification_id=notification_id,
+        to_email=to_email,
+        subject=subject,
+        body=body,
+        status=OUTBOX_PENDING,
+        attempts=0,
+        next_attempt_at=now,
+        created_at=now
+    )
+    db.add(email)
+    return email
+
+def enqueue_emails_from_select(db: Session, addresses: Select, subject: str, body: str) -> int:
+    """
+    Adaugă în email_outbox câte un email pentru fiecare adresă întoarsă de o
+    interogare, într-o singură instrucțiune INSERT ... SELECT (fără commit)
+
+    Args:
+        db: Sesiunea tranzacției care creează notificările
+        addresses: Interogarea cu o singură coloană, adresa destinatarului
+        subject: Subiectul email-urilor
+        body: Conținutul email-urilor (text)
+
+    Returns:
+        Numărul de email-uri adăugate
+    """
+    now = datetime.utcnow()
+    recipients = addresses.subquery()
+    (to_email,) = recipients.c
+
+    result = db.execute(
+        insert(EmailOutbox).from_select(
+            ['to_email', 'subject', 'body', 'status', 'attempts', 'next_attempt_at', 'created_at'],
+            select(to_email, literal(subject), literal(body), literal(OUTBOX_PENDING), literal(0), literal(now), literal(now))
+        )
+    )
+    return result.rowcount
+
+def retry_delay(attempts: int, base: float = EMAIL_OUTBOX_BACKOFF, limit: float = EMAIL_OUTBOX_BACKOFF_MAX) -> float:
+    """
+    Calculează întârzierea până la următoarea încercare
+
+    Întârzierea se dublează la fiecare încercare, până la limit; o parte aleatoare
+    evită reîncercarea simultană a tuturor email-urilor eșuate odată.
+
+    Args:
+        attempts: Numărul de încercări făcute deja
+        base: Întârzierea după prima încercare
+        limit: Întârzierea maximă
+
+    Returns:
+        Întârzierea în secunde, între jumătate și întreaga valoare calculată
+    """
+    delay = min(limit, base * 2 ** max(attempts - 1, 0))
+    return random.uniform(delay / 2, delay)
+
+def outbox_counts(db: Session) -> Dict[str, int]:
+    """
+    Numără email-urile din email_outbox pe stări
+    """
+    counts = {status: 0 for status in (OUTBOX_PENDING, OUTBOX_SENDING, OUTBOX_SENT, OUTBOX_DEAD)}
+    for status, count in db.execute(select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)):
+        counts[status] = count
+    return counts
+
+def requeue_dead(db: Session) -> int:
+    """
+    Repune în coadă email-urile abandonate (de ex. după corectarea configurării)
+
+    Returns:
+        Numărul de email-uri repuse în coadă
+    """
+    result = db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.status == OUTBOX_DEAD)
+        .values(status=OUTBOX_PENDING, attempts=0, next_attempt_at=datetime.utcnow(), locked_until=None)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+class EmailOutboxWorker:
+    """
+    Worker care trimite email-urile din email_outbox
+
+    Mai mulți workeri (procese) pot rula simultan: un email preluat de unul nu
+    este preluat de altul până la expirarea termenului locked_until.
+    """
+
+    def __init__(self,
+                 session_factory: Callable[[], Session],
+                 transport: Any,
+                 sender: Optional[BatchingEmailSender] = None,
+                 max_workers: int = EMAIL_OUTBOX_WORKERS,
+                 batch_size: int = EMAIL_OUTBOX_BATCH,
+                 max_attempts: int = EMAIL_OUTBOX_MAX_ATTEMPTS,
+                 lease: int = EMAIL_OUTBOX_LEASE,
+                 retention: int = EMAIL_OUTBOX_RETENTION):
+        self.session_factory = session_factory
+        self.transport = transport
+        self.sender = sender if sender is not None else BatchingEmailSender(transport)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.lease = lease
+        self.retention = retention
+        self.executor = BoundedExecutor('email', max_workers, max(batch_size - max_workers, 0))
+        self._lock = threading.Lock()
+        self._last_purge = float('-inf')
+        self.sent = 0
+        self.retried = 0
+        self.dead = 0
+
+    def claim(self, limit: int) -> List[OutgoingEmail]:
+        """
+        Preia email-urile scadente (și pe cele ale căror termen de preluare a expirat)
+
+        Args:
+            limit: Numărul maxim de email-uri preluate
+
+        Returns:
+            Email-urile preluate, marcate 'sending' până la locked_until
+        """
+        session = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            locked_until = now + timedelta(seconds=self.lease)
+            claimable = or_(
+                and_(EmailOutbox.status == OUTBOX_PENDING, EmailOutbox.next_attempt_at <= now),
+                and_(EmailOutbox.status == OUTBOX_SENDING, EmailOutbox.locked_until < now)
+            )
+
+            statement = select(EmailOutbox.id).where(claimable).order_by(EmailOutbox.next_attempt_at, EmailOutbox.id).limit(limit)
+            if session.get_bind().dialect.name == 'postgresql':
+                statement = statement.with_for_update(skip_locked=True)
+            ids = session.execute(statement).scalars().all()
+
+            if not ids:
+                session.commit()
+                return []
+
+            # Condiția se repetă: un rând preluat între timp de alt worker nu mai corespunde
+            session.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_(ids), claimable)
+                .values(status=OUTBOX_SENDING, locked_until=locked_until, attempts=EmailOutbox.attempts + 1)
+                .execution_options(synchronize_session=False)
+            )
+            rows = session.execute(
+                select(EmailOutbox.id, EmailOutbox.to_email, EmailOutbox.subject, EmailOutbox.body, EmailOutbox.attempts)
+                .where(EmailOutbox.id.in_(ids), EmailOutbox.status == OUTBOX_SENDING, EmailOutbox.locked_until == locked_until)
+                .order_by(EmailOutbox.id)
+            ).all()
+            session.commit()
+
+            return [OutgoingEmail(*row) for row in rows]
+        except SQLAlchemyError:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _record(self, results: List[DeliveryResult]) -> None:
+        """Salvează rezultatul trimiterilor: trimise, reprogramate sau abandonate"""
+        session = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            sent_ids = [email.id for email, error, _ in results if error is None]
+            if sent_ids:
+                session.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id.in_(sent_ids))
+                    .values(status=OUTBOX_SENT, sent_at=now, locked_until=None, last_error=None)
+                    .execution_options(synchronize_session=False)
+                )
+
+            retried, dead = 0, 0
+            for email, error, permanent in results:
+                if error is None:
+                    continue
+
+                if permanent or email.attempts >= self.max_attempts:
+                    values = {'status': OUTBOX_DEAD}
+                    dead += 1
+                else:
+                    values = {'status': OUTBOX_PENDING, 'next_attempt_at': now + timedelta(seconds=retry_delay(email.attempts))}
+                    retried += 1
+
+                session.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id == email.id)
+                    .values(locked_until=None, last_error=error[:1000], **values)
+                    .execution_options(synchronize_session=False)
+                )
+            session.commit()
+
+            with self._lock:
+                self.sent += len(sent_ids)
+                self.retried += retried
+                self.dead += dead
+        except SQLAlchemyError:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def run_once(self) -> int:
+        """
+        Preia și trimite un lot de email-uri
+
+        Returns:
+            Numărul de email-uri preluate (0 dacă nu există email-uri scadente)
+        """
+        emails = self.claim(self.batch_size)
+        futures = [self.executor.submit(self.sender.send_batch, batch) for batch in self.sender.batches(emails)]
+        results = [result for future in futures for result in future.result()]
+
+        if results:
+            self._record(results)
+        return len(emails)
+
+    def purge_sent(self) -> int:
+        """
+        Șterge email-urile trimise mai vechi de retention secunde
+
+        Returns:
+            Numărul de email-uri șterse
+        """
+        session = self.session_factory()
+        try:
+            result = session.execute(
+                delete(EmailOutbox)
+                .where(EmailOutbox.status == OUTBOX_SENT, EmailOutbox.sent_at < datetime.utcnow() - timedelta(seconds=self.retention))
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            return result.rowcount
+        finally:
+            session.close()
+
+    def run_forever(self, stop: threading.Event, poll_interval: float = EMAIL_OUTBOX_POLL_INTERVAL) -> None:
+        """
+        Trimite email-uri până la setarea evenimentului stop
+
+        Loturile pline sunt urmate imediat de următorul; după un lot incomplet
+        workerul așteaptă poll_interval secunde.
+        """
+        while not stop.is_set():
+            try:
+                if time.monotonic() - self._last_purge >= PURGE_INTERVAL:
+                    self._last_purge = time.monotonic()
+                    self.purge_sent()
+
+                if self.run_once() >= self.batch_size:
+                    continue
+            except SQLAlchemyError as e:
+                print(f"Eroare la trimiterea email-urilor din coadă: {str(e)}")
+
+            stop.wait(poll_interval)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returnează statisticile workerului (procesul curent)
+        """
+        with self._lock:
+            counters = {'sent': self.sent, 'retried': self.retried, 'dead': self.dead}
+
+        counters['sender'] = self.sender.snapshot()
+        counters['pool'] = self.executor.snapshot()
+        return counters
+
+    def shutdown(self) -> None:
+        """Oprește pool-ul de trimitere, după terminarea trimiterilor în curs"""
+        self.executor.shutdown(wait=True)
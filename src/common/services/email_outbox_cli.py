@@ -0,0 +1,88 @@
+"""
+Workerul de trimitere a email-urilor din email_outbox
+
+Rulare (din rădăcina proiectului, cu DATABASE_URL și SENDGRID_API_KEY setate):
+
+    python -m src.common.services.email_outbox_cli run            # până la SIGTERM/SIGINT
+    python -m src.common.services.email_outbox_cli once           # un singur lot
+    python -m src.common.services.email_outbox_cli stats          # email-urile pe stări
+    python -m src.common.services.email_outbox_cli requeue-dead   # repune în coadă email-urile abandonate
+
+Cu --transport console email-urile nu sunt trimise, ci doar afișate (dezvoltare).
+"""
+from typing import List, Optional
+import argparse
+import os
+import signal
+import sys
+import threading
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.services.email_outbox import EmailOutboxWorker, outbox_counts, requeue_dead
+from src.common.services.email_sender import SendGridTransport
+
+class ConsoleEmailTransport:
+    """Transport de dezvoltare care doar afișează email-urile"""
+
+    def send_batch(self, emails):
+        for email in emails:
+            print(f"email {email.id} către {email.to_email}: {email.subject}")
+        return {}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Trimiterea email-urilor din email_outbox")
+    parser.add_argument('command', choices=('run', 'once', 'stats', 'requeue-dead'))
+    parser.add_argument('--transport', choices=('sendgrid', 'console'), default='sendgrid')
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL', 'postgresql://fiesc_admin:secure_password@db:5432/exam_scheduling'))
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    session_factory = sessionmaker(bind=engine)
+
+    try:
+        if args.command in ('stats', 'requeue-dead'):
+            session = session_factory()
+            try:
+                if args.command == 'requeue-dead':
+                    count = requeue_dead(session)
+                    session.commit()
+                    print(f"{count} email-uri repuse în coadă")
+                else:
+                    for status, count in outbox_counts(session).items():
+                        print(f"{status}: {count}")
+                return 0
+            finally:
+                session.close()
+
+        if args.transport == 'console':
+            transport = ConsoleEmailTransport()
+        elif not os.environ.get('SENDGRID_API_KEY'):
+            print("SendGrid API key nu este configurat (SENDGRID_API_KEY)")
+            return 2
+        else:
+            transport = SendGridTransport(
+                api_key=os.environ['SENDGRID_API_KEY'],
+                email_from=os.environ.get('EMAIL_FROM', 'planificare@fiesc.usv.ro'),
+                email_from_name=os.environ.get('EMAIL_FROM_NAME', 'Planificare Examene FIESC')
+            )
+
+        worker = EmailOutboxWorker(session_factory, transport)
+        try:
+            if args.command == 'once':
+                print(f"{worker.run_once()} email-uri procesate")
+                return 0
+
+            stop = threading.Event()
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: stop.set())
+            worker.run_forever(stop)
+            print(f"Worker oprit: {worker.snapshot()}")
+            return 0
+        finally:
+            worker.shutdown()
+    finally:
+        engine.dispose()
+
+if __name__ == "__main__":
+    sys.exit(main())
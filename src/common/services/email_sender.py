@@ -0,0 +1,310 @@
+"""
+Trimiterea email-urilor în loturi (SendGrid personalizations)
+
+Notificările trimise mai multor utilizatori au același subiect și conținut, deci
+nu este nevoie de câte o cerere HTTP pentru fiecare destinatar: BatchingEmailSender
+grupează email-urile identice și le trimite într-o singură cerere SendGrid, cu
+câte o personalizare (destinatar) pentru fiecare, cel mult
+SENDGRID_MAX_PERSONALIZATIONS pe cerere. Destinatarii nu se văd între ei.
+
+- Cererile folosesc o singură sesiune HTTP per proces (conexiuni păstrate și
+  refolosite), în locul unui client SendGrid nou pentru fiecare email.
+- Numărul de cereri pe secundă este limitat cu un token bucket (EMAIL_SEND_RATE,
+  rafale de cel mult EMAIL_SEND_BURST); după un răspuns 429 trimiterile sunt
+  suspendate pe durata din Retry-After.
+- Cererile, email-urile trimise și eșuate și durata cererilor sunt contorizate
+  (snapshot()).
+
+MemoryEmailTransport înlocuiește SendGrid în teste și în dezvoltare.
+"""
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from collections import OrderedDict
+import os
+import threading
+import time
+
+from src.common.utils import LatencyRecorder, TokenBucket
+
+# Numărul maxim de personalizări (destinatari) într-o cerere SendGrid
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
+SENDGRID_API_URL = 'https://api.sendgrid.com/v3/mail/send'
+
+# Durata maximă (secunde) a unei cereri către SendGrid
+SENDGRID_TIMEOUT = float(os.environ.get('SENDGRID_TIMEOUT', 30))
+
+# Numărul maxim de destinatari grupați într-o cerere
+EMAIL_SEND_BATCH = min(int(os.environ.get('EMAIL_SEND_BATCH', SENDGRID_MAX_PERSONALIZATIONS)), SENDGRID_MAX_PERSONALIZATIONS)
+
+# Numărul mediu de cereri pe secundă și rafala maximă, per proces
+EMAIL_SEND_RATE = float(os.environ.get('EMAIL_SEND_RATE', 10))
+EMAIL_SEND_BURST = int(os.environ.get('EMAIL_SEND_BURST', 20))
+
+# Numărul de conexiuni HTTP păstrate deschise de sesiunea procesului
+EMAIL_HTTP_POOL_SIZE = int(os.environ.get('EMAIL_HTTP_POOL_SIZE', 8))
+
+class OutgoingEmail(NamedTuple):
+    """Un email preluat din email_outbox pentru trimitere"""
+    id: int
+    to_email: str
+    subject: str
+    body: str
+    attempts: int
+
+class EmailDeliveryError(RuntimeError):
+    """
+    Excepție ridicată de un transport când trimiterea eșuează
+
+    permanent este True pentru erorile care nu dispar la reîncercare (ex. adresă
+    invalidă), iar retry_after este durata (secunde) cerută de furnizor înainte
+    de cererea următoare. recipient este True când furnizorul indică drept cauză
+    un destinatar al lotului (nu expeditorul sau conținutul), deci lotul merită
+    împărțit pentru a-l găsi.
+    """
+
+    def __init__(self, message: str, permanent: bool = False, retry_after: Optional[float] = None,
+                 recipient: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+        self.retry_after = retry_after
+        self.recipient = recipient
+
+# Rezultatul trimiterii unui email: (email, eroare sau None, eroare permanentă)
+DeliveryResult = Tuple[OutgoingEmail, Optional[str], bool]
+
+class SendGridTransport:
+    """
+    Transport prin API-ul SendGrid v3, cu sesiunea HTTP a procesului
+
+    send_batch trimite email-uri cu același subiect și conținut într-o singură
+    cerere, cu câte o personalizare pentru fiecare destinatar.
+    """
+
+    def __init__(self, api_key: str, email_from: str, email_from_name: Optional[str] = None,
+                 http_session: Any = None, timeout: float = SENDGRID_TIMEOUT):
+        self.email_from = email_from
+        self.email_from_name = email_from_name
+        self.timeout = timeout
+        self._http_session = http_session
+        self._headers = {'Authorization': f'Bearer {api_key}', 'Content-Type': 'application/json'}
+
+    @property
+    def http_session(self):
+        return self._http_session if self._http_session is not None else get_http_session()
+
+    def payload(self, emails: List[OutgoingEmail]) -> Dict[str, Any]:
+        """Corpul cererii SendGrid pentru un lot de email-uri identice"""
+        sender = {'email': self.email_from}
+        if self.email_from_name:
+            sender['name'] = self.email_from_name
+
+        return {
+            'personalizations': [{'to': [{'email': email.to_email}]} for email in emails],
+            'from': sender,
+            'subject': emails[0].subject,
+            'content': [{'type': 'text/plain', 'value': emails[0].body}]
+        }
+
+    def send_batch(self, emails: List[OutgoingEmail]) -> Dict[int, EmailDeliveryError]:
+        """
+        Trimite un lot de email-uri cu același subiect și conținut
+
+        Returns:
+            Erorile email-urilor respinse individual (SendGrid acceptă sau respinge
+            cererea în întregime, deci dicționarul este gol; BatchingEmailSender
+            împarte lotul respins din cauza unui destinatar pentru a-l găsi)
+
+        Raises:
+            EmailDeliveryError: Dacă cererea este respinsă sau SendGrid nu poate fi contactat
+        """
+        try:
+            response = self.http_session.post(SENDGRID_API_URL, json=self.payload(emails),
+                                              headers=self._headers, timeout=self.timeout)
+        except Exception as e:
+            raise EmailDeliveryError(f"SendGrid: {e}")
+
+        if 200 <= response.status_code < 300:
+            return {}
+
+        if response.status_code == 429:
+            retry_after = response.headers.get('Retry-After')
+            raise EmailDeliveryError("SendGrid 429: limită de cereri depășită",
+                                     retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None)
+
+        # 4xx înseamnă o cerere pe care SendGrid nu o va accepta niciodată; 401/403
+        # (cheie API greșită sau revocată) dispar după corectarea configurării
+        permanent = 400 <= response.status_code < 500 and response.status_code not in (401, 403)
+        # Erorile unui destinatar au câmpul personalizations.N.to.M.email; celelalte
+        # (expeditor neverificat, conținut prea mare sau invalid) privesc tot lotul
+        recipient = permanent and any(field.startswith('personalizations') for field in self.error_fields(response))
+        raise EmailDeliveryError(f"SendGrid {response.status_code}: {response.text[:500]}",
+                                 permanent=permanent, recipient=recipient)
+
+    @staticmethod
+    def error_fields(response) -> List[str]:
+        """Câmpurile cererii indicate de erorile din răspunsul SendGrid ({"errors": [{"field": ...}]})"""
+        try:
+            errors = response.json().get('errors') or []
+            return [error.get('field') or '' for error in errors if isinstance(error, dict)]
+        except (ValueError, AttributeError):
+            return []
+
+class MemoryEmailTransport:
+    """
+    Transport local care păstrează email-urile în memorie (teste și dezvoltare)
+
+    fail, dacă este dat, este apelat pentru fiecare email și poate ridica
+    EmailDeliveryError pentru a simula respingerea lui de către furnizor.
+    """
+
+    def __init__(self, fail: Optional[Callable[[OutgoingEmail], None]] = None):
+        self.fail = fail
+        self.sent: List[OutgoingEmail] = []
+        self.batches: List[List[OutgoingEmail]] = []
+        self._lock = threading.Lock()
+
+    def send_batch(self, emails: List[OutgoingEmail]) -> Dict[int, EmailDeliveryError]:
+        errors = {}
+        for email in emails:
+            if self.fail is not None:
+                try:
+                    self.fail(email)
+                except EmailDeliveryError as e:
+                    errors[email.id] = e
+
+        with self._lock:
+            self.batches.append(list(emails))
+            self.sent.extend(email for email in emails if email.id not in errors)
+        return errors
+
+class BatchingEmailSender:
+    """
+    Grupează email-urile identice în cereri cu mai mulți destinatari și limitează
+    rata cererilor
+
+    Metodele sunt sigure pentru mai multe fire de execuție; limita de rată este
+    comună tuturor firelor care folosesc același obiect.
+    """
+
+    def __init__(self, transport: Any, max_batch: int = EMAIL_SEND_BATCH,
+                 rate_limiter: Optional[TokenBucket] = None):
+        self.transport = transport
+        self.max_batch = max_batch
+        self.rate_limiter = rate_limiter if rate_limiter is not None else TokenBucket(EMAIL_SEND_RATE, EMAIL_SEND_BURST)
+        self.request_time = LatencyRecorder()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.sent = 0
+        self.failed = 0
+
+    def batches(self, emails: List[OutgoingEmail]) -> List[List[OutgoingEmail]]:
+        """
+        Grupează email-urile după subiect și conținut, în loturi de cel mult max_batch
+
+        Args:
+            emails: Email-urile de trimis
+
+        Returns:
+            Loturile, în ordinea primului email din fiecare grup
+        """
+        groups: 'OrderedDict[Tuple[str, str], List[OutgoingEmail]]' = OrderedDict()
+        for email in emails:
+            groups.setdefault((email.subject, email.body), []).append(email)
+
+        return [
+            group[start:start + self.max_batch]
+            for group in groups.values()
+            for start in range(0, len(group), self.max_batch)
+        ]
+
+    def send_batch(self, batch: List[OutgoingEmail]) -> List[DeliveryResult]:
+        """
+        Trimite un lot de email-uri identice printr-o singură cerere
+
+        Dacă furnizorul respinge definitiv o cerere cu mai mulți destinatari din
+        cauza unui destinatar (de ex. 400 pentru o singură adresă invalidă), lotul
+        este împărțit în două și retrimis, până rămân doar destinatarii respinși.
+        Erorile permanente care privesc cererea (expeditor, conținut) marchează tot
+        lotul, fără cereri suplimentare.
+
+        Args:
+            batch: Lotul (vezi batches)
+
+        Returns:
+            Rezultatul fiecărui email din lot
+        """
+        results = self._send(batch)
+
+        failed = sum(1 for _, error, _ in results if error is not None)
+        with self._lock:
+            self.sent += len(results) - failed
+            self.failed += failed
+        return results
+
+    def _send(self, batch: List[OutgoingEmail]) -> List[DeliveryResult]:
+        self.rate_limiter.acquire()
+        started_at = time.perf_counter()
+        results: Optional[List[DeliveryResult]] = None
+
+        try:
+            errors = self.transport.send_batch(batch)
+            results = [
+                (email, str(errors[email.id]), errors[email.id].permanent) if email.id in errors else (email, None, False)
+                for email in batch
+            ]
+        except EmailDeliveryError as e:
+            if e.retry_after:
+                self.rate_limiter.defer(e.retry_after)
+            if not (e.permanent and e.recipient and len(batch) > 1):
+                results = [(email, str(e), e.permanent) for email in batch]
+        except Exception as e:
+            results = [(email, str(e), False) for email in batch]
+        finally:
+            self.request_time.observe(time.perf_counter() - started_at)
+            with self._lock:
+                self.requests += 1
+
+        if results is None:
+            middle = len(batch) // 2
+            return self._send(batch[:middle]) + self._send(batch[middle:])
+        return results
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returnează contoarele și durata cererilor (procesul curent)
+        """
+        with self._lock:
+            counters = {'requests': self.requests, 'sent': self.sent, 'failed': self.failed}
+
+        counters['request_time'] = self.request_time.snapshot()
+        counters['rate_limit'] = self.rate_limiter.snapshot()
+        return counters
+
+# Sesiunea HTTP a procesului, creată la prima utilizare
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session():
+    """
+    Funcție pentru obținerea sesiunii HTTP (cu conexiuni refolosite) a procesului
+    """
+    global _http_session
+
+    with _http_session_lock:
+        if _http_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=EMAIL_HTTP_POOL_SIZE))
+            _http_session = session
+
+        return _http_session
+
+def _reset_http_session_after_fork():
+    # Conexiunile deschise de procesul părinte nu pot fi folosite în procesul copil
+    global _http_session, _http_session_lock
+    _http_session, _http_session_lock = None, threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_http_session_after_fork)
@@ -0,0 +1,230 @@
+"""
+Cache pe disc pentru fișierele exportate (Excel și PDF)
+
+Cheia unui export este hash-ul SHA-256 al formatului, al filtrelor și al versiunii
+datelor planificărilor (vezi schedule_read_model.data_version); aceeași cheie
+înseamnă același conținut, deci cheia este folosită și ca ETag. O scriere pe
+planificări schimbă versiunea, iar exporturile următoare primesc chei noi;
+fișierele vechi nu mai sunt citite și sunt eliminate de evacuarea LRU.
+
+Fișierele sunt scrise într-un fișier temporar din același director și mutate
+atomic la locul lor, deci cache-ul poate fi partajat de mai multe procese worker.
+Dimensiunea totală este limitată la EXPORT_CACHE_MAX_BYTES; la depășire sunt
+șterse fișierele folosite cel mai demult (data modificării este actualizată la
+fiecare citire).
+"""
+from typing import Any, BinaryIO, Callable, Dict, Optional
+from datetime import date
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Directorul cache-ului (partajat de procesele worker de pe aceeași mașină)
+EXPORT_CACHE_DIR = os.environ.get('EXPORT_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'fiesc_export_cache'))
+
+# Dimensiunea maximă a cache-ului, în octeți
+EXPORT_CACHE_MAX_BYTES = int(os.environ.get('EXPORT_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+# Se schimbă când se schimbă conținutul fișierelor generate (coloane, șablon HTML),
+# pentru ca fișierele generate de versiunea anterioară a codului să nu mai fie servite
+EXPORT_LAYOUT_VERSION = 1
+
+# Fișierele temporare mai vechi de atât (secunde) sunt rămășițe ale unor procese oprite
+STALE_TEMP_SECONDS = 3600
+
+CACHE_SUFFIX = '.export'
+TEMP_SUFFIX = '.tmp'
+
+def export_cache_key(export_format: str,
+                     version: int,
+                     group_id: Optional[int] = None,
+                     teacher_id: Optional[int] = None,
+                     start_date: Optional[date] = None,
+                     end_date: Optional[date] = None) -> str:
+    """
+    Calculează cheia unui export
+
+    Args:
+        export_format: Formatul ("xlsx" sau "pdf")
+        version: Versiunea datelor planificărilor
+        group_id: ID-ul grupei (opțional)
+        teacher_id: ID-ul cadrului didactic (opțional)
+        start_date: Data de început pentru filtrare (opțional)
+        end_date: Data de sfârșit pentru filtrare (opțional)
+
+    Returns:
+        Hash-ul SHA-256 (hex) al parametrilor exportului
+    """
+    parts = [
+        EXPORT_LAYOUT_VERSION, export_format, version, group_id or None, teacher_id or None,
+        start_date.isoformat() if start_date else None,
+        end_date.isoformat() if end_date else None
+    ]
+    return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+class ExportCache:
+    """
+    Cache pe disc cu evacuare LRU după dimensiune
+
+    Metodele sunt sigure pentru mai multe fire de execuție și mai multe procese;
+    lock(key) evită generarea aceluiași export de mai multe ori în paralel în
+    același proces.
+    """
+
+    def __init__(self, directory: str = EXPORT_CACHE_DIR, max_bytes: int = EXPORT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._locks = [threading.Lock() for _ in range(64)]
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def lock(self, key: str) -> threading.Lock:
+        """
+        Obține lock-ul (partajat pe grupuri de chei) sub care se generează un export
+        """
+        return self._locks[int(key[:8], 16) % len(self._locks)]
+
+    def open(self, key: str) -> Optional[BinaryIO]:
+        """
+        Deschide fișierul unui export din cache
+
+        Args:
+            key: Cheia exportului
+
+        Returns:
+            Fișierul deschis pentru citire sau None dacă nu este în cache
+        """
+        path = self._path(key)
+
+        try:
+            handle = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evacuat între timp de alt proces; fișierul deschis rămâne valid
+            pass
+
+        with self._stats_lock:
+            self.hits += 1
+        return handle
+
+    def store(self, key: str, write: Callable[[str], Any]) -> BinaryIO:
+        """
+        Generează un export și îl adaugă în cache
+
+        Args:
+            key: Cheia exportului
+            write: Funcția care scrie exportul în calea primită
+
+        Returns:
+            Fișierul exportului deschis pentru citire (valid și dacă fișierul este
+            evacuat între timp)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(suffix=TEMP_SUFFIX, dir=self.directory)
+        os.close(descriptor)
+
+        try:
+            write(temp_path)
+            handle = open(temp_path, 'rb')
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        with self._stats_lock:
+            self.misses += 1
+
+        self.evict()
+        return handle
+
+    def evict(self) -> int:
+        """
+        Șterge fișierele folosite cel mai demult până când cache-ul încape în max_bytes
+
+        Returns:
+            Numărul de fișiere șterse
+        """
+        entries = []
+        now = time.time()
+
+        try:
+            with os.scandir(self.directory) as iterator:
+                for entry in iterator:
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+
+                    if entry.name.endswith(CACHE_SUFFIX):
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    elif entry.name.endswith(TEMP_SUFFIX) and now - stat.st_mtime > STALE_TEMP_SECONDS:
+                        self._remove(entry.path)
+        except FileNotFoundError:
+            return 0
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            # Fișierele deja deschise rămân valide până la închidere
+            if self._remove(path):
+                removed += 1
+            total -= size
+
+        if removed:
+            with self._stats_lock:
+                self.evictions += removed
+        return removed
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            # Șters între timp de alt proces
+            return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returnează dimensiunea cache-ului și statisticile procesului curent
+        """
+        files, size = 0, 0
+        try:
+            with os.scandir(self.directory) as iterator:
+                for entry in iterator:
+                    if entry.name.endswith(CACHE_SUFFIX):
+                        try:
+                            size += entry.stat().st_size
+                            files += 1
+                        except FileNotFoundError:
+                            continue
+        except FileNotFoundError:
+            pass
+
+        with self._stats_lock:
+            return {
+                'files': files,
+                'bytes': size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+# Cache-ul partajat de toate instanțele ExportService din proces
+export_cache = ExportCache()
@@ -0,0 +1,364 @@
+"""
+Sarcini de export asincron (tabela export_jobs)
+
+Exporturile mari (Excel/PDF) nu mai trebuie generate în cererea HTTP: cererea
+creează o sarcină și primește ID-ul ei, generarea rulează într-un pool limitat de
+fire de execuție al procesului, iar fișierul rezultat este descărcat ulterior.
+
+- Starea sarcinilor este păstrată în baza de date, deci poate fi interogată din
+  orice proces worker; fișierele sunt scrise în EXPORT_JOB_DIR, care trebuie să
+  fie partajat de procesele care servesc descărcările.
+- O sarcină identică (aceeași cheie din cache-ul de exporturi: format, filtre și
+  versiunea datelor) aflată în așteptare, în execuție sau terminată și neexpirată
+  este refolosită în loc să fie creată una nouă.
+- Fișierele sarcinilor terminate sunt păstrate EXPORT_JOB_RETENTION secunde, apoi
+  sunt șterse împreună cu sarcina; sarcinile rămase în așteptare sau în execuție
+  mai mult de EXPORT_JOB_STALE_SECONDS (procesul lor a fost oprit) sunt marcate
+  ca eșuate.
+"""
+from typing import Any, BinaryIO, Callable, Dict, Optional, Tuple
+from datetime import date, datetime, timedelta
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.common.models import ExportJob
+from src.common.services.export_cache import ExportCache
+from src.common.services.export_service import ExportService, EXPORT_FORMATS
+from src.common.services.pdf_renderer import PdfRendererPool
+from src.common.utils import BoundedExecutor
+
+# Numărul de exporturi generate simultan per proces worker
+EXPORT_JOB_WORKERS = int(os.environ.get('EXPORT_JOB_WORKERS', 2))
+
+# Numărul de sarcini care pot aștepta în coada procesului
+EXPORT_JOB_QUEUE = int(os.environ.get('EXPORT_JOB_QUEUE', 20))
+
+# Durata (secunde) cât sunt păstrate fișierele sarcinilor terminate
+EXPORT_JOB_RETENTION = int(os.environ.get('EXPORT_JOB_RETENTION', 24 * 3600))
+
+# Durata (secunde) după care o sarcină neterminată este considerată întreruptă
+EXPORT_JOB_STALE_SECONDS = int(os.environ.get('EXPORT_JOB_STALE_SECONDS', 3600))
+
+# Directorul fișierelor generate (partajat de procesele worker)
+EXPORT_JOB_DIR = os.environ.get('EXPORT_JOB_DIR', os.path.join(tempfile.gettempdir(), 'fiesc_export_jobs'))
+
+# Intervalul minim (secunde) între două curățări ale sarcinilor expirate în același proces
+PURGE_INTERVAL = 60
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+
+def artifact_path(directory: str, job: ExportJob) -> str:
+    """Calea fișierului generat de o sarcină"""
+    return os.path.join(directory, f"{job.id}.{job.format}")
+
+def run_export_job(session_factory: Callable[[], Session],
+                   job_id: str,
+                   directory: str = EXPORT_JOB_DIR,
+                   cache: Optional[ExportCache] = None,
+                   pdf_renderer: Optional[PdfRendererPool] = None) -> Optional[str]:
+    """
+    Generează fișierul unei sarcini de export (rulează în pool-ul de export)
+
+    Args:
+        session_factory: Fabrica de sesiuni (sesiunea cererii nu poate fi folosită aici)
+        job_id: ID-ul sarcinii
+        directory: Directorul fișierelor generate
+        cache: Cache-ul de exporturi (implicit cel partajat de proces)
+        pdf_renderer: Pool-ul de renderere PDF (implicit cel partajat de proces)
+
+    Returns:
+        Starea finală a sarcinii sau None dacă sarcina nu mai era în așteptare
+    """
+    session = session_factory()
+
+    try:
+        job = session.get(ExportJob, job_id)
+        if job is None or job.status != JOB_QUEUED:
+            return None
+
+        job.status = JOB_RUNNING
+        job.started_at = datetime.utcnow()
+        session.commit()
+
+        try:
+            export_service = ExportService(db_session=session, pdf_renderer=pdf_renderer, cache=cache)
+            export_file = export_service.cached_export(
+                job.format, job.cache_key, job.group_id, job.teacher_id, job.start_date, job.end_date
+            )
+            if export_file is None:
+                raise RuntimeError("Eroare la generarea exportului")
+
+            # Copiem exportul lângă fișierele sarcinilor, unde nu este evacuat din cache
+            os.makedirs(directory, exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+            try:
+                with export_file, os.fdopen(descriptor, 'wb') as output:
+                    shutil.copyfileobj(export_file, output)
+                os.replace(temp_path, artifact_path(directory, job))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+            job.status = JOB_SUCCEEDED
+            job.size = os.path.getsize(artifact_path(directory, job))
+        except Exception as e:
+            session.rollback()
+            print(f"Eroare la sarcina de export {job_id}: {str(e)}")
+            job = session.get(ExportJob, job_id)
+            job.status = JOB_FAILED
+            job.error = str(e)
+
+        job.finished_at = datetime.utcnow()
+        job.expires_at = job.finished_at + timedelta(seconds=EXPORT_JOB_RETENTION)
+        session.commit()
+        return job.status
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"Eroare la actualizarea sarcinii de export {job_id}: {str(e)}")
+        return None
+    finally:
+        session.close()
+
+class ExportJobService:
+    """Serviciu pentru sarcinile de export asincron"""
+
+    def __init__(self,
+                 db_session: Session,
+                 session_factory: Callable[[], Session],
+                 executor: Optional[BoundedExecutor] = None,
+                 directory: str = EXPORT_JOB_DIR,
+                 cache: Optional[ExportCache] = None,
+                 pdf_renderer: Optional[PdfRendererPool] = None):
+        self.db_session = db_session
+        self.session_factory = session_factory
+        self._executor = executor
+        self.directory = directory
+        self.cache = cache
+        self.pdf_renderer = pdf_renderer
+
+    @property
+    def executor(self) -> BoundedExecutor:
+        """Pool-ul în care rulează sarcinile (implicit cel partajat de proces)"""
+        if self._executor is None:
+            self._executor = get_export_job_executor()
+        return self._executor
+
+    def submit(self,
+               export_format: str,
+               group_id: Optional[int] = None,
+               teacher_id: Optional[int] = None,
+               start_date: Optional[date] = None,
+               end_date: Optional[date] = None,
+               requested_by: Optional[int] = None) -> Optional[Tuple[ExportJob, bool]]:
+        """
+        Creează o sarcină de export sau o refolosește pe una identică
+
+        Args:
+            export_format: Formatul ("xlsx" sau "pdf")
+            group_id: ID-ul grupei (opțional)
+            teacher_id: ID-ul cadrului didactic (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            requested_by: ID-ul utilizatorului care a cerut exportul (opțional)
+
+        Returns:
+            (sarcina, True dacă a fost creată acum) sau None în caz de eroare
+
+        Raises:
+            ValueError: Dacă formatul nu este cunoscut
+            ExecutorSaturatedError: Dacă pool-ul de export și coada lui sunt pline
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Format de export necunoscut: {export_format}")
+
+        self._purge_periodically()
+
+        key = ExportService(db_session=self.db_session).export_key(export_format, group_id, teacher_id, start_date, end_date)
+        if key is None:
+            return None
+
+        try:
+            existing = self._find_reusable(key)
+            if existing is not None:
+                return existing, False
+
+            now = datetime.utcnow()
+            job = ExportJob(
+                id=uuid.uuid4().hex, format=export_format, group_id=group_id, teacher_id=teacher_id,
+                start_date=start_date, end_date=end_date, cache_key=key, status=JOB_QUEUED,
+                requested_by=requested_by, created_at=now
+            )
+            self.db_session.add(job)
+            self.db_session.commit()
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            print(f"Eroare la crearea sarcinii de export: {str(e)}")
+            return None
+
+        try:
+            self.executor.submit(run_export_job, self.session_factory, job.id, self.directory, self.cache, self.pdf_renderer)
+        except Exception as e:
+            # Sarcina nu a ajuns în coadă; nu trebuie refolosită de cererile următoare
+            job.status = JOB_FAILED
+            job.error = str(e)
+            job.finished_at = datetime.utcnow()
+            job.expires_at = job.finished_at
+            self.db_session.commit()
+            raise
+
+        return job, True
+
+    def _find_reusable(self, key: str) -> Optional[ExportJob]:
+        """Caută o sarcină identică în curs sau terminată cu succes și neexpirată"""
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=EXPORT_JOB_STALE_SECONDS)
+
+        return self.db_session.execute(
+            select(ExportJob)
+            .where(
+                ExportJob.cache_key == key,
+                or_(
+                    and_(ExportJob.status.in_((JOB_QUEUED, JOB_RUNNING)), ExportJob.created_at > stale_before),
+                    and_(ExportJob.status == JOB_SUCCEEDED, ExportJob.expires_at > now)
+                )
+            )
+            .order_by(ExportJob.created_at.desc())
+            .limit(1)
+        ).scalar()
+
+    def get_job(self, job_id: str) -> Optional[ExportJob]:
+        """
+        Obține o sarcină de export după ID
+
+        Args:
+            job_id: ID-ul sarcinii
+
+        Returns:
+            Sarcina sau None dacă nu există (sau a expirat și a fost ștearsă)
+        """
+        try:
+            return self.db_session.get(ExportJob, job_id)
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea sarcinii de export: {str(e)}")
+            return None
+
+    def open_artifact(self, job: ExportJob) -> Optional[BinaryIO]:
+        """
+        Deschide fișierul generat de o sarcină terminată cu succes
+
+        Args:
+            job: Sarcina
+
+        Returns:
+            Fișierul deschis pentru citire sau None dacă nu există sau a expirat
+        """
+        if job.status != JOB_SUCCEEDED or (job.expires_at and job.expires_at <= datetime.utcnow()):
+            return None
+
+        try:
+            return open(artifact_path(self.directory, job), 'rb')
+        except FileNotFoundError:
+            return None
+
+    def purge_expired(self) -> int:
+        """
+        Șterge sarcinile expirate împreună cu fișierele lor și marchează ca eșuate
+        sarcinile întrerupte
+
+        Returns:
+            Numărul de sarcini șterse
+        """
+        now = datetime.utcnow()
+
+        try:
+            self.db_session.execute(
+                update(ExportJob)
+                .where(
+                    ExportJob.status.in_((JOB_QUEUED, JOB_RUNNING)),
+                    ExportJob.created_at <= now - timedelta(seconds=EXPORT_JOB_STALE_SECONDS)
+                )
+                .values(status=JOB_FAILED, error="Sarcina a fost întreruptă", finished_at=now,
+                        expires_at=now + timedelta(seconds=EXPORT_JOB_RETENTION))
+            )
+
+            expired = self.db_session.execute(
+                select(ExportJob.id, ExportJob.format).where(ExportJob.expires_at <= now)
+            ).all()
+
+            if expired:
+                self.db_session.execute(
+                    delete(ExportJob)
+                    .where(ExportJob.id.in_([job_id for job_id, _ in expired]))
+                    .execution_options(synchronize_session='fetch')
+                )
+            self.db_session.commit()
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            print(f"Eroare la curățarea sarcinilor de export: {str(e)}")
+            return 0
+
+        for job_id, export_format in expired:
+            try:
+                os.unlink(os.path.join(self.directory, f"{job_id}.{export_format}"))
+            except FileNotFoundError:
+                pass
+
+        return len(expired)
+
+    def _purge_periodically(self):
+        global _last_purge
+
+        now = time.monotonic()
+        with _purge_lock:
+            if now - _last_purge < PURGE_INTERVAL:
+                return
+            _last_purge = now
+
+        self.purge_expired()
+
+# Momentul ultimei curățări în procesul curent
+_last_purge = float('-inf')
+_purge_lock = threading.Lock()
+
+# Pool-ul de export al procesului, creat la prima utilizare
+_executor: Optional[BoundedExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_export_job_executor() -> BoundedExecutor:
+    """
+    Funcție pentru obținerea pool-ului în care rulează sarcinile de export
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = BoundedExecutor('export', EXPORT_JOB_WORKERS, EXPORT_JOB_QUEUE)
+
+        return _executor
+
+def get_export_job_metrics() -> Optional[Dict[str, Any]]:
+    """
+    Funcție pentru obținerea metricilor pool-ului de export (None dacă nu a fost creat)
+    """
+    with _executor_lock:
+        executor = _executor
+
+    return executor.snapshot() if executor else None
+
+def _reset_executor_after_fork():
+    # Firele de execuție ale pool-ului nu există în procesul copil
+    global _executor, _executor_lock
+    _executor, _executor_lock = None, threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_executor_after_fork)
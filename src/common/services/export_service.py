@@ -1,20 +1,199 @@
-from typing import List, Optional, Dict, Any, BinaryIO
+from typing import Optional, BinaryIO, Union
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-import pandas as pd
+from sqlalchemy.sql import Select
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from datetime import date, datetime
+from html import escape
 import io
-from datetime import date
-import os
-import tempfile
-import pdfkit
 
-from src.common.models import Schedule, Subject, Teacher, Room, Group
+from src.common.models import Teacher, Group, ScheduleListing
+from src.common.services.schedule_read_model import listings_refreshed_at, data_version
+from src.common.services.export_cache import ExportCache, export_cache, export_cache_key
+from src.common.services.pdf_renderer import PdfRendererPool, PdfRenderTimeoutError, get_pdf_renderer_pool
+from src.common.utils import ExecutorSaturatedError
+
+# Coloanele fișierului Excel exportat
+EXCEL_COLUMNS = ('ID', 'Disciplina', 'Acronim', 'Cadru didactic', 'Grupa', 'Data', 'Ora început', 'Ora sfârșit', 'Sala', 'Status')
+
+# Numărul de rânduri citite dintr-o dată din baza de date la exportul Excel
+EXPORT_BATCH_ROWS = 1000
+
+# Formatele de export păstrate în cache
+EXPORT_FORMATS = ('xlsx', 'pdf')
+
+# Fragmentele documentului HTML din care se generează PDF-ul
+PDF_HEADER = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Planificare Examene FIESC</title>
+    <style>
+        body { font-family: Arial, sans-serif; }
+        h1 { text-align: center; color: #003366; }
+        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+        th { background-color: #003366; color: white; padding: 8px; text-align: left; }
+        td { padding: 8px; border-bottom: 1px solid #ddd; }
+        tr:nth-child(even) { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <h1>Planificare Examene FIESC</h1>
+"""
+
+PDF_TABLE_HEADER = """
+    <table>
+        <thead>
+            <tr>
+                <th>Disciplina</th>
+                <th>Cadru didactic</th>
+                <th>Grupa</th>
+                <th>Data</th>
+                <th>Ora</th>
+                <th>Sala</th>
+                <th>Status</th>
+            </tr>
+        </thead>
+        <tbody>
+"""
+
+PDF_ROW = """
+            <tr>
+                <td>{subject}</td>
+                <td>{teacher}</td>
+                <td>{group}</td>
+                <td>{date}</td>
+                <td>{start_time} - {end_time}</td>
+                <td>{room}</td>
+                <td>{status}</td>
+            </tr>
+"""
+
+PDF_FOOTER = """
+        </tbody>
+    </table>
+</body>
+</html>
+"""
+
+PDF_STATUS_TEXT = {
+    'proposed': 'Propus',
+    'approved': 'Aprobat',
+    'rejected': 'Respins'
+}
 
 class ExportService:
     """Serviciu pentru exportul datelor în formate Excel și PDF"""
     
-    def __init__(self, db_session: Session):
+    def __init__(self,
+                 db_session: Session,
+                 pdf_renderer: Optional[PdfRendererPool] = None,
+                 cache: Optional[ExportCache] = None):
         self.db_session = db_session
+        self._pdf_renderer = pdf_renderer
+        self.cache = cache if cache is not None else export_cache
+    
+    @property
+    def pdf_renderer(self) -> PdfRendererPool:
+        """Pool-ul de renderere PDF (implicit cel partajat de proces)"""
+        if self._pdf_renderer is None:
+            self._pdf_renderer = get_pdf_renderer_pool()
+        return self._pdf_renderer
+    
+    def _listings_statement(self,
+                            group_id: Optional[int] = None,
+                            teacher_id: Optional[int] = None,
+                            start_date: Optional[date] = None,
+                            end_date: Optional[date] = None) -> Select:
+        """
+        Construiește interogarea planificărilor de exportat din modelul de citire (schedule_listings)
+        
+        Args:
+            group_id: ID-ul grupei (opțional)
+            teacher_id: ID-ul cadrului didactic titular (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            
+        Returns:
+            Obiectul Select pentru rândurile aplatizate (rânduri simple, fără obiecte ORM)
+        """
+        statement = select(ScheduleListing.__table__)
+        
+        # Aplicăm filtrele
+        if group_id:
+            statement = statement.where(ScheduleListing.group_id == group_id)
+        
+        if teacher_id:
+            statement = statement.where(ScheduleListing.teacher_id == teacher_id)
+        
+        if start_date:
+            statement = statement.where(ScheduleListing.date >= start_date)
+        
+        if end_date:
+            statement = statement.where(ScheduleListing.date <= end_date)
+        
+        return statement
+    
+    def get_data_refreshed_at(self) -> Optional[datetime]:
+        """
+        Obține momentul ultimei actualizări a modelului de citire din care se exportă
+        
+        Returns:
+            Data și ora ultimei actualizări sau None dacă modelul este gol ori în caz de eroare
+        """
+        try:
+            return listings_refreshed_at(self.db_session)
+        except SQLAlchemyError as e:
+            print(f"Eroare la citirea stării modelului de citire: {str(e)}")
+            return None
+    
+    def _write_excel(self, path: Union[str, BinaryIO], statement: Select) -> int:
+        """
+        Scrie planificările într-un fișier Excel, cu memorie constantă
+        
+        Rândurile sunt citite în loturi de EXPORT_BATCH_ROWS (yield_per, cursor pe
+        server în PostgreSQL) și adăugate într-un registru write-only, care le
+        scrie imediat pe disc.
+        
+        Args:
+            path: Calea fișierului creat sau un fișier deschis pentru scriere
+            statement: Interogarea rândurilor de exportat
+            
+        Returns:
+            Numărul de planificări scrise
+        """
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet('Planificare Examene')
+        
+        header = []
+        for title in EXCEL_COLUMNS:
+            cell = WriteOnlyCell(sheet, value=title)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        sheet.append(header)
+        
+        count = 0
+        for row in self.db_session.execute(statement.execution_options(yield_per=EXPORT_BATCH_ROWS)):
+            sheet.append([
+                row.schedule_id,
+                row.subject_name,
+                row.subject_short_name,
+                f"{row.teacher_first_name} {row.teacher_last_name}",
+                row.group_name,
+                row.date,
+                row.start_time.strftime('%H:%M') if row.start_time else '',
+                row.end_time.strftime('%H:%M') if row.end_time else '',
+                row.room_name or '',
+                row.status
+            ])
+            count += 1
+        
+        workbook.save(path)
+        return count
     
     def export_to_excel(self, 
                         group_id: Optional[int] = None, 
@@ -24,6 +203,9 @@ class ExportService:
         """
         Exportă planificările examenelor în format Excel
         
+        Fișierul este construit în memorie; endpoint-urile folosesc cached_export,
+        care scrie exportul direct pe disc.
+        
         Args:
             group_id: ID-ul grupei (opțional)
             teacher_id: ID-ul cadrului didactic (opțional)
@@ -33,72 +215,80 @@ class ExportService:
         Returns:
             Conținutul fișierului Excel ca bytes sau None în caz de eroare
         """
+        output = io.BytesIO()
+        
         try:
-            # Construim query-ul pentru planificări
-            query = self.db_session.query(
-                Schedule.id,
-                Schedule.date,
-                Schedule.start_time,
-                Schedule.end_time,
-                Schedule.status,
-                Subject.name.label('subject_name'),
-                Subject.short_name.label('subject_short_name'),
-                Teacher.first_name.label('teacher_first_name'),
-                Teacher.last_name.label('teacher_last_name'),
-                Room.name.label('room_name'),
-                Group.name.label('group_name')
-            ).join(Subject, Schedule.subject_id == Subject.id)\
-             .join(Teacher, Schedule.teacher_id == Teacher.id)\
-             .join(Group, Schedule.group_id == Group.id)\
-             .outerjoin(Room, Schedule.room_id == Room.id)
-            
-            # Aplicăm filtrele
-            if group_id:
-                query = query.filter(Schedule.group_id == group_id)
-            
-            if teacher_id:
-                query = query.filter(Schedule.teacher_id == teacher_id)
-            
-            if start_date:
-                query = query.filter(Schedule.date >= start_date)
-            
-            if end_date:
-                query = query.filter(Schedule.date <= end_date)
-            
-            # Executăm query-ul
-            results = query.all()
-            
-            # Convertim rezultatele în dicționare
-            data = []
-            for row in results:
-                data.append({
-                    'ID': row.id,
-                    'Disciplina': row.subject_name,
-                    'Acronim': row.subject_short_name,
-                    'Cadru didactic': f"{row.teacher_first_name} {row.teacher_last_name}",
-                    'Grupa': row.group_name,
-                    'Data': row.date,
-                    'Ora început': row.start_time.strftime('%H:%M') if row.start_time else '',
-                    'Ora sfârșit': row.end_time.strftime('%H:%M') if row.end_time else '',
-                    'Sala': row.room_name or '',
-                    'Status': row.status
-                })
-            
-            # Creăm un DataFrame pandas
-            df = pd.DataFrame(data)
-            
-            # Exportăm DataFrame-ul în Excel
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Planificare Examene', index=False)
-            
-            return output.getvalue()
-        except SQLAlchemyError as e:
-            print(f"Eroare la exportul în Excel: {str(e)}")
-            return None
+            self._write_excel(output, self._listings_statement(group_id, teacher_id, start_date, end_date))
         except Exception as e:
             print(f"Eroare la exportul în Excel: {str(e)}")
             return None
+        
+        return output.getvalue()
+    
+    def _pdf_html(self, 
+                  statement: Select,
+                  group_id: Optional[int] = None, 
+                  teacher_id: Optional[int] = None, 
+                  start_date: Optional[date] = None,
+                  end_date: Optional[date] = None) -> str:
+        """
+        Construiește documentul HTML din care se generează PDF-ul
+        
+        Fragmentele sunt adunate într-o listă și unite o singură dată, iar valorile
+        din baza de date sunt escapate.
+        
+        Args:
+            statement: Interogarea rândurilor de exportat
+            group_id: ID-ul grupei (opțional)
+            teacher_id: ID-ul cadrului didactic (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            
+        Returns:
+            Documentul HTML
+        """
+        parts = [PDF_HEADER]
+        
+        # Adăugăm informații despre filtre
+        filters = []
+        if group_id:
+            group = self.db_session.query(Group).filter(Group.id == group_id).first()
+            if group:
+                filters.append(f"Grupa: {escape(group.name)}")
+        
+        if teacher_id:
+            teacher = self.db_session.query(Teacher).filter(Teacher.id == teacher_id).first()
+            if teacher:
+                filters.append(f"Cadru didactic: {escape(teacher.first_name)} {escape(teacher.last_name)}")
+        
+        if start_date:
+            filters.append(f"De la: {start_date.strftime('%d.%m.%Y')}")
+        
+        if end_date:
+            filters.append(f"Până la: {end_date.strftime('%d.%m.%Y')}")
+        
+        parts.append(f"<p><strong>Filtre aplicate:</strong> {', '.join(filters)}</p>")
+        parts.append(PDF_TABLE_HEADER)
+        
+        # Adăugăm tabelul cu date, citit în loturi
+        result = self.db_session.execute(statement.execution_options(yield_per=EXPORT_BATCH_ROWS))
+        for row in result:
+            start_time = row.start_time.strftime('%H:%M') if row.start_time else ''
+            end_time = row.end_time.strftime('%H:%M') if row.end_time else ''
+            
+            parts.append(PDF_ROW.format(
+                subject=escape(f"{row.subject_name} ({row.subject_short_name})"),
+                teacher=escape(f"{row.teacher_first_name} {row.teacher_last_name}"),
+                group=escape(row.group_name or ''),
+                date=row.date.strftime('%d.%m.%Y'),
+                start_time=start_time,
+                end_time=end_time,
+                room=escape(row.room_name or ''),
+                status=escape(PDF_STATUS_TEXT.get(row.status, row.status))
+            ))
+        
+        parts.append(PDF_FOOTER)
+        return "".join(parts)
     
     def export_to_pdf(self, 
                       group_id: Optional[int] = None, 
@@ -108,6 +298,9 @@ class ExportService:
         """
         Exportă planificările examenelor în format PDF
         
+        Randarea se face în pool-ul de renderere PDF al procesului (vezi
+        pdf_renderer.PdfRendererPool), care limitează numărul de randări simultane.
+        
         Args:
             group_id: ID-ul grupei (opțional)
             teacher_id: ID-ul cadrului didactic (opțional)
@@ -116,178 +309,112 @@ class ExportService:
             
         Returns:
             Conținutul fișierului PDF ca bytes sau None în caz de eroare
+            
+        Raises:
+            ExecutorSaturatedError: Dacă pool-ul de renderere și coada lui sunt pline
+            PdfRenderTimeoutError: Dacă randarea nu se termină în timpul permis
         """
         try:
-            # Construim query-ul pentru planificări
-            query = self.db_session.query(
-                Schedule.id,
-                Schedule.date,
-                Schedule.start_time,
-                Schedule.end_time,
-                Schedule.status,
-                Subject.name.label('subject_name'),
-                Subject.short_name.label('subject_short_name'),
-                Teacher.first_name.label('teacher_first_name'),
-                Teacher.last_name.label('teacher_last_name'),
-                Room.name.label('room_name'),
-                Group.name.label('group_name')
-            ).join(Subject, Schedule.subject_id == Subject.id)\
-             .join(Teacher, Schedule.teacher_id == Teacher.id)\
-             .join(Group, Schedule.group_id == Group.id)\
-             .outerjoin(Room, Schedule.room_id == Room.id)
-            
-            # Aplicăm filtrele
-            if group_id:
-                query = query.filter(Schedule.group_id == group_id)
-            
-            if teacher_id:
-                query = query.filter(Schedule.teacher_id == teacher_id)
-            
-            if start_date:
-                query = query.filter(Schedule.date >= start_date)
-            
-            if end_date:
-                query = query.filter(Schedule.date <= end_date)
-            
-            # Executăm query-ul
-            results = query.all()
-            
-            # Convertim rezultatele în dicționare
-            data = []
-            for row in results:
-                data.append({
-                    'ID': row.id,
-                    'Disciplina': row.subject_name,
-                    'Acronim': row.subject_short_name,
-                    'Cadru didactic': f"{row.teacher_first_name} {row.teacher_last_name}",
-                    'Grupa': row.group_name,
-                    'Data': row.date.strftime('%d.%m.%Y'),
-                    'Ora început': row.start_time.strftime('%H:%M') if row.start_time else '',
-                    'Ora sfârșit': row.end_time.strftime('%H:%M') if row.end_time else '',
-                    'Sala': row.room_name or '',
-                    'Status': row.status
-                })
-            
-            # Creăm un DataFrame pandas
-            df = pd.DataFrame(data)
-            
-            # Generăm HTML pentru PDF
-            html = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <title>Planificare Examene FIESC</title>
-                <style>
-                    body { font-family: Arial, sans-serif; }
-                    h1 { text-align: center; color: #003366; }
-                    table { width: 100%; border-collapse: collapse; margin-top: 20px; }
-                    th { background-color: #003366; color: white; padding: 8px; text-align: left; }
-                    td { padding: 8px; border-bottom: 1px solid #ddd; }
-                    tr:nth-child(even) { background-color: #f2f2f2; }
-                </style>
-            </head>
-            <body>
-                <h1>Planificare Examene FIESC</h1>
-            """
-            
-            # Adăugăm informații despre filtre
-            html += "<p><strong>Filtre aplicate:</strong> "
-            if group_id:
-                group = self.db_session.query(Group).filter(Group.id == group_id).first()
-                if group:
-                    html += f"Grupa: {group.name}, "
-            
-            if teacher_id:
-                teacher = self.db_session.query(Teacher).filter(Teacher.id == teacher_id).first()
-                if teacher:
-                    html += f"Cadru didactic: {teacher.first_name} {teacher.last_name}, "
-            
-            if start_date:
-                html += f"De la: {start_date.strftime('%d.%m.%Y')}, "
-            
-            if end_date:
-                html += f"Până la: {end_date.strftime('%d.%m.%Y')}, "
-            
-            html = html.rstrip(", ") + "</p>"
-            
-            # Adăugăm tabelul cu date
-            html += """
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Disciplina</th>
-                            <th>Cadru didactic</th>
-                            <th>Grupa</th>
-                            <th>Data</th>
-                            <th>Ora</th>
-                            <th>Sala</th>
-                            <th>Status</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-            """
-            
-            for _, row in df.iterrows():
-                status_text = {
-                    'proposed': 'Propus',
-                    'approved': 'Aprobat',
-                    'rejected': 'Respins'
-                }.get(row['Status'], row['Status'])
-                
-                html += f"""
-                        <tr>
-                            <td>{row['Disciplina']} ({row['Acronim']})</td>
-                            <td>{row['Cadru didactic']}</td>
-                            <td>{row['Grupa']}</td>
-                            <td>{row['Data']}</td>
-                            <td>{row['Ora început']} - {row['Ora sfârșit']}</td>
-                            <td>{row['Sala']}</td>
-                            <td>{status_text}</td>
-                        </tr>
-                """
-            
-            html += """
-                    </tbody>
-                </table>
-            </body>
-            </html>
-            """
-            
-            # Generăm PDF din HTML folosind pdfkit
-            options = {
-                'page-size': 'A4',
-                'margin-top': '20mm',
-                'margin-right': '20mm',
-                'margin-bottom': '20mm',
-                'margin-left': '20mm',
-                'encoding': 'UTF-8',
-                'no-outline': None
-            }
-            
-            # Salvăm HTML într-un fișier temporar
-            with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as f:
-                f.write(html.encode('utf-8'))
-                temp_html = f.name
-            
-            # Generăm PDF
-            output_pdf = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
-            output_pdf.close()
-            
-            pdfkit.from_file(temp_html, output_pdf.name, options=options)
-            
-            # Citim conținutul PDF
-            with open(output_pdf.name, 'rb') as f:
-                pdf_content = f.read()
-            
-            # Ștergem fișierele temporare
-            os.unlink(temp_html)
-            os.unlink(output_pdf.name)
-            
-            return pdf_content
+            # Citim rândurile aplatizate din modelul de citire (fără JOIN-uri)
+            statement = self._listings_statement(group_id, teacher_id, start_date, end_date)
+            html = self._pdf_html(statement, group_id, teacher_id, start_date, end_date)
+            
+            # HTML-ul este trimis renderer-ului prin stdin, fără fișiere temporare
+            return self.pdf_renderer.render(html)
+        except (ExecutorSaturatedError, PdfRenderTimeoutError):
+            raise
         except SQLAlchemyError as e:
             print(f"Eroare la exportul în PDF: {str(e)}")
             return None
         except Exception as e:
             print(f"Eroare la exportul în PDF: {str(e)}")
             return None
+    
+    def export_key(self, 
+                   export_format: str,
+                   group_id: Optional[int] = None, 
+                   teacher_id: Optional[int] = None, 
+                   start_date: Optional[date] = None,
+                   end_date: Optional[date] = None) -> Optional[str]:
+        """
+        Calculează cheia din cache (și ETag-ul) unui export, fără a-l genera
+        
+        Args:
+            export_format: Formatul ("xlsx" sau "pdf")
+            group_id: ID-ul grupei (opțional)
+            teacher_id: ID-ul cadrului didactic (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            
+        Returns:
+            Cheia exportului sau None în caz de eroare
+        """
+        try:
+            version = data_version(self.db_session)
+        except SQLAlchemyError as e:
+            print(f"Eroare la citirea versiunii datelor: {str(e)}")
+            return None
+        
+        return export_cache_key(export_format, version, group_id, teacher_id, start_date, end_date)
+    
+    def cached_export(self, 
+                      export_format: str,
+                      key: str,
+                      group_id: Optional[int] = None, 
+                      teacher_id: Optional[int] = None, 
+                      start_date: Optional[date] = None,
+                      end_date: Optional[date] = None) -> Optional[BinaryIO]:
+        """
+        Obține un export din cache, generându-l dacă lipsește
+        
+        Versiunea din cheie este citită înaintea datelor, deci un export generat
+        acum are date cel puțin la fel de noi ca versiunea din cheia lui.
+        
+        Args:
+            export_format: Formatul ("xlsx" sau "pdf")
+            key: Cheia întoarsă de export_key pentru aceleași filtre
+            group_id: ID-ul grupei (opțional)
+            teacher_id: ID-ul cadrului didactic (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            
+        Returns:
+            Fișierul exportului deschis pentru citire sau None în caz de eroare
+            
+        Raises:
+            ExecutorSaturatedError: Dacă pool-ul de renderere PDF și coada lui sunt pline
+            PdfRenderTimeoutError: Dacă randarea PDF nu se termină în timpul permis
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Format de export necunoscut: {export_format}")
+        
+        cached = self.cache.open(key)
+        if cached is not None:
+            return cached
+        
+        # Cererile simultane pentru același export îl generează o singură dată
+        with self.cache.lock(key):
+            cached = self.cache.open(key)
+            if cached is not None:
+                return cached
+            
+            if export_format == 'xlsx':
+                statement = self._listings_statement(group_id, teacher_id, start_date, end_date)
+                write = lambda path: self._write_excel(path, statement)
+            else:
+                pdf_content = self.export_to_pdf(group_id, teacher_id, start_date, end_date)
+                if pdf_content is None:
+                    return None
+                
+                def write(path):
+                    with open(path, 'wb') as f:
+                        f.write(pdf_content)
+            
+            try:
+                return self.cache.store(key, write)
+            except SQLAlchemyError as e:
+                print(f"Eroare la exportul în Excel: {str(e)}")
+                return None
+            except OSError as e:
+                print(f"Eroare la scrierea exportului în cache: {str(e)}")
+                return None
@@ -0,0 +1,205 @@
+"""
+Distribuirea notificărilor noi către clienții conectați (push)
+
+NotificationService publică fiecare notificare salvată (după commit) în broker,
+iar endpoint-ul /api/notifications/stream din FastAPI o trimite clienților
+conectați ai destinatarilor, prin Server-Sent Events. Clienții nu mai interoghează
+periodic lista de notificări: o conexiune inactivă nu folosește baza de date.
+
+- Destinatarii unui eveniment sunt dați prin ID-uri de utilizator și/sau roluri,
+  ca în build_recipients_condition; un fan-out către un rol întreg nu necesită
+  încărcarea ID-urilor din baza de date.
+- Fiecare client are o coadă de cel mult NOTIFICATION_STREAM_QUEUE evenimente.
+  Un client care nu citește destul de repede nu blochează publicarea: coada lui
+  este golită și înlocuită cu un eveniment 'resync', după care clientul reîncarcă
+  lista prin GET /api/notifications.
+- Numărul de clienți conectați la un proces este limitat la
+  NOTIFICATION_STREAM_MAX_CLIENTS.
+
+MemoryNotificationBroker distribuie evenimentele doar în procesul curent. Orice
+obiect cu metodele publish/subscribe/snapshot poate fi folosit în locul lui (de
+ex. peste Redis pub/sub sau LISTEN/NOTIFY din PostgreSQL, când notificările sunt
+create și de alte procese decât cel la care sunt conectați clienții).
+"""
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+from collections import deque
+import asyncio
+import os
+import threading
+
+# Numărul maxim de evenimente necitite păstrate pentru un client
+NOTIFICATION_STREAM_QUEUE = int(os.environ.get('NOTIFICATION_STREAM_QUEUE', 100))
+
+# Numărul maxim de clienți conectați la un proces
+NOTIFICATION_STREAM_MAX_CLIENTS = int(os.environ.get('NOTIFICATION_STREAM_MAX_CLIENTS', 1000))
+
+EVENT_NOTIFICATION = 'notification'
+EVENT_RESYNC = 'resync'
+
+class NotificationEvent(NamedTuple):
+    """Un eveniment trimis unui client"""
+    id: int
+    event: str
+    data: Dict[str, Any]
+
+class BrokerFullError(RuntimeError):
+    """Excepție ridicată când procesul are deja numărul maxim de clienți conectați"""
+
+class NotificationSubscription:
+    """
+    Coada de evenimente a unui client conectat
+
+    push poate fi apelat din orice fir de execuție; get se apelează din event
+    loop-ul în care a fost creat abonamentul.
+    """
+
+    def __init__(self, broker: 'MemoryNotificationBroker', user_id: int, role: Optional[str],
+                 max_queue: int, loop: asyncio.AbstractEventLoop):
+        self.broker = broker
+        self.user_id = user_id
+        self.role = role
+        self.max_queue = max_queue
+        self.closed = False
+        self._loop = loop
+        self._events: deque = deque()
+        self._wakeup = asyncio.Event()
+        self._lock = threading.Lock()
+
+    def push(self, event: NotificationEvent) -> bool:
+        """
+        Adaugă un eveniment în coadă, fără să aștepte clientul
+
+        Returns:
+            False dacă coada era plină și a fost înlocuită cu un eveniment 'resync'
+        """
+        with self._lock:
+            delivered = len(self._events) < self.max_queue
+            if not delivered:
+                self._events.clear()
+                event = NotificationEvent(event.id, EVENT_RESYNC, {})
+            self._events.append(event)
+
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # Event loop-ul clientului a fost oprit
+            self.close()
+        return delivered
+
+    async def get(self, timeout: float) -> List[NotificationEvent]:
+        """
+        Așteaptă evenimente noi
+
+        Args:
+            timeout: Durata maximă de așteptare (secunde)
+
+        Returns:
+            Toate evenimentele din coadă, sau o listă goală la expirarea timpului
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        with self._lock:
+            self._wakeup.clear()
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+    def close(self) -> None:
+        """Închide abonamentul; evenimentele următoare nu mai sunt primite"""
+        self.closed = True
+        self.broker.unsubscribe(self)
+
+class MemoryNotificationBroker:
+    """
+    Broker în memorie pentru clienții conectați la procesul curent
+
+    Metodele sunt sigure pentru mai multe fire de execuție: publish este apelat
+    din firele în care rulează NotificationService, subscribe din event loop.
+    """
+
+    def __init__(self, max_queue: int = NOTIFICATION_STREAM_QUEUE, max_clients: int = NOTIFICATION_STREAM_MAX_CLIENTS):
+        self.max_queue = max_queue
+        self.max_clients = max_clients
+        self._subscriptions: List[NotificationSubscription] = []
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self.published = 0
+        self.delivered = 0
+        self.overflowed = 0
+
+    def subscribe(self, user_id: int, role: Optional[str] = None) -> NotificationSubscription:
+        """
+        Conectează un client (din event loop-ul care va citi evenimentele)
+
+        Args:
+            user_id: ID-ul utilizatorului conectat
+            role: Rolul utilizatorului (pentru notificările trimise unui rol)
+
+        Returns:
+            Abonamentul clientului; se închide cu close()
+
+        Raises:
+            BrokerFullError: Dacă procesul are deja max_clients clienți conectați
+        """
+        subscription = NotificationSubscription(self, user_id, role, self.max_queue, asyncio.get_running_loop())
+
+        with self._lock:
+            if len(self._subscriptions) >= self.max_clients:
+                raise BrokerFullError("Prea mulți clienți conectați")
+            self._subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: NotificationSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def publish(self, data: Dict[str, Any], user_ids: Iterable[int] = (), roles: Iterable[str] = ()) -> int:
+        """
+        Trimite un eveniment clienților conectați ai destinatarilor
+
+        Args:
+            data: Conținutul evenimentului (serializabil JSON)
+            user_ids: ID-urile utilizatorilor destinatari
+            roles: Rolurile destinatarilor
+
+        Returns:
+            Numărul de clienți cărora le-a fost trimis evenimentul
+        """
+        user_ids: FrozenSet[int] = frozenset(user_ids)
+        roles: FrozenSet[str] = frozenset(roles)
+
+        with self._lock:
+            self._last_id += 1
+            event = NotificationEvent(self._last_id, EVENT_NOTIFICATION, data)
+            recipients = [
+                subscription for subscription in self._subscriptions
+                if subscription.user_id in user_ids or subscription.role in roles
+            ]
+
+        overflowed = sum(1 for subscription in recipients if not subscription.push(event))
+
+        with self._lock:
+            self.published += 1
+            self.delivered += len(recipients) - overflowed
+            self.overflowed += overflowed
+        return len(recipients)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Returnează numărul de clienți conectați și contoarele (procesul curent)
+        """
+        with self._lock:
+            return {
+                'clients': len(self._subscriptions),
+                'published': self.published,
+                'delivered': self.delivered,
+                'overflowed': self.overflowed
+            }
+
+# Broker-ul procesului, folosit implicit de NotificationService și de endpoint-ul stream
+notification_broker = MemoryNotificationBroker()
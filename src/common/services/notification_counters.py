@@ -0,0 +1,242 @@
+"""
+Contoarele notificărilor necitite (tabela notification_counters)
+
+Badge-ul de notificări are nevoie de numărul de notificări necitite la fiecare
+încărcare a paginii. În loc să numere rândurile din notifications, îl citește
+din notification_counters (căutare după cheia primară), printr-un cache în
+memorie; contoarele sunt actualizate atomic (UPDATE unread = unread + n) în
+tranzacția fiecărei scrieri:
+
+- la flush-ul unei sesiuni care creează sau șterge notificări necitite ori
+  schimbă coloana read, contorul destinatarului este actualizat automat;
+- scrierile care ocolesc unitatea de lucru a sesiunii (INSERT/UPDATE în bloc)
+  apelează explicit add_unread sau add_unread_from_select.
+
+După commit intrările utilizatorilor atinși sunt eliminate din cache-ul procesului
+curent (write-through invalidation). Scrierile altor procese nu pot invalida
+cache-ul acestui proces; intrările expiră după NOTIFICATION_COUNT_CACHE_TTL
+secunde, deci un contor poate întârzia cel mult atât.
+"""
+from typing import Dict, Iterable, Optional
+from collections import Counter, OrderedDict
+from datetime import datetime
+import os
+import threading
+import time
+from sqlalchemy import event, inspect, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from src.common.models import Notification, NotificationCounter
+
+# Durata (secunde) cât un contor este servit din cache fără recitire
+NOTIFICATION_COUNT_CACHE_TTL = float(os.environ.get('NOTIFICATION_COUNT_CACHE_TTL', 10))
+
+# Numărul maxim de utilizatori păstrați în cache
+NOTIFICATION_COUNT_CACHE_SIZE = int(os.environ.get('NOTIFICATION_COUNT_CACHE_SIZE', 10000))
+
+# Cheile din session.info cu utilizatorii ale căror contoare au fost modificate în tranzacție
+CHANGED_USERS_KEY = 'notification_counters.changed'
+CHANGED_ALL_KEY = 'notification_counters.changed_all'
+
+class UnreadCountCache:
+    """
+    Cache LRU cu expirare pentru contoarele notificărilor necitite
+
+    Metodele sunt sigure pentru mai multe fire de execuție. O valoare citită din
+    baza de date este păstrată doar dacă între timp nu a avut loc nicio
+    invalidare (generation), ca o citire începută înaintea unui commit să nu
+    readucă în cache valoarea veche.
+    """
+
+    def __init__(self, max_entries: int = NOTIFICATION_COUNT_CACHE_SIZE, ttl: float = NOTIFICATION_COUNT_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[int, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[int]:
+        """
+        Returnează contorul din cache sau None dacă lipsește ori a expirat
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or time.monotonic() - entry[1] > self.ttl:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, user_id: int, unread: int, generation: int) -> None:
+        """
+        Păstrează un contor citit din baza de date
+
+        Args:
+            user_id: ID-ul utilizatorului
+            unread: Numărul de notificări necitite
+            generation: Valoarea lui generation de dinaintea citirii
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+
+            self._entries[user_id] = (unread, time.monotonic())
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Elimină contoarele utilizatorilor dați (sau toate, dacă user_ids este None)
+        """
+        with self._lock:
+            self.generation += 1
+            if user_ids is None:
+                self._entries.clear()
+            else:
+                for user_id in user_ids:
+                    self._entries.pop(user_id, None)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Returnează dimensiunea și contoarele de utilizare ale cache-ului (procesul curent)
+        """
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+# Cache-ul procesului, folosit de NotificationService și AsyncNotificationService
+unread_count_cache = UnreadCountCache()
+
+def unread_count_statement(user_id: int) -> Select:
+    """
+    Construiește interogarea contorului unui utilizator (după cheia primară)
+    """
+    return select(NotificationCounter.unread).where(NotificationCounter.user_id == user_id)
+
+def add_unread(session: Session, deltas: Dict[int, int]) -> None:
+    """
+    Adaugă la contoarele utilizatorilor numărul de notificări necitite noi
+    (negativ pentru notificări citite sau șterse), fără commit
+
+    Args:
+        session: Sesiunea tranzacției care modifică notificările
+        deltas: ID utilizator -> diferența de notificări necitite
+    """
+    deltas = {int(user_id): delta for user_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    connection = session.connection()
+    table = NotificationCounter.__table__
+    now = datetime.utcnow()
+    upsert = connection.dialect.name in ('postgresql', 'sqlite')
+    existing = set() if upsert else set(connection.execute(
+        select(table.c.user_id).where(table.c.user_id.in_(deltas))
+    ).scalars())
+
+    # Rândurile sunt atinse mereu în aceeași ordine, ca să nu apară blocaje circulare
+    for user_id, delta in sorted(deltas.items()):
+        if upsert:
+            dialect_insert = postgresql.insert if connection.dialect.name == 'postgresql' else sqlite.insert
+            connection.execute(
+                dialect_insert(table).values(user_id=user_id, unread=max(delta, 0), updated_at=now)
+                .on_conflict_do_update(index_elements=['user_id'], set_={'unread': table.c.unread + delta, 'updated_at': now})
+            )
+        elif user_id in existing:
+            connection.execute(
+                update(table).where(table.c.user_id == user_id).values(unread=table.c.unread + delta, updated_at=now)
+            )
+        else:
+            connection.execute(insert(table).values(user_id=user_id, unread=max(delta, 0), updated_at=now))
+
+    session.info.setdefault(CHANGED_USERS_KEY, set()).update(deltas)
+
+def add_unread_from_select(session: Session, user_ids: Select) -> None:
+    """
+    Incrementează cu 1 contoarele utilizatorilor întorși de o interogare, într-o
+    singură instrucțiune INSERT ... SELECT (fără commit)
+
+    Args:
+        session: Sesiunea tranzacției care creează notificările
+        user_ids: Interogarea cu o singură coloană, ID-ul utilizatorului
+    """
+    connection = session.connection()
+    table = NotificationCounter.__table__
+    now = datetime.utcnow()
+    recipients = user_ids.subquery()
+    (user_id,) = recipients.c
+    # WHERE este necesar în SQLite pentru a separa SELECT de ON CONFLICT
+    rows = select(user_id, literal(1), literal(now)).where(user_id.isnot(None)).order_by(user_id)
+
+    if connection.dialect.name in ('postgresql', 'sqlite'):
+        dialect_insert = postgresql.insert if connection.dialect.name == 'postgresql' else sqlite.insert
+        connection.execute(
+            dialect_insert(table).from_select(['user_id', 'unread', 'updated_at'], rows)
+            .on_conflict_do_update(index_elements=['user_id'], set_={'unread': table.c.unread + 1, 'updated_at': now})
+        )
+    else:
+        connection.execute(
+            update(table).where(table.c.user_id.in_(select(user_id)))
+            .values(unread=table.c.unread + 1, updated_at=now)
+        )
+        connection.execute(
+            insert(table).from_select(
+                ['user_id', 'unread', 'updated_at'],
+                rows.where(user_id.notin_(select(table.c.user_id)))
+            )
+        )
+
+    session.info[CHANGED_ALL_KEY] = True
+
+def _read_delta(session, obj) -> int:
+    """Diferența de notificări necitite produsă de schimbarea coloanei read"""
+    history = inspect(obj).attrs.read.history
+    if not history.added:
+        return 0
+
+    if history.deleted:
+        was_unread = history.deleted[0] is None
+    else:
+        # Valoarea veche nu fusese încărcată înainte de modificare
+        was_unread = session.connection().execute(select(Notification.read).where(Notification.id == obj.id)).scalar() is None
+    return int(history.added[0] is None) - int(was_unread)
+
+@event.listens_for(Session, 'before_flush')
+def _count_flushed_notifications(session, flush_context, instances):
+    """Actualizează contoarele pentru notificările create, citite sau șterse prin sesiune"""
+    deltas: Counter = Counter()
+
+    for obj in session.new:
+        if isinstance(obj, Notification) and obj.read is None and obj.user_id is not None:
+            deltas[obj.user_id] += 1
+
+    for obj in session.dirty:
+        if isinstance(obj, Notification) and session.is_modified(obj):
+            deltas[obj.user_id] += _read_delta(session, obj)
+
+    for obj in session.deleted:
+        if isinstance(obj, Notification) and obj.read is None:
+            deltas[obj.user_id] -= 1
+
+    if any(deltas.values()):
+        add_unread(session, deltas)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_counters(session):
+    """Elimină din cache contoarele modificate de tranzacția salvată"""
+    changed = session.info.pop(CHANGED_USERS_KEY, None)
+    if session.info.pop(CHANGED_ALL_KEY, False):
+        unread_count_cache.invalidate()
+    elif changed:
+        unread_count_cache.invalidate(changed)
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_rolled_back_counters(session):
+    session.info.pop(CHANGED_USERS_KEY, None)
+    session.info.pop(CHANGED_ALL_KEY, None)
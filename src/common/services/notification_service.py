@@ -1,19 +1,109 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-import sendgrid
-from sendgrid.helpers.mail import Mail, Email, To, Content
-import os
+from sqlalchemy.sql import Select
+from sqlalchemy import insert, literal, or_, select, update, func
+from datetime import datetime
+import math
 
 from src.common.models import Notification, User
+from src.common.services.email_outbox import enqueue_email, enqueue_emails_from_select
+from src.common.services.notification_broker import notification_broker
+from src.common.services.notification_counters import add_unread, add_unread_from_select, unread_count_cache, unread_count_statement
+
+# Subiectul email-urilor care însoțesc notificările
+EMAIL_SUBJECT = "Notificare nouă"
+
+def build_user_notifications_statement(user_id: int, unread_only: bool = False) -> Select:
+    """
+    Construiește interogarea pentru notificările unui utilizator
+
+    Interogarea este folosită atât de NotificationService, cât și de varianta
+    asincronă AsyncNotificationService.
+
+    Returns:
+        Obiectul Select pentru notificările utilizatorului, cele mai noi primele
+    """
+    statement = select(Notification).where(Notification.user_id == user_id)
+    
+    if unread_only:
+        statement = statement.where(Notification.read.is_(None))
+    
+    return statement.order_by(Notification.created_at.desc(), Notification.id.desc())
+
+def build_recipients_condition(recipients: Optional[List[int]] = None, role: Optional[str] = None):
+    """
+    Construiește condiția pe users care selectează destinatarii unei notificări
+
+    Args:
+        recipients: ID-urile utilizatorilor (opțional)
+        role: Rolul utilizatorilor (opțional)
+
+    Returns:
+        Condiția SQL (utilizatorii dați sau cei cu rolul dat)
+    """
+    conditions = []
+    if recipients:
+        conditions.append(User.id.in_(recipients))
+    if role:
+        conditions.append(User.role == role)
+    return or_(*conditions) if conditions else User.id.is_(None)
+
+def build_pagination(page: int, per_page: int, total_items: int) -> Dict[str, int]:
+    """
+    Construiește metadatele de paginare incluse în răspunsurile API
+    """
+    return {
+        'page': page,
+        'per_page': per_page,
+        'total_pages': math.ceil(total_items / per_page) if per_page else 0,
+        'total_items': total_items
+    }
 
 class NotificationService:
-    """Serviciu pentru gestionarea notificărilor"""
+    """
+    Serviciu pentru gestionarea notificărilor
     
-    def __init__(self, db_session: Session, sendgrid_api_key: Optional[str] = None, email_from: Optional[str] = None):
+    Email-urile care însoțesc notificările sunt adăugate în email_outbox în aceeași
+    tranzacție cu notificările și sunt trimise de workerul din
+    src/common/services/email_outbox.py, nu în cererea HTTP.
+    
+    După commit, notificările sunt publicate în broker (vezi notification_broker),
+    care le trimite clienților conectați ai destinatarilor.
+    """
+    
+    def __init__(self, db_session: Session, api_key: Optional[str] = None, broker: Any = None):
         self.db_session = db_session
-        self.sendgrid_api_key = sendgrid_api_key or os.environ.get('SENDGRID_API_KEY')
-        self.email_from = email_from or os.environ.get('EMAIL_FROM', 'planificare@fiesc.usv.ro')
+        # Cheia SendGrid este folosită doar de workerul email_outbox; parametrul
+        # este păstrat pentru apelanții existenți
+        self.api_key = api_key
+        self.broker = broker if broker is not None else notification_broker
+    
+    def publish(self, title: str, message: str, notification_type: str,
+                user_ids: Optional[List[int]] = None, roles: Optional[List[str]] = None,
+                notification_id: Optional[int] = None) -> None:
+        """
+        Publică o notificare salvată către clienții conectați ai destinatarilor
+        
+        Se apelează după commit; o eroare a broker-ului nu anulează notificarea,
+        clienții o vor vedea la următoarea reîncărcare a listei.
+        
+        Args:
+            title: Titlul notificării
+            message: Mesajul notificării
+            notification_type: Tipul notificării
+            user_ids: ID-urile utilizatorilor destinatari (opțional)
+            roles: Rolurile destinatarilor (opțional)
+            notification_id: ID-ul notificării, dacă este una singură (opțional)
+        """
+        try:
+            self.broker.publish(
+                {'id': notification_id, 'title': title, 'message': message, 'type': notification_type},
+                user_ids=user_ids or (),
+                roles=roles or ()
+            )
+        except Exception as e:
+            print(f"Eroare la publicarea notificării: {str(e)}")
     
     def get_notifications(self, user_id: int, status: Optional[str] = None) -> List[Notification]:
         """
@@ -37,23 +127,93 @@ class NotificationService:
             print(f"Eroare la obținerea notificărilor: {str(e)}")
             return []
     
-    def mark_notification_as_read(self, notification_id: int) -> Optional[Notification]:
+    def get_user_notifications(self, user_id: int, unread_only: bool = False, page: int = 1, per_page: int = 10) -> Tuple[List[Notification], Dict[str, int]]:
+        """
+        Obține o pagină din notificările unui utilizator
+        
+        Args:
+            user_id: ID-ul utilizatorului
+            unread_only: Dacă se returnează doar notificările necitite
+            page: Numărul paginii (începând de la 1)
+            per_page: Numărul de notificări per pagină
+            
+        Returns:
+            Tuple cu lista de notificări și metadatele de paginare
+        """
+        try:
+            statement = build_user_notifications_statement(user_id, unread_only)
+            
+            total_items = self.db_session.execute(
+                select(func.count()).select_from(statement.order_by(None).subquery())
+            ).scalar_one()
+            
+            notifications = self.db_session.execute(
+                statement.offset((page - 1) * per_page).limit(per_page)
+            ).scalars().all()
+            
+            return list(notifications), build_pagination(page, per_page, total_items)
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea notificărilor: {str(e)}")
+            return [], build_pagination(page, per_page, 0)
+    
+    def get_unread_count(self, user_id: int) -> int:
+        """
+        Obține numărul de notificări necitite ale unui utilizator
+        
+        Valoarea este citită din cache sau din notification_counters (după cheia
+        primară), fără interogarea tabelei notifications.
+        
+        Args:
+            user_id: ID-ul utilizatorului
+            
+        Returns:
+            Numărul de notificări necitite (0 în caz de eroare)
+        """
+        unread = unread_count_cache.get(user_id)
+        if unread is not None:
+            return unread
+        
+        try:
+            generation = unread_count_cache.generation
+            unread = max(self.db_session.execute(unread_count_statement(user_id)).scalar() or 0, 0)
+            unread_count_cache.put(user_id, unread, generation)
+            return unread
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea numărului de notificări necitite: {str(e)}")
+            return 0
+    
+    def mark_notification_as_read(self, notification_id: int, user_id: Optional[int] = None) -> Optional[Notification]:
         """
         Marchează o notificare ca citită
         
+        Notificarea este marcată cu o singură instrucțiune UPDATE condiționată de
+        read IS NULL, deci contorul de necitite scade o singură dată chiar dacă
+        notificarea este marcată simultan din mai multe cereri.
+        
         Args:
             notification_id: ID-ul notificării
+            user_id: ID-ul utilizatorului căruia trebuie să-i aparțină notificarea (opțional)
             
         Returns:
-            Obiectul Notification actualizat sau None în caz de eroare
+            Obiectul Notification actualizat sau None dacă nu există (sau aparține
+            altui utilizator) ori în caz de eroare
         """
         try:
-            notification = self.db_session.query(Notification).filter(Notification.id == notification_id).first()
+            conditions = [Notification.id == notification_id]
+            if user_id is not None:
+                conditions.append(Notification.user_id == int(user_id))
             
+            notification = self.db_session.execute(select(Notification).where(*conditions)).scalar_one_or_none()
             if not notification:
                 return None
             
-            notification.status = 'read'
+            marked = self.db_session.execute(
+                update(Notification)
+                .where(*conditions, Notification.read.is_(None))
+                .values(read=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            add_unread(self.db_session, {notification.user_id: -marked})
             self.db_session.commit()
             
             return notification
@@ -62,13 +222,42 @@ class NotificationService:
             print(f"Eroare la marcarea notificării ca citită: {str(e)}")
             return None
     
-    def create_notification(self, user_id: int, message: str) -> Optional[Notification]:
+    def mark_all_notifications_as_read(self, user_id: int) -> int:
+        """
+        Marchează ca citite toate notificările necitite ale unui utilizator
+        
+        Args:
+            user_id: ID-ul utilizatorului
+            
+        Returns:
+            Numărul de notificări marcate (0 în caz de eroare)
+        """
+        try:
+            user_id = int(user_id)
+            marked = self.db_session.execute(
+                update(Notification)
+                .where(Notification.user_id == user_id, Notification.read.is_(None))
+                .values(read=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            add_unread(self.db_session, {user_id: -marked})
+            self.db_session.commit()
+            
+            return marked
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            print(f"Eroare la marcarea notificărilor ca citite: {str(e)}")
+            return 0
+    
+    def create_notification(self, user_id: int, message: str, title: str = EMAIL_SUBJECT, notification_type: str = 'info') -> Optional[Notification]:
         """
-        Creează o notificare nouă
+        Creează o notificare nouă și pune în coadă email-ul care o însoțește
         
         Args:
             user_id: ID-ul utilizatorului destinatar
             message: Mesajul notificării
+            title: Titlul notificării (opțional)
+            notification_type: Tipul notificării (opțional, implicit 'info')
             
         Returns:
             Obiectul Notification creat sau None în caz de eroare
@@ -76,63 +265,114 @@ class NotificationService:
         try:
             notification = Notification(
                 user_id=user_id,
+                title=title,
                 message=message,
-                status='unread'
+                type=notification_type
             )
             
             self.db_session.add(notification)
-            self.db_session.commit()
+            self.db_session.flush()
             
-            # Trimitem și un email
+            # Email-ul este salvat în aceeași tranzacție cu notificarea
             user = self.db_session.query(User).filter(User.id == user_id).first()
             if user:
-                self.send_email_notification(user.email, "Notificare nouă", message)
+                self.send_email_notification(user.email, title, message, notification_id=notification.id)
             
+            notification_id = notification.id
+            self.db_session.commit()
+            self.publish(title, message, notification_type, user_ids=[user_id], notification_id=notification_id)
             return notification
         except SQLAlchemyError as e:
             self.db_session.rollback()
             print(f"Eroare la crearea notificării: {str(e)}")
             return None
     
-    def send_email_notification(self, to_email: str, subject: str, message: str) -> bool:
+    def send_email_notification(self, to_email: str, subject: str, message: str, notification_id: Optional[int] = None) -> bool:
         """
-        Trimite o notificare prin email
+        Pune în coadă o notificare prin email
+        
+        Email-ul este adăugat în email_outbox în tranzacția curentă (fără commit) și
+        este trimis de workerul email_outbox după commit.
         
         Args:
             to_email: Adresa de email a destinatarului
             subject: Subiectul email-ului
             message: Conținutul email-ului
+            notification_id: ID-ul notificării însoțite (opțional)
             
         Returns:
-            True dacă email-ul a fost trimis cu succes, False în caz contrar
+            True dacă email-ul a fost pus în coadă
         """
-        if not self.sendgrid_api_key:
-            print("SendGrid API key nu este configurat")
-            return False
+        enqueue_email(self.db_session, to_email, subject, message, notification_id=notification_id)
+        return True
+    
+    def fan_out(self, condition, title: str, message: str, notification_type: str = 'info', send_email: bool = True) -> int:
+        """
+        Creează aceeași notificare pentru toți utilizatorii care îndeplinesc condiția
         
-        try:
-            sg = sendgrid.SendGridAPIClient(api_key=self.sendgrid_api_key)
-            
-            from_email = Email(self.email_from)
-            to_email = To(to_email)
-            content = Content("text/plain", message)
-            
-            mail = Mail(from_email, to_email, subject, content)
+        Notificările (și email-urile) sunt inserate, iar contoarele de necitite
+        incrementate, cu câte o instrucțiune INSERT ... SELECT din users, fără
+        încărcarea utilizatorilor în memorie, într-o singură tranzacție (fără commit).
+        
+        Args:
+            condition: Condiția pe users (vezi build_recipients_condition)
+            title: Titlul notificării
+            message: Mesajul notificării
+            notification_type: Tipul notificării
+            send_email: Dacă se pune în coadă și câte un email
             
-            response = sg.client.mail.send.post(request_body=mail.get())
+        Returns:
+            Numărul de notificări create
+        """
+        result = self.db_session.execute(
+            insert(Notification).from_select(
+                ['user_id', 'title', 'message', 'type'],
+                select(User.id, literal(title), literal(message), literal(notification_type)).where(condition)
+            )
+        )
+        add_unread_from_select(self.db_session, select(User.id).where(condition))
+        
+        if send_email:
+            enqueue_emails_from_select(self.db_session, select(User.email).where(condition), title, message)
+        
+        return result.rowcount
+    
+    def send_notification(self,
+                          title: str,
+                          message: str,
+                          notification_type: str,
+                          recipients: Optional[List[int]] = None,
+                          role: Optional[str] = None,
+                          send_email: bool = False,
+                          sender_id: Optional[int] = None) -> int:
+        """
+        Trimite o notificare utilizatorilor dați și/sau tuturor utilizatorilor cu un rol
+        
+        Args:
+            title: Titlul notificării
+            message: Mesajul notificării
+            notification_type: Tipul notificării (system, schedule, deadline, info)
+            recipients: ID-urile utilizatorilor destinatari (opțional)
+            role: Rolul utilizatorilor destinatari (opțional)
+            send_email: Dacă se trimite și email
+            sender_id: ID-ul utilizatorului care trimite notificarea (opțional)
             
-            if response.status_code >= 200 and response.status_code < 300:
-                return True
-            else:
-                print(f"Eroare la trimiterea email-ului: {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"Eroare la trimiterea email-ului: {str(e)}")
-            return False
+        Returns:
+            Numărul de notificări trimise
+        """
+        try:
+            count = self.fan_out(build_recipients_condition(recipients, role), title, message, notification_type, send_email)
+            self.db_session.commit()
+            self.publish(title, message, notification_type, user_ids=recipients, roles=[role] if role else None)
+            return count
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            print(f"Eroare la trimiterea notificării: {str(e)}")
+            return 0
     
     def notify_group_leaders(self, message: str) -> int:
         """
-        Trimite o notificare tuturor șefilor de grupă
+        Trimite o notificare (și email) tuturor șefilor de grupă
         
         Args:
             message: Mesajul notificării
@@ -141,21 +381,9 @@ class NotificationService:
             Numărul de notificări trimise
         """
         try:
-            group_leaders = self.db_session.query(User).filter(User.role == 'SG').all()
-            
-            count = 0
-            for leader in group_leaders:
-                notification = Notification(
-                    user_id=leader.id,
-                    message=message,
-                    status='unread'
-                )
-                
-                self.db_session.add(notification)
-                self.send_email_notification(leader.email, "Notificare nouă", message)
-                count += 1
-            
+            count = self.fan_out(User.role == 'SG', EMAIL_SUBJECT, message)
             self.db_session.commit()
+            self.publish(EMAIL_SUBJECT, message, 'info', roles=['SG'])
             return count
         except SQLAlchemyError as e:
             self.db_session.rollback()
@@ -164,7 +392,7 @@ class NotificationService:
     
     def notify_teachers(self, message: str) -> int:
         """
-        Trimite o notificare tuturor cadrelor didactice
+        Trimite o notificare (și email) tuturor cadrelor didactice
         
         Args:
             message: Mesajul notificării
@@ -173,21 +401,9 @@ class NotificationService:
             Numărul de notificări trimise
         """
         try:
-            teachers = self.db_session.query(User).filter(User.role == 'CD').all()
-            
-            count = 0
-            for teacher in teachers:
-                notification = Notification(
-                    user_id=teacher.id,
-                    message=message,
-                    status='unread'
-                )
-                
-                self.db_session.add(notification)
-                self.send_email_notification(teacher.email, "Notificare nouă", message)
-                count += 1
-            
+            count = self.fan_out(User.role == 'CD', EMAIL_SUBJECT, message)
             self.db_session.commit()
+            self.publish(EMAIL_SUBJECT, message, 'info', roles=['CD'])
             return count
         except SQLAlchemyError as e:
             self.db_session.rollback()
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.common.models import Teacher, Room, Subject, Group
+from src.common.services.room_availability import room_availability
 
 class OrarIntegrationService:
     """Serviciu pentru integrarea cu API-ul Orar USV"""
@@ -171,6 +172,9 @@ class OrarIntegrationService:
                 count += 1
             
             self.db_session.commit()
+            
+            # Indexul sălilor libere recitește sălile (capacități noi sau modificate)
+            room_availability.invalidate_rooms()
             return count
         except SQLAlchemyError as e:
             self.db_session.rollback()
@@ -0,0 +1,198 @@
+from typing import Any, Callable, Dict, Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import os
+import threading
+import pdfkit
+
+from src.common.utils import BoundedExecutor
+
+# Numărul de randări PDF simultane (procese wkhtmltopdf) per proces worker
+PDF_RENDER_WORKERS = int(os.environ.get('PDF_RENDER_WORKERS', 2))
+
+# Numărul de randări care pot aștepta în coadă; peste această limită cererile
+# sunt respinse imediat (503), în loc să țină ocupate firele serverului
+PDF_RENDER_QUEUE = int(os.environ.get('PDF_RENDER_QUEUE', 8))
+
+# Timpul maxim (secunde) cât o cerere așteaptă rezultatul randării
+PDF_RENDER_TIMEOUT = float(os.environ.get('PDF_RENDER_TIMEOUT', 60))
+
+# Opțiunile wkhtmltopdf pentru documentele exportate
+PDF_OPTIONS = {
+    'page-size': 'A4',
+    'margin-top': '20mm',
+    'margin-right': '20mm',
+    'margin-bottom': '20mm',
+    'margin-left': '20mm',
+    'encoding': 'UTF-8',
+    'no-outline': None
+}
+
+class PdfRenderTimeoutError(RuntimeError):
+    """Excepție ridicată când randarea unui PDF nu se termină în timpul permis"""
+
+    def __init__(self, timeout: float):
+        super().__init__(f"Randarea PDF nu s-a terminat în {timeout:g} secunde")
+        self.timeout = timeout
+
+class WkhtmltopdfRenderer:
+    """
+    Renderer PDF bazat pe wkhtmltopdf
+
+    Configurarea pdfkit (căutarea executabilului) este făcută o singură dată, la
+    crearea renderer-ului; la fiecare randare HTML-ul este trimis prin stdin și
+    PDF-ul este citit din stdout, fără fișiere temporare.
+    """
+
+    def __init__(self, options: Optional[Dict[str, Any]] = None):
+        self.options = dict(PDF_OPTIONS if options is None else options)
+        self.configuration = pdfkit.configuration()
+
+    def render(self, html: str) -> bytes:
+        """
+        Generează un PDF din HTML
+
+        Args:
+            html: Documentul HTML
+
+        Returns:
+            Conținutul fișierului PDF
+        """
+        return pdfkit.from_string(html, False, options=self.options, configuration=self.configuration)
+
+class PdfRendererPool:
+    """
+    Pool limitat de renderere PDF cu coadă de sarcini și metrici
+
+    Fiecare fir de execuție al pool-ului își creează renderer-ul la prima sarcină
+    și îl refolosește pentru următoarele. Numărul de sarcini acceptate este
+    limitat la max_workers + max_queue (vezi BoundedExecutor), iar metricile
+    includ adâncimea cozii, timpul de așteptare și timpul de randare.
+    """
+
+    def __init__(self,
+                 max_workers: int = PDF_RENDER_WORKERS,
+                 max_queue: int = PDF_RENDER_QUEUE,
+                 timeout: float = PDF_RENDER_TIMEOUT,
+                 renderer_factory: Callable[[], Any] = WkhtmltopdfRenderer):
+        self.timeout = timeout
+        self.renderer_factory = renderer_factory
+        self._executor = BoundedExecutor('pdf', max_workers, max_queue)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.renderers = 0
+
+    def _renderer(self) -> Any:
+        renderer = getattr(self._local, 'renderer', None)
+
+        if renderer is None:
+            renderer = self._local.renderer = self.renderer_factory()
+            with self._lock:
+                self.renderers += 1
+
+        return renderer
+
+    def _render(self, html: str) -> bytes:
+        return self._renderer().render(html)
+
+    def submit(self, html: str) -> Future:
+        """
+        Adaugă o randare în coada pool-ului
+
+        Args:
+            html: Documentul HTML
+
+        Returns:
+            Future cu conținutul fișierului PDF
+
+        Raises:
+            ExecutorSaturatedError: Dacă pool-ul și coada sunt pline
+        """
+        return self._executor.submit(self._render, html)
+
+    def render(self, html: str, timeout: Optional[float] = None) -> bytes:
+        """
+        Generează un PDF în pool și așteaptă rezultatul
+
+        Args:
+            html: Documentul HTML
+            timeout: Timpul maxim de așteptare în secunde (implicit self.timeout)
+
+        Returns:
+            Conținutul fișierului PDF
+
+        Raises:
+            ExecutorSaturatedError: Dacă pool-ul și coada sunt pline
+            PdfRenderTimeoutError: Dacă randarea nu se termină în timpul permis
+        """
+        timeout = self.timeout if timeout is None else timeout
+        future = self.submit(html)
+
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # Dacă sarcina încă așteaptă în coadă, locul ei este eliberat
+            future.cancel()
+            raise PdfRenderTimeoutError(timeout)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returnează starea pool-ului; run_time este timpul de randare
+        """
+        metrics = self._executor.snapshot()
+        with self._lock:
+            metrics['renderers'] = self.renderers
+        return metrics
+
+    def shutdown(self, wait: bool = True):
+        """
+        Oprește pool-ul
+
+        Args:
+            wait: Dacă se așteaptă terminarea randărilor în curs
+        """
+        self._executor.shutdown(wait=wait)
+
+# Pool-ul de renderere al procesului, creat la prima utilizare
+_pool: Optional[PdfRendererPool] = None
+_pool_lock = threading.Lock()
+
+def get_pdf_renderer_pool() -> PdfRendererPool:
+    """
+    Funcție pentru obținerea pool-ului de renderere PDF al procesului
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = PdfRendererPool()
+
+        return _pool
+
+def get_pdf_render_metrics() -> Optional[Dict[str, Any]]:
+    """
+    Funcție pentru obținerea metricilor pool-ului de renderere (None dacă nu a fost creat)
+    """
+    with _pool_lock:
+        pool = _pool
+
+    return pool.snapshot() if pool else None
+
+def shutdown_pdf_renderer_pool(wait: bool = True):
+    """
+    Funcție pentru oprirea pool-ului de renderere PDF (la oprirea aplicației)
+    """
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+
+    if pool:
+        pool.shutdown(wait=wait)
+
+def _reset_pool_after_fork():
+    # Firele de execuție ale pool-ului nu există în procesul copil
+    global _pool, _pool_lock
+    _pool, _pool_lock = None, threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
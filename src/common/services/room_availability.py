@@ -0,0 +1,275 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from datetime import date, time
+from bisect import bisect_left
+import os
+import threading
+import time as timer
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.common.models import Room, Schedule
+
+# Durata (secunde) după care ocuparea unei zile este recitită din baza de date.
+# Modificările făcute prin ScheduleService în procesul curent sunt aplicate imediat;
+# reîncărcarea periodică preia modificările făcute de alte procese worker.
+ROOM_AVAILABILITY_TTL = float(os.environ.get('ROOM_AVAILABILITY_TTL', 30))
+
+class RoomInfo(NamedTuple):
+    """Datele unei săli păstrate în index (independente de sesiunea SQLAlchemy)"""
+    id: int
+    name: str
+    short_name: str
+    capacity: int
+    building: Optional[str]
+    floor: Optional[int]
+
+class Booking(NamedTuple):
+    """Intervalul în care o planificare ocupă o sală"""
+    date: date
+    room_id: int
+    start_time: time
+    end_time: time
+
+def schedule_booking(schedule: Schedule) -> Optional[Booking]:
+    """
+    Obține intervalul în care o planificare ocupă sala
+
+    Args:
+        schedule: Planificarea
+
+    Returns:
+        Booking sau None dacă planificarea nu ocupă nicio sală (fără sală sau oră, respinsă)
+    """
+    if schedule.status == 'rejected' or None in (schedule.room_id, schedule.start_time, schedule.end_time):
+        return None
+
+    return Booking(schedule.date, schedule.room_id, schedule.start_time, schedule.end_time)
+
+class _RoomList(NamedTuple):
+    """Sălile grupate pe capacități, sortate crescător (capacities[i] este capacitatea grupei buckets[i])"""
+    loaded_at: float
+    capacities: List[int]
+    buckets: List[List[RoomInfo]]
+
+class _RoomDay:
+    """Ocuparea unei săli într-o zi: rezervările și intervalele ocupate reunite, sortate"""
+    __slots__ = ('bookings', 'starts', 'ends')
+
+    def __init__(self):
+        self.bookings: Dict[int, Tuple[time, time]] = {}
+        self.starts: List[time] = []
+        self.ends: List[time] = []
+
+    def rebuild(self) -> None:
+        # Intervalele suprapuse sau consecutive sunt reunite, deci starts și ends
+        # rămân sortate și disjuncte
+        starts, ends = [], []
+        for start_time, end_time in sorted(self.bookings.values()):
+            if ends and start_time <= ends[-1]:
+                ends[-1] = max(ends[-1], end_time)
+            else:
+                starts.append(start_time)
+                ends.append(end_time)
+        self.starts, self.ends = starts, ends
+
+    def is_free(self, start_time: time, end_time: time) -> bool:
+        # Ultimul interval ocupat care începe înainte de end_time este singurul care
+        # se poate suprapune cu [start_time, end_time)
+        index = bisect_left(self.starts, end_time) - 1
+        return index < 0 or self.ends[index] <= start_time
+
+class RoomAvailabilityIndex:
+    """
+    Index în memorie al ocupării sălilor, pentru căutarea sălilor libere
+
+    Pentru fiecare zi consultată, indexul păstrează pentru fiecare sală intervalele
+    ocupate, reunite și sortate, deci verificarea unei săli este o căutare binară
+    (O(log n) în numărul de rezervări ale sălii în ziua respectivă). Sălile sunt
+    grupate pe capacități, sortate crescător, iar filtrul de capacitate minimă
+    sare direct la prima grupă potrivită.
+
+    Zilele sunt încărcate la prima interogare (o singură interogare SQL) și
+    actualizate incremental prin apply_change după fiecare modificare a unei
+    planificări. Instanța este partajată între fire de execuție.
+
+    Sălile și zilele sunt citite din baza de date fără lock, ca o interogare lentă
+    să nu blocheze celelalte fire. Rezultatul este instalat în index doar dacă între
+    timp nu a avut loc nicio modificare sau invalidare a lui (generation), ca o
+    citire începută înaintea unei modificări să nu o suprascrie; altfel rezultatul
+    servește doar apelului curent.
+    """
+
+    def __init__(self, ttl: float = ROOM_AVAILABILITY_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._rooms: Optional[_RoomList] = None
+        self._rooms_generation = 0
+        self._days: Dict[date, Tuple[float, Dict[int, _RoomDay]]] = {}
+        self._days_generation = 0
+        self._day_generations: Dict[date, int] = {}
+
+    def available_rooms(self,
+                        db_session: Session,
+                        day: date,
+                        start_time: time,
+                        end_time: time,
+                        capacity: Optional[int] = None) -> List[RoomInfo]:
+        """
+        Obține sălile libere în intervalul [start_time, end_time) dintr-o zi
+
+        Args:
+            db_session: Sesiunea folosită dacă ziua sau sălile trebuie încărcate
+            day: Ziua
+            start_time: Ora de început
+            end_time: Ora de sfârșit
+            capacity: Capacitatea minimă (opțional)
+
+        Returns:
+            Sălile libere, ordonate după capacitate și nume
+        """
+        with self._lock:
+            now = timer.monotonic()
+            rooms = self._rooms if self._rooms is not None and now - self._rooms.loaded_at < self.ttl else None
+            loaded = self._days.get(day)
+            occupancy = loaded[1] if loaded is not None and now - loaded[0] < self.ttl else None
+
+            if rooms is not None and occupancy is not None:
+                return self._free_rooms(rooms, occupancy, start_time, end_time, capacity)
+
+            rooms_generation = self._rooms_generation
+            day_generation = self._day_generation(day)
+
+        # Citirile din baza de date au loc fără lock (vezi docstring-ul clasei)
+        load_rooms, load_day = rooms is None, occupancy is None
+        loaded_at = timer.monotonic()
+
+        if load_rooms:
+            rooms = self._load_rooms(db_session, loaded_at)
+        if load_day:
+            occupancy = self._load_day(db_session, day)
+
+        with self._lock:
+            if load_rooms and rooms_generation == self._rooms_generation:
+                self._rooms = rooms
+            if load_day and day_generation == self._day_generation(day):
+                self._install_day(day, loaded_at, occupancy)
+
+            return self._free_rooms(rooms, occupancy, start_time, end_time, capacity)
+
+    def apply_change(self, schedule_id: int, old: Optional[Booking], new: Optional[Booking]) -> None:
+        """
+        Actualizează incremental indexul după modificarea unei planificări
+
+        Doar sălile și zilele atinse de modificare sunt recalculate; zilele care nu
+        sunt încărcate sunt ignorate (vor fi citite din baza de date la nevoie).
+
+        Args:
+            schedule_id: ID-ul planificării
+            old: Ocuparea dinainte de modificare (None dacă nu ocupa o sală)
+            new: Ocuparea după modificare (None la ștergere sau dacă nu mai ocupă o sală)
+        """
+        if old == new:
+            return
+
+        with self._lock:
+            # Citirile în curs ale zilelor atinse nu mai pot fi instalate
+            for booking in (old, new):
+                if booking is not None:
+                    self._day_generations[booking.date] = self._day_generations.get(booking.date, 0) + 1
+
+            if old is not None and old.date in self._days:
+                room_day = self._days[old.date][1].get(old.room_id)
+                if room_day is not None and room_day.bookings.pop(schedule_id, None) is not None:
+                    room_day.rebuild()
+
+            if new is not None and new.date in self._days:
+                room_day = self._days[new.date][1].setdefault(new.room_id, _RoomDay())
+                room_day.bookings[schedule_id] = (new.start_time, new.end_time)
+                room_day.rebuild()
+
+    def invalidate(self, day: Optional[date] = None) -> None:
+        """
+        Elimină din index ocuparea unei zile (sau a tuturor zilelor)
+
+        Args:
+            day: Ziua (opțional; implicit toate zilele)
+        """
+        with self._lock:
+            if day is None:
+                self._days.clear()
+                self._days_generation += 1
+                self._day_generations.clear()
+            else:
+                self._days.pop(day, None)
+                self._day_generations[day] = self._day_generations.get(day, 0) + 1
+
+    def invalidate_rooms(self) -> None:
+        """Reîncarcă lista sălilor la următoarea interogare (după adăugarea sau modificarea unei săli)"""
+        with self._lock:
+            self._rooms = None
+            self._rooms_generation += 1
+
+    def _day_generation(self, day: date) -> Tuple[int, int]:
+        return self._days_generation, self._day_generations.get(day, 0)
+
+    def _free_rooms(self,
+                    rooms: _RoomList,
+                    occupancy: Dict[int, _RoomDay],
+                    start_time: time,
+                    end_time: time,
+                    capacity: Optional[int]) -> List[RoomInfo]:
+        first_bucket = bisect_left(rooms.capacities, capacity) if capacity else 0
+
+        return [
+            room
+            for bucket in rooms.buckets[first_bucket:]
+            for room in bucket
+            if room.id not in occupancy or occupancy[room.id].is_free(start_time, end_time)
+        ]
+
+    def _load_rooms(self, db_session: Session, loaded_at: float) -> _RoomList:
+        rows = db_session.execute(
+            select(Room.id, Room.name, Room.short_name, Room.capacity, Room.building, Room.floor)
+            .order_by(Room.capacity, Room.name)
+        ).all()
+
+        rooms = _RoomList(loaded_at, [], [])
+        for row in rows:
+            room = RoomInfo(*row)
+
+            if not rooms.capacities or rooms.capacities[-1] != room.capacity:
+                rooms.capacities.append(room.capacity)
+                rooms.buckets.append([])
+            rooms.buckets[-1].append(room)
+
+        return rooms
+
+    def _load_day(self, db_session: Session, day: date) -> Dict[int, _RoomDay]:
+        rows = db_session.execute(
+            select(Schedule.id, Schedule.room_id, Schedule.start_time, Schedule.end_time).where(
+                Schedule.date == day,
+                Schedule.status != 'rejected',
+                Schedule.room_id.is_not(None),
+                Schedule.start_time.is_not(None),
+                Schedule.end_time.is_not(None)
+            )
+        ).all()
+
+        occupancy: Dict[int, _RoomDay] = {}
+        for schedule_id, room_id, start_time, end_time in rows:
+            occupancy.setdefault(room_id, _RoomDay()).bookings[schedule_id] = (start_time, end_time)
+
+        for room_day in occupancy.values():
+            room_day.rebuild()
+
+        return occupancy
+
+    def _install_day(self, day: date, loaded_at: float, occupancy: Dict[int, _RoomDay]) -> None:
+        now = timer.monotonic()
+
+        # Zilele expirate sunt eliminate, pentru ca indexul să nu crească nelimitat
+        self._days = {d: entry for d, entry in self._days.items() if now - entry[0] < self.ttl}
+        self._days[day] = (loaded_at, occupancy)
+
+# Indexul partajat de toate instanțele ScheduleService din proces
+room_availability = RoomAvailabilityIndex()
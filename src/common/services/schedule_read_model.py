@@ -0,0 +1,471 @@
+"""
+Modelul de citire al planificărilor (tabela schedule_listings)
+
+Listarea planificărilor și exporturile Excel/PDF au nevoie de aceleași rânduri
+aplatizate (planificare + disciplină + cadru didactic + grupă + sală + asistenți).
+În loc să refacă JOIN-ul la fiecare citire, le citesc din schedule_listings, care
+este actualizată în tranzacția fiecărei scrieri:
+
+- la flush-ul unei sesiuni care creează, modifică sau șterge o planificare, rândul
+  ei este recalculat (sau șters);
+- la redenumirea unei discipline, săli, grupe sau a unui cadru didactic sunt
+  recalculate rândurile planificărilor care le folosesc.
+
+Scrierile care ocolesc unitatea de lucru a sesiunii (UPDATE/INSERT în bloc) trebuie
+să apeleze explicit refresh_listings. Citirile primesc max(refreshed_at) ca
+indicator de prospețime. Fiecare modificare a tabelei incrementează și versiunea
+datelor (schedule_data_version), folosită de cache-ul exporturilor, și versiunile
+feed-urilor iCalendar ale grupelor și cadrelor didactice atinse
+(calendar_feed_versions). Rândul unic al versiunii datelor este atins de toate
+scrierile, deci, când modificarea trece printr-o sesiune, este incrementat abia la
+commit (before_commit), ca lock-ul lui să fie ținut doar pe durata commit-ului.
+Tabela poate fi reconstruită și verificată din linia de
+comandă (din rădăcina proiectului, cu DATABASE_URL setat):
+
+    python -m src.common.services.schedule_read_model_cli rebuild
+    python -m src.common.services.schedule_read_model_cli check
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from datetime import date, datetime
+from sqlalchemy import delete, event, func, insert, inspect, select, tuple_, union, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import Select
+
+from src.common.models import Schedule, Subject, Teacher, Room, Group, ScheduleListing, ScheduleDataVersion, CalendarFeedVersion
+from src.common.models.schedule import schedule_assistants
+
+# Câmpurile entităților referite care apar în rândurile modelului de citire
+DENORMALIZED_FIELDS = {
+    Subject: ('name', 'short_name'),
+    Teacher: ('title', 'first_name', 'last_name'),
+    Room: ('name',),
+    Group: ('name',)
+}
+
+# Cheia din session.info care marchează o tranzacție ce a modificat modelul de citire
+DATA_CHANGED_KEY = 'schedule_read_model.data_changed'
+
+# Coloanele ordinii de paginare (date, start_time, id), ca la listarea din schedules
+LISTING_PAGE_COLUMNS = (ScheduleListing.date, ScheduleListing.start_time, ScheduleListing.schedule_id)
+
+# Coloanele comparate de verify_listings (toate, în afară de refreshed_at)
+LISTING_COLUMNS = tuple(column.name for column in ScheduleListing.__table__.columns if column.name != 'refreshed_at')
+
+def teacher_full_name(title: Optional[str], first_name: Optional[str], last_name: Optional[str]) -> str:
+    """Numele complet al unui cadru didactic, ca Teacher.full_name"""
+    return f"{title or ''} {first_name} {last_name}".strip()
+
+def _listing_rows(db, *conditions) -> List[Dict[str, Any]]:
+    """Calculează rândurile modelului de citire pentru planificările care îndeplinesc condițiile"""
+    rows = db.execute(
+        select(
+            Schedule.id.label('schedule_id'), Schedule.subject_id, Schedule.teacher_id, Schedule.room_id,
+            Schedule.group_id, Schedule.exam_period_id, Schedule.date, Schedule.start_time, Schedule.end_time,
+            Schedule.status, Schedule.created_at, Schedule.updated_at,
+            Subject.name.label('subject_name'),
+            Subject.short_name.label('subject_short_name'),
+            Teacher.title.label('teacher_title'),
+            Teacher.first_name.label('teacher_first_name'),
+            Teacher.last_name.label('teacher_last_name'),
+            Room.name.label('room_name'),
+            Group.name.label('group_name')
+        )
+        .outerjoin(Subject, Schedule.subject_id == Subject.id)
+        .outerjoin(Teacher, Schedule.teacher_id == Teacher.id)
+        .outerjoin(Room, Schedule.room_id == Room.id)
+        .outerjoin(Group, Schedule.group_id == Group.id)
+        .where(*conditions)
+    ).all()
+
+    # Asistenții tuturor planificărilor, într-o singură interogare
+    assistant = aliased(Teacher)
+    assistant_rows = db.execute(
+        select(schedule_assistants.c.schedule_id, assistant.id, assistant.title, assistant.first_name, assistant.last_name)
+        .join(assistant, assistant.id == schedule_assistants.c.teacher_id)
+        .join(Schedule, Schedule.id == schedule_assistants.c.schedule_id)
+        .where(*conditions)
+        .order_by(schedule_assistants.c.schedule_id, assistant.id)
+    ).all()
+
+    assistants: Dict[int, List[Dict[str, Any]]] = {}
+    for schedule_id, teacher_id, title, first_name, last_name in assistant_rows:
+        assistants.setdefault(schedule_id, []).append({'id': teacher_id, 'name': teacher_full_name(title, first_name, last_name)})
+
+    return [
+        {**row._asdict(), 'assistants': json.dumps(assistants.get(row.schedule_id, []), ensure_ascii=False)}
+        for row in rows
+    ]
+
+def bump_data_version(db) -> None:
+    """
+    Incrementează versiunea datelor planificărilor
+
+    Pentru o sesiune, incrementarea este amânată până chiar înainte de commit;
+    pentru o conexiune, are loc imediat.
+
+    Args:
+        db: Sesiunea sau conexiunea, în tranzacția modificării
+    """
+    if isinstance(db, Session):
+        db.info[DATA_CHANGED_KEY] = True
+        return
+
+    result = db.execute(
+        update(ScheduleDataVersion.__table__)
+        .where(ScheduleDataVersion.id == 1)
+        .values(version=ScheduleDataVersion.version + 1, updated_at=func.now())
+    )
+
+    if result.rowcount == 0:
+        # Baze create fără migrația 0005 (ex. create_all în teste)
+        db.execute(insert(ScheduleDataVersion.__table__).values(id=1, version=1))
+
+def data_version(db) -> int:
+    """
+    Versiunea curentă a datelor planificărilor
+
+    Args:
+        db: Sesiunea sau conexiunea folosită
+
+    Returns:
+        Versiunea (0 dacă nu a fost încă incrementată)
+    """
+    version = db.execute(select(ScheduleDataVersion.version).where(ScheduleDataVersion.id == 1)).scalar()
+    return version or 0
+
+def _row_feeds(group_id: int, teacher_id: int, assistants: str) -> Set[Tuple[str, int]]:
+    """Feed-urile iCalendar în care apare un rând al modelului de citire"""
+    feeds = {('group', group_id), ('teacher', teacher_id)}
+    feeds.update(('teacher', assistant['id']) for assistant in json.loads(assistants))
+    return feeds
+
+def bump_feed_versions(db, feeds: Iterable[Tuple[str, int]]) -> None:
+    """
+    Incrementează versiunile feed-urilor iCalendar date
+
+    Args:
+        db: Sesiunea sau conexiunea, în tranzacția modificării
+        feeds: Perechi (kind, entity_id), cu kind 'group' sau 'teacher'
+    """
+    feeds = sorted(feeds)
+    if not feeds:
+        return
+
+    table = CalendarFeedVersion.__table__
+    now = datetime.utcnow()
+    rows = [{'kind': kind, 'entity_id': entity_id, 'version': 1, 'changed_at': now} for kind, entity_id in feeds]
+    dialect = db.dialect if hasattr(db, 'dialect') else db.get_bind().dialect
+
+    if dialect.name in ('postgresql', 'sqlite'):
+        # Rândurile sunt atinse mereu în aceeași ordine, ca să nu apară blocaje circulare
+        dialect_insert = postgresql.insert if dialect.name == 'postgresql' else sqlite.insert
+        statement = dialect_insert(table)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=['kind', 'entity_id'],
+            set_={'version': table.c.version + 1, 'changed_at': statement.excluded.changed_at}
+        ), rows)
+        return
+
+    existing = set(db.execute(
+        select(table.c.kind, table.c.entity_id).where(tuple_(table.c.kind, table.c.entity_id).in_(feeds))
+    ).all())
+    if existing:
+        db.execute(
+            update(table)
+            .where(tuple_(table.c.kind, table.c.entity_id).in_(sorted(existing)))
+            .values(version=table.c.version + 1, changed_at=now)
+        )
+    missing = [row for row in rows if (row['kind'], row['entity_id']) not in existing]
+    if missing:
+        db.execute(insert(table), missing)
+
+def _delete_listings(db, ids: Set[int]) -> Set[Tuple[str, int]]:
+    """Șterge rândurile planificărilor date și întoarce feed-urile în care apăreau"""
+    feeds: Set[Tuple[str, int]] = set()
+    for row in db.execute(
+        select(ScheduleListing.group_id, ScheduleListing.teacher_id, ScheduleListing.assistants)
+        .where(ScheduleListing.schedule_id.in_(ids))
+    ):
+        feeds |= _row_feeds(row.group_id, row.teacher_id, row.assistants)
+
+    db.execute(delete(ScheduleListing).where(ScheduleListing.schedule_id.in_(ids)))
+    return feeds
+
+def forget_listings(db, schedule_ids: Iterable[int], bump_data: bool = True) -> None:
+    """
+    Șterge rândurile modelului de citire ale planificărilor date și incrementează
+    versiunea datelor și versiunile feed-urilor în care apăreau
+
+    Args:
+        db: Sesiunea sau conexiunea, în tranzacția modificării
+        schedule_ids: ID-urile planificărilor
+        bump_data: False dacă apelantul incrementează singur versiunea datelor
+    """
+    ids = set(schedule_ids)
+    if ids:
+        feeds = _delete_listings(db, ids)
+        if bump_data:
+            bump_data_version(db)
+        bump_feed_versions(db, feeds)
+
+def refresh_listings(db, schedule_ids: Iterable[int], bump_data: bool = True) -> int:
+    """
+    Recalculează rândurile modelului de citire ale planificărilor date
+
+    Sunt incrementate versiunea datelor și versiunile feed-urilor în care
+    planificările apăreau înainte sau apar după modificare.
+
+    Args:
+        db: Sesiunea sau conexiunea, în tranzacția modificării
+        schedule_ids: ID-urile planificărilor create, modificate sau șterse
+        bump_data: False dacă apelantul incrementează singur versiunea datelor
+
+    Returns:
+        Numărul de rânduri scrise (planificările șterse rămân fără rând)
+    """
+    ids = set(schedule_ids)
+    if not ids:
+        return 0
+
+    feeds = _delete_listings(db, ids)
+    rows = _listing_rows(db, Schedule.id.in_(ids))
+
+    if rows:
+        db.execute(insert(ScheduleListing), rows)
+
+    for row in rows:
+        feeds |= _row_feeds(row['group_id'], row['teacher_id'], row['assistants'])
+
+    if bump_data:
+        bump_data_version(db)
+    bump_feed_versions(db, feeds)
+    return len(rows)
+
+def refresh_dependent_listings(db,
+                               subject_ids: Iterable[int] = (),
+                               teacher_ids: Iterable[int] = (),
+                               room_ids: Iterable[int] = (),
+                               group_ids: Iterable[int] = (),
+                               bump_data: bool = True) -> int:
+    """
+    Recalculează rândurile planificărilor care folosesc entitățile date
+
+    Args:
+        db: Sesiunea sau conexiunea, în tranzacția modificării
+        subject_ids: ID-urile disciplinelor modificate
+        teacher_ids: ID-urile cadrelor didactice modificate (titulari sau asistenți)
+        room_ids: ID-urile sălilor modificate
+        group_ids: ID-urile grupelor modificate
+        bump_data: False dacă apelantul incrementează singur versiunea datelor
+
+    Returns:
+        Numărul de rânduri recalculate
+    """
+    subject_ids, teacher_ids, room_ids, group_ids = set(subject_ids), set(teacher_ids), set(room_ids), set(group_ids)
+    statements = []
+
+    if subject_ids:
+        statements.append(select(Schedule.id).where(Schedule.subject_id.in_(subject_ids)))
+    if teacher_ids:
+        statements.append(select(Schedule.id).where(Schedule.teacher_id.in_(teacher_ids)))
+        statements.append(select(schedule_assistants.c.schedule_id).where(schedule_assistants.c.teacher_id.in_(teacher_ids)))
+    if room_ids:
+        statements.append(select(Schedule.id).where(Schedule.room_id.in_(room_ids)))
+    if group_ids:
+        statements.append(select(Schedule.id).where(Schedule.group_id.in_(group_ids)))
+
+    if not statements:
+        return 0
+
+    return refresh_listings(db, db.execute(union(*statements)).scalars().all(), bump_data=bump_data)
+
+def rebuild_listings(db, bump_versions: bool = True) -> int:
+    """
+    Reconstruiește întregul model de citire din planificări
+
+    Args:
+        db: Sesiunea sau conexiunea folosită (apelantul face commit)
+        bump_versions: False dacă tabelele schedule_data_version și
+            calendar_feed_versions nu există încă (migrația 0004)
+
+    Returns:
+        Numărul de rânduri scrise
+    """
+    db.execute(delete(ScheduleListing))
+    rows = _listing_rows(db)
+
+    if rows:
+        db.execute(insert(ScheduleListing), rows)
+
+    if not bump_versions:
+        return len(rows)
+
+    bump_data_version(db)
+
+    # Toate feed-urile existente și cele ale planificărilor reconstruite
+    feeds = set(db.execute(select(CalendarFeedVersion.kind, CalendarFeedVersion.entity_id)).all())
+    for row in rows:
+        feeds |= _row_feeds(row['group_id'], row['teacher_id'], row['assistants'])
+    bump_feed_versions(db, feeds)
+
+    return len(rows)
+
+def verify_listings(db) -> Tuple[List[int], List[int]]:
+    """
+    Compară modelul de citire cu rândurile recalculate din planificări
+
+    Args:
+        db: Sesiunea sau conexiunea folosită
+
+    Returns:
+        (planificările cu rând lipsă sau învechit, rândurile fără planificare)
+    """
+    expected = {row['schedule_id']: row for row in _listing_rows(db)}
+    stored = {
+        row.schedule_id: row._asdict()
+        for row in db.execute(select(*(ScheduleListing.__table__.c[name] for name in LISTING_COLUMNS)))
+    }
+
+    outdated = [schedule_id for schedule_id, row in expected.items() if stored.get(schedule_id) != row]
+    extra = [schedule_id for schedule_id in stored if schedule_id not in expected]
+
+    return sorted(outdated), sorted(extra)
+
+def listings_refreshed_at(db) -> Optional[datetime]:
+    """
+    Momentul ultimei actualizări a modelului de citire (indicatorul de prospețime)
+
+    Args:
+        db: Sesiunea sau conexiunea folosită
+
+    Returns:
+        max(refreshed_at) sau None dacă tabela este goală
+    """
+    return db.execute(select(func.max(ScheduleListing.refreshed_at))).scalar()
+
+def build_listings_statement(group_id: Optional[int] = None,
+                             teacher_id: Optional[int] = None,
+                             subject_id: Optional[int] = None,
+                             status: Optional[str] = None,
+                             start_date: Optional[date] = None,
+                             end_date: Optional[date] = None) -> Select:
+    """
+    Construiește interogarea pe modelul de citire cu aceleași filtre ca
+    build_schedules_statement
+
+    Returns:
+        Obiectul Select pentru rândurile care corespund filtrelor (rânduri simple,
+        fără obiecte ORM)
+    """
+    statement = select(ScheduleListing.__table__)
+
+    if group_id:
+        statement = statement.where(ScheduleListing.group_id == group_id)
+
+    if teacher_id:
+        # Titular sau asistent, ca în build_schedules_statement
+        statement = statement.where(ScheduleListing.schedule_id.in_(union(
+            select(ScheduleListing.schedule_id).where(ScheduleListing.teacher_id == teacher_id),
+            select(schedule_assistants.c.schedule_id).where(schedule_assistants.c.teacher_id == teacher_id)
+        )))
+
+    if subject_id:
+        statement = statement.where(ScheduleListing.subject_id == subject_id)
+
+    if status:
+        statement = statement.where(ScheduleListing.status == status)
+
+    if start_date:
+        statement = statement.where(ScheduleListing.date >= start_date)
+
+    if end_date:
+        statement = statement.where(ScheduleListing.date <= end_date)
+
+    return statement
+
+def listing_to_dict(listing) -> Dict[str, Any]:
+    """
+    Convertește un rând al modelului de citire în dicționarul întors de Schedule.to_dict()
+
+    Args:
+        listing: Rândul modelului de citire (obiect ScheduleListing sau rând simplu)
+
+    Returns:
+        Dicționarul planificării, cu numele entităților referite și asistenții
+    """
+    return {
+        'id': listing.schedule_id,
+        'created_at': listing.created_at,
+        'updated_at': listing.updated_at,
+        'subject_id': listing.subject_id,
+        'teacher_id': listing.teacher_id,
+        'room_id': listing.room_id,
+        'group_id': listing.group_id,
+        'exam_period_id': listing.exam_period_id,
+        'date': listing.date,
+        'start_time': listing.start_time,
+        'end_time': listing.end_time,
+        'status': listing.status,
+        'subject_name': listing.subject_name,
+        'teacher_name': teacher_full_name(listing.teacher_title, listing.teacher_first_name, listing.teacher_last_name)
+                        if listing.teacher_first_name is not None else None,
+        'room_name': listing.room_name,
+        'group_name': listing.group_name,
+        'assistants': json.loads(listing.assistants)
+    }
+
+def _changed(obj, fields: Iterable[str]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+@event.listens_for(Session, 'before_flush')
+def _forget_deleted_listings(session, flush_context, instances):
+    """Elimină rândurile planificărilor șterse înainte ca planificările să dispară"""
+    deleted_ids = [obj.id for obj in session.deleted if isinstance(obj, Schedule)]
+
+    if deleted_ids:
+        forget_listings(session.connection(), deleted_ids, bump_data=False)
+        bump_data_version(session)
+
+@event.listens_for(Session, 'after_flush')
+def _refresh_flushed_listings(session, flush_context):
+    """Recalculează rândurile planificărilor și entităților create sau modificate în flush"""
+    schedule_ids = [obj.id for obj in session.new if isinstance(obj, Schedule)]
+    schedule_ids += [obj.id for obj in session.dirty if isinstance(obj, Schedule) and session.is_modified(obj)]
+
+    if schedule_ids:
+        refresh_listings(session.connection(), schedule_ids, bump_data=False)
+        bump_data_version(session)
+
+    dependents = {
+        model: [obj.id for obj in session.dirty if isinstance(obj, model) and _changed(obj, fields)]
+        for model, fields in DENORMALIZED_FIELDS.items()
+    }
+
+    if any(dependents.values()):
+        refresh_dependent_listings(
+            session.connection(),
+            subject_ids=dependents[Subject],
+            teacher_ids=dependents[Teacher],
+            room_ids=dependents[Room],
+            group_ids=dependents[Group],
+            bump_data=False
+        )
+        bump_data_version(session)
+
+@event.listens_for(Session, 'before_commit')
+def _bump_committed_data_version(session):
+    """Incrementează versiunea datelor ultima, chiar înainte de commit-ul tranzacției"""
+    if session.in_nested_transaction():
+        return
+
+    # Flush-ul final al commit-ului poate marca și el tranzacția
+    session.flush()
+    if session.info.pop(DATA_CHANGED_KEY, False):
+        bump_data_version(session.connection())
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_data_version_bump(session):
+    session.info.pop(DATA_CHANGED_KEY, None)
@@ -0,0 +1,49 @@
+"""
+Reconstruirea și verificarea modelului de citire al planificărilor
+
+Rulare (din rădăcina proiectului, cu DATABASE_URL setat):
+
+    python -m src.common.services.schedule_read_model_cli rebuild
+    python -m src.common.services.schedule_read_model_cli check
+
+Comanda check se termină cu codul 1 dacă tabela schedule_listings diferă de
+rândurile recalculate din planificări.
+"""
+from typing import List, Optional
+import argparse
+import os
+import sys
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.services.schedule_read_model import rebuild_listings, verify_listings
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Reconstruirea și verificarea modelului de citire al planificărilor")
+    parser.add_argument('command', choices=('rebuild', 'check'))
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL', 'postgresql://fiesc_admin:secure_password@db:5432/exam_scheduling'))
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    session = sessionmaker(bind=engine)()
+
+    try:
+        if args.command == 'rebuild':
+            count = rebuild_listings(session)
+            session.commit()
+            print(f"Model de citire reconstruit: {count} planificări")
+            return 0
+
+        outdated, extra = verify_listings(session)
+        for label, schedule_ids in (('învechit', outdated), ('în plus', extra)):
+            for schedule_id in schedule_ids:
+                print(f"{label}: planificarea {schedule_id}")
+
+        print(f"Model de citire {'consistent' if not outdated and not extra else 'inconsistent'}: {len(outdated)} învechite, {len(extra)} în plus")
+        return 0 if not outdated and not extra else 1
+    finally:
+        session.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,246 @@
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import date, time
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_, or_, func
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
+from collections import Counter
+import json
+from datetime import date, datetime, time, timedelta
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.sql import Select
+from sqlalchemy import and_, or_, func, insert, select, tuple_, union, update
 
-from src.common.models import Schedule, Subject, Teacher, Room, Group, User, Notification
+from src.common.models import Schedule, Subject, Teacher, Room, Group, User, Notification, AuditLog, ExamPeriod
+from src.common.models.schedule import schedule_assistants, db_conflict_checks_enabled
+from src.common.services.conflict_detection import (
+    ScheduleInterval, Conflict, ScheduleConflictError, PlacementCandidate, CandidateConflict,
+    conflict_from_integrity_error, detect_conflicts, evaluate_candidates
+)
+from src.common.services.notification_counters import add_unread
+from src.common.services.conflict_index import ACTIVE_SCHEDULE, load_intervals, query_conflicts, refresh_conflicts
+from src.common.services.schedule_read_model import (
+    LISTING_PAGE_COLUMNS, build_listings_statement, listing_to_dict, listings_refreshed_at, refresh_listings
+)
+from src.common.services.timetable_solver import TimetableSolver, ExamRequest, SolverResult
+from src.common.services.room_availability import (
+    RoomAvailabilityIndex, RoomInfo, Booking, room_availability, schedule_booking
+)
+from src.common.utils.pagination import InvalidCursorError, encode_cursor, decode_cursor, clamp_page_size
+
+# Strategiile de încărcare a relațiilor citite de Schedule.to_dict()
+SCHEDULE_LOAD_STRATEGIES = ('eager', 'lazy')
+
+# Numărul maxim de propuneri acceptate într-o cerere de încărcare în bloc
+MAX_BULK_PROPOSALS = 5000
+
+class ProposalItem(NamedTuple):
+    """O propunere de dată de examen pentru o disciplină și o grupă"""
+    subject_id: int
+    group_id: int
+    teacher_id: int
+    date: date
+
+class ProposalResult(NamedTuple):
+    """
+    Rezultatul unei propuneri din lot: action este 'created', 'updated' sau
+    'error' (cu motivul în error)
+    """
+    schedule_id: Optional[int]
+    action: str
+    error: Optional[str] = None
+
+def schedule_load_options(strategy: str = 'eager') -> tuple:
+    """
+    Returnează opțiunile de încărcare a relațiilor unei planificări
+
+    Cu strategia 'eager', relațiile many-to-one (disciplină, cadru didactic, sală,
+    grupă) sunt încărcate prin JOIN în aceeași interogare, iar asistenții printr-o
+    singură interogare suplimentară (SELECT ... WHERE id IN), indiferent de numărul
+    de planificări. Cu strategia 'lazy', fiecare relație este încărcată la primul
+    acces (câte o interogare per planificare).
+
+    Args:
+        strategy: Strategia de încărcare ('eager' sau 'lazy')
+
+    Returns:
+        Tuple cu opțiunile pentru Select.options()
+    """
+    if strategy not in SCHEDULE_LOAD_STRATEGIES:
+        raise ValueError(f"Strategie de încărcare invalidă: {strategy}")
+
+    if strategy == 'lazy':
+        return ()
+
+    return (
+        joinedload(Schedule.subject),
+        joinedload(Schedule.teacher),
+        joinedload(Schedule.room),
+        joinedload(Schedule.group),
+        selectinload(Schedule.assistants)
+    )
+
+def build_schedules_statement(group_id: Optional[int] = None,
+                              teacher_id: Optional[int] = None,
+                              subject_id: Optional[int] = None,
+                              status: Optional[str] = None,
+                              start_date: Optional[date] = None,
+                              end_date: Optional[date] = None) -> Select:
+    """
+    Construiește interogarea de listare a planificărilor cu filtrele opționale
+
+    Interogarea este folosită atât de ScheduleService, cât și de varianta
+    asincronă AsyncScheduleService, pentru ca filtrele să rămână identice.
+
+    Returns:
+        Obiectul Select pentru planificările care corespund filtrelor
+    """
+    statement = select(Schedule)
+    
+    if group_id:
+        statement = statement.where(Schedule.group_id == group_id)
+    
+    if teacher_id:
+        # Titular sau asistent. Reuniunea celor două căutări folosește indecșii
+        # ix_schedules_teacher_id_date și ix_schedule_assistants_teacher_id; un OR
+        # cu EXISTS corelat ar forța parcurgerea întregii tabele de planificări.
+        statement = statement.where(Schedule.id.in_(union(
+            select(Schedule.id).where(Schedule.teacher_id == teacher_id),
+            select(schedule_assistants.c.schedule_id).where(schedule_assistants.c.teacher_id == teacher_id)
+        )))
+    
+    if subject_id:
+        statement = statement.where(Schedule.subject_id == subject_id)
+    
+    if status:
+        statement = statement.where(Schedule.status == status)
+    
+    if start_date:
+        statement = statement.where(Schedule.date >= start_date)
+    
+    if end_date:
+        statement = statement.where(Schedule.date <= end_date)
+    
+    return statement
+
+def build_overlap_statement(column,
+                            value: int,
+                            day: date,
+                            start_time: time,
+                            end_time: time,
+                            exclude_id: Optional[int] = None) -> Select:
+    """
+    Construiește interogarea pentru planificările active care folosesc aceeași resursă
+    și se suprapun cu intervalul dat în ziua respectivă
+
+    Args:
+        column: Coloana resursei (ex. Schedule.room_id, Schedule.teacher_id)
+        value: ID-ul resursei
+        day: Ziua verificată
+        start_time: Ora de început a intervalului
+        end_time: Ora de sfârșit a intervalului
+        exclude_id: Planificarea verificată, exclusă din rezultat (opțional)
+
+    Returns:
+        Obiectul Select pentru ID-urile planificărilor suprapuse
+    """
+    conditions = [
+        column == value,
+        Schedule.date == day,
+        Schedule.status != 'rejected',
+        or_(
+            and_(Schedule.start_time <= start_time, Schedule.end_time > start_time),
+            and_(Schedule.start_time < end_time, Schedule.end_time >= end_time),
+            and_(Schedule.start_time >= start_time, Schedule.end_time <= end_time)
+        )
+    ]
+    
+    if exclude_id is not None:
+        conditions.append(Schedule.id != exclude_id)
+    
+    return select(Schedule.id).where(*conditions)
+
+def page_order(date_column, start_time_column, id_column) -> tuple:
+    """
+    Ordinea stabilă folosită la paginarea cu cursor: (date, start_time, id)
+
+    start_time poate fi NULL (planificări propuse), iar NULL-urile sunt puse primele
+    explicit, pentru ca ordinea să fie aceeași în PostgreSQL și SQLite.
+    """
+    return (date_column.asc(), start_time_column.asc().nulls_first(), id_column.asc())
+
+SCHEDULE_PAGE_COLUMNS = (Schedule.date, Schedule.start_time, Schedule.id)
+SCHEDULE_PAGE_ORDER = page_order(*SCHEDULE_PAGE_COLUMNS)
+
+def encode_schedule_cursor(schedule: Schedule) -> str:
+    """
+    Creează cursorul care indică poziția de după o planificare
+
+    Args:
+        schedule: Ultima planificare din pagina curentă
+
+    Returns:
+        Cursorul opac pentru pagina următoare
+    """
+    return encode_cursor([
+        schedule.date.isoformat(),
+        schedule.start_time.isoformat() if schedule.start_time else None,
+        schedule.id
+    ])
+
+def apply_schedule_cursor(statement: Select, cursor: Optional[str], columns: tuple = SCHEDULE_PAGE_COLUMNS) -> Select:
+    """
+    Adaugă condiția keyset (date, start_time, id) > cursor și ordinea de paginare
+
+    Condiția poate folosi un index pe coloanele de sortare, deci costul unei pagini nu
+    depinde de cât de departe este pagina în rezultat (spre deosebire de OFFSET).
+
+    Args:
+        statement: Interogarea de listare a planificărilor
+        cursor: Cursorul paginii anterioare (None pentru prima pagină)
+        columns: Coloanele (date, start_time, id) ale tabelei interogate
+
+    Returns:
+        Interogarea cu condiția de continuare și ordinea aplicate
+
+    Raises:
+        InvalidCursorError: Dacă cursorul este invalid
+    """
+    date_column, start_time_column, id_column = columns
+    statement = statement.order_by(*page_order(*columns))
+
+    if not cursor:
+        return statement
+
+    date_str, start_time_str, last_id = decode_cursor(cursor, 3)
+
+    try:
+        last_date = date.fromisoformat(date_str)
+        last_start_time = time.fromisoformat(start_time_str) if start_time_str is not None else None
+        last_id = int(last_id)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError("Cursor de paginare invalid") from e
+
+    if last_start_time is None:
+        # După NULL urmează: alte NULL-uri cu id mai mare, apoi toate orele din aceeași zi
+        same_day = or_(
+            start_time_column.isnot(None),
+            and_(start_time_column.is_(None), id_column > last_id)
+        )
+    else:
+        same_day = or_(
+            start_time_column > last_start_time,
+            and_(start_time_column == last_start_time, id_column > last_id)
+        )
+
+    return statement.where(or_(
+        date_column > last_date,
+        and_(date_column == last_date, same_day)
+    ))
 
 class ScheduleService:
     """Serviciu pentru gestionarea planificărilor examenelor"""
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, availability_index: Optional[RoomAvailabilityIndex] = None):
         self.db_session = db_session
+        # Indexul sălilor libere, actualizat după fiecare modificare a unei planificări
+        self.availability = availability_index or room_availability
     
     def get_schedules(self, 
                       group_id: Optional[int] = None, 
@@ -18,7 +248,8 @@ class ScheduleService:
                       subject_id: Optional[int] = None, 
                       status: Optional[str] = None,
                       start_date: Optional[date] = None,
-                      end_date: Optional[date] = None) -> List[Schedule]:
+                      end_date: Optional[date] = None,
+                      load: str = 'eager') -> List[Schedule]:
         """
         Obține planificările examenelor cu filtrare opțională
         
@@ -29,51 +260,173 @@ class ScheduleService:
             status: Statusul planificării (opțional)
             start_date: Data de început pentru filtrare (opțional)
             end_date: Data de sfârșit pentru filtrare (opțional)
+            load: Strategia de încărcare a relațiilor ('eager' sau 'lazy')
             
         Returns:
             Listă de obiecte Schedule
         """
         try:
-            query = self.db_session.query(Schedule)
-            
-            if group_id:
-                query = query.filter(Schedule.group_id == group_id)
-            
-            if teacher_id:
-                query = query.filter(or_(
-                    Schedule.teacher_id == teacher_id,
-                    Schedule.assistants.any(Teacher.id == teacher_id)
-                ))
+            statement = build_schedules_statement(
+                group_id=group_id,
+                teacher_id=teacher_id,
+                subject_id=subject_id,
+                status=status,
+                start_date=start_date,
+                end_date=end_date
+            ).options(*schedule_load_options(load))
             
-            if subject_id:
-                query = query.filter(Schedule.subject_id == subject_id)
+            return list(self.db_session.execute(statement).scalars().all())
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea planificărilor: {str(e)}")
+            return []
+    
+    def get_schedules_page(self,
+                           group_id: Optional[int] = None,
+                           teacher_id: Optional[int] = None,
+                           subject_id: Optional[int] = None,
+                           status: Optional[str] = None,
+                           start_date: Optional[date] = None,
+                           end_date: Optional[date] = None,
+                           cursor: Optional[str] = None,
+                           limit: Optional[int] = None,
+                           load: str = 'eager') -> Tuple[List[Schedule], Optional[str]]:
+        """
+        Obține o pagină de planificări, ordonate după (date, start_time, id)
+        
+        Args:
+            group_id: ID-ul grupei (opțional)
+            teacher_id: ID-ul cadrului didactic (opțional)
+            subject_id: ID-ul disciplinei (opțional)
+            status: Statusul planificării (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            cursor: Cursorul returnat de pagina anterioară (opțional)
+            limit: Numărul de planificări per pagină (limitat la MAX_PAGE_SIZE)
+            load: Strategia de încărcare a relațiilor ('eager' sau 'lazy')
             
-            if status:
-                query = query.filter(Schedule.status == status)
+        Returns:
+            Tuple cu lista de planificări și cursorul paginii următoare
+            (None dacă aceasta este ultima pagină)
             
-            if start_date:
-                query = query.filter(Schedule.date >= start_date)
+        Raises:
+            InvalidCursorError: Dacă cursorul este invalid
+        """
+        limit = clamp_page_size(limit)
+        
+        statement = apply_schedule_cursor(build_schedules_statement(
+            group_id=group_id,
+            teacher_id=teacher_id,
+            subject_id=subject_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date
+        ), cursor)
+        
+        try:
+            # Citim un rând în plus pentru a afla dacă există o pagină următoare
+            schedules = list(self.db_session.execute(
+                statement.options(*schedule_load_options(load)).limit(limit + 1)
+            ).scalars().all())
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea planificărilor: {str(e)}")
+            return [], None
+        
+        if len(schedules) > limit:
+            schedules = schedules[:limit]
+            return schedules, encode_schedule_cursor(schedules[-1])
+        
+        return schedules, None
+    
+    def get_listings_page(self,
+                          group_id: Optional[int] = None,
+                          teacher_id: Optional[int] = None,
+                          subject_id: Optional[int] = None,
+                          status: Optional[str] = None,
+                          start_date: Optional[date] = None,
+                          end_date: Optional[date] = None,
+                          cursor: Optional[str] = None,
+                          limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Obține o pagină de planificări din modelul de citire (schedule_listings)
+        
+        Filtrele, ordinea și cursorul sunt aceleași ca la get_schedules_page, iar
+        fiecare element are forma întoarsă de Schedule.to_dict(), fără JOIN-uri.
+        
+        Args:
+            group_id: ID-ul grupei (opțional)
+            teacher_id: ID-ul cadrului didactic (opțional)
+            subject_id: ID-ul disciplinei (opțional)
+            status: Statusul planificării (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            cursor: Cursorul returnat de pagina anterioară (opțional)
+            limit: Numărul de planificări per pagină (limitat la MAX_PAGE_SIZE)
             
-            if end_date:
-                query = query.filter(Schedule.date <= end_date)
+        Returns:
+            Tuple cu lista de planificări (dicționare) și cursorul paginii următoare
+            (None dacă aceasta este ultima pagină)
             
-            return query.all()
+        Raises:
+            InvalidCursorError: Dacă cursorul este invalid
+        """
+        limit = clamp_page_size(limit)
+        
+        statement = apply_schedule_cursor(build_listings_statement(
+            group_id=group_id,
+            teacher_id=teacher_id,
+            subject_id=subject_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date
+        ), cursor, LISTING_PAGE_COLUMNS)
+        
+        try:
+            # Citim un rând în plus pentru a afla dacă există o pagină următoare
+            listings = self.db_session.execute(statement.limit(limit + 1)).all()
         except SQLAlchemyError as e:
             print(f"Eroare la obținerea planificărilor: {str(e)}")
-            return []
+            return [], None
+        
+        next_cursor = None
+        if len(listings) > limit:
+            listings = listings[:limit]
+            last = listings[-1]
+            next_cursor = encode_cursor([
+                last.date.isoformat(),
+                last.start_time.isoformat() if last.start_time else None,
+                last.schedule_id
+            ])
+        
+        return [listing_to_dict(listing) for listing in listings], next_cursor
     
-    def get_schedule_by_id(self, schedule_id: int) -> Optional[Schedule]:
+    def get_listings_refreshed_at(self) -> Optional[datetime]:
+        """
+        Obține momentul ultimei actualizări a modelului de citire (indicatorul de prospețime)
+        
+        Returns:
+            Data și ora ultimei actualizări sau None dacă modelul este gol ori în caz de eroare
+        """
+        try:
+            return listings_refreshed_at(self.db_session)
+        except SQLAlchemyError as e:
+            print(f"Eroare la citirea stării modelului de citire: {str(e)}")
+            return None
+    
+    def get_schedule_by_id(self, schedule_id: int, load: str = 'eager') -> Optional[Schedule]:
         """
         Obține o planificare după ID
         
         Args:
             schedule_id: ID-ul planificării
+            load: Strategia de încărcare a relațiilor ('eager' sau 'lazy')
             
         Returns:
             Obiectul Schedule sau None dacă planificarea nu există
         """
         try:
-            return self.db_session.query(Schedule).filter(Schedule.id == schedule_id).first()
+            statement = select(Schedule).where(Schedule.id == schedule_id).options(*schedule_load_options(load))
+            
+            return self.db_session.execute(statement).scalars().first()
         except SQLAlchemyError as e:
             print(f"Eroare la obținerea planificării după ID: {str(e)}")
             return None
@@ -91,53 +444,221 @@ class ScheduleService:
         Returns:
             Obiectul Schedule creat sau None în caz de eroare
         """
+        results = self.propose_schedules([ProposalItem(subject_id, group_id, teacher_id, exam_date)])
+        
+        if not results or results[0].error:
+            return None
+        
+        return self.db_session.get(Schedule, results[0].schedule_id)
+    
+    def propose_schedules(self, items: List[ProposalItem]) -> Optional[List[ProposalResult]]:
+        """
+        Propune în bloc date de examen pentru perechi (disciplină, grupă)
+        
+        Ca la propose_schedule, o pereche care are deja o planificare primește data
+        nouă și statusul 'proposed', altfel este creată o planificare nouă, iar
+        cadrul didactic titular este notificat. Numărul de interogări nu depinde de
+        numărul de propuneri: cheile externe sunt validate cu câte un IN per tip de
+        entitate, planificările existente sunt găsite cu un singur IN pe perechi,
+        planificările noi sunt inserate într-un singur executemany (ID-urile lor
+        sunt citite apoi după perechi), cele existente sunt actualizate în bloc după
+        cheia primară, iar notificările sunt inserate în bloc, totul într-o singură
+        tranzacție.
+        
+        O planificare existentă își păstrează sala și orele, deci mutarea ei în altă
+        zi este verificată înainte de scriere față de ocuparea zilelor noi (sală și
+        titular, ca în constrângerile de excludere) și față de celelalte mutări din
+        lot; o mutare care s-ar suprapune este raportată ca 'conflict', iar restul
+        lotului este salvat.
+        
+        Args:
+            items: Propunerile
+            
+        Returns:
+            Pentru fiecare propunere, în ordinea primită, un ProposalResult (erorile
+            sunt 'subject_not_found', 'group_not_found', 'teacher_not_found',
+            'duplicate' pentru o pereche repetată în lot sau 'conflict') ori None în
+            caz de eroare a bazei de date (nicio modificare nu este salvată)
+        """
+        if not items:
+            return []
+        
         try:
-            # Verificăm dacă există deja o planificare pentru această disciplină și grupă
-            existing_schedule = self.db_session.query(Schedule).filter(
-                Schedule.subject_id == subject_id,
-                Schedule.group_id == group_id
-            ).first()
+            subjects = dict(self.db_session.execute(
+                select(Subject.id, Subject.name).where(Subject.id.in_({item.subject_id for item in items}))
+            ).all())
+            groups = dict(self.db_session.execute(
+                select(Group.id, Group.name).where(Group.id.in_({item.group_id for item in items}))
+            ).all())
+            teachers = dict(self.db_session.execute(
+                select(Teacher.id, Teacher.email).where(Teacher.id.in_({item.teacher_id for item in items}))
+            ).all())
             
-            if existing_schedule:
-                # Actualizăm planificarea existentă
-                existing_schedule.date = exam_date
-                existing_schedule.status = 'proposed'
-                self.db_session.commit()
-                return existing_schedule
+            results: List[Optional[ProposalResult]] = [None] * len(items)
+            valid: Dict[Tuple[int, int], int] = {}
             
-            # Creăm o nouă planificare
-            schedule = Schedule(
-                subject_id=subject_id,
-                group_id=group_id,
-                teacher_id=teacher_id,
-                date=exam_date,
-                status='proposed'
-            )
+            for index, item in enumerate(items):
+                if item.subject_id not in subjects:
+                    results[index] = ProposalResult(None, 'error', 'subject_not_found')
+                elif item.group_id not in groups:
+                    results[index] = ProposalResult(None, 'error', 'group_not_found')
+                elif item.teacher_id not in teachers:
+                    results[index] = ProposalResult(None, 'error', 'teacher_not_found')
+                elif (item.subject_id, item.group_id) in valid:
+                    results[index] = ProposalResult(None, 'error', 'duplicate')
+                else:
+                    valid[(item.subject_id, item.group_id)] = index
             
-            self.db_session.add(schedule)
-            self.db_session.commit()
+            if not valid:
+                return results
             
-            # Obținem informații despre disciplină și grupă pentru notificare
-            subject = self.db_session.query(Subject).filter(Subject.id == subject_id).first()
-            group = self.db_session.query(Group).filter(Group.id == group_id).first()
-            
-            # Trimitem notificare cadrului didactic
-            teacher = self.db_session.query(Teacher).filter(Teacher.id == teacher_id).first()
-            if teacher:
-                user = self.db_session.query(User).filter(User.email == teacher.email).first()
-                if user:
-                    notification = Notification(
-                        user_id=user.id,
-                        message=f"O nouă propunere de examen pentru disciplina {subject.name} a fost făcută de grupa {group.name} pentru data {exam_date}."
+            # Planificarea existentă a fiecărei perechi (cea mai veche, ca .first() în propose_schedule)
+            existing: Dict[Tuple[int, int], Any] = {}
+            for row in self.db_session.execute(
+                select(Schedule.id, Schedule.subject_id, Schedule.group_id, Schedule.teacher_id, Schedule.date,
+                       Schedule.room_id, Schedule.start_time, Schedule.end_time, Schedule.status)
+                .where(tuple_(Schedule.subject_id, Schedule.group_id).in_(list(valid)))
+                .order_by(Schedule.id)
+            ).all():
+                existing.setdefault((row.subject_id, row.group_id), row)
+            
+            for index in self._conflicting_moves({index: existing[pair] for pair, index in valid.items() if pair in existing}, items):
+                pair = (items[index].subject_id, items[index].group_id)
+                del valid[pair], existing[pair]
+                results[index] = ProposalResult(None, 'error', 'conflict')
+            
+            updates = [
+                {'id': existing[pair].id, 'date': items[index].date, 'status': 'proposed'}
+                for pair, index in valid.items() if pair in existing
+            ]
+            created = [(pair, index) for pair, index in valid.items() if pair not in existing]
+            
+            if updates:
+                self.db_session.execute(update(Schedule), updates)
+            
+            created_ids: Dict[Tuple[int, int], int] = {}
+            if created:
+                self.db_session.execute(insert(Schedule), [
+                    {
+                        'subject_id': items[index].subject_id,
+                        'group_id': items[index].group_id,
+                        'teacher_id': items[index].teacher_id,
+                        'date': items[index].date,
+                        'status': 'proposed'
+                    }
+                    for _, index in created
+                ])
+                # Perechile noi nu aveau planificări, deci își identifică unic rândurile inserate
+                created_ids = {
+                    (row.subject_id, row.group_id): row.id
+                    for row in self.db_session.execute(
+                        select(Schedule.id, Schedule.subject_id, Schedule.group_id)
+                        .where(tuple_(Schedule.subject_id, Schedule.group_id).in_([pair for pair, _ in created]))
                     )
-                    self.db_session.add(notification)
-                    self.db_session.commit()
+                }
             
-            return schedule
+            # Notificăm cadrele didactice titulare ale planificărilor noi
+            users = dict(self.db_session.execute(
+                select(User.email, User.id).where(User.email.in_({teachers[items[index].teacher_id] for _, index in created}))
+            ).all()) if created else {}
+            
+            notifications = [
+                {
+                    'user_id': users[teachers[items[index].teacher_id]],
+                    'title': "Propunere nouă de examen",
+                    'message': f"O nouă propunere de examen pentru disciplina {subjects[items[index].subject_id]} a fost făcută de grupa {groups[items[index].group_id]} pentru data {items[index].date}.",
+                    'type': 'info'
+                }
+                for _, index in created
+                if teachers[items[index].teacher_id] in users
+            ]
+            
+            if notifications:
+                self.db_session.execute(insert(Notification), notifications)
+                add_unread(self.db_session, Counter(notification['user_id'] for notification in notifications))
+            
+            # Scrierile în bloc ocolesc sesiunea, deci indexul conflictelor, modelul de
+            # citire și contoarele notificărilor necitite sunt actualizate explicit
+            refresh_conflicts(self.db_session, [update_row['id'] for update_row in updates])
+            refresh_listings(self.db_session, [update_row['id'] for update_row in updates] + list(created_ids.values()))
+            self.db_session.commit()
         except SQLAlchemyError as e:
             self.db_session.rollback()
-            print(f"Eroare la propunerea planificării: {str(e)}")
+            print(f"Eroare la propunerea planificărilor: {str(e)}")
             return None
+        
+        for pair, index in valid.items():
+            if pair in existing:
+                row = existing[pair]
+                new_booking = None
+                if None not in (row.room_id, row.start_time, row.end_time):
+                    new_booking = Booking(items[index].date, row.room_id, row.start_time, row.end_time)
+                self.availability.apply_change(row.id, schedule_booking(row), new_booking)
+                results[index] = ProposalResult(row.id, 'updated')
+        
+        for pair, index in created:
+            results[index] = ProposalResult(created_ids[pair], 'created')
+        
+        return results
+    
+    def _conflicting_moves(self, moves: Dict[int, Any], items: List[ProposalItem]) -> List[int]:
+        """
+        Găsește propunerile care ar muta o planificare existentă peste alta
+        
+        Ocuparea zilelor noi este citită într-o singură interogare; suprapunerile de
+        sală și de titular (ca în constrângerile de excludere) sunt găsite cu
+        detect_conflicts. Dintre două mutări care se suprapun rămâne prima din lot,
+        iar o mutare respinsă își păstrează ziua actuală, deci căutarea se repetă
+        până nu mai apar conflicte noi.
+        
+        Args:
+            moves: Indexul propunerii -> rândul planificării existente
+            items: Propunerile
+            
+        Returns:
+            Indecșii propunerilor respinse, crescător
+        """
+        # Planificările fără sală sau oră nu ocupă resurse; una respinsă redevine activă
+        # chiar dacă ziua nu se schimbă
+        moves = {
+            index: row for index, row in moves.items()
+            if None not in (row.room_id, row.start_time, row.end_time)
+            and (row.date != items[index].date or row.status == 'rejected')
+        }
+        if not moves:
+            return []
+        
+        occupied = [
+            ScheduleInterval(row.id, row.date, row.start_time, row.end_time, row.room_id, (row.teacher_id,), None)
+            for row in self.db_session.execute(
+                select(Schedule.id, Schedule.date, Schedule.start_time, Schedule.end_time, Schedule.room_id, Schedule.teacher_id)
+                .where(Schedule.date.in_({items[index].date for index in moves}), *ACTIVE_SCHEDULE,
+                       Schedule.id.notin_([row.id for row in moves.values()]))
+            ).all()
+        ]
+        rejected: set = set()
+        
+        while True:
+            intervals = list(occupied)
+            for index, row in moves.items():
+                if index not in rejected:
+                    # ID-urile negative identifică mutările: -(index + 1)
+                    intervals.append(ScheduleInterval(-(index + 1), items[index].date, row.start_time, row.end_time,
+                                                      row.room_id, (row.teacher_id,), None))
+                elif row.status != 'rejected':
+                    intervals.append(ScheduleInterval(row.id, row.date, row.start_time, row.end_time,
+                                                      row.room_id, (row.teacher_id,), None))
+            
+            # schedule_id1 < schedule_id2: mutarea față de o planificare existentă sau
+            # mutarea aflată mai târziu în lot
+            conflicting = {
+                -conflict.schedule_id1 - 1
+                for conflict in detect_conflicts(intervals, types=('room', 'teacher'))
+                if conflict.schedule_id1 < 0
+            }
+            if not conflicting:
+                return sorted(rejected)
+            rejected |= conflicting
     
     def update_schedule_status(self, schedule_id: int, status: str, message: Optional[str] = None) -> Optional[Schedule]:
         """
@@ -157,8 +678,10 @@ class ScheduleService:
             if not schedule:
                 return None
             
+            old_booking = schedule_booking(schedule)
             schedule.status = status
             self.db_session.commit()
+            self.availability.apply_change(schedule.id, old_booking, schedule_booking(schedule))
             
             # Obținem informații pentru notificare
             subject = self.db_session.query(Subject).filter(Subject.id == schedule.subject_id).first()
@@ -191,10 +714,241 @@ class ScheduleService:
             print(f"Eroare la actualizarea statusului planificării: {str(e)}")
             return None
     
+    def create_schedule(self,
+                        subject_id: int,
+                        teacher_id: int,
+                        group_id: int,
+                        room_id: Optional[int],
+                        date: date,
+                        start_time: Optional[time],
+                        end_time: Optional[time],
+                        created_by: Optional[int] = None,
+                        status: str = 'proposed') -> Optional[Schedule]:
+        """
+        Creează o planificare completă (sală și interval orar)
+        
+        Args:
+            subject_id: ID-ul disciplinei
+            teacher_id: ID-ul cadrului didactic titular
+            group_id: ID-ul grupei
+            room_id: ID-ul sălii (opțional)
+            date: Data examenului
+            start_time: Ora de început (opțional)
+            end_time: Ora de sfârșit (opțional)
+            created_by: ID-ul utilizatorului care creează planificarea (pentru jurnalul de audit)
+            status: Statusul inițial (implicit 'proposed')
+            
+        Returns:
+            Obiectul Schedule creat sau None în caz de eroare
+            
+        Raises:
+            ScheduleConflictError: Dacă sala sau cadrul didactic sunt deja ocupate în intervalul dat
+        """
+        try:
+            self._ensure_no_overlaps(None, date, room_id, teacher_id, start_time, end_time, status)
+            
+            schedule = Schedule(
+                subject_id=subject_id,
+                teacher_id=teacher_id,
+                group_id=group_id,
+                room_id=room_id,
+                date=date,
+                start_time=start_time,
+                end_time=end_time,
+                status=status
+            )
+            
+            self.db_session.add(schedule)
+            self._commit_schedule(None)
+            self.availability.apply_change(schedule.id, None, schedule_booking(schedule))
+            
+            self._audit(created_by, 'create', schedule.id)
+            
+            return schedule
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            print(f"Eroare la crearea planificării: {str(e)}")
+            return None
+    
+    def update_schedule(self,
+                        schedule_id: int,
+                        subject_id: Optional[int] = None,
+                        teacher_id: Optional[int] = None,
+                        group_id: Optional[int] = None,
+                        room_id: Optional[int] = None,
+                        date: Optional[date] = None,
+                        start_time: Optional[time] = None,
+                        end_time: Optional[time] = None,
+                        status: Optional[str] = None,
+                        updated_by: Optional[int] = None) -> Optional[Schedule]:
+        """
+        Actualizează câmpurile furnizate ale unei planificări
+        
+        Args:
+            schedule_id: ID-ul planificării
+            subject_id, teacher_id, group_id, room_id, date, start_time, end_time, status:
+                Valorile noi (None lasă câmpul neschimbat)
+            updated_by: ID-ul utilizatorului care face modificarea (pentru jurnalul de audit)
+            
+        Returns:
+            Obiectul Schedule actualizat sau None dacă planificarea nu există sau în caz de eroare
+            
+        Raises:
+            ScheduleConflictError: Dacă sala sau cadrul didactic sunt deja ocupate în intervalul dat
+        """
+        try:
+            schedule = self.db_session.query(Schedule).filter(Schedule.id == schedule_id).first()
+            
+            if not schedule:
+                return None
+            
+            old_booking = schedule_booking(schedule)
+            values = {
+                'subject_id': subject_id,
+                'teacher_id': teacher_id,
+                'group_id': group_id,
+                'room_id': room_id,
+                'date': date,
+                'start_time': start_time,
+                'end_time': end_time,
+                'status': status
+            }
+            changes = {}
+            
+            for field, value in values.items():
+                if value is not None and getattr(schedule, field) != value:
+                    changes[field] = {'old': getattr(schedule, field), 'new': value}
+                    setattr(schedule, field, value)
+            
+            if not changes:
+                return schedule
+            
+            self._ensure_no_overlaps(schedule.id, schedule.date, schedule.room_id, schedule.teacher_id,
+                                     schedule.start_time, schedule.end_time, schedule.status)
+            
+            self._commit_schedule(schedule.id)
+            self.availability.apply_change(schedule.id, old_booking, schedule_booking(schedule))
+            
+            self._audit(updated_by, 'update', schedule.id, changes)
+            
+            return schedule
+        except ScheduleConflictError:
+            self.db_session.rollback()
+            raise
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            print(f"Eroare la actualizarea planificării: {str(e)}")
+            return None
+    
+    def delete_schedule(self, schedule_id: int, deleted_by: Optional[int] = None) -> bool:
+        """
+        Șterge o planificare
+        
+        Args:
+            schedule_id: ID-ul planificării
+            deleted_by: ID-ul utilizatorului care șterge planificarea (pentru jurnalul de audit)
+            
+        Returns:
+            True dacă planificarea a fost ștearsă, False dacă nu există sau în caz de eroare
+        """
+        try:
+            schedule = self.db_session.query(Schedule).filter(Schedule.id == schedule_id).first()
+            
+            if not schedule:
+                return False
+            
+            old_booking = schedule_booking(schedule)
+            
+            self.db_session.delete(schedule)
+            self.db_session.commit()
+            self.availability.apply_change(schedule_id, old_booking, None)
+            
+            self._audit(deleted_by, 'delete', schedule_id)
+            
+            return True
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            print(f"Eroare la ștergerea planificării: {str(e)}")
+            return False
+    
+    def database_checks_conflicts(self) -> bool:
+        """
+        Verifică dacă suprapunerile sunt respinse de constrângerile de excludere din
+        baza de date (PostgreSQL cu SCHEDULE_DB_CONFLICT_CHECKS=True)
+        """
+        return db_conflict_checks_enabled() and self.db_session.get_bind().dialect.name == 'postgresql'
+    
+    def _ensure_no_overlaps(self,
+                            schedule_id: Optional[int],
+                            day: date,
+                            room_id: Optional[int],
+                            teacher_id: int,
+                            start_time: Optional[time],
+                            end_time: Optional[time],
+                            status: str = 'approved') -> None:
+        """
+        Verifică în aplicație suprapunerile de sală și de cadru didactic titular
+        (ex. pentru SQLite); în modul PostgreSQL cu constrângeri de excludere verificarea
+        este lăsată bazei de date. Planificările respinse sunt ignorate, ca în constrângeri.
+        
+        Raises:
+            ScheduleConflictError: Dacă sala sau cadrul didactic sunt deja ocupate
+        """
+        if self.database_checks_conflicts() or status == 'rejected' or start_time is None or end_time is None:
+            return
+        
+        # Modificările încă nesalvate ale planificării nu trebuie trimise în baza de date
+        with self.db_session.no_autoflush:
+            for conflict_type, column, value in (('room', Schedule.room_id, room_id), ('teacher', Schedule.teacher_id, teacher_id)):
+                if value is None:
+                    continue
+                
+                conflicting_ids = list(self.db_session.execute(
+                    build_overlap_statement(column, value, day, start_time, end_time, exclude_id=schedule_id)
+                ).scalars().all())
+                
+                if conflicting_ids:
+                    raise ScheduleConflictError(conflict_type, schedule_id, conflicting_ids)
+    
+    def _commit_schedule(self, schedule_id: Optional[int]) -> None:
+        """
+        Salvează modificările; violarea unei constrângeri de excludere devine ScheduleConflictError
+        """
+        try:
+            self.db_session.commit()
+        except IntegrityError as e:
+            conflict = conflict_from_integrity_error(e, schedule_id)
+            
+            if conflict is None:
+                raise
+            
+            self.db_session.rollback()
+            raise conflict
+    
+    def _audit(self, user_id: Optional[Any], action: str, schedule_id: int, changes: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Înregistrează o modificare a unei planificări în jurnalul de audit
+        """
+        if user_id is None:
+            return
+        
+        self.db_session.add(AuditLog(
+            user_id=int(user_id),
+            action=action,
+            entity_type=Schedule.__tablename__,
+            entity_id=schedule_id,
+            changes=json.dumps(changes, default=str) if changes else None
+        ))
+        self.db_session.commit()
+    
     def set_schedule_details(self, schedule_id: int, room_id: int, start_time: time, end_time: time, assistant_ids: List[int]) -> Optional[Schedule]:
         """
         Setează detaliile unei planificări aprobate (sală, oră, asistenți)
         
+        În modul PostgreSQL cu constrângeri de excludere, actualizarea este un singur
+        UPDATE verificat de baza de date; altfel, suprapunerile de sală și de cadru
+        didactic sunt verificate în aplicație înainte de actualizare.
+        
         Args:
             schedule_id: ID-ul planificării
             room_id: ID-ul sălii
@@ -204,6 +958,9 @@ class ScheduleService:
             
         Returns:
             Obiectul Schedule actualizat sau None în caz de eroare
+            
+        Raises:
+            ScheduleConflictError: Dacă sala sau cadrul didactic sunt deja ocupate în intervalul dat
         """
         try:
             schedule = self.db_session.query(Schedule).filter(Schedule.id == schedule_id).first()
@@ -211,37 +968,10 @@ class ScheduleService:
             if not schedule or schedule.status != 'approved':
                 return None
             
-            # Verificăm dacă există conflicte de sală
-            room_conflicts = self.db_session.query(Schedule).filter(
-                Schedule.room_id == room_id,
-                Schedule.date == schedule.date,
-                Schedule.id != schedule_id,
-                or_(
-                    and_(Schedule.start_time <= start_time, Schedule.end_time > start_time),
-                    and_(Schedule.start_time < end_time, Schedule.end_time >= end_time),
-                    and_(Schedule.start_time >= start_time, Schedule.end_time <= end_time)
-                )
-            ).all()
+            # Verificăm dacă există conflicte de sală sau pentru cadrul didactic titular
+            self._ensure_no_overlaps(schedule.id, schedule.date, room_id, schedule.teacher_id, start_time, end_time)
             
-            if room_conflicts:
-                print("Conflict de sală detectat")
-                return None
-            
-            # Verificăm dacă există conflicte pentru profesori și asistenți
-            teacher_conflicts = self.db_session.query(Schedule).filter(
-                Schedule.teacher_id == schedule.teacher_id,
-                Schedule.date == schedule.date,
-                Schedule.id != schedule_id,
-                or_(
-                    and_(Schedule.start_time <= start_time, Schedule.end_time > start_time),
-                    and_(Schedule.start_time < end_time, Schedule.end_time >= end_time),
-                    and_(Schedule.start_time >= start_time, Schedule.end_time <= end_time)
-                )
-            ).all()
-            
-            if teacher_conflicts:
-                print("Conflict de profesor detectat")
-                return None
+            old_booking = schedule_booking(schedule)
             
             # Actualizăm planificarea
             schedule.room_id = room_id
@@ -252,7 +982,8 @@ class ScheduleService:
             assistants = self.db_session.query(Teacher).filter(Teacher.id.in_(assistant_ids)).all()
             schedule.assistants = assistants
             
-            self.db_session.commit()
+            self._commit_schedule(schedule_id)
+            self.availability.apply_change(schedule.id, old_booking, schedule_booking(schedule))
             
             return schedule
         except SQLAlchemyError as e:
@@ -260,86 +991,323 @@ class ScheduleService:
             print(f"Eroare la setarea detaliilor planificării: {str(e)}")
             return None
     
-    def check_conflicts(self, date_val: Optional[date] = None, teacher_id: Optional[int] = None, room_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    def solve_exam_period(self,
+                          exam_period_id: int,
+                          time_budget: float = 10.0,
+                          min_gap_days: int = 1,
+                          flexible_dates: bool = False,
+                          apply: bool = False) -> Optional[SolverResult]:
+        """
+        Plasează automat în săli și intervale orare examenele aprobate dintr-o perioadă
+        de examinare care nu au încă sală sau oră
+        
+        Planificările care au deja sală și oră (din orice perioadă) ocupă resursele lor
+        și nu sunt mutate. Zilele perioadei sunt de luni până sâmbătă.
+        
+        Args:
+            exam_period_id: ID-ul perioadei de examinare
+            time_budget: Timpul maxim (secunde) pentru repararea locală a soluției
+            min_gap_days: Numărul minim de zile între două examene ale aceleiași grupe
+            flexible_dates: Permite mutarea examenelor în alte zile ale perioadei
+            apply: Salvează plasările în baza de date (altfel doar le returnează)
+            
+        Returns:
+            SolverResult cu plasările și examenele nerezolvate sau None dacă perioada
+            nu există ori în caz de eroare
+            
+        Raises:
+            ScheduleConflictError: Dacă la salvare o constrângere de excludere respinge o plasare
+        """
+        try:
+            period = self.db_session.query(ExamPeriod).filter(ExamPeriod.id == exam_period_id).first()
+            
+            if not period:
+                return None
+            
+            pending = self.db_session.execute(
+                select(Schedule.id, Schedule.date, Schedule.group_id, Group.number_of_students)
+                .join(Group, Schedule.group_id == Group.id)
+                .where(
+                    Schedule.exam_period_id == exam_period_id,
+                    Schedule.status == 'approved',
+                    or_(Schedule.room_id.is_(None), Schedule.start_time.is_(None), Schedule.end_time.is_(None))
+                )
+            ).all()
+            
+            pending_ids = {row.id for row in pending}
+            first_day = min([period.exam_start_date, *(row.date for row in pending)])
+            last_day = max([period.exam_end_date, *(row.date for row in pending)])
+            
+            days = [
+                period.exam_start_date + timedelta(days=offset)
+                for offset in range((period.exam_end_date - period.exam_start_date).days + 1)
+                if (period.exam_start_date + timedelta(days=offset)).weekday() != 6
+            ]
+            rooms = self.db_session.execute(select(Room.id, Room.capacity)).all()
+            
+            solver = TimetableSolver(rooms, days, min_gap_days=min_gap_days, flexible_dates=flexible_dates)
+            teacher_ids = {}
+            
+            for interval in self.load_schedule_intervals(start_date=first_day, end_date=last_day, exclude_rejected=True):
+                if interval.schedule_id in pending_ids:
+                    teacher_ids[interval.schedule_id] = interval.teacher_ids
+                else:
+                    solver.block(interval)
+            
+            result = solver.solve([
+                ExamRequest(row.id, row.date, row.group_id, row.number_of_students, teacher_ids[row.id])
+                for row in pending
+            ], time_budget=time_budget)
+            
+            if apply and result.placements:
+                self.db_session.execute(update(Schedule), [
+                    {
+                        'id': placement.schedule_id,
+                        'room_id': placement.room_id,
+                        'date': placement.date,
+                        'start_time': placement.start_time,
+                        'end_time': placement.end_time
+                    }
+                    for placement in result.placements
+                ])
+                # UPDATE-ul în bloc ocolește sesiunea, deci indexul conflictelor și modelul de
+                # citire sunt actualizate explicit
+                refresh_conflicts(self.db_session, [placement.schedule_id for placement in result.placements])
+                refresh_listings(self.db_session, [placement.schedule_id for placement in result.placements])
+                self._commit_schedule(None)
+                
+                for placement in result.placements:
+                    self.availability.apply_change(placement.schedule_id, None, Booking(
+                        placement.date, placement.room_id, placement.start_time, placement.end_time
+                    ))
+            
+            return result
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            print(f"Eroare la plasarea automată a examenelor: {str(e)}")
+            return None
+    
+    def get_available_rooms(self,
+                            date: date,
+                            start_time: time,
+                            end_time: time,
+                            capacity: Optional[int] = None) -> List[RoomInfo]:
+        """
+        Obține sălile libere pentru o zi și un interval orar
+        
+        Răspunsul vine din indexul de ocupare din memorie (RoomAvailabilityIndex);
+        baza de date este citită doar pentru zilele încă neîncărcate sau expirate.
+        
+        Args:
+            date: Data
+            start_time: Ora de început
+            end_time: Ora de sfârșit
+            capacity: Capacitatea minimă a sălii (opțional)
+            
+        Returns:
+            Listă de săli libere (RoomInfo), ordonate după capacitate și nume
+        """
+        try:
+            return self.availability.available_rooms(self.db_session, date, start_time, end_time, capacity)
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea sălilor disponibile: {str(e)}")
+            return []
+    
+    def load_schedule_intervals(self,
+                                date_val: Optional[date] = None,
+                                start_date: Optional[date] = None,
+                                end_date: Optional[date] = None,
+                                exclude_rejected: bool = False) -> List[ScheduleInterval]:
+        """
+        Încarcă intervalele planificărilor pentru detectarea conflictelor
+        
+        Sunt citite doar coloanele necesare (fără obiecte ORM), iar asistenții
+        tuturor planificărilor sunt încărcați într-o singură interogare.
+        
+        Args:
+            date_val: O singură zi (opțional)
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            exclude_rejected: Ignoră planificările respinse (implicit False)
+            
+        Returns:
+            Listă de obiecte ScheduleInterval
+        """
+        conditions = []
+        
+        if exclude_rejected:
+            conditions.append(Schedule.status != 'rejected')
+        
+        if date_val:
+            conditions.append(Schedule.date == date_val)
+        
+        if start_date:
+            conditions.append(Schedule.date >= start_date)
+        
+        if end_date:
+            conditions.append(Schedule.date <= end_date)
+        
+        return load_intervals(self.db_session, *conditions)
+    
+    def check_conflicts(self, date_val: Optional[date] = None, teacher_id: Optional[int] = None, room_id: Optional[int] = None, group_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Verifică conflictele de planificare
         
+        Dacă nu este specificată nicio resursă (sală, cadru didactic, grupă), sunt
+        raportate conflictele pentru toate sălile, cadrele didactice (titulari și
+        asistenți) și grupele. Conflictele sunt citite din indexul persistent
+        (schedule_conflicts); planificările respinse nu produc conflicte.
+        
         Args:
             date_val: Data pentru care se verifică conflictele (opțional)
             teacher_id: ID-ul cadrului didactic pentru care se verifică conflictele (opțional)
             room_id: ID-ul sălii pentru care se verifică conflictele (opțional)
+            group_id: ID-ul grupei pentru care se verifică conflictele (opțional)
             
         Returns:
             Listă de dicționare cu informații despre conflicte
         """
-        conflicts = []
+        resources = {
+            conflict_type: resource_id
+            for conflict_type, resource_id in (('room', room_id), ('teacher', teacher_id), ('group', group_id))
+            if resource_id
+        }
         
         try:
-            # Obținem toate planificările pentru data specificată
-            query = self.db_session.query(Schedule)
+            conflicts = query_conflicts(self.db_session, date_val=date_val, resources=resources or None)
             
-            if date_val:
-                query = query.filter(Schedule.date == date_val)
+            if not conflicts:
+                return []
             
-            schedules = query.all()
+            # Numele resurselor și intervalele orare sunt rezolvate în bloc
+            names = self._resolve_resource_names(conflicts)
+            schedule_ids = {c.schedule_id1 for c in conflicts} | {c.schedule_id2 for c in conflicts}
+            time_ranges = {
+                schedule_id: f"{start_time}-{end_time}"
+                for schedule_id, start_time, end_time in self.db_session.execute(
+                    select(Schedule.id, Schedule.start_time, Schedule.end_time).where(Schedule.id.in_(schedule_ids))
+                ).all()
+            }
             
-            # Verificăm conflicte de sală
-            if room_id:
-                room_schedules = [s for s in schedules if s.room_id == room_id]
-                
-                for i in range(len(room_schedules)):
-                    for j in range(i + 1, len(room_schedules)):
-                        s1 = room_schedules[i]
-                        s2 = room_schedules[j]
-                        
-                        # Verificăm dacă există suprapunere de timp
-                        if (s1.start_time and s1.end_time and s2.start_time and s2.end_time and
-                            ((s1.start_time <= s2.start_time and s1.end_time > s2.start_time) or
-                             (s1.start_time < s2.end_time and s1.end_time >= s2.end_time) or
-                             (s1.start_time >= s2.start_time and s1.end_time <= s2.end_time))):
-                            
-                            room = self.db_session.query(Room).filter(Room.id == room_id).first()
-                            
-                            conflicts.append({
-                                'type': 'room_conflict',
-                                'schedule_id1': s1.id,
-                                'schedule_id2': s2.id,
-                                'room_id': room_id,
-                                'room_name': room.name if room else 'Unknown',
-                                'date': s1.date,
-                                'time_range1': f"{s1.start_time}-{s1.end_time}",
-                                'time_range2': f"{s2.start_time}-{s2.end_time}"
-                            })
-            
-            # Verificăm conflicte de profesor
-            if teacher_id:
-                teacher_schedules = [s for s in schedules if s.teacher_id == teacher_id or teacher_id in [a.id for a in s.assistants]]
-                
-                for i in range(len(teacher_schedules)):
-                    for j in range(i + 1, len(teacher_schedules)):
-                        s1 = teacher_schedules[i]
-                        s2 = teacher_schedules[j]
-                        
-                        # Verificăm dacă există suprapunere de timp
-                        if (s1.start_time and s1.end_time and s2.start_time and s2.end_time and
-                            ((s1.start_time <= s2.start_time and s1.end_time > s2.start_time) or
-                             (s1.start_time < s2.end_time and s1.end_time >= s2.end_time) or
-                             (s1.start_time >= s2.start_time and s1.end_time <= s2.end_time))):
-                            
-                            teacher = self.db_session.query(Teacher).filter(Teacher.id == teacher_id).first()
-                            
-                            conflicts.append({
-                                'type': 'teacher_conflict',
-                                'schedule_id1': s1.id,
-                                'schedule_id2': s2.id,
-                                'teacher_id': teacher_id,
-                                'teacher_name': teacher.full_name if teacher else 'Unknown',
-                                'date': s1.date,
-                                'time_range1': f"{s1.start_time}-{s1.end_time}",
-                                'time_range2': f"{s2.start_time}-{s2.end_time}"
-                            })
-            
-            return conflicts
+            return [
+                {
+                    'type': f"{conflict.type}_conflict",
+                    'schedule_id1': conflict.schedule_id1,
+                    'schedule_id2': conflict.schedule_id2,
+                    f"{conflict.type}_id": conflict.resource_id,
+                    f"{conflict.type}_name": names[conflict.type].get(conflict.resource_id, 'Unknown'),
+                    'date': conflict.date,
+                    'time_range1': time_ranges[conflict.schedule_id1],
+                    'time_range2': time_ranges[conflict.schedule_id2]
+                }
+                for conflict in conflicts
+            ]
         except SQLAlchemyError as e:
             print(f"Eroare la verificarea conflictelor: {str(e)}")
             return []
+    
+    def get_conflicts(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Obține toate conflictele de planificare dintr-un interval de date
+        
+        Args:
+            start_date: Data de început pentru filtrare (opțional)
+            end_date: Data de sfârșit pentru filtrare (opțional)
+            
+        Returns:
+            Listă de dicționare cu tipul conflictului ('room', 'teacher', 'group'),
+            resursa, data și cele două planificări suprapuse
+        """
+        try:
+            conflicts = query_conflicts(self.db_session, start_date=start_date, end_date=end_date)
+            
+            if not conflicts:
+                return []
+            
+            schedule_ids = {c.schedule_id1 for c in conflicts} | {c.schedule_id2 for c in conflicts}
+            schedules = {
+                schedule.id: schedule.to_dict()
+                for schedule in self.db_session.execute(
+                    select(Schedule).where(Schedule.id.in_(schedule_ids)).options(*schedule_load_options('eager'))
+                ).scalars().all()
+            }
+            
+            return [
+                {
+                    'type': conflict.type,
+                    'resource_id': conflict.resource_id,
+                    'date': conflict.date,
+                    'schedules': [schedules[conflict.schedule_id1], schedules[conflict.schedule_id2]]
+                }
+                for conflict in conflicts
+            ]
+        except SQLAlchemyError as e:
+            print(f"Eroare la obținerea conflictelor: {str(e)}")
+            return []
+    
+    def evaluate_placements(self, candidates: List[PlacementCandidate]) -> Optional[List[List[CandidateConflict]]]:
+        """
+        Evaluează plasări de încercare („what-if”) fără a scrie în baza de date
+        
+        Ocuparea zilelor plasărilor și datele planificărilor din lot (titular,
+        asistenți, grupă) sunt citite o singură dată; fiecare plasare este apoi
+        verificată față de această ocupare și față de celelalte plasări din lot
+        (vezi evaluate_candidates). Planificările respinse nu ocupă resurse.
+        
+        Args:
+            candidates: Plasările de încercare
+            
+        Returns:
+            Pentru fiecare plasare, în ordinea primită, lista conflictelor ei sau None
+            dacă o planificare nu există ori în caz de eroare
+        """
+        if not candidates:
+            return []
+        
+        schedule_ids = {candidate.schedule_id for candidate in candidates}
+        days = {candidate.date for candidate in candidates}
+        
+        try:
+            intervals = load_intervals(self.db_session, or_(
+                and_(Schedule.date.in_(days), *ACTIVE_SCHEDULE),
+                Schedule.id.in_(schedule_ids)
+            ))
+        except SQLAlchemyError as e:
+            print(f"Eroare la evaluarea plasărilor: {str(e)}")
+            return None
+        
+        if not schedule_ids <= {interval.schedule_id for interval in intervals}:
+            return None
+        
+        return evaluate_candidates(intervals, candidates)
+    
+    def _resolve_resource_names(self, conflicts: List[Conflict]) -> Dict[str, Dict[int, str]]:
+        """
+        Obține numele sălilor, cadrelor didactice și grupelor implicate în conflicte,
+        cu o singură interogare per tip de resursă
+        """
+        ids: Dict[str, set] = {'room': set(), 'teacher': set(), 'group': set()}
+        for conflict in conflicts:
+            ids[conflict.type].add(conflict.resource_id)
+        
+        names: Dict[str, Dict[int, str]] = {'room': {}, 'teacher': {}, 'group': {}}
+        
+        if ids['room']:
+            names['room'] = dict(self.db_session.execute(
+                select(Room.id, Room.name).where(Room.id.in_(ids['room']))
+            ).all())
+        
+        if ids['teacher']:
+            names['teacher'] = {
+                teacher.id: teacher.full_name
+                for teacher in self.db_session.execute(
+                    select(Teacher).where(Teacher.id.in_(ids['teacher']))
+                ).scalars().all()
+            }
+        
+        if ids['group']:
+            names['group'] = dict(self.db_session.execute(
+                select(Group.id, Group.name).where(Group.id.in_(ids['group']))
+            ).all())
+        
+        return names
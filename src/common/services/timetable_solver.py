@@ -0,0 +1,299 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from datetime import date, datetime, time, timedelta
+from bisect import bisect_left
+import time as timer
+
+from src.common.services.conflict_detection import ScheduleInterval
+
+# Grila implicită a intervalelor orare: examene de 2 ore între 08:00 și 20:00
+DEFAULT_DAY_START = time(8, 0)
+DEFAULT_DAY_END = time(20, 0)
+DEFAULT_SLOT_MINUTES = 120
+
+# Motivele pentru care un examen nu a putut fi plasat
+UNPLACED_REASONS = ('capacity', 'group_gap', 'no_slot')
+
+# Ocupare care nu aparține unui examen plasat de solver (planificări existente)
+FIXED = -1
+
+class ExamRequest(NamedTuple):
+    """Un examen aprobat care trebuie plasat într-o sală și un interval orar"""
+    schedule_id: int
+    date: date
+    group_id: int
+    students: int
+    teacher_ids: Tuple[int, ...]
+
+class Placement(NamedTuple):
+    """Sala și intervalul orar alese pentru un examen"""
+    schedule_id: int
+    room_id: int
+    date: date
+    start_time: time
+    end_time: time
+
+class UnplacedExam(NamedTuple):
+    """Un examen care nu a putut fi plasat și motivul (din UNPLACED_REASONS)"""
+    schedule_id: int
+    reason: str
+
+class SolverResult(NamedTuple):
+    """Rezultatul solver-ului"""
+    placements: List[Placement]
+    unplaced: List[UnplacedExam]
+    elapsed: float
+
+class TimetableSolver:
+    """
+    Plasează examene aprobate în săli și intervale orare
+
+    Constrângeri (toate obligatorii):
+    - capacitatea sălii este cel puțin numărul de studenți ai grupei;
+    - o sală, un cadru didactic (titular sau asistent) și o grupă au cel mult un
+      examen în același interval, inclusiv față de planificările deja existente;
+    - între două examene ale aceleiași grupe sunt cel puțin min_gap_days zile
+      (0 = doar fără suprapunere).
+
+    Zilele candidate sunt data aprobată a fiecărui examen sau, cu flexible_dates,
+    toate zilele perioadei, în ordinea depărtării de data aprobată.
+
+    Căutarea are două etape:
+    1. plasare greedy, cu examenele cele mai constrânse primele (cele mai puține zile
+       candidate, apoi cele mai mari grupe și cele mai multe cadre didactice), în
+       prima zi și primul interval posibile, în cea mai mică sală suficientă;
+    2. reparare locală până la epuizarea bugetului de timp: pentru fiecare examen
+       rămas, se caută un interval blocat de un singur examen plasat, care este
+       mutat în altă poziție validă (lanț de ejecție de lungime 1).
+    """
+
+    def __init__(self,
+                 rooms: Iterable[Tuple[int, int]],
+                 days: Sequence[date],
+                 min_gap_days: int = 1,
+                 flexible_dates: bool = False,
+                 day_start: time = DEFAULT_DAY_START,
+                 day_end: time = DEFAULT_DAY_END,
+                 slot_minutes: int = DEFAULT_SLOT_MINUTES):
+        """
+        Args:
+            rooms: Perechi (room_id, capacitate)
+            days: Zilele perioadei de examinare
+            min_gap_days: Numărul minim de zile între două examene ale aceleiași grupe
+            flexible_dates: Permite mutarea examenelor în alte zile ale perioadei
+            day_start: Ora primului interval
+            day_end: Ora până la care trebuie să se termine ultimul interval
+            slot_minutes: Durata unui examen (și a unui interval)
+        """
+        rooms = sorted(rooms, key=lambda room: (room[1], room[0]))
+        self.room_ids = [room_id for room_id, _ in rooms]
+        self.room_capacities = [capacity for _, capacity in rooms]
+        self.days = sorted(days)
+        self.min_gap_days = min_gap_days
+        self.flexible_dates = flexible_dates
+        self.slot_minutes = slot_minutes
+
+        self.slots: List[Tuple[time, time]] = []
+        start = datetime.combine(date.min, day_start)
+        while (start + timedelta(minutes=slot_minutes)).time() <= day_end and start.date() == date.min:
+            end = start + timedelta(minutes=slot_minutes)
+            self.slots.append((start.time(), end.time()))
+            start = end
+
+        # Ocuparea: cheie -> ID-ul examenului (FIXED pentru planificările existente)
+        self._rooms: Dict[Tuple[int, date, int], int] = {}
+        self._teachers: Dict[Tuple[int, date, int], int] = {}
+        self._groups: Dict[Tuple[int, date, int], int] = {}
+        # Zilele cu examene ale fiecărei grupe: grupă -> zi -> ID-uri
+        self._group_days: Dict[int, Dict[date, Set[int]]] = {}
+        self._placed: Dict[int, Tuple[ExamRequest, date, int, int]] = {}
+
+    def block(self, interval: ScheduleInterval) -> None:
+        """
+        Marchează ca ocupate resursele unei planificări existente
+
+        Args:
+            interval: Planificarea existentă (cu sală și oră)
+        """
+        if interval.start_time is None or interval.end_time is None:
+            return
+
+        for slot, (start_time, end_time) in enumerate(self.slots):
+            if interval.start_time < end_time and start_time < interval.end_time:
+                if interval.room_id is not None:
+                    self._rooms[(interval.room_id, interval.date, slot)] = FIXED
+                for teacher_id in interval.teacher_ids:
+                    self._teachers[(teacher_id, interval.date, slot)] = FIXED
+                if interval.group_id is not None:
+                    self._groups[(interval.group_id, interval.date, slot)] = FIXED
+
+        if interval.group_id is not None:
+            self._group_days.setdefault(interval.group_id, {}).setdefault(interval.date, set()).add(FIXED)
+
+    def solve(self, exams: Iterable[ExamRequest], time_budget: float = 10.0) -> SolverResult:
+        """
+        Plasează examenele
+
+        Args:
+            exams: Examenele de plasat
+            time_budget: Timpul maxim (secunde) pentru etapa de reparare locală
+
+        Returns:
+            SolverResult cu plasările și examenele rămase nerezolvate
+        """
+        started = timer.perf_counter()
+        deadline = started + time_budget
+        # Un titular trecut și ca asistent ar ocupa de două ori aceeași cheie
+        exams = [exam._replace(teacher_ids=tuple(dict.fromkeys(exam.teacher_ids))) for exam in exams]
+        candidates = {exam.schedule_id: self._candidate_days(exam) for exam in exams}
+        largest_room = self.room_capacities[-1] if self.room_capacities else 0
+
+        pending = []
+        unplaced: Dict[int, str] = {}
+
+        for exam in sorted(exams, key=lambda e: (len(candidates[e.schedule_id]), -e.students, -len(e.teacher_ids), e.schedule_id)):
+            if exam.students > largest_room:
+                unplaced[exam.schedule_id] = 'capacity'
+            elif not self._place_anywhere(exam, candidates[exam.schedule_id]):
+                pending.append(exam)
+
+        # Repararea locală se oprește la bugetul de timp sau când o trecere nu mai plasează nimic
+        progress = True
+        while pending and progress and timer.perf_counter() < deadline:
+            progress = False
+            remaining = []
+
+            for exam in pending:
+                if timer.perf_counter() < deadline and self._repair(exam, candidates):
+                    progress = True
+                else:
+                    remaining.append(exam)
+
+            pending = remaining
+
+        for exam in pending:
+            unplaced[exam.schedule_id] = self._unplaced_reason(exam, candidates[exam.schedule_id])
+
+        placements = [
+            Placement(schedule_id, room_id, day, *self.slots[slot])
+            for schedule_id, (_, day, slot, room_id) in sorted(self._placed.items())
+        ]
+
+        return SolverResult(
+            placements=placements,
+            unplaced=[UnplacedExam(schedule_id, reason) for schedule_id, reason in sorted(unplaced.items())],
+            elapsed=timer.perf_counter() - started
+        )
+
+    def _candidate_days(self, exam: ExamRequest) -> List[date]:
+        if not self.flexible_dates:
+            return [exam.date]
+        return sorted(self.days, key=lambda day: (abs((day - exam.date).days), day))
+
+    def _gap_blockers(self, exam: ExamRequest, day: date) -> Set[int]:
+        """Examenele grupei prea apropiate de ziua dată"""
+        blockers = set()
+        if self.min_gap_days <= 0:
+            return blockers
+
+        for other_day, schedule_ids in self._group_days.get(exam.group_id, {}).items():
+            if abs((other_day - day).days) < self.min_gap_days:
+                blockers |= schedule_ids - {exam.schedule_id}
+        return blockers
+
+    def _free_room(self, exam: ExamRequest, day: date, slot: int) -> Optional[int]:
+        """Cea mai mică sală suficientă și liberă"""
+        for index in range(bisect_left(self.room_capacities, exam.students), len(self.room_ids)):
+            if (self.room_ids[index], day, slot) not in self._rooms:
+                return self.room_ids[index]
+        return None
+
+    def _is_free(self, exam: ExamRequest, day: date, slot: int) -> bool:
+        if (exam.group_id, day, slot) in self._groups:
+            return False
+        return all((teacher_id, day, slot) not in self._teachers for teacher_id in exam.teacher_ids)
+
+    def _place_anywhere(self, exam: ExamRequest, days: List[date]) -> bool:
+        for day in days:
+            if self._gap_blockers(exam, day):
+                continue
+            for slot in range(len(self.slots)):
+                if not self._is_free(exam, day, slot):
+                    continue
+                room_id = self._free_room(exam, day, slot)
+                if room_id is not None:
+                    self._assign(exam, day, slot, room_id)
+                    return True
+        return False
+
+    def _assign(self, exam: ExamRequest, day: date, slot: int, room_id: int) -> None:
+        self._placed[exam.schedule_id] = (exam, day, slot, room_id)
+        self._rooms[(room_id, day, slot)] = exam.schedule_id
+        self._groups[(exam.group_id, day, slot)] = exam.schedule_id
+        for teacher_id in exam.teacher_ids:
+            self._teachers[(teacher_id, day, slot)] = exam.schedule_id
+        self._group_days.setdefault(exam.group_id, {}).setdefault(day, set()).add(exam.schedule_id)
+
+    def _unassign(self, schedule_id: int) -> Tuple[ExamRequest, date, int, int]:
+        exam, day, slot, room_id = self._placed.pop(schedule_id)
+        del self._rooms[(room_id, day, slot)]
+        del self._groups[(exam.group_id, day, slot)]
+        for teacher_id in exam.teacher_ids:
+            del self._teachers[(teacher_id, day, slot)]
+        days = self._group_days[exam.group_id]
+        days[day].discard(schedule_id)
+        if not days[day]:
+            del days[day]
+        return exam, day, slot, room_id
+
+    def _blockers(self, exam: ExamRequest, day: date, slot: int) -> Optional[Set[int]]:
+        """
+        Examenele plasate care trebuie mutate pentru a elibera (day, slot), sau None
+        dacă intervalul este blocat de planificări existente
+        """
+        blockers = self._gap_blockers(exam, day)
+        keys = [(self._groups, (exam.group_id, day, slot))]
+        keys += [(self._teachers, (teacher_id, day, slot)) for teacher_id in exam.teacher_ids]
+
+        for occupancy, key in keys:
+            if key in occupancy:
+                blockers.add(occupancy[key])
+
+        if self._free_room(exam, day, slot) is None:
+            # Sala eliberată de un examen deja blocant este suficientă; altfel mutăm
+            # ocupantul celei mai mici săli suficiente
+            rooms = [
+                self._rooms[(room_id, day, slot)]
+                for room_id in self.room_ids[bisect_left(self.room_capacities, exam.students):]
+            ]
+            if not blockers & set(rooms):
+                movable = [schedule_id for schedule_id in rooms if schedule_id != FIXED]
+                if not movable:
+                    return None
+                blockers.add(movable[0])
+
+        return None if FIXED in blockers else blockers
+
+    def _repair(self, exam: ExamRequest, candidates: Dict[int, List[date]]) -> bool:
+        for day in candidates[exam.schedule_id]:
+            for slot in range(len(self.slots)):
+                blockers = self._blockers(exam, day, slot)
+                if blockers is None or len(blockers) != 1:
+                    continue
+
+                (blocker_id,) = blockers
+                blocker, blocker_day, blocker_slot, blocker_room = self._unassign(blocker_id)
+                room_id = self._free_room(exam, day, slot)
+
+                if room_id is not None and self._is_free(exam, day, slot) and not self._gap_blockers(exam, day):
+                    self._assign(exam, day, slot, room_id)
+                    if self._place_anywhere(blocker, candidates[blocker_id]):
+                        return True
+                    self._unassign(exam.schedule_id)
+
+                self._assign(blocker, blocker_day, blocker_slot, blocker_room)
+        return False
+
+    def _unplaced_reason(self, exam: ExamRequest, days: List[date]) -> str:
+        if all(self._gap_blockers(exam, day) for day in days):
+            return 'group_gap'
+        return 'no_slot'
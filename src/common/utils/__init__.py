@@ -0,0 +1,33 @@
+from src.common.utils.database import (
+    create_pooled_engine, create_pooled_async_engine, get_pool_status,
+    PoolMetrics, InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
+)
+from src.common.utils.metrics import LatencyRecorder
+from src.common.utils.executor import BoundedExecutor, ExecutorSaturatedError
+from src.common.utils.rate_limit import TokenBucket
+from src.common.utils.pagination import (
+    InvalidCursorError, encode_cursor, decode_cursor, clamp_page_size, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+)
+from src.common.utils.query_plans import explain_statement, find_full_scans
+
+# Exportă toate utilitarele pentru a fi utilizate în alte module
+__all__ = [
+    'create_pooled_engine',
+    'create_pooled_async_engine',
+    'get_pool_status',
+    'PoolMetrics',
+    'InstrumentedQueuePool',
+    'InstrumentedAsyncAdaptedQueuePool',
+    'LatencyRecorder',
+    'BoundedExecutor',
+    'ExecutorSaturatedError',
+    'TokenBucket',
+    'InvalidCursorError',
+    'encode_cursor',
+    'decode_cursor',
+    'clamp_page_size',
+    'DEFAULT_PAGE_SIZE',
+    'MAX_PAGE_SIZE',
+    'explain_statement',
+    'find_full_scans'
+]
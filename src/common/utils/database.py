@@ -0,0 +1,265 @@
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+import threading
+import time
+
+from src.common.utils.metrics import LatencyRecorder
+
+class PoolMetrics:
+    """Colectează metrici despre pool-ul de conexiuni prin evenimentele SQLAlchemy"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_time = LatencyRecorder()
+
+    def attach(self, engine):
+        """
+        Înregistrează ascultătorii de evenimente pe pool-ul unui engine
+
+        Args:
+            engine: Engine-ul SQLAlchemy instrumentat (sincron sau asincron)
+        """
+        # AsyncEngine nu acceptă ascultători; evenimentele pool-ului sunt emise de engine-ul sincron
+        if isinstance(engine, AsyncEngine):
+            engine = engine.sync_engine
+
+        event.listen(engine, 'connect', self._on_connect)
+        event.listen(engine, 'checkout', self._on_checkout)
+        event.listen(engine, 'checkin', self._on_checkin)
+        event.listen(engine, 'invalidate', self._on_invalidate)
+
+        if isinstance(engine.pool, InstrumentedQueuePool):
+            engine.pool.metrics = self
+
+    def _increment(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self._increment('connects')
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self._increment('checkouts')
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        self._increment('checkins')
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self._increment('invalidations')
+
+    def observe_wait(self, seconds: float, timed_out: bool = False):
+        """
+        Înregistrează timpul petrecut pentru obținerea unei conexiuni din pool
+
+        Args:
+            seconds: Durata așteptării, în secunde
+            timed_out: Dacă așteptarea s-a terminat cu depășirea pool_timeout
+        """
+        self.wait_time.observe(seconds)
+
+        if timed_out:
+            self._increment('timeouts')
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returnează valorile curente ale contoarelor
+        """
+        with self._lock:
+            counters = {
+                'connects': self.connects,
+                'checkouts': self.checkouts,
+                'checkins': self.checkins,
+                'invalidations': self.invalidations,
+                'timeouts': self.timeouts
+            }
+
+        counters['wait_time'] = self.wait_time.snapshot()
+        return counters
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool care măsoară cât durează obținerea unei conexiuni"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        # Durata include așteptarea în coadă și, dacă e cazul, deschiderea unei
+        # conexiuni noi către server
+        start = time.perf_counter()
+        timed_out = False
+
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe_wait(time.perf_counter() - start, timed_out=timed_out)
+
+    def recreate(self):
+        # engine.dispose() recreează pool-ul; păstrăm colectorul de metrici
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Varianta pentru engine-uri asincrone a InstrumentedQueuePool"""
+
+def create_pooled_engine(database_url: str,
+                         pool_size: int = 5,
+                         max_overflow: int = 10,
+                         pool_timeout: float = 30,
+                         pool_recycle: int = 1800,
+                         pool_pre_ping: bool = True,
+                         statement_timeout_ms: Optional[int] = None,
+                         metrics: Optional[PoolMetrics] = None,
+                         **engine_options: Any) -> Engine:
+    """
+    Creează un engine SQLAlchemy cu un pool de conexiuni configurat explicit
+
+    Engine-ul trebuie creat o singură dată per proces și reutilizat pentru toate
+    cererile, altfel fiecare cerere plătește o conexiune TCP nouă și autentificarea
+    la PostgreSQL.
+
+    Args:
+        database_url: URL-ul bazei de date
+        pool_size: Numărul de conexiuni păstrate deschise în pool
+        max_overflow: Numărul de conexiuni suplimentare permise peste pool_size
+        pool_timeout: Secundele de așteptare pentru o conexiune liberă
+        pool_recycle: Vârsta maximă (în secunde) a unei conexiuni înainte de a fi redeschisă
+        pool_pre_ping: Dacă se verifică conexiunea înainte de a fi folosită
+        statement_timeout_ms: Durata maximă a unei interogări în PostgreSQL (opțional)
+        metrics: Colector de metrici atașat pool-ului (opțional)
+        **engine_options: Opțiuni suplimentare transmise către create_engine
+
+    Returns:
+        Obiectul Engine creat
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend == 'postgresql' and statement_timeout_ms:
+        connect_args = engine_options.setdefault('connect_args', {})
+        connect_args['options'] = f"{connect_args.get('options', '')} -c statement_timeout={int(statement_timeout_ms)}".strip()
+
+    if backend == 'sqlite':
+        engine_options.setdefault('connect_args', {}).setdefault('check_same_thread', False)
+
+        # O bază SQLite în memorie trebuie să partajeze o singură conexiune,
+        # altfel fiecare checkout ar vedea o bază de date goală
+        if url.database in (None, '', ':memory:'):
+            engine = create_engine(url, poolclass=StaticPool, **engine_options)
+            if metrics is not None:
+                metrics.attach(engine)
+            return engine
+
+    default_poolclass = InstrumentedQueuePool if metrics is not None else QueuePool
+
+    engine = create_engine(
+        url,
+        poolclass=engine_options.pop('poolclass', default_poolclass),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        **engine_options
+    )
+
+    if metrics is not None:
+        metrics.attach(engine)
+
+    return engine
+
+def create_pooled_async_engine(database_url: str,
+                               pool_size: int = 5,
+                               max_overflow: int = 10,
+                               pool_timeout: float = 30,
+                               pool_recycle: int = 1800,
+                               pool_pre_ping: bool = True,
+                               statement_timeout_ms: Optional[int] = None,
+                               metrics: Optional[PoolMetrics] = None,
+                               **engine_options: Any) -> AsyncEngine:
+    """
+    Creează un engine SQLAlchemy asincron cu un pool de conexiuni configurat explicit
+
+    URL-ul trebuie să indice un driver asincron (ex. postgresql+asyncpg,
+    sqlite+aiosqlite). Parametrii au aceeași semnificație ca la create_pooled_engine.
+
+    Returns:
+        Obiectul AsyncEngine creat
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend == 'postgresql' and statement_timeout_ms:
+        # asyncpg nu acceptă parametrul libpq "options"; setarea se trimite la conectare
+        connect_args = engine_options.setdefault('connect_args', {})
+        connect_args.setdefault('server_settings', {})['statement_timeout'] = str(int(statement_timeout_ms))
+
+    if backend == 'sqlite' and url.database in (None, '', ':memory:'):
+        engine = create_async_engine(url, poolclass=StaticPool, **engine_options)
+        if metrics is not None:
+            metrics.attach(engine)
+        return engine
+
+    default_poolclass = InstrumentedAsyncAdaptedQueuePool if metrics is not None else AsyncAdaptedQueuePool
+
+    engine = create_async_engine(
+        url,
+        poolclass=engine_options.pop('poolclass', default_poolclass),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        **engine_options
+    )
+
+    if metrics is not None:
+        metrics.attach(engine)
+
+    return engine
+
+def get_pool_status(engine: Engine) -> Dict[str, Any]:
+    """
+    Returnează starea curentă a pool-ului de conexiuni al unui engine
+
+    Args:
+        engine: Engine-ul SQLAlchemy
+
+    Returns:
+        Dicționar cu dimensiunea pool-ului și numărul de conexiuni
+        disponibile (checked_in), în uz (checked_out) și suplimentare (overflow)
+    """
+    if isinstance(engine, AsyncEngine):
+        engine = engine.sync_engine
+
+    pool = engine.pool
+
+    if isinstance(pool, QueuePool):
+        return {
+            'pool_class': type(pool).__name__,
+            'pool_size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': pool.overflow()
+        }
+
+    # Pool-urile fără coadă (ex. StaticPool pentru SQLite) nu expun contoare
+    return {
+        'pool_class': type(pool).__name__,
+        'pool_size': None,
+        'checked_in': None,
+        'checked_out': None,
+        'overflow': None
+    }
@@ -0,0 +1,136 @@
+from typing import Any, Callable, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+
+from src.common.utils.metrics import LatencyRecorder
+
+class ExecutorSaturatedError(RuntimeError):
+    """Excepție ridicată când coada unui pool de fire de execuție este plină"""
+
+    def __init__(self, name: str, limit: int):
+        super().__init__(f"Pool-ul '{name}' este saturat ({limit} sarcini în execuție sau în așteptare)")
+        self.name = name
+        self.limit = limit
+
+class BoundedExecutor:
+    """
+    Pool de fire de execuție cu coadă limitată și metrici
+
+    Spre deosebire de ThreadPoolExecutor, numărul de sarcini acceptate (în execuție
+    plus în așteptare) este limitat la max_workers + max_queue; sarcinile peste
+    această limită sunt respinse imediat cu ExecutorSaturatedError, în loc să
+    acumuleze latență într-o coadă nelimitată.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int = 0):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"pool-{name}")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.queue_wait = LatencyRecorder()
+        self.run_time = LatencyRecorder()
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Trimite o funcție spre execuție în pool
+
+        Args:
+            func: Funcția (blocantă) de executat
+            *args: Argumentele poziționale ale funcției
+            **kwargs: Argumentele cu nume ale funcției
+
+        Returns:
+            Future cu rezultatul funcției
+
+        Raises:
+            ExecutorSaturatedError: Dacă pool-ul și coada sunt pline
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ExecutorSaturatedError(self.name, self.max_workers + self.max_queue)
+
+        with self._lock:
+            self.queued += 1
+
+        submitted_at = time.perf_counter()
+
+        def _run():
+            started_at = time.perf_counter()
+            self.queue_wait.observe(started_at - submitted_at)
+
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+
+            succeeded = False
+            try:
+                result = func(*args, **kwargs)
+                succeeded = True
+                return result
+            finally:
+                self.run_time.observe(time.perf_counter() - started_at)
+
+                with self._lock:
+                    self.active -= 1
+                    if succeeded:
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+
+                self._slots.release()
+
+        try:
+            future = self._executor.submit(_run)
+        except RuntimeError:
+            # Pool-ul a fost oprit între timp
+            with self._lock:
+                self.queued -= 1
+            self._slots.release()
+            raise
+
+        def _release_if_cancelled(done: Future):
+            # O sarcină anulată cât timp aștepta în coadă nu mai ajunge în _run
+            if done.cancelled():
+                with self._lock:
+                    self.queued -= 1
+                self._slots.release()
+
+        future.add_done_callback(_release_if_cancelled)
+        return future
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returnează starea curentă a pool-ului și statisticile de latență
+        """
+        with self._lock:
+            counters = {
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'queue_depth': self.queued,
+                'active': self.active,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected
+            }
+
+        counters['queue_wait'] = self.queue_wait.snapshot()
+        counters['run_time'] = self.run_time.snapshot()
+        return counters
+
+    def shutdown(self, wait: bool = True):
+        """
+        Oprește pool-ul
+
+        Args:
+            wait: Dacă se așteaptă terminarea sarcinilor în curs
+        """
+        self._executor.shutdown(wait=wait)
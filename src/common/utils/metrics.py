@@ -0,0 +1,68 @@
+from typing import Any, Dict, List
+from collections import deque
+import threading
+
+def _percentile(sorted_samples: List[float], percent: float) -> float:
+    if not sorted_samples:
+        return 0.0
+
+    index = min(len(sorted_samples) - 1, int(round(percent / 100.0 * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+class LatencyRecorder:
+    """Înregistrează durate și calculează statistici pe ultimele observații"""
+
+    def __init__(self, window: int = 1024):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        """
+        Adaugă o observație
+
+        Args:
+            seconds: Durata măsurată, în secunde
+        """
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        """
+        Calculează un percentil (în secunde) pe fereastra de observații recente
+
+        Args:
+            percent: Percentilul dorit, între 0 și 100
+
+        Returns:
+            Valoarea percentilului sau 0 dacă nu există observații
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+
+        return _percentile(samples, percent)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returnează statisticile curente, cu duratele exprimate în milisecunde
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self.count
+            total = self.total
+            maximum = self.max
+
+        return {
+            'count': count,
+            'avg_ms': round(total / count * 1000, 3) if count else 0.0,
+            'max_ms': round(maximum * 1000, 3),
+            'p50_ms': round(_percentile(samples, 50) * 1000, 3),
+            'p95_ms': round(_percentile(samples, 95) * 1000, 3),
+            'p99_ms': round(_percentile(samples, 99) * 1000, 3)
+        }
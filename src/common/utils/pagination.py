@@ -0,0 +1,63 @@
+from typing import Any, List, Optional
+import base64
+import json
+
+# Dimensiunea implicită și maximă a unei pagini pentru listările cu cursor
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+class InvalidCursorError(ValueError):
+    """Excepție ridicată când un cursor de paginare nu poate fi decodat"""
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Codifică valorile cheii de sortare ale ultimului rând într-un cursor opac
+
+    Args:
+        values: Valorile cheii de sortare (serializabile JSON)
+
+    Returns:
+        Cursorul, ca șir base64 sigur pentru URL
+    """
+    payload = json.dumps(values, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """
+    Decodează un cursor creat cu encode_cursor
+
+    Args:
+        cursor: Cursorul primit de la client
+        length: Numărul de valori așteptate în cursor
+
+    Returns:
+        Lista valorilor cheii de sortare
+
+    Raises:
+        InvalidCursorError: Dacă cursorul este invalid
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding).decode('utf-8'))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Cursor de paginare invalid") from e
+
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursorError("Cursor de paginare invalid")
+
+    return values
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    """
+    Limitează dimensiunea paginii cerute la intervalul [1, MAX_PAGE_SIZE]
+
+    Args:
+        limit: Dimensiunea cerută (None pentru valoarea implicită)
+
+    Returns:
+        Dimensiunea efectivă a paginii
+    """
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
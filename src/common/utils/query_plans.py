@@ -0,0 +1,61 @@
+from typing import Any, Dict, Iterable, List
+import json
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+def explain_statement(connection: Connection, statement: Select) -> List[str]:
+    """
+    Obține planul de execuție al unei interogări
+
+    Interogarea este compilată cu valorile parametrilor incluse, pentru ca planificatorul
+    să estimeze selectivitatea pe valorile reale. Pe PostgreSQL se folosește
+    EXPLAIN (FORMAT JSON), pe SQLite EXPLAIN QUERY PLAN.
+
+    Args:
+        connection: Conexiunea la baza de date
+        statement: Interogarea analizată
+
+    Returns:
+        Liniile planului, câte una pentru fiecare nod: „<tip nod> <tabel> [<index>]”
+        pe PostgreSQL, textul SQLite (ex. „SEARCH schedules USING INDEX ...”) pe SQLite
+    """
+    sql = str(statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+
+    if connection.dialect.name == 'postgresql':
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return [_describe_node(node) for node in _walk_plan(plan[0]['Plan'])]
+
+    return [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+
+def find_full_scans(plan: List[str], tables: Iterable[str]) -> List[str]:
+    """
+    Găsește în plan parcurgerile complete ale tabelelor date
+
+    Args:
+        plan: Planul obținut cu explain_statement
+        tables: Tabelele care nu au voie să fie parcurse complet
+
+    Returns:
+        Liniile planului care reprezintă parcurgeri complete (listă goală dacă nu există)
+    """
+    full_scans = []
+
+    for line in plan:
+        words = line.split()
+        # PostgreSQL: „Seq Scan schedules”; SQLite: „SCAN schedules” fără „USING ... INDEX”
+        if line.startswith('Seq Scan ') and words[2] in tables:
+            full_scans.append(line)
+        elif words[:1] == ['SCAN'] and words[1] in tables and 'INDEX' not in words:
+            full_scans.append(line)
+
+    return full_scans
+
+def _walk_plan(node: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    yield node
+    for child in node.get('Plans', []):
+        yield from _walk_plan(child)
+
+def _describe_node(node: Dict[str, Any]) -> str:
+    return ' '.join(part for part in (node['Node Type'], node.get('Relation Name'), node.get('Index Name')) if part)
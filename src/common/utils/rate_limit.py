@@ -0,0 +1,85 @@
+from typing import Dict, Optional
+import threading
+import time
+
+class TokenBucket:
+    """
+    Limitator de rată (token bucket) sigur pentru mai multe fire de execuție
+
+    Găleata se umple cu rate jetoane pe secundă, până la capacity; fiecare
+    operație consumă un jeton, iar în lipsa lor apelantul așteaptă. capacity
+    permite rafale scurte peste rata medie.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - max(self._updated_at, self._paused_until)
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Consumă jetoane, așteptând dacă este nevoie
+
+        Args:
+            tokens: Numărul de jetoane consumate
+            timeout: Durata maximă de așteptare (secunde); None înseamnă fără limită
+
+        Returns:
+            True dacă jetoanele au fost consumate, False la depășirea timpului
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now >= self._paused_until and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+
+                wait = max(self._paused_until - now, (tokens - self._tokens) / self.rate)
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+
+            time.sleep(wait)
+            with self._lock:
+                self.waited += wait
+
+    def defer(self, seconds: float):
+        """
+        Suspendă consumul de jetoane (de ex. după un răspuns 429 cu Retry-After)
+
+        Args:
+            seconds: Durata suspendării, în secunde
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Returnează configurarea și timpul total de așteptare
+        """
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'waited': round(self.waited, 3)
+            }
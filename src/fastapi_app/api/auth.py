@@ -8,6 +8,7 @@ import datetime
 from common.models import User
 from common.services import AuthService
 from fastapi_app.dependencies import get_db_session, get_current_user, get_current_active_user
+from fastapi_app.concurrency import run_in_pool
 from fastapi_app.schemas.auth import Token, UserCreate, UserResponse, UserUpdate
 
 # Creăm router-ul pentru autentificare
@@ -34,7 +35,7 @@ async def login(google_token: GoogleToken, db_session: Session = Depends(get_db_
     )
     
     # Verificăm token-ul Google OAuth
-    user_info = auth_service.verify_google_token(google_token.token)
+    user_info = await run_in_pool(auth_service.verify_google_token, google_token.token, pool='io')
     
     if not user_info:
         raise HTTPException(
@@ -45,7 +46,7 @@ async def login(google_token: GoogleToken, db_session: Session = Depends(get_db_
     
     # Obținem utilizatorul după email
     email = user_info.get('email')
-    user = auth_service.get_user_by_email(email)
+    user = await run_in_pool(auth_service.get_user_by_email, email)
     
     if not user:
         # Verificăm dacă email-ul este valid pentru aplicație
@@ -60,7 +61,8 @@ async def login(google_token: GoogleToken, db_session: Session = Depends(get_db_
         role = 'SG' if email.endswith('@student.usv.ro') else 'CD'
         
         # Creăm un utilizator nou
-        user = auth_service.create_user(
+        user = await run_in_pool(
+            auth_service.create_user,
             email=email,
             first_name=user_info.get('given_name', ''),
             last_name=user_info.get('family_name', ''),
@@ -124,7 +126,7 @@ async def get_users(
         )
     
     # Obținem toți utilizatorii din baza de date
-    users = db_session.query(User).offset(skip).limit(limit).all()
+    users = await run_in_pool(db_session.query(User).offset(skip).limit(limit).all)
     
     # Returnăm lista de utilizatori
     return users
@@ -152,7 +154,7 @@ async def create_user(
     )
     
     # Verificăm dacă utilizatorul există deja
-    existing_user = auth_service.get_user_by_email(user_create.email)
+    existing_user = await run_in_pool(auth_service.get_user_by_email, user_create.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -160,7 +162,8 @@ async def create_user(
         )
     
     # Creăm utilizatorul
-    user = auth_service.create_user(
+    user = await run_in_pool(
+        auth_service.create_user,
         email=user_create.email,
         first_name=user_create.firstName,
         last_name=user_create.lastName,
@@ -176,7 +179,7 @@ async def create_user(
     # Setăm parola dacă este furnizată și utilizatorul este administrator
     if user_create.password and user_create.role == 'ADM':
         user.set_password(user_create.password)
-        db_session.commit()
+        await run_in_pool(db_session.commit)
     
     # Returnăm informațiile utilizatorului creat
     return {
@@ -205,7 +208,7 @@ async def update_user(
         )
     
     # Obținem utilizatorul din baza de date
-    user = db_session.query(User).filter(User.id == user_id).first()
+    user = await run_in_pool(db_session.query(User).filter(User.id == user_id).first)
     
     if not user:
         raise HTTPException(
@@ -235,7 +238,7 @@ async def update_user(
     if user_update.password and user.role == 'ADM':
         user.set_password(user_update.password)
     
-    db_session.commit()
+    await run_in_pool(db_session.commit)
     
     # Returnăm informațiile utilizatorului actualizat
     return {
@@ -263,7 +266,7 @@ async def delete_user(
         )
     
     # Obținem utilizatorul din baza de date
-    user = db_session.query(User).filter(User.id == user_id).first()
+    user = await run_in_pool(db_session.query(User).filter(User.id == user_id).first)
     
     if not user:
         raise HTTPException(
@@ -273,7 +276,7 @@ async def delete_user(
     
     # Ștergem utilizatorul
     db_session.delete(user)
-    db_session.commit()
+    await run_in_pool(db_session.commit)
     
     # Returnăm un răspuns gol
     return None
@@ -1,11 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
+import json
 
 from common.models import User, Notification
-from common.services import NotificationService
-from fastapi_app.dependencies import get_db_session, get_current_user, get_current_active_user
+from common.services import (
+    NotificationService, AsyncNotificationService, BrokerFullError, NotificationEvent, NotificationSubscription,
+    notification_broker
+)
+from fastapi_app.config import get_settings
+from fastapi_app.dependencies import get_db_session, get_async_db_session, get_current_user, get_current_active_user
+from fastapi_app.concurrency import run_in_pool
 from fastapi_app.schemas.notification import (
     NotificationResponse, NotificationCreate, NotificationSettings,
     NotificationSettingsUpdate, PaginatedNotificationResponse
@@ -24,19 +32,16 @@ async def get_notifications(
     page: int = Query(1, ge=1, description="Numărul paginii"),
     per_page: int = Query(10, ge=1, le=100, description="Numărul de notificări per pagină"),
     current_user: User = Depends(get_current_active_user),
-    db_session: Session = Depends(get_db_session)
+    db_session: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Endpoint pentru obținerea notificărilor utilizatorului curent
     """
     # Inițializăm serviciul de notificări
-    notification_service = NotificationService(
-        db_session=db_session,
-        api_key="your-sendgrid-api-key"  # Va fi înlocuit cu o variabilă de mediu
-    )
+    notification_service = AsyncNotificationService(db_session=db_session)
     
     # Obținem notificările
-    notifications, pagination = notification_service.get_user_notifications(
+    notifications, pagination = await notification_service.get_user_notifications(
         user_id=current_user.id,
         unread_only=unread_only,
         page=page,
@@ -49,6 +54,93 @@ async def get_notifications(
         "pagination": pagination
     }
 
+@router.get("/unread-count", response_model=dict)
+async def get_unread_count(
+    current_user: User = Depends(get_current_active_user),
+    db_session: AsyncSession = Depends(get_async_db_session)
+):
+    """
+    Endpoint pentru numărul de notificări necitite ale utilizatorului curent (badge)
+
+    Valoarea este citită din cache sau din contorul utilizatorului, fără
+    interogarea tabelei de notificări.
+    """
+    notification_service = AsyncNotificationService(db_session=db_session)
+
+    return {"unread": await notification_service.get_unread_count(current_user.id)}
+
+def format_sse(event: NotificationEvent) -> str:
+    """
+    Formatează un eveniment în formatul text/event-stream
+    """
+    data = json.dumps(event.data, ensure_ascii=False)
+    return f"id: {event.id}\nevent: {event.event}\ndata: {data}\n\n"
+
+async def notification_events(subscription: NotificationSubscription, heartbeat: float, retry_ms: int) -> AsyncIterator[str]:
+    """
+    Generează fluxul de evenimente al unui client, până la deconectare
+
+    Args:
+        subscription: Abonamentul clientului la broker
+        heartbeat: Intervalul (secunde) între comentariile trimise când nu există evenimente
+        retry_ms: Intervalul de reconectare comunicat browserului
+
+    Returns:
+        Generator de fragmente text/event-stream
+    """
+    try:
+        yield f"retry: {retry_ms}\n\n"
+
+        while not subscription.closed:
+            events = await subscription.get(heartbeat)
+            if not events:
+                yield ": heartbeat\n\n"
+                continue
+
+            yield "".join(format_sse(event) for event in events)
+    finally:
+        # La deconectare Starlette anulează generatorul; abonamentul este eliberat aici
+        subscription.close()
+
+@router.get("/stream")
+async def stream_notifications(
+    current_user: User = Depends(get_current_active_user),
+    db_session: AsyncSession = Depends(get_async_db_session)
+):
+    """
+    Endpoint pentru primirea notificărilor noi ale utilizatorului curent, prin
+    Server-Sent Events (text/event-stream)
+
+    Evenimente:
+    - notification: o notificare nouă, {"id", "title", "message", "type"} (id este
+      null pentru notificările trimise mai multor utilizatori)
+    - resync: unele notificări nu au putut fi trimise (client prea lent); lista
+      trebuie reîncărcată prin GET /api/notifications
+
+    Când nu există evenimente este trimis periodic un comentariu (": heartbeat").
+    """
+    settings = get_settings()
+
+    # Conexiunea rămâne deschisă cât timp clientul este conectat; sesiunea folosită
+    # pentru autentificare este închisă acum, ca să nu țină ocupată o conexiune din pool
+    user_id, role = current_user.id, current_user.role
+    await db_session.close()
+
+    try:
+        subscription = notification_broker.subscribe(user_id, role)
+    except BrokerFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Prea mulți clienți conectați, încercați din nou",
+            headers={"Retry-After": str(settings.NOTIFICATION_STREAM_RETRY_MS // 1000 or 1)},
+        )
+
+    return StreamingResponse(
+        notification_events(subscription, settings.NOTIFICATION_STREAM_HEARTBEAT, settings.NOTIFICATION_STREAM_RETRY_MS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.post("/{notification_id}/read", response_model=dict)
 async def mark_notification_as_read(
     notification_id: int,
@@ -65,7 +157,8 @@ async def mark_notification_as_read(
     )
     
     # Marcăm notificarea ca citită
-    success = notification_service.mark_notification_as_read(
+    success = await run_in_pool(
+        notification_service.mark_notification_as_read,
         notification_id=notification_id,
         user_id=current_user.id
     )
@@ -97,7 +190,7 @@ async def mark_all_notifications_as_read(
     )
     
     # Marcăm toate notificările ca citite
-    count = notification_service.mark_all_notifications_as_read(user_id=current_user.id)
+    count = await run_in_pool(notification_service.mark_all_notifications_as_read, user_id=current_user.id)
     
     # Returnăm mesajul de succes
     return {
@@ -121,7 +214,7 @@ async def get_notification_settings(
     )
     
     # Obținem setările de notificare
-    settings = notification_service.get_notification_settings(user_id=current_user.id)
+    settings = await run_in_pool(notification_service.get_notification_settings, user_id=current_user.id)
     
     # Returnăm setările de notificare
     return settings
@@ -142,7 +235,8 @@ async def update_notification_settings(
     )
     
     # Actualizăm setările de notificare
-    settings = notification_service.update_notification_settings(
+    settings = await run_in_pool(
+        notification_service.update_notification_settings,
         user_id=current_user.id,
         email_notifications=settings_update.email_notifications,
         push_notifications=settings_update.push_notifications,
@@ -188,7 +282,8 @@ async def send_notification(
     
     # Trimitem notificarea
     try:
-        count = notification_service.send_notification(
+        count = await run_in_pool(
+            notification_service.send_notification,
             title=notification_create.title,
             message=notification_create.message,
             notification_type=notification_create.type,
@@ -205,7 +300,7 @@ async def send_notification(
             "count": count
         }
     except SQLAlchemyError as e:
-        db_session.rollback()
+        await run_in_pool(db_session.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Eroare la trimiterea notificării: {str(e)}",
@@ -6,6 +6,7 @@ from typing import List, Optional, Dict, Any
 from common.models import User
 from common.services import OrarIntegrationService
 from fastapi_app.dependencies import get_db_session, get_current_user, get_current_active_user
+from fastapi_app.concurrency import run_in_pool
 from fastapi_app.schemas.schedule import TeacherResponse, GroupResponse, RoomResponse
 
 # Creăm router-ul pentru integrarea cu Orar USV
@@ -38,7 +39,7 @@ async def sync_data(
     
     # Sincronizăm datele
     try:
-        result = orar_service.sync_all_data()
+        result = await run_in_pool(orar_service.sync_all_data, pool='io')
         
         # Returnăm rezultatul sincronizării
         return {
@@ -69,7 +70,7 @@ async def get_teachers(
     
     # Obținem cadrele didactice
     try:
-        teachers = orar_service.get_teachers(search=search)
+        teachers = await run_in_pool(orar_service.get_teachers, search=search, pool='io')
         
         # Returnăm lista de cadre didactice
         return teachers
@@ -98,7 +99,9 @@ async def get_groups(
     
     # Obținem grupele
     try:
-        groups = orar_service.get_groups(
+        groups = await run_in_pool(
+            orar_service.get_groups,
+            pool='io',
             search=search,
             year=year,
             specialization=specialization
@@ -131,7 +134,9 @@ async def get_rooms(
     
     # Obținem sălile
     try:
-        rooms = orar_service.get_rooms(
+        rooms = await run_in_pool(
+            orar_service.get_rooms,
+            pool='io',
             search=search,
             building=building,
             capacity=capacity
@@ -163,7 +168,9 @@ async def get_subjects(
     
     # Obținem disciplinele
     try:
-        subjects = orar_service.get_subjects(
+        subjects = await run_in_pool(
+            orar_service.get_subjects,
+            pool='io',
             search=search,
             teacher_id=teacher_id
         )
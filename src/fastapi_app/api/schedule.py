@@ -1,15 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional
 from datetime import date, time, datetime
 
 from common.models import User, Schedule, Room, Group, Subject, Teacher
-from common.services import ScheduleService, NotificationService
-from fastapi_app.dependencies import get_db_session, get_current_user, get_current_active_user
+from common.services import ScheduleService, NotificationService, AsyncScheduleService, ScheduleConflictError, PlacementCandidate, ProposalItem
+from common.services.schedule_service import MAX_BULK_PROPOSALS
+from common.services.conflict_detection import MAX_WHAT_IF_CANDIDATES
+from common.utils import InvalidCursorError, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from fastapi_app.dependencies import get_db_session, get_async_db_session, get_current_user, get_current_active_user
+from fastapi_app.concurrency import run_in_pool
+from fastapi_app.config import get_settings
 from fastapi_app.schemas.schedule import (
     ScheduleCreate, ScheduleUpdate, ScheduleResponse, SchedulePropose,
-    ConflictResponse, AvailableRoomResponse
+    ConflictResponse, AvailableRoomResponse, PaginatedScheduleResponse, SolverRequest, SolverResponse,
+    WhatIfRequest, WhatIfResult, BulkProposalRequest, BulkProposalResult
 )
 
 # Creăm router-ul pentru planificare
@@ -19,48 +26,62 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("", response_model=List[ScheduleResponse])
+@router.get("", response_model=PaginatedScheduleResponse)
 async def get_schedules(
     group_id: Optional[int] = None,
     teacher_id: Optional[int] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    status: Optional[str] = None,
+    # Parametrul "status" ar ascunde modulul fastapi.status folosit pentru codurile de eroare
+    schedule_status: Optional[str] = Query(None, alias="status"),
+    cursor: Optional[str] = Query(None, description="Cursorul returnat în next_cursor de pagina anterioară"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Numărul de planificări per pagină"),
     current_user: User = Depends(get_current_active_user),
-    db_session: Session = Depends(get_db_session)
+    db_session: AsyncSession = Depends(get_async_db_session)
 ):
     """
-    Endpoint pentru obținerea planificărilor
+    Endpoint pentru obținerea planificărilor, paginate cu cursor după (date, start_time, id)
     """
     # Inițializăm serviciul de planificare
-    schedule_service = ScheduleService(db_session=db_session)
+    schedule_service = AsyncScheduleService(db_session=db_session)
     
-    # Obținem planificările
-    schedules = schedule_service.get_schedules(
-        group_id=group_id,
-        teacher_id=teacher_id,
-        start_date=start_date,
-        end_date=end_date,
-        status=status
-    )
+    # Obținem pagina de planificări
+    try:
+        schedules, next_cursor = await schedule_service.get_schedules_page(
+            group_id=group_id,
+            teacher_id=teacher_id,
+            start_date=start_date,
+            end_date=end_date,
+            status=schedule_status,
+            cursor=cursor,
+            limit=limit
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     
-    # Returnăm lista de planificări
-    return schedules
+    # Returnăm pagina de planificări
+    return {
+        "schedules": schedules,
+        "next_cursor": next_cursor
+    }
 
 @router.get("/{schedule_id}", response_model=ScheduleResponse)
 async def get_schedule(
     schedule_id: int,
     current_user: User = Depends(get_current_active_user),
-    db_session: Session = Depends(get_db_session)
+    db_session: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Endpoint pentru obținerea unei planificări după ID
     """
     # Inițializăm serviciul de planificare
-    schedule_service = ScheduleService(db_session=db_session)
+    schedule_service = AsyncScheduleService(db_session=db_session)
     
     # Obținem planificarea
-    schedule = schedule_service.get_schedule_by_id(schedule_id)
+    schedule = await schedule_service.get_schedule_by_id(schedule_id)
     
     if not schedule:
         raise HTTPException(
@@ -92,7 +113,8 @@ async def create_schedule(
     
     # Creăm planificarea
     try:
-        schedule = schedule_service.create_schedule(
+        schedule = await run_in_pool(
+            schedule_service.create_schedule,
             subject_id=schedule_create.subjectId,
             teacher_id=schedule_create.teacherId,
             group_id=schedule_create.groupId,
@@ -115,15 +137,21 @@ async def create_schedule(
             api_key="your-sendgrid-api-key"  # Va fi înlocuit cu o variabilă de mediu
         )
         
-        notification_service.send_schedule_notification(
+        await run_in_pool(
+            notification_service.send_schedule_notification,
             schedule_id=schedule.id,
             notification_type='created'
         )
         
         # Returnăm planificarea creată
         return schedule
+    except ScheduleConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Conflict de tip {e.conflict_type} cu planificările {e.conflicting_ids}",
+        )
     except SQLAlchemyError as e:
-        db_session.rollback()
+        await run_in_pool(db_session.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Eroare la crearea planificării: {str(e)}",
@@ -151,7 +179,8 @@ async def update_schedule(
     
     # Actualizăm planificarea
     try:
-        schedule = schedule_service.update_schedule(
+        schedule = await run_in_pool(
+            schedule_service.update_schedule,
             schedule_id=schedule_id,
             subject_id=schedule_update.subjectId,
             teacher_id=schedule_update.teacherId,
@@ -179,15 +208,21 @@ async def update_schedule(
             
             notification_type = 'approved' if schedule_update.status == 'approved' else 'rejected'
             
-            notification_service.send_schedule_notification(
+            await run_in_pool(
+                notification_service.send_schedule_notification,
                 schedule_id=schedule.id,
                 notification_type=notification_type
             )
         
         # Returnăm planificarea actualizată
         return schedule
+    except ScheduleConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Conflict de tip {e.conflict_type} cu planificările {e.conflicting_ids}",
+        )
     except SQLAlchemyError as e:
-        db_session.rollback()
+        await run_in_pool(db_session.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Eroare la actualizarea planificării: {str(e)}",
@@ -214,7 +249,8 @@ async def delete_schedule(
     
     # Ștergem planificarea
     try:
-        success = schedule_service.delete_schedule(
+        success = await run_in_pool(
+            schedule_service.delete_schedule,
             schedule_id=schedule_id,
             deleted_by=current_user.id
         )
@@ -231,7 +267,8 @@ async def delete_schedule(
             api_key="your-sendgrid-api-key"  # Va fi înlocuit cu o variabilă de mediu
         )
         
-        notification_service.send_schedule_notification(
+        await run_in_pool(
+            notification_service.send_schedule_notification,
             schedule_id=schedule_id,
             notification_type='deleted'
         )
@@ -239,7 +276,7 @@ async def delete_schedule(
         # Returnăm un răspuns gol
         return None
     except SQLAlchemyError as e:
-        db_session.rollback()
+        await run_in_pool(db_session.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Eroare la ștergerea planificării: {str(e)}",
@@ -266,7 +303,7 @@ async def propose_schedule(
     
     # Obținem cadrul didactic asociat utilizatorului
     try:
-        teacher = db_session.query(Teacher).join(User).filter(User.id == current_user.id).first()
+        teacher = await run_in_pool(db_session.query(Teacher).join(User).filter(User.id == current_user.id).first)
         
         if not teacher:
             raise HTTPException(
@@ -275,7 +312,8 @@ async def propose_schedule(
             )
         
         # Creăm planificarea
-        schedule = schedule_service.create_schedule(
+        schedule = await run_in_pool(
+            schedule_service.create_schedule,
             subject_id=schedule_propose.subjectId,
             teacher_id=teacher.id,
             group_id=schedule_propose.groupId,
@@ -299,20 +337,68 @@ async def propose_schedule(
             api_key="your-sendgrid-api-key"  # Va fi înlocuit cu o variabilă de mediu
         )
         
-        notification_service.send_schedule_notification(
+        await run_in_pool(
+            notification_service.send_schedule_notification,
             schedule_id=schedule.id,
             notification_type='proposed'
         )
         
         # Returnăm planificarea propusă
         return schedule
+    except ScheduleConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Conflict de tip {e.conflict_type} cu planificările {e.conflicting_ids}",
+        )
     except SQLAlchemyError as e:
-        db_session.rollback()
+        await run_in_pool(db_session.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Eroare la propunerea planificării: {str(e)}",
         )
 
+@router.post("/bulk", response_model=List[BulkProposalResult])
+async def propose_schedules(
+    bulk_request: BulkProposalRequest,
+    current_user: User = Depends(get_current_active_user),
+    db_session: Session = Depends(get_db_session)
+):
+    """
+    Endpoint pentru propunerea în bloc a datelor de examen, cu rezultat per propunere
+    """
+    # Verificăm dacă utilizatorul are permisiunea de a încărca propuneri
+    if current_user.role not in ['SEC', 'ADM']:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Nu aveți permisiunea de a încărca propuneri",
+        )
+    
+    if len(bulk_request.items) > MAX_BULK_PROPOSALS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cel mult {MAX_BULK_PROPOSALS} propuneri pot fi trimise într-o cerere",
+        )
+    
+    # Inițializăm serviciul de planificare
+    schedule_service = ScheduleService(db_session=db_session)
+    
+    results = await run_in_pool(schedule_service.propose_schedules, [
+        ProposalItem(item.subjectId, item.groupId, item.teacherId, item.date)
+        for item in bulk_request.items
+    ])
+    
+    if results is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Eroare la propunerea planificărilor",
+        )
+    
+    # Returnăm rezultatul fiecărei propuneri
+    return [
+        BulkProposalResult(index=index, status=result.action, scheduleId=result.schedule_id, error=result.error)
+        for index, result in enumerate(results)
+    ]
+
 @router.get("/conflicts", response_model=List[ConflictResponse])
 async def get_conflicts(
     start_date: Optional[date] = None,
@@ -334,7 +420,8 @@ async def get_conflicts(
     schedule_service = ScheduleService(db_session=db_session)
     
     # Obținem conflictele
-    conflicts = schedule_service.get_conflicts(
+    conflicts = await run_in_pool(
+        schedule_service.get_conflicts,
         start_date=start_date,
         end_date=end_date
     )
@@ -342,6 +429,124 @@ async def get_conflicts(
     # Returnăm lista de conflicte
     return conflicts
 
+@router.post("/solve", response_model=SolverResponse)
+async def solve_exam_period(
+    solver_request: SolverRequest,
+    current_user: User = Depends(get_current_active_user),
+    db_session: Session = Depends(get_db_session)
+):
+    """
+    Endpoint pentru plasarea automată a examenelor aprobate dintr-o perioadă de examinare
+    """
+    # Verificăm dacă utilizatorul are permisiunea de a plasa examene
+    if current_user.role not in ['SEC', 'ADM']:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Nu aveți permisiunea de a plasa examene",
+        )
+    
+    # Inițializăm serviciul de planificare
+    schedule_service = ScheduleService(db_session=db_session)
+    
+    try:
+        result = await run_in_pool(
+            schedule_service.solve_exam_period,
+            exam_period_id=solver_request.examPeriodId,
+            time_budget=min(solver_request.timeBudget, get_settings().SOLVER_MAX_TIME_BUDGET),
+            min_gap_days=solver_request.minGapDays,
+            flexible_dates=solver_request.flexibleDates,
+            apply=solver_request.apply
+        )
+    except ScheduleConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Conflict de tip {e.conflict_type} cu planificările {e.conflicting_ids}",
+        )
+    
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Perioadă de examinare negăsită sau eroare la plasare",
+        )
+    
+    # Returnăm plasările și examenele rămase
+    return SolverResponse(
+        placements=[{
+            "scheduleId": placement.schedule_id,
+            "roomId": placement.room_id,
+            "date": placement.date,
+            "startTime": placement.start_time,
+            "endTime": placement.end_time
+        } for placement in result.placements],
+        unplaced=[{"scheduleId": item.schedule_id, "reason": item.reason} for item in result.unplaced],
+        elapsed=round(result.elapsed, 3),
+        applied=solver_request.apply
+    )
+
+@router.post("/what-if", response_model=List[WhatIfResult])
+async def evaluate_placements(
+    what_if_request: WhatIfRequest,
+    current_user: User = Depends(get_current_active_user),
+    db_session: Session = Depends(get_db_session)
+):
+    """
+    Endpoint pentru evaluarea unor plasări de încercare, fără salvarea lor
+    
+    Fiecare plasare este verificată față de ocuparea existentă din ziua ei și față
+    de celelalte plasări din cerere; plasările pentru aceeași planificare sunt alternative.
+    """
+    # Verificăm dacă utilizatorul are permisiunea de a planifica examene
+    if current_user.role not in ['SEC', 'ADM', 'CD']:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Nu aveți permisiunea de a evalua plasări",
+        )
+    
+    if len(what_if_request.candidates) > MAX_WHAT_IF_CANDIDATES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cel mult {MAX_WHAT_IF_CANDIDATES} plasări pot fi evaluate într-o cerere",
+        )
+    
+    candidates = [
+        PlacementCandidate(
+            schedule_id=item.scheduleId,
+            room_id=item.roomId,
+            date=item.date,
+            start_time=item.startTime,
+            end_time=item.endTime,
+            assistant_ids=tuple(item.assistantIds) if item.assistantIds is not None else None
+        )
+        for item in what_if_request.candidates
+    ]
+    
+    # Inițializăm serviciul de planificare
+    schedule_service = ScheduleService(db_session=db_session)
+    
+    results = await run_in_pool(schedule_service.evaluate_placements, candidates)
+    
+    if results is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Planificare negăsită sau eroare la evaluare",
+        )
+    
+    # Returnăm conflictele fiecărei plasări
+    return [
+        WhatIfResult(
+            index=index,
+            scheduleId=candidate.schedule_id,
+            ok=not conflicts,
+            conflicts=[{
+                "type": conflict.type,
+                "resourceId": conflict.resource_id,
+                "scheduleId": conflict.schedule_id,
+                "candidate": conflict.candidate
+            } for conflict in conflicts]
+        )
+        for index, (candidate, conflicts) in enumerate(zip(candidates, results))
+    ]
+
 @router.get("/available-rooms", response_model=List[AvailableRoomResponse])
 async def get_available_rooms(
     date: date = Query(..., description="Data pentru care se caută săli disponibile"),
@@ -365,7 +570,8 @@ async def get_available_rooms(
     schedule_service = ScheduleService(db_session=db_session)
     
     # Obținem sălile disponibile
-    rooms = schedule_service.get_available_rooms(
+    rooms = await run_in_pool(
+        schedule_service.get_available_rooms,
         date=date,
         start_time=start_time,
         end_time=end_time,
@@ -0,0 +1,79 @@
+from typing import Any, Callable, Dict
+import asyncio
+import functools
+import threading
+
+from common.utils import BoundedExecutor
+from fastapi_app.config import Settings, get_settings
+
+# Pool-urile de fire de execuție ale procesului, create la prima utilizare
+_pools: Dict[str, BoundedExecutor] = {}
+_pools_lock = threading.Lock()
+
+def create_threadpools(settings: Settings) -> Dict[str, BoundedExecutor]:
+    """
+    Creează pool-urile de fire de execuție pe baza configurării aplicației
+
+    Args:
+        settings: Configurarea aplicației
+
+    Returns:
+        Dicționar nume pool -> BoundedExecutor
+    """
+    return {
+        'db': BoundedExecutor('db', settings.THREADPOOL_DB_WORKERS, settings.THREADPOOL_DB_QUEUE),
+        'io': BoundedExecutor('io', settings.THREADPOOL_IO_WORKERS, settings.THREADPOOL_IO_QUEUE)
+    }
+
+def get_threadpool(name: str) -> BoundedExecutor:
+    """
+    Funcție pentru obținerea unui pool de fire de execuție după nume
+    """
+    with _pools_lock:
+        if not _pools:
+            _pools.update(create_threadpools(get_settings()))
+
+        return _pools[name]
+
+async def run_in_pool(func: Callable[..., Any], *args: Any, pool: str = 'db', **kwargs: Any) -> Any:
+    """
+    Execută o funcție blocantă într-un pool de fire de execuție, fără a bloca event loop-ul
+
+    Utilizare:
+    schedules = await run_in_pool(schedule_service.get_conflicts, start_date=start_date)
+    result = await run_in_pool(orar_service.sync_all_data, pool='io')
+
+    Args:
+        func: Funcția sincronă de executat
+        *args: Argumentele poziționale ale funcției
+        pool: Numele pool-ului ("db" sau "io")
+        **kwargs: Argumentele cu nume ale funcției
+
+    Returns:
+        Rezultatul funcției
+
+    Raises:
+        ExecutorSaturatedError: Dacă pool-ul este saturat
+    """
+    future = get_threadpool(pool).submit(functools.partial(func, *args, **kwargs))
+    return await asyncio.wrap_future(future)
+
+def get_threadpool_metrics() -> Dict[str, Any]:
+    """
+    Funcție pentru obținerea metricilor pool-urilor de fire de execuție
+    """
+    with _pools_lock:
+        pools = dict(_pools)
+
+    return {name: executor.snapshot() for name, executor in pools.items()}
+
+def shutdown_threadpools(wait: bool = True):
+    """
+    Funcție pentru oprirea pool-urilor de fire de execuție (la oprirea aplicației)
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for executor in pools:
+        executor.shutdown(wait=wait)
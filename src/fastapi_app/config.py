@@ -11,6 +11,33 @@ class Settings(BaseSettings):
     # Configurare bază de date
     DATABASE_URL: str = os.environ.get("DATABASE_URL", "postgresql://fiesc_admin:secure_password@db:5432/exam_scheduling")
     
+    # Configurare pool de conexiuni (per proces uvicorn)
+    # Conexiuni maxime către PostgreSQL = nr. workeri × (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: int = int(os.environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = os.environ.get("DB_POOL_PRE_PING", "True") == "True"
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 0))  # 0 = fără limită
+    
+    # Configurare pool-uri de fire de execuție pentru apelurile sincrone din endpoint-uri async
+    # "db": interogări SQLAlchemy sincrone; nu are sens să depășească numărul de conexiuni din pool
+    # "io": apeluri HTTP externe (requests), pandas, pdfkit
+    THREADPOOL_DB_WORKERS: int = int(os.environ.get("THREADPOOL_DB_WORKERS", int(os.environ.get("DB_POOL_SIZE", 5)) + int(os.environ.get("DB_MAX_OVERFLOW", 10))))
+    THREADPOOL_DB_QUEUE: int = int(os.environ.get("THREADPOOL_DB_QUEUE", 100))
+    THREADPOOL_IO_WORKERS: int = int(os.environ.get("THREADPOOL_IO_WORKERS", 8))
+    THREADPOOL_IO_QUEUE: int = int(os.environ.get("THREADPOOL_IO_QUEUE", 50))
+    
+    # Timpul maxim (secunde) pe care îl poate cere o plasare automată a examenelor
+    SOLVER_MAX_TIME_BUDGET: float = float(os.environ.get("SOLVER_MAX_TIME_BUDGET", 60))
+    
+    # Conexiunile /api/notifications/stream (Server-Sent Events)
+    # Un comentariu este trimis la fiecare NOTIFICATION_STREAM_HEARTBEAT secunde, pentru
+    # ca proxy-urile să nu închidă conexiunile inactive și deconectările să fie observate
+    NOTIFICATION_STREAM_HEARTBEAT: float = float(os.environ.get("NOTIFICATION_STREAM_HEARTBEAT", 15))
+    # Intervalul (milisecunde) după care browserul se reconectează
+    NOTIFICATION_STREAM_RETRY_MS: int = int(os.environ.get("NOTIFICATION_STREAM_RETRY_MS", 5000))
+    
     # Configurare JWT
     SECRET_KEY: str = os.environ.get("SECRET_KEY", "dev_key_for_development_only")
     ALGORITHM: str = "HS256"
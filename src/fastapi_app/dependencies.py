@@ -1,13 +1,14 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 from typing import Optional
 import os
 
 from common.models import User
 from common.services import AuthService
-from fastapi_app.database import get_db
+from fastapi_app.config import get_settings
+from fastapi_app.database import SessionLocal, get_async_sessionmaker
 
 # Configurăm schema OAuth2 pentru autentificare
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -16,17 +17,39 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 def get_db_session():
     """
     Dependență pentru obținerea sesiunii de bază de date
+
+    Sesiunea este creată per cerere pe engine-ul partajat al procesului.
+    Tranzacția rămasă deschisă este anulată dacă cererea se termină cu o
+    excepție, iar conexiunea revine în pool la final.
     """
-    db = get_db()
+    db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
+# Funcție pentru obținerea sesiunii asincrone de bază de date
+async def get_async_db_session():
+    """
+    Dependență pentru obținerea sesiunii asincrone de bază de date
+
+    Se folosește în endpoint-urile asincrone, pentru ca interogările să nu
+    blocheze event loop-ul.
+    """
+    async with get_async_sessionmaker()() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
 # Funcție pentru obținerea utilizatorului curent
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db_session: Session = Depends(get_db_session)
+    db_session: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Dependență pentru obținerea utilizatorului curent din token-ul JWT
@@ -38,20 +61,22 @@ async def get_current_user(
     )
     
     try:
-        # Inițializăm serviciul de autentificare
+        # Inițializăm serviciul de autentificare (verificarea token-ului nu
+        # folosește baza de date)
         auth_service = AuthService(
-            db_session=db_session,
-            secret_key=os.getenv("JWT_SECRET_KEY", "your-secret-key")
+            db_session=None,
+            secret_key=os.getenv("JWT_SECRET_KEY", get_settings().SECRET_KEY)
         )
         
         # Verificăm token-ul JWT
-        user_id = auth_service.verify_token(token)
+        payload = auth_service.verify_token(token)
+        user_id = payload.get('sub') if payload else None
         
         if user_id is None:
             raise credentials_exception
         
         # Obținem utilizatorul din baza de date
-        user = db_session.query(User).filter(User.id == user_id).first()
+        user = await db_session.get(User, int(user_id))
         
         if user is None:
             raise credentials_exception
@@ -6,6 +6,10 @@ from fastapi.responses import JSONResponse
 import os
 
 from fastapi_app.openapi_tags import tags_metadata
+from common.utils import ExecutorSaturatedError
+from fastapi_app.database import get_pool_metrics
+from fastapi_app.concurrency import get_threadpool_metrics, shutdown_threadpools
+from common.services import notification_broker, unread_count_cache
 
 # Configurare aplicație FastAPI
 app = FastAPI(
@@ -61,6 +65,25 @@ app.include_router(api_router, prefix="/api")
 async def health_check():
     return {"status": "ok", "service": "fastapi"}
 
+# Endpoint pentru metricile pool-ului de conexiuni
+@app.get("/api/metrics/db", tags=["health"], summary="Metrici pool conexiuni", description="Starea pool-ului de conexiuni la baza de date și contoarele de connect/checkout/checkin/așteptare pentru procesul curent")
+async def db_metrics():
+    return get_pool_metrics()
+
+# Endpoint pentru metricile pool-urilor de fire de execuție
+@app.get("/api/metrics/threadpools", tags=["health"], summary="Metrici pool-uri fire de execuție", description="Adâncimea cozii, sarcinile active și latențele (așteptare în coadă, execuție) pentru pool-urile în care rulează apelurile sincrone")
+async def threadpool_metrics():
+    return get_threadpool_metrics()
+
+# Endpoint pentru metricile conexiunilor de notificări
+@app.get("/api/metrics/notifications", tags=["health"], summary="Metrici notificări push", description="Clienții conectați la /api/notifications/stream, evenimentele publicate, trimise și pierdute (coadă plină) și utilizarea cache-ului contoarelor de necitite pentru procesul curent")
+async def notification_metrics():
+    return {**notification_broker.snapshot(), 'unread_count_cache': unread_count_cache.snapshot()}
+
+@app.on_event("shutdown")
+def stop_threadpools():
+    shutdown_threadpools(wait=False)
+
 # Personalizare Swagger UI
 @app.get("/api/custom-docs", include_in_schema=False)
 async def custom_swagger_ui_html():
@@ -129,6 +152,15 @@ async def http_exception_handler(request, exc):
         content={"error": exc.detail},
     )
 
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request, exc):
+    # Cererea este respinsă imediat în loc să aștepte într-o coadă nelimitată
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"error": "Serviciul este supraîncărcat, încercați din nou"},
+        headers={"Retry-After": "1"},
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
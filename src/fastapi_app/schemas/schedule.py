@@ -122,11 +122,96 @@ class ScheduleResponse(BaseModel):
     class Config:
         orm_mode = True
 
+class PaginatedScheduleResponse(BaseModel):
+    """Schema pentru răspunsul paginat cu planificări (paginare cu cursor)"""
+    schedules: List[ScheduleResponse]
+    next_cursor: Optional[str] = None
+
 class ConflictResponse(BaseModel):
     """Schema pentru răspunsul cu informații despre conflicte"""
     type: str
+    resource_id: Optional[int] = None
     schedules: List[ScheduleResponse]
 
 class AvailableRoomResponse(RoomResponse):
     """Schema pentru răspunsul cu informații despre sălile disponibile"""
     pass
+
+class SolverRequest(BaseModel):
+    """Schema pentru cererea de plasare automată a examenelor dintr-o perioadă"""
+    examPeriodId: int = Field(..., gt=0)
+    apply: bool = False
+    timeBudget: float = Field(10, gt=0)
+    minGapDays: int = Field(1, ge=0)
+    flexibleDates: bool = False
+
+class PlacementResponse(BaseModel):
+    """Schema pentru sala și intervalul orar alese pentru un examen"""
+    scheduleId: int
+    roomId: int
+    date: date
+    startTime: time
+    endTime: time
+
+class UnplacedExamResponse(BaseModel):
+    """Schema pentru un examen care nu a putut fi plasat"""
+    scheduleId: int
+    reason: str
+
+class SolverResponse(BaseModel):
+    """Schema pentru rezultatul plasării automate"""
+    placements: List[PlacementResponse]
+    unplaced: List[UnplacedExamResponse]
+    elapsed: float
+    applied: bool
+
+class WhatIfCandidate(BaseModel):
+    """Schema pentru o plasare de încercare (assistantIds lipsă păstrează asistenții actuali)"""
+    scheduleId: int = Field(..., gt=0)
+    roomId: Optional[int] = Field(None, gt=0)
+    date: date
+    startTime: time
+    endTime: time
+    assistantIds: Optional[List[int]] = None
+
+    @validator('endTime')
+    def end_time_must_be_after_start_time(cls, v, values):
+        if 'startTime' in values and v <= values['startTime']:
+            raise ValueError('Timpul de sfârșit trebuie să fie după timpul de început')
+        return v
+
+class WhatIfRequest(BaseModel):
+    """Schema pentru cererea de evaluare a unor plasări de încercare (cel mult MAX_WHAT_IF_CANDIDATES)"""
+    candidates: List[WhatIfCandidate] = Field(..., min_items=1)
+
+class CandidateConflictResponse(BaseModel):
+    """Schema pentru suprapunerea unei plasări cu o planificare existentă sau cu altă plasare"""
+    type: str
+    resourceId: int
+    scheduleId: int
+    candidate: Optional[int] = None
+
+class WhatIfResult(BaseModel):
+    """Schema pentru rezultatul evaluării unei plasări"""
+    index: int
+    scheduleId: int
+    ok: bool
+    conflicts: List[CandidateConflictResponse]
+
+class BulkProposalItem(BaseModel):
+    """Schema pentru o propunere din încărcarea în bloc"""
+    subjectId: int = Field(..., gt=0)
+    groupId: int = Field(..., gt=0)
+    teacherId: int = Field(..., gt=0)
+    date: date
+
+class BulkProposalRequest(BaseModel):
+    """Schema pentru cererea de propunere în bloc (cel mult MAX_BULK_PROPOSALS)"""
+    items: List[BulkProposalItem] = Field(..., min_items=1)
+
+class BulkProposalResult(BaseModel):
+    """Schema pentru rezultatul unei propuneri: created, updated sau error"""
+    index: int
+    status: str
+    scheduleId: Optional[int] = None
+    error: Optional[str] = None
@@ -54,9 +54,14 @@ def swagger_spec():
         return jsonify(json.load(f))
 
 # Inițializare bază de date
-from src.flask_app.utils.db import init_db
+from src.flask_app.utils.db import init_db, get_pool_status
 init_db(app)
 
+from src.common.services.pdf_renderer import get_pdf_render_metrics
+from src.common.services.export_cache import export_cache
+from src.common.services.export_jobs import get_export_job_metrics
+from src.common.services.calendar_feed import calendar_feed_cache
+
 # Înregistrare rute
 from src.flask_app.routes import register_routes
 register_routes(app)
@@ -64,7 +69,16 @@ register_routes(app)
 # Endpoint pentru verificarea sănătății
 @app.route('/api/health')
 def health_check():
-    return jsonify({"status": "ok"})
+    return jsonify({
+        "status": "ok",
+        "database": {
+            "pool": get_pool_status(app)
+        },
+        "pdf_renderer": get_pdf_render_metrics(),
+        "export_cache": export_cache.snapshot(),
+        "export_jobs": get_export_job_metrics(),
+        "calendar_feeds": calendar_feed_cache.snapshot()
+    })
 
 # Pagină de eroare 404
 @app.errorhandler(404)
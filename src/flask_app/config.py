@@ -9,6 +9,14 @@ class Config:
     # Configurare bază de date
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'postgresql://fiesc_admin:secure_password@db:5432/exam_scheduling')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    DATABASE_URL = SQLALCHEMY_DATABASE_URI
+    
+    # Configurare pool de conexiuni (un singur engine per proces)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'True') == 'True'
     
     # Configurare JWT
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', SECRET_KEY)
@@ -33,6 +41,9 @@ class Config:
     DEFAULT_EXAM_END_DATE = '2025-01-30'
     DEFAULT_COLLOQUIUM_START_DATE = '2025-01-05'
     DEFAULT_COLLOQUIUM_END_DATE = '2025-01-14'
+    
+    # Timpul maxim (secunde) pe care îl poate cere o plasare automată a examenelor
+    SOLVER_MAX_TIME_BUDGET = float(os.environ.get('SOLVER_MAX_TIME_BUDGET', 60))
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -51,6 +62,7 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    DATABASE_URL = SQLALCHEMY_DATABASE_URI
     
 # Configurare în funcție de mediu
 config_by_name = {
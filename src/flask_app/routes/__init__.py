@@ -4,6 +4,7 @@ from .export import export_bp
 from .upload import upload_bp
 from .schedule import schedule_bp
 from .notification import notification_bp
+from .calendar import calendar_bp
 
 # Creăm blueprint-ul principal pentru API
 api_bp = Blueprint('api', __name__, url_prefix='/api')
@@ -14,6 +15,7 @@ api_bp.register_blueprint(export_bp, url_prefix='/export')
 api_bp.register_blueprint(upload_bp, url_prefix='/upload')
 api_bp.register_blueprint(schedule_bp, url_prefix='/schedules')
 api_bp.register_blueprint(notification_bp, url_prefix='/notifications')
+api_bp.register_blueprint(calendar_bp, url_prefix='/calendar')
 
 # Funcție pentru înregistrarea tuturor rutelor în aplicația Flask
 def register_routes(app):
@@ -27,5 +29,6 @@ __all__ = [
     'upload_bp',
     'schedule_bp',
     'notification_bp',
+    'calendar_bp',
     'register_routes'
 ]
@@ -0,0 +1,83 @@
+from flask import Blueprint, Response, request, jsonify, current_app, url_for
+from flask_jwt_extended import jwt_required
+from werkzeug.http import is_resource_modified
+
+from src.common.models import Group, Teacher
+from src.common.services import CalendarFeedService
+from src.common.services.calendar_feed import feed_etag, feed_token, verify_feed_token
+from src.flask_app.utils.db import get_db_session
+
+# Creăm blueprint-ul pentru feed-urile iCalendar
+calendar_bp = Blueprint('calendar', __name__)
+
+# Segmentul din URL al fiecărui tip de feed
+FEED_PATHS = {
+    'groups': ('group', Group),
+    'teachers': ('teacher', Teacher)
+}
+
+@calendar_bp.route('/<any(groups, teachers):feed_path>/<int:entity_id>/subscription', methods=['GET'])
+@jwt_required()
+def get_calendar_subscription(feed_path, entity_id):
+    """
+    Endpoint pentru obținerea adresei de abonare la feed-ul iCalendar al unei
+    grupe sau al unui cadru didactic
+
+    Response:
+    {
+        "url": "https://.../api/calendar/groups/1.ics?token=..."
+    }
+    """
+    kind, model = FEED_PATHS[feed_path]
+
+    if get_db_session().get(model, entity_id) is None:
+        return jsonify({"error": "Grupa sau cadrul didactic nu a fost găsit"}), 404
+
+    token = feed_token(current_app.config['SECRET_KEY'], kind, entity_id)
+    url = url_for('.get_calendar_feed', feed_path=feed_path, entity_id=entity_id, token=token, _external=True)
+    return jsonify({"url": url})
+
+@calendar_bp.route('/<any(groups, teachers):feed_path>/<int:entity_id>.ics', methods=['GET'])
+def get_calendar_feed(feed_path, entity_id):
+    """
+    Endpoint pentru feed-ul iCalendar al unei grupe sau al unui cadru didactic
+
+    Query parameters:
+    - token: Token-ul din adresa obținută de la endpoint-ul subscription
+
+    Response:
+    Documentul text/calendar cu examenele nerespinse (cele aprobate ca CONFIRMED,
+    cele propuse ca TENTATIVE), cu ETag și Last-Modified; o cerere cu
+    If-None-Match sau If-Modified-Since valid primește 304 după o singură
+    interogare a versiunii feed-ului
+    """
+    kind, _ = FEED_PATHS[feed_path]
+
+    if not verify_feed_token(current_app.config['SECRET_KEY'], kind, entity_id, request.args.get('token')):
+        return jsonify({"error": "Token invalid"}), 403
+
+    service = CalendarFeedService(db_session=get_db_session())
+    state = service.get_feed_state(kind, entity_id)
+    if state is None:
+        return jsonify({"error": "Eroare la generarea calendarului"}), 500
+
+    etag = feed_etag(kind, entity_id, state.version)
+
+    if not is_resource_modified(request.environ, etag=etag, last_modified=state.changed_at):
+        response = Response(status=304)
+    else:
+        body = service.get_feed(kind, entity_id, state)
+        if body is None:
+            return jsonify({"error": "Calendarul nu a fost găsit"}), 404
+
+        response = Response(body, mimetype='text/calendar')
+        response.headers['Content-Disposition'] = f'inline; filename="{kind}-{entity_id}.ics"'
+
+    # Clientul poate păstra calendarul, dar trebuie să-l revalideze
+    response.set_etag(etag)
+    if state.changed_at:
+        response.last_modified = state.changed_at
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+
+    return response
@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, send_file, current_app
+from flask import Blueprint, Response, request, jsonify, send_file, current_app, url_for
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -6,13 +6,88 @@ import io
 from datetime import datetime
 
 from src.common.models import User
-from src.common.services import ExportService
+from src.common.services import ExportService, PdfRenderTimeoutError
+from src.common.services.export_jobs import ExportJobService, JOB_SUCCEEDED
+from src.common.utils import ExecutorSaturatedError
 from src.flask_app.utils.db import get_db_session
 from src.flask_app.utils.decorators import role_required
 
 # Creăm blueprint-ul pentru export
 export_bp = Blueprint('export', __name__)
 
+# Rolurile care pot cere fiecare format (ca la endpoint-urile sincrone)
+EXPORT_ROLES = {
+    'xlsx': ('SEC', 'ADM'),
+    'pdf': ('SEC', 'ADM', 'CD', 'SG')
+}
+
+# Tipurile MIME ale formatelor exportate
+EXPORT_MIMETYPES = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'pdf': 'application/pdf'
+}
+
+def _export_filters():
+    """
+    Citește filtrele exportului din query string
+    """
+    start_date_str = request.args.get('start_date')
+    end_date_str = request.args.get('end_date')
+    
+    return {
+        'group_id': request.args.get('group_id', type=int),
+        'teacher_id': request.args.get('teacher_id', type=int),
+        'start_date': datetime.strptime(start_date_str, '%Y-%m-%d').date() if start_date_str else None,
+        'end_date': datetime.strptime(end_date_str, '%Y-%m-%d').date() if end_date_str else None
+    }
+
+def _send_export(export_format: str, error_message: str):
+    """
+    Trimite un export din cache-ul de exporturi, generându-l dacă lipsește
+    
+    ETag-ul este cheia exportului (format, filtre, versiunea datelor); o cerere
+    cu If-None-Match egal primește 304 fără ca exportul să fie citit sau generat.
+    """
+    filters = _export_filters()
+    
+    # Inițializăm serviciul de export
+    db_session = get_db_session()
+    export_service = ExportService(db_session=db_session)
+    
+    key = export_service.export_key(export_format, **filters)
+    if key is None:
+        return jsonify({"error": error_message}), 500
+    
+    if request.if_none_match.contains_weak(key):
+        response = Response(status=304)
+    else:
+        export_file = export_service.cached_export(export_format, key, **filters)
+        if export_file is None:
+            return jsonify({"error": error_message}), 500
+        
+        # Generăm numele fișierului
+        filename = f"planificare_examene_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        
+        response = send_file(
+            export_file,
+            mimetype=EXPORT_MIMETYPES[export_format],
+            as_attachment=True,
+            download_name=filename,
+            etag=False
+        )
+    
+    # Clientul poate păstra fișierul, dar trebuie să-l revalideze cu ETag-ul
+    response.set_etag(key)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    
+    # Momentul ultimei actualizări a datelor exportate
+    refreshed_at = export_service.get_data_refreshed_at()
+    if refreshed_at:
+        response.headers['X-Data-Refreshed-At'] = refreshed_at.isoformat()
+    
+    return response
+
 @export_bp.route('/excel', methods=['GET'])
 @jwt_required()
 @role_required('SEC', 'ADM')
@@ -27,47 +102,11 @@ def export_excel():
     - end_date: Data de sfârșit pentru filtrare (opțional, format: YYYY-MM-DD)
     
     Response:
-    Fișier Excel cu planificarea examenelor
+    Fișier Excel cu planificarea examenelor, servit din cache-ul de exporturi, cu
+    ETag (304 la If-None-Match egal); antetul X-Data-Refreshed-At conține momentul
+    ultimei actualizări a modelului de citire al planificărilor
     """
-    # Obținem parametrii din query string
-    group_id = request.args.get('group_id', type=int)
-    teacher_id = request.args.get('teacher_id', type=int)
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
-    
-    # Convertim datele din string în obiecte date
-    start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date() if start_date_str else None
-    end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date() if end_date_str else None
-    
-    # Inițializăm serviciul de export
-    db_session = get_db_session()
-    export_service = ExportService(db_session=db_session)
-    
-    # Generăm fișierul Excel
-    excel_data = export_service.export_to_excel(
-        group_id=group_id,
-        teacher_id=teacher_id,
-        start_date=start_date,
-        end_date=end_date
-    )
-    
-    if not excel_data:
-        return jsonify({"error": "Eroare la generarea fișierului Excel"}), 500
-    
-    # Creăm un fișier în memorie
-    excel_file = io.BytesIO(excel_data)
-    excel_file.seek(0)
-    
-    # Generăm numele fișierului
-    filename = f"planificare_examene_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    
-    # Returnăm fișierul Excel
-    return send_file(
-        excel_file,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        as_attachment=True,
-        download_name=filename
-    )
+    return _send_export('xlsx', "Eroare la generarea fișierului Excel")
 
 @export_bp.route('/pdf', methods=['GET'])
 @jwt_required()
@@ -83,44 +122,161 @@ def export_pdf():
     - end_date: Data de sfârșit pentru filtrare (opțional, format: YYYY-MM-DD)
     
     Response:
-    Fișier PDF cu planificarea examenelor
+    Fișier PDF cu planificarea examenelor, servit din cache-ul de exporturi, cu
+    ETag (304 la If-None-Match egal); antetul X-Data-Refreshed-At conține momentul
+    ultimei actualizări a modelului de citire al planificărilor.
+    Când pool-ul de renderere PDF este saturat sau randarea depășește timpul
+    permis, răspunsul este 503 cu antetul Retry-After.
     """
-    # Obținem parametrii din query string
-    group_id = request.args.get('group_id', type=int)
-    teacher_id = request.args.get('teacher_id', type=int)
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
+    try:
+        return _send_export('pdf', "Eroare la generarea fișierului PDF")
+    except (ExecutorSaturatedError, PdfRenderTimeoutError):
+        response = jsonify({"error": "Serviciul de generare PDF este ocupat, încercați din nou"})
+        response.headers['Retry-After'] = '5'
+        return response, 503
+
+def _export_job_service():
+    """
+    Creează serviciul de sarcini de export pentru cererea curentă
+    """
+    return ExportJobService(
+        db_session=get_db_session(),
+        session_factory=current_app.extensions['db_session_factory']
+    )
+
+def _job_response(job):
+    """
+    Convertește o sarcină de export în răspunsul API, cu URL-urile ei
+    """
+    data = job.to_dict()
+    data['status_url'] = url_for('.export_job_status', job_id=job.id)
+    data['download_url'] = url_for('.export_job_download', job_id=job.id) if job.status == JOB_SUCCEEDED else None
+    return data
+
+@export_bp.route('/jobs', methods=['POST'])
+@jwt_required()
+@role_required('SEC', 'ADM', 'CD', 'SG')
+def create_export_job():
+    """
+    Endpoint pentru crearea unei sarcini de export asincron
     
-    # Convertim datele din string în obiecte date
-    start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date() if start_date_str else None
-    end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date() if end_date_str else None
+    Exportul este generat în fundal; starea se urmărește la status_url, iar
+    fișierul se descarcă de la download_url după terminare. O cerere identică
+    (format, filtre, aceleași date) cât timp sarcina anterioară este în curs sau
+    fișierul ei nu a expirat primește aceeași sarcină.
     
-    # Inițializăm serviciul de export
-    db_session = get_db_session()
-    export_service = ExportService(db_session=db_session)
+    Request:
+    {
+        "format": "pdf",
+        "groupId": 1,
+        "teacherId": null,
+        "startDate": "2025-06-01",
+        "endDate": "2025-06-30"
+    }
     
-    # Generăm fișierul PDF
-    pdf_data = export_service.export_to_pdf(
-        group_id=group_id,
-        teacher_id=teacher_id,
-        start_date=start_date,
-        end_date=end_date
-    )
+    Response (202 pentru o sarcină în curs, 200 pentru una deja terminată):
+    {
+        "id": "3f2c...",
+        "format": "pdf",
+        "status": "queued",
+        "status_url": "/api/export/jobs/3f2c...",
+        "download_url": null,
+        ...
+    }
+    """
+    # Obținem datele din request
+    data = request.get_json() or {}
+    export_format = data.get('format')
+    
+    if export_format not in EXPORT_ROLES:
+        return jsonify({"error": "Câmpul 'format' trebuie să fie 'xlsx' sau 'pdf'"}), 400
+    
+    # Verificăm rolul pentru formatul cerut
+    user_id = get_jwt_identity()
+    user = get_db_session().query(User).filter(User.id == user_id).first()
+    if user.role not in EXPORT_ROLES[export_format]:
+        return jsonify({"error": "Acces interzis"}), 403
+    
+    try:
+        start_date = datetime.strptime(data['startDate'], '%Y-%m-%d').date() if data.get('startDate') else None
+        end_date = datetime.strptime(data['endDate'], '%Y-%m-%d').date() if data.get('endDate') else None
+    except (TypeError, ValueError):
+        return jsonify({"error": "Datele trebuie să fie în formatul YYYY-MM-DD"}), 400
+    
+    try:
+        result = _export_job_service().submit(
+            export_format,
+            group_id=data.get('groupId'),
+            teacher_id=data.get('teacherId'),
+            start_date=start_date,
+            end_date=end_date,
+            requested_by=user.id
+        )
+    except ExecutorSaturatedError:
+        response = jsonify({"error": "Prea multe exporturi în curs, încercați din nou"})
+        response.headers['Retry-After'] = '30'
+        return response, 503
+    
+    if result is None:
+        return jsonify({"error": "Eroare la crearea sarcinii de export"}), 500
+    
+    job, _ = result
+    response = jsonify(_job_response(job))
+    response.status_code = 200 if job.status == JOB_SUCCEEDED else 202
+    response.headers['Location'] = url_for('.export_job_status', job_id=job.id)
+    return response
+
+@export_bp.route('/jobs/<job_id>', methods=['GET'])
+@jwt_required()
+@role_required('SEC', 'ADM', 'CD', 'SG')
+def export_job_status(job_id):
+    """
+    Endpoint pentru starea unei sarcini de export
+    
+    Response:
+    Sarcina (status: queued, running, succeeded sau failed); download_url este
+    setat după terminarea cu succes. Sarcinile expirate nu mai există (404).
+    """
+    job = _export_job_service().get_job(job_id)
+    
+    if not job:
+        return jsonify({"error": "Sarcina de export nu a fost găsită"}), 404
+    
+    return jsonify(_job_response(job))
+
+@export_bp.route('/jobs/<job_id>/download', methods=['GET'])
+@jwt_required()
+@role_required('SEC', 'ADM', 'CD', 'SG')
+def export_job_download(job_id):
+    """
+    Endpoint pentru descărcarea fișierului generat de o sarcină de export
+    
+    Response:
+    Fișierul exportat; 409 dacă sarcina nu s-a terminat cu succes, 410 dacă
+    fișierul a expirat
+    """
+    service = _export_job_service()
+    job = service.get_job(job_id)
+    
+    if not job:
+        return jsonify({"error": "Sarcina de export nu a fost găsită"}), 404
     
-    if not pdf_data:
-        return jsonify({"error": "Eroare la generarea fișierului PDF"}), 500
+    if job.status != JOB_SUCCEEDED:
+        return jsonify({"error": "Exportul nu este gata", "status": job.status}), 409
     
-    # Creăm un fișier în memorie
-    pdf_file = io.BytesIO(pdf_data)
-    pdf_file.seek(0)
+    export_file = service.open_artifact(job)
+    if export_file is None:
+        return jsonify({"error": "Fișierul exportat a expirat"}), 410
     
-    # Generăm numele fișierului
-    filename = f"planificare_examene_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    filename = f"planificare_examene_{job.created_at.strftime('%Y%m%d_%H%M%S')}.{job.format}"
     
-    # Returnăm fișierul PDF
-    return send_file(
-        pdf_file,
-        mimetype='application/pdf',
+    response = send_file(
+        export_file,
+        mimetype=EXPORT_MIMETYPES[job.format],
         as_attachment=True,
-        download_name=filename
+        download_name=filename,
+        etag=False
     )
+    response.set_etag(job.cache_key)
+    response.cache_control.private = True
+    return response
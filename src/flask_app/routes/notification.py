@@ -71,6 +71,24 @@ def get_notifications():
         "pagination": pagination
     })
 
+@notification_bp.route('/unread-count', methods=['GET'])
+@jwt_required()
+def get_unread_count():
+    """
+    Endpoint pentru numărul de notificări necitite ale utilizatorului curent (badge)
+    
+    Valoarea este citită din cache sau din contorul utilizatorului, fără
+    interogarea tabelei de notificări.
+    
+    Response:
+    {
+        "unread": 3
+    }
+    """
+    notification_service = NotificationService(db_session=get_db_session())
+    
+    return jsonify({"unread": notification_service.get_unread_count(int(get_jwt_identity()))})
+
 @notification_bp.route('/<int:notification_id>/read', methods=['POST'])
 @jwt_required()
 def mark_notification_as_read(notification_id):
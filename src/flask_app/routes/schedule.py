@@ -5,13 +5,24 @@ from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
 
 from src.common.models import User, Schedule, Room, Group, Subject, Teacher
-from src.common.services import ScheduleService, NotificationService
+from src.common.services import ScheduleService, NotificationService, ScheduleConflictError, PlacementCandidate, ProposalItem
+from src.common.services.schedule_service import MAX_BULK_PROPOSALS
+from src.common.services.conflict_detection import MAX_WHAT_IF_CANDIDATES
+from src.common.utils import InvalidCursorError
 from src.flask_app.utils.db import get_db_session
 from src.flask_app.utils.decorators import role_required
 
 # Creăm blueprint-ul pentru planificări
 schedule_bp = Blueprint('schedule', __name__)
 
+def conflict_response(error: ScheduleConflictError):
+    """Răspunsul 409 pentru o planificare care s-ar suprapune cu altele"""
+    return jsonify({
+        "error": "Sala sau cadrul didactic sunt deja ocupate în intervalul ales",
+        "conflictType": error.conflict_type,
+        "conflictingIds": error.conflicting_ids
+    }), 409
+
 @schedule_bp.route('', methods=['GET'])
 @jwt_required()
 def get_schedules():
@@ -24,42 +35,41 @@ def get_schedules():
     - start_date: Data de început pentru filtrare (opțional, format: YYYY-MM-DD)
     - end_date: Data de sfârșit pentru filtrare (opțional, format: YYYY-MM-DD)
     - status: Statusul planificării (opțional, valori: 'proposed', 'approved', 'rejected')
+    - cursor: Cursorul returnat în next_cursor de pagina anterioară (opțional)
+    - limit: Numărul de planificări per pagină (opțional, implicit 100, maxim 500)
+    
+    Planificările sunt ordonate după (date, start_time, id). Pentru pagina următoare
+    se trimite next_cursor ca parametru cursor; next_cursor este null pe ultima pagină.
+    
+    Planificările sunt citite din modelul de citire (schedule_listings), fără JOIN-uri;
+    refreshed_at este momentul ultimei actualizări a acestuia.
     
     Response:
-    [
-        {
-            "id": 1,
-            "subject": {
-                "id": 1,
-                "name": "Programare Web",
-                "acronym": "PW"
-            },
-            "teacher": {
-                "id": 1,
-                "firstName": "Nume",
-                "lastName": "Prenume",
-                "email": "email@usv.ro"
-            },
-            "group": {
-                "id": 1,
-                "name": "3A4",
-                "year": 3,
-                "specialization": "Calculatoare"
-            },
-            "room": {
+    {
+        "schedules": [
+            {
                 "id": 1,
-                "name": "C201",
-                "capacity": 30,
-                "building": "C"
-            },
-            "date": "2023-06-15",
-            "startTime": "10:00",
-            "endTime": "12:00",
-            "status": "approved",
-            "createdAt": "2023-05-01T12:00:00Z",
-            "updatedAt": "2023-05-02T14:30:00Z"
-        }
-    ]
+                "subject_id": 1,
+                "subject_name": "Programare Web",
+                "teacher_id": 1,
+                "teacher_name": "Prof. Nume Prenume",
+                "group_id": 1,
+                "group_name": "3A4",
+                "room_id": 1,
+                "room_name": "C201",
+                "exam_period_id": null,
+                "assistants": [{"id": 2, "name": "Asist. Nume Prenume"}],
+                "date": "2023-06-15",
+                "start_time": "10:00:00",
+                "end_time": "12:00:00",
+                "status": "approved",
+                "created_at": "2023-05-01T12:00:00",
+                "updated_at": "2023-05-02T14:30:00"
+            }
+        ],
+        "next_cursor": "WyIyMDIzLTA2LTE1IiwiMTA6MDA6MDAiLDFd",
+        "refreshed_at": "2023-05-02T14:30:00"
+    }
     """
     # Obținem parametrii din query string
     group_id = request.args.get('group_id', type=int)
@@ -67,6 +77,8 @@ def get_schedules():
     start_date_str = request.args.get('start_date')
     end_date_str = request.args.get('end_date')
     status = request.args.get('status')
+    cursor = request.args.get('cursor')
+    limit = request.args.get('limit', type=int)
     
     # Convertim datele din string în obiecte date
     start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date() if start_date_str else None
@@ -76,17 +88,28 @@ def get_schedules():
     db_session = get_db_session()
     schedule_service = ScheduleService(db_session=db_session)
     
-    # Obținem planificările
-    schedules = schedule_service.get_schedules(
-        group_id=group_id,
-        teacher_id=teacher_id,
-        start_date=start_date,
-        end_date=end_date,
-        status=status
-    )
+    # Obținem pagina de planificări din modelul de citire
+    try:
+        schedules, next_cursor = schedule_service.get_listings_page(
+            group_id=group_id,
+            teacher_id=teacher_id,
+            start_date=start_date,
+            end_date=end_date,
+            status=status,
+            cursor=cursor,
+            limit=limit
+        )
+    except InvalidCursorError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    refreshed_at = schedule_service.get_listings_refreshed_at()
     
-    # Returnăm lista de planificări
-    return jsonify([schedule.to_dict() for schedule in schedules])
+    # Returnăm pagina de planificări
+    return jsonify({
+        "schedules": schedules,
+        "next_cursor": next_cursor,
+        "refreshed_at": refreshed_at.isoformat() if refreshed_at else None
+    })
 
 @schedule_bp.route('/<int:schedule_id>', methods=['GET'])
 @jwt_required()
@@ -221,16 +244,19 @@ def create_schedule():
     user_id = get_jwt_identity()
     
     # Creăm planificarea
-    schedule = schedule_service.create_schedule(
-        subject_id=data['subjectId'],
-        teacher_id=data['teacherId'],
-        group_id=data['groupId'],
-        room_id=data['roomId'],
-        date=date,
-        start_time=start_time,
-        end_time=end_time,
-        created_by=user_id
-    )
+    try:
+        schedule = schedule_service.create_schedule(
+            subject_id=data['subjectId'],
+            teacher_id=data['teacherId'],
+            group_id=data['groupId'],
+            room_id=data['roomId'],
+            date=date,
+            start_time=start_time,
+            end_time=end_time,
+            created_by=user_id
+        )
+    except ScheduleConflictError as e:
+        return conflict_response(e)
     
     if not schedule:
         return jsonify({"error": "Eroare la crearea planificării"}), 500
@@ -339,18 +365,21 @@ def update_schedule(schedule_id):
     user_id = get_jwt_identity()
     
     # Actualizăm planificarea
-    schedule = schedule_service.update_schedule(
-        schedule_id=schedule_id,
-        subject_id=data.get('subjectId'),
-        teacher_id=data.get('teacherId'),
-        group_id=data.get('groupId'),
-        room_id=data.get('roomId'),
-        date=date,
-        start_time=start_time,
-        end_time=end_time,
-        status=data.get('status'),
-        updated_by=user_id
-    )
+    try:
+        schedule = schedule_service.update_schedule(
+            schedule_id=schedule_id,
+            subject_id=data.get('subjectId'),
+            teacher_id=data.get('teacherId'),
+            group_id=data.get('groupId'),
+            room_id=data.get('roomId'),
+            date=date,
+            start_time=start_time,
+            end_time=end_time,
+            status=data.get('status'),
+            updated_by=user_id
+        )
+    except ScheduleConflictError as e:
+        return conflict_response(e)
     
     if not schedule:
         return jsonify({"error": "Planificare negăsită sau eroare la actualizare"}), 404
@@ -530,10 +559,97 @@ def propose_schedule():
         
         # Returnăm planificarea propusă
         return jsonify(schedule.to_dict()), 201
+    except ScheduleConflictError as e:
+        return conflict_response(e)
     except SQLAlchemyError as e:
         db_session.rollback()
         return jsonify({"error": f"Eroare la propunerea planificării: {str(e)}"}), 500
 
+@schedule_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+@role_required('SEC', 'ADM')
+def propose_schedules():
+    """
+    Endpoint pentru propunerea în bloc a datelor de examen
+    
+    Pentru fiecare pereche (disciplină, grupă), planificarea existentă primește
+    data nouă și statusul 'proposed', altfel este creată o planificare nouă.
+    Propunerile valide sunt salvate într-o singură tranzacție; cele invalide sunt
+    raportate individual.
+    
+    Request:
+    {
+        "items": [
+            {
+                "subjectId": 1,
+                "groupId": 1,
+                "teacherId": 1,
+                "date": "2023-06-15"
+            }
+        ]
+    }
+    
+    Response (câte un element pentru fiecare propunere, în ordinea primită):
+    [
+        {
+            "index": 0,
+            "status": "created",
+            "scheduleId": 10,
+            "error": null
+        },
+        {
+            "index": 1,
+            "status": "error",
+            "scheduleId": null,
+            "error": "group_not_found"
+        }
+    ]
+    """
+    # Obținem datele din request
+    data = request.get_json()
+    
+    if not data or not isinstance(data.get('items'), list) or not data['items']:
+        return jsonify({"error": "Câmpul 'items' lipsește sau este gol"}), 400
+    
+    if len(data['items']) > MAX_BULK_PROPOSALS:
+        return jsonify({"error": f"Cel mult {MAX_BULK_PROPOSALS} propuneri pot fi trimise într-o cerere"}), 400
+    
+    # Propunerile cu format invalid sunt raportate fără a ajunge la serviciu
+    response = [None] * len(data['items'])
+    items, positions = [], []
+    
+    for index, item in enumerate(data['items']):
+        try:
+            items.append(ProposalItem(
+                subject_id=int(item['subjectId']),
+                group_id=int(item['groupId']),
+                teacher_id=int(item['teacherId']),
+                date=datetime.strptime(item['date'], '%Y-%m-%d').date()
+            ))
+            positions.append(index)
+        except (KeyError, TypeError, ValueError):
+            response[index] = {"index": index, "status": "error", "scheduleId": None, "error": "invalid"}
+    
+    # Inițializăm serviciul de planificare
+    db_session = get_db_session()
+    schedule_service = ScheduleService(db_session=db_session)
+    
+    results = schedule_service.propose_schedules(items)
+    
+    if results is None:
+        return jsonify({"error": "Eroare la propunerea planificărilor"}), 500
+    
+    for index, result in zip(positions, results):
+        response[index] = {
+            "index": index,
+            "status": result.action,
+            "scheduleId": result.schedule_id,
+            "error": result.error
+        }
+    
+    # Returnăm rezultatul fiecărei propuneri
+    return jsonify(response)
+
 @schedule_bp.route('/conflicts', methods=['GET'])
 @jwt_required()
 @role_required('SEC', 'ADM', 'CD')
@@ -545,10 +661,13 @@ def get_conflicts():
     - start_date: Data de început pentru filtrare (opțional, format: YYYY-MM-DD)
     - end_date: Data de sfârșit pentru filtrare (opțional, format: YYYY-MM-DD)
     
-    Response:
+    Response (câte un element pentru fiecare pereche de planificări suprapuse pe
+    aceeași sală, același cadru didactic - titular sau asistent - sau aceeași grupă):
     [
         {
             "type": "room",
+            "resource_id": 1,
+            "date": "2023-06-15",
             "schedules": [
                 {
                     "id": 1,
@@ -635,6 +754,181 @@ def get_conflicts():
     # Returnăm lista de conflicte
     return jsonify(conflicts)
 
+@schedule_bp.route('/solve', methods=['POST'])
+@jwt_required()
+@role_required('SEC', 'ADM')
+def solve_exam_period():
+    """
+    Endpoint pentru plasarea automată a examenelor aprobate dintr-o perioadă de examinare
+    
+    Request:
+    {
+        "examPeriodId": 1,
+        "apply": false,
+        "timeBudget": 10,
+        "minGapDays": 1,
+        "flexibleDates": false
+    }
+    
+    Response:
+    {
+        "placements": [
+            {
+                "scheduleId": 1,
+                "roomId": 3,
+                "date": "2023-06-15",
+                "startTime": "10:00",
+                "endTime": "12:00"
+            }
+        ],
+        "unplaced": [
+            {
+                "scheduleId": 2,
+                "reason": "no_slot"
+            }
+        ],
+        "elapsed": 0.42,
+        "applied": false
+    }
+    """
+    # Obținem datele din request
+    data = request.get_json()
+    
+    if not data or 'examPeriodId' not in data:
+        return jsonify({"error": "Câmpul 'examPeriodId' lipsește"}), 400
+    
+    # Inițializăm serviciul de planificare
+    db_session = get_db_session()
+    schedule_service = ScheduleService(db_session=db_session)
+    
+    apply = bool(data.get('apply', False))
+    
+    try:
+        result = schedule_service.solve_exam_period(
+            exam_period_id=data['examPeriodId'],
+            time_budget=min(float(data.get('timeBudget', 10)), current_app.config.get('SOLVER_MAX_TIME_BUDGET', 60)),
+            min_gap_days=int(data.get('minGapDays', 1)),
+            flexible_dates=bool(data.get('flexibleDates', False)),
+            apply=apply
+        )
+    except (TypeError, ValueError):
+        return jsonify({"error": "Parametri invalizi"}), 400
+    except ScheduleConflictError as e:
+        return conflict_response(e)
+    
+    if result is None:
+        return jsonify({"error": "Perioadă de examinare negăsită sau eroare la plasare"}), 404
+    
+    # Returnăm plasările și examenele rămase
+    return jsonify({
+        "placements": [{
+            "scheduleId": placement.schedule_id,
+            "roomId": placement.room_id,
+            "date": placement.date.isoformat(),
+            "startTime": placement.start_time.strftime('%H:%M'),
+            "endTime": placement.end_time.strftime('%H:%M')
+        } for placement in result.placements],
+        "unplaced": [{
+            "scheduleId": item.schedule_id,
+            "reason": item.reason
+        } for item in result.unplaced],
+        "elapsed": round(result.elapsed, 3),
+        "applied": apply
+    })
+
+@schedule_bp.route('/what-if', methods=['POST'])
+@jwt_required()
+@role_required('SEC', 'ADM', 'CD')
+def evaluate_placements():
+    """
+    Endpoint pentru evaluarea unor plasări de încercare, fără salvarea lor
+    
+    Fiecare plasare este verificată față de ocuparea existentă din ziua ei și față
+    de celelalte plasări din cerere (considerate aplicate împreună; plasările pentru
+    aceeași planificare sunt alternative). assistantIds lipsă păstrează asistenții
+    actuali.
+    
+    Request:
+    {
+        "candidates": [
+            {
+                "scheduleId": 1,
+                "roomId": 3,
+                "date": "2023-06-15",
+                "startTime": "10:00",
+                "endTime": "12:00",
+                "assistantIds": [4, 5]
+            }
+        ]
+    }
+    
+    Response (câte un element pentru fiecare plasare, în ordinea primită;
+    candidate este indexul celeilalte plasări sau null pentru o planificare existentă):
+    [
+        {
+            "index": 0,
+            "scheduleId": 1,
+            "ok": false,
+            "conflicts": [
+                {
+                    "type": "room",
+                    "resourceId": 3,
+                    "scheduleId": 7,
+                    "candidate": null
+                }
+            ]
+        }
+    ]
+    """
+    # Obținem datele din request
+    data = request.get_json()
+    
+    if not data or not isinstance(data.get('candidates'), list) or not data['candidates']:
+        return jsonify({"error": "Câmpul 'candidates' lipsește sau este gol"}), 400
+    
+    if len(data['candidates']) > MAX_WHAT_IF_CANDIDATES:
+        return jsonify({"error": f"Cel mult {MAX_WHAT_IF_CANDIDATES} plasări pot fi evaluate într-o cerere"}), 400
+    
+    # Convertim plasările
+    try:
+        candidates = []
+        for item in data['candidates']:
+            candidate = PlacementCandidate(
+                schedule_id=int(item['scheduleId']),
+                room_id=int(item['roomId']) if item.get('roomId') is not None else None,
+                date=datetime.strptime(item['date'], '%Y-%m-%d').date(),
+                start_time=datetime.strptime(item['startTime'], '%H:%M').time(),
+                end_time=datetime.strptime(item['endTime'], '%H:%M').time(),
+                assistant_ids=tuple(int(a) for a in item['assistantIds']) if item.get('assistantIds') is not None else None
+            )
+            if candidate.end_time <= candidate.start_time:
+                raise ValueError
+            candidates.append(candidate)
+    except (KeyError, TypeError, ValueError):
+        return jsonify({"error": "Plasare invalidă: scheduleId, date, startTime și endTime sunt obligatorii, iar endTime trebuie să fie după startTime"}), 400
+    
+    # Inițializăm serviciul de planificare
+    db_session = get_db_session()
+    schedule_service = ScheduleService(db_session=db_session)
+    
+    results = schedule_service.evaluate_placements(candidates)
+    
+    if results is None:
+        return jsonify({"error": "Planificare negăsită sau eroare la evaluare"}), 404
+    
+    # Returnăm conflictele fiecărei plasări
+    return jsonify([{
+        "index": index,
+        "scheduleId": candidate.schedule_id,
+        "ok": not conflicts,
+        "conflicts": [{
+            "type": conflict.type,
+            "resourceId": conflict.resource_id,
+            "scheduleId": conflict.schedule_id,
+            "candidate": conflict.candidate
+        } for conflict in conflicts]
+    } for index, (candidate, conflicts) in enumerate(zip(candidates, results))])
+
 @schedule_bp.route('/available-rooms', methods=['GET'])
 @jwt_required()
 def get_available_rooms():
@@ -1,5 +1,5 @@
 from src.flask_app.utils.decorators import role_required, validate_json
-from src.flask_app.utils.db import get_db_session, close_db_session, init_db
+from src.flask_app.utils.db import get_db_session, close_db_session, init_db, get_engine, get_pool_status
 
 # Exportă toate utilitarele pentru a fi utilizate în alte module
 __all__ = [
@@ -7,5 +7,7 @@ __all__ = [
     'validate_json',
     'get_db_session',
     'close_db_session',
-    'init_db'
+    'init_db',
+    'get_engine',
+    'get_pool_status'
 ]
@@ -1,45 +1,113 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
+from typing import Any, Dict
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
 from flask import current_app, g
 import os
+import threading
+
+from src.common.utils import create_pooled_engine, get_pool_status as get_engine_pool_status
+
+# Registrul de engine-uri la nivel de proces, indexat după URL-ul bazei de date.
+# Engine-ul (și pool-ul lui de conexiuni) se creează o singură dată, la pornirea
+# aplicației, iar cererile doar împrumută conexiuni din pool.
+_engine_registry: Dict[str, Engine] = {}
+_registry_lock = threading.Lock()
+
+def get_or_create_engine(config) -> Engine:
+    """
+    Funcție pentru obținerea engine-ului asociat unei configurații
+
+    Dacă engine-ul pentru DATABASE_URL există deja în registru, este reutilizat;
+    altfel este creat cu setările de pool din configurație.
+    """
+    database_url = config['DATABASE_URL']
+
+    with _registry_lock:
+        engine = _engine_registry.get(database_url)
+
+        if engine is None:
+            engine = create_pooled_engine(
+                database_url,
+                pool_size=config.get('DB_POOL_SIZE', 5),
+                max_overflow=config.get('DB_MAX_OVERFLOW', 10),
+                pool_timeout=config.get('DB_POOL_TIMEOUT', 30),
+                pool_recycle=config.get('DB_POOL_RECYCLE', 1800),
+                pool_pre_ping=config.get('DB_POOL_PRE_PING', True)
+            )
+            _engine_registry[database_url] = engine
+
+    return engine
+
+def dispose_engines():
+    """
+    Funcție pentru închiderea tuturor engine-urilor din registru
+    """
+    with _registry_lock:
+        for engine in _engine_registry.values():
+            engine.dispose()
+        _engine_registry.clear()
+
+def _reset_pools_after_fork():
+    # Conexiunile moștenite de la procesul părinte (ex. gunicorn --preload) nu pot
+    # fi folosite în procesul copil; le abandonăm fără a le închide pe server
+    for engine in _engine_registry.values():
+        engine.dispose(close=False)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+def get_engine(app=None) -> Engine:
+    """
+    Funcție pentru obținerea engine-ului aplicației curente
+    """
+    app = app or current_app
+    return app.extensions['db_engine']
 
 def get_db_session():
     """
     Funcție pentru obținerea unei sesiuni de bază de date
-    
+
+    Sesiunea este creată o singură dată per cerere, pe engine-ul partajat al
+    procesului, și este închisă la teardown (conexiunea revine în pool).
+
     Utilizare:
     db_session = get_db_session()
     users = db_session.query(User).all()
     """
     if 'db_session' not in g:
-        # Obținem URL-ul bazei de date din configurație
-        database_url = current_app.config['DATABASE_URL']
-        
-        # Creăm engine-ul SQLAlchemy
-        engine = create_engine(database_url)
-        
-        # Creăm sesiunea
-        session_factory = sessionmaker(bind=engine)
-        g.db_session = scoped_session(session_factory)
-    
+        session_factory = current_app.extensions['db_session_factory']
+        g.db_session = session_factory()
+
     return g.db_session
 
 def close_db_session(e=None):
     """
     Funcție pentru închiderea sesiunii de bază de date
-    
+
     Această funcție trebuie înregistrată ca teardown_appcontext
     """
     db_session = g.pop('db_session', None)
-    
+
     if db_session is not None:
-        db_session.remove()
+        db_session.close()
+
+def get_pool_status(app=None) -> Dict[str, Any]:
+    """
+    Funcție pentru obținerea stării pool-ului de conexiuni al aplicației
+    """
+    return get_engine_pool_status(get_engine(app))
 
 def init_db(app):
     """
     Funcție pentru inițializarea bazei de date
-    
-    Această funcție trebuie apelată la inițializarea aplicației
+
+    Această funcție trebuie apelată la inițializarea aplicației. Creează (sau
+    reutilizează) engine-ul procesului și fabrica de sesiuni.
     """
+    engine = get_or_create_engine(app.config)
+
+    app.extensions['db_engine'] = engine
+    app.extensions['db_session_factory'] = sessionmaker(bind=engine)
+
     # Înregistrăm funcția de închidere a sesiunii
     app.teardown_appcontext(close_db_session)
@@ -8,17 +8,17 @@ from sqlalchemy.pool import StaticPool
 # Adăugăm directorul src la calea de import
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from common.models import Base
-from common.models.user import User
-from common.models.teacher import Teacher
-from common.models.room import Room
-from common.models.group import Group
-from common.models.subject import Subject
-from common.models.schedule import Schedule
-from common.models.notification import Notification
-from common.models.exam_period import ExamPeriod
-from common.models.excel_template import ExcelTemplate
-from common.models.audit_log import AuditLog
+from src.common.models import Base
+from src.common.models.user import User
+from src.common.models.teacher import Teacher
+from src.common.models.room import Room
+from src.common.models.group import Group
+from src.common.models.subject import Subject
+from src.common.models.schedule import Schedule
+from src.common.models.notification import Notification
+from src.common.models.exam_period import ExamPeriod
+from src.common.models.excel_template import ExcelTemplate
+from src.common.models.audit_log import AuditLog
 
 @pytest.fixture
 def in_memory_db():
@@ -2,8 +2,8 @@ import pytest
 import jwt
 from datetime import datetime, timedelta
 
-from common.services.auth_service import AuthService
-from common.models.user import User
+from src.common.services.auth_service import AuthService
+from src.common.models.user import User
 
 class TestAuthService:
     """Teste pentru AuthService"""
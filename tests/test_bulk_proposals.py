@@ -0,0 +1,142 @@
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, User, Schedule, Notification
+from src.common.services import ScheduleService, RoomAvailabilityIndex, ProposalItem, verify_conflicts
+from src.common.services.schedule_service import ProposalResult
+
+DAY = date(2025, 6, 10)
+NEXT_DAY = date(2025, 6, 11)
+
+class TestProposeSchedules:
+    """Teste pentru ScheduleService.propose_schedules (propuneri în bloc)"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """40 de discipline, 3 grupe, 2 cadre didactice (doar primul are cont) și o planificare în C201"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add_all([Subject(name=f"Disciplina {i}", short_name=f"D{i}", credits=5, semester=2) for i in range(40)])
+        session.add_all([Group(name=f"321{i}A", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(3)])
+        session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(2)])
+        session.add(Room(name="C201", short_name="C201", capacity=40, building="C", floor=2))
+        user = User(first_name="Prenume0", last_name="Nume", email="cd0@usv.ro", role='PROF', is_active=True)
+        user.password = "parola"
+        session.add(user)
+        session.flush()
+
+        # Planificarea 1 (disciplina 1, grupa 1) ocupă C201, iar planificarea 2 este în aceeași sală a doua zi
+        session.add_all([
+            Schedule(subject_id=1, group_id=1, teacher_id=1, room_id=1, date=date(2025, 6, 9),
+                     start_time=time(10, 0), end_time=time(12, 0), status='approved'),
+            Schedule(subject_id=2, group_id=2, teacher_id=2, room_id=1, date=DAY,
+                     start_time=time(11, 0), end_time=time(13, 0), status='approved')
+        ])
+        session.commit()
+        session.close()
+
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def service(self, engine):
+        session = sessionmaker(bind=engine)()
+        yield ScheduleService(db_session=session, availability_index=RoomAvailabilityIndex(ttl=3600))
+        session.close()
+
+    def count_statements(self, engine, service, items):
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, 'before_cursor_execute', listener)
+        results = service.propose_schedules(items)
+        event.remove(engine, 'before_cursor_execute', listener)
+        return results, len(statements)
+
+    def test_statement_count_does_not_grow_with_batch(self, engine, service):
+        """Testează că numărul de interogări este același pentru 2 și pentru 60 de propuneri"""
+        _, small = self.count_statements(engine, service, [ProposalItem(s, 3, 1, DAY) for s in (3, 4)])
+        results, large = self.count_statements(engine, service, [
+            ProposalItem(s, g, 1, DAY) for s in range(5, 25) for g in (1, 2, 3)
+        ])
+
+        assert small == large
+        assert [result.action for result in results] == ['created'] * 60
+        assert service.db_session.query(Notification).count() == 62
+
+    def test_results_and_error_codes(self, service):
+        """Testează actualizarea, crearea și erorile raportate per propunere"""
+        results = service.propose_schedules([
+            ProposalItem(1, 1, 1, NEXT_DAY),
+            ProposalItem(3, 2, 2, DAY),
+            ProposalItem(99, 1, 1, DAY),
+            ProposalItem(3, 9, 1, DAY),
+            ProposalItem(4, 1, 9, DAY),
+            ProposalItem(3, 2, 1, DAY)
+        ])
+
+        assert results[0] == ProposalResult(1, 'updated')
+        assert results[1].action == 'created'
+        assert [result.error for result in results[2:]] == ['subject_not_found', 'group_not_found', 'teacher_not_found', 'duplicate']
+
+        session = service.db_session
+        session.expire_all()
+        updated = session.get(Schedule, 1)
+        assert (updated.date, updated.status, updated.room_id) == (NEXT_DAY, 'proposed', 1)
+        assert session.get(Schedule, results[1].schedule_id).teacher_id == 2
+
+        # Doar cadrul didactic cu cont este notificat, și doar pentru planificările noi
+        assert session.query(Notification).count() == 0
+
+    def test_conflict_index_and_availability(self, service):
+        """Testează că mutarea în bloc actualizează conflictele și ocuparea sălilor"""
+        assert service.get_available_rooms(NEXT_DAY, time(10, 0), time(11, 0)) != []
+
+        assert service.propose_schedules([ProposalItem(1, 1, 1, NEXT_DAY)]) == [ProposalResult(1, 'updated')]
+
+        assert verify_conflicts(service.db_session) == ([], [])
+        assert service.check_conflicts(date_val=NEXT_DAY) == []
+        assert service.get_available_rooms(NEXT_DAY, time(10, 0), time(11, 0)) == []
+
+    def test_moves_checked_for_overlaps(self, service):
+        """Testează că o mutare peste altă planificare este raportată ca 'conflict' fără să oprească lotul"""
+        session = service.db_session
+        session.add(Room(name="C202", short_name="C202", capacity=40, building="C", floor=2))
+        session.add_all([
+            Schedule(subject_id=3, group_id=3, teacher_id=2, room_id=1, date=date(2025, 6, 8),
+                     start_time=time(9, 0), end_time=time(11, 0), status='approved'),
+            Schedule(subject_id=4, group_id=1, teacher_id=2, room_id=2, date=date(2025, 6, 7),
+                     start_time=time(10, 0), end_time=time(12, 0), status='approved')
+        ])
+        session.commit()
+
+        results = service.propose_schedules([
+            # Sala C201 este ocupată în DAY de planificarea 2
+            ProposalItem(1, 1, 1, DAY),
+            ProposalItem(3, 3, 2, NEXT_DAY),
+            ProposalItem(5, 3, 1, DAY),
+            # Titularul este ocupat de mutarea anterioară din lot
+            ProposalItem(4, 1, 2, NEXT_DAY)
+        ])
+
+        assert [result.action for result in results] == ['error', 'updated', 'created', 'error']
+        assert results[0].error == results[3].error == 'conflict'
+
+        session.expire_all()
+        assert [session.get(Schedule, schedule_id).date for schedule_id in (1, 3, 4)] == [date(2025, 6, 9), NEXT_DAY, date(2025, 6, 7)]
+        assert service.check_conflicts(date_val=DAY) == [] and service.check_conflicts(date_val=NEXT_DAY) == []
+        assert verify_conflicts(session) == ([], [])
+
+    def test_single_proposal_delegates(self, service):
+        """Testează că propose_schedule folosește aceeași cale și notifică titularul"""
+        schedule = service.propose_schedule(subject_id=5, group_id=1, teacher_id=1, exam_date=DAY)
+
+        assert schedule.status == 'proposed' and schedule.date == DAY
+        notification = service.db_session.query(Notification).one()
+        assert notification.title == "Propunere nouă de examen"
+        assert "Disciplina 4" in notification.message and "3210A" in notification.message
+
+        assert service.propose_schedule(subject_id=99, group_id=1, teacher_id=1, exam_date=DAY) is None
@@ -0,0 +1,185 @@
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+from src.common.models import Base, CalendarFeedVersion, Group, Room, Subject, Teacher, Schedule, User
+from src.common.services import CalendarFeedService, CalendarFeedCache
+from src.common.services.calendar_feed import render_calendar
+from src.flask_app.utils import db as flask_db
+from src.flask_app.routes import calendar as calendar_routes
+
+def seed(session):
+    """2 grupe, 3 cadre didactice și 3 planificări (a doua cu asistent, a treia respinsă)"""
+    session.add(Subject(name="Baze de date; SQL, NoSQL", short_name="BD", credits=5, semester=2))
+    session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(3)])
+    session.add(Room(name="C201", short_name="C201", capacity=40, building="C", floor=2))
+    session.add_all([Group(name=f"321{i}A", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(2)])
+    session.flush()
+
+    session.add(Schedule(subject_id=1, teacher_id=1, group_id=1, room_id=1, date=date(2025, 6, 10),
+                         start_time=time(8, 0), end_time=time(10, 0), status='approved'))
+    assisted = Schedule(subject_id=1, teacher_id=2, group_id=2, date=date(2025, 6, 11), status='proposed')
+    assisted.assistants.append(session.get(Teacher, 3))
+    session.add(assisted)
+    session.add(Schedule(subject_id=1, teacher_id=1, group_id=1, date=date(2025, 6, 12), status='rejected'))
+    session.commit()
+
+def versions(session):
+    session.expire_all()
+    return {(row.kind, row.entity_id): row.version for row in session.query(CalendarFeedVersion)}
+
+class TestCalendarFeed:
+    """Teste pentru feed-urile iCalendar și versiunile lor"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'calendar.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        seed(session)
+        session.close()
+
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def session(self, engine):
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def test_only_affected_feeds_change(self, session):
+        """Testează că o scriere incrementează doar versiunile feed-urilor atinse"""
+        before = versions(session)
+        assert set(before) == {('group', 1), ('group', 2), ('teacher', 1), ('teacher', 2), ('teacher', 3)}
+
+        # Mutarea unei planificări la altă grupă atinge ambele grupe
+        session.get(Schedule, 1).group_id = 2
+        session.commit()
+        after_move = versions(session)
+        assert {key for key in before if after_move[key] != before[key]} == {('group', 1), ('group', 2), ('teacher', 1)}
+
+        # Redenumirea asistentului atinge doar feed-urile planificărilor lui
+        session.get(Teacher, 3).last_name = "Ionescu"
+        session.commit()
+        after_rename = versions(session)
+        assert {key for key in before if after_rename[key] != after_move[key]} == {('group', 2), ('teacher', 2), ('teacher', 3)}
+
+        # O modificare fără legătură cu planificările nu schimbă nimic
+        session.get(Room, 1).capacity = 50
+        session.commit()
+        assert versions(session) == after_rename
+
+    def test_renders_rfc5545(self, session):
+        """Testează conținutul și formatul documentului iCalendar"""
+        service = CalendarFeedService(db_session=session, cache=CalendarFeedCache())
+        body = service.get_feed('teacher', 1, service.get_feed_state('teacher', 1)).decode('utf-8')
+
+        assert body.startswith("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n") and body.endswith("END:VCALENDAR\r\n")
+        assert body.count("BEGIN:VEVENT") == 1
+        assert "UID:schedule-1@planificare.fiesc.usv.ro" in body
+        assert "DTSTART;TZID=Europe/Bucharest:20250610T080000" in body
+        assert "SUMMARY:Examen Baze de date\\; SQL\\, NoSQL (BD)" in body
+        assert "STATUS:CONFIRMED" in body
+        assert all(len(line.encode('utf-8')) <= 75 for line in body.split("\r\n"))
+
+        # Asistentul vede planificarea ca eveniment pe toată ziua, încă nesigur
+        assistant_feed = service.get_feed('teacher', 3, service.get_feed_state('teacher', 3)).decode('utf-8').replace("\r\n ", "")
+        assert "DTSTART;VALUE=DATE:20250611" in assistant_feed and "STATUS:TENTATIVE" in assistant_feed
+        assert "Asistenți: Prenume2 Nume" in assistant_feed
+
+        assert service.get_feed('group', 99, service.get_feed_state('group', 99)) is None
+
+    def test_folds_long_lines(self):
+        """Testează împărțirea liniilor lungi fără tăierea caracterelor UTF-8"""
+        body = render_calendar("Examene " + "ă" * 60, [])
+        lines = body.decode('utf-8').split("\r\n")
+        name = [index for index, line in enumerate(lines) if line.startswith("X-WR-CALNAME")][0]
+
+        assert all(len(line.encode('utf-8')) <= 75 for line in lines)
+        assert lines[name + 1].startswith(" ")
+        assert "X-WR-CALNAME:Examene " + "ă" * 60 + "\r\n" in body.decode('utf-8').replace("\r\n ", "")
+
+    def test_cached_feed_costs_one_query(self, engine, session):
+        """Testează că un feed nemodificat este servit din cache după o singură interogare"""
+        service = CalendarFeedService(db_session=session, cache=CalendarFeedCache())
+        first = service.get_feed('group', 1, service.get_feed_state('group', 1))
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        assert service.get_feed('group', 1, service.get_feed_state('group', 1)) == first
+        assert len(statements) == 1
+
+        # O scriere pe altă grupă nu invalidează feed-ul
+        session.get(Schedule, 2).date = date(2025, 6, 13)
+        session.commit()
+        statements.clear()
+        assert service.get_feed('group', 1, service.get_feed_state('group', 1)) == first
+        assert len(statements) == 1
+        assert service.cache.snapshot()['hits'] == 2
+
+class TestCalendarRoutes:
+    """Teste pentru endpoint-urile feed-urilor iCalendar"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        database_url = f"sqlite:///{tmp_path / 'routes.db'}"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        user = User(first_name="Ana", last_name="Popescu", email="student@usv.ro", role='SG')
+        user.password = "parola"
+        session.add(user)
+        seed(session)
+
+        cache = CalendarFeedCache()
+        monkeypatch.setattr(calendar_routes, 'CalendarFeedService',
+                            lambda db_session: CalendarFeedService(db_session=db_session, cache=cache))
+
+        app = Flask(__name__)
+        app.config.update(TESTING=True, DATABASE_URL=database_url, SECRET_KEY='cheie-de-test',
+                          JWT_SECRET_KEY='cheie-de-test-' * 3)
+        flask_db.init_db(app)
+        JWTManager(app)
+        app.register_blueprint(calendar_routes.calendar_bp, url_prefix='/api/calendar')
+
+        with app.app_context():
+            token = create_access_token(identity=str(user.id))
+
+        yield app.test_client(), {'Authorization': f'Bearer {token}'}, session
+
+        session.close()
+        flask_db.dispose_engines()
+        engine.dispose()
+
+    def test_conditional_get(self, client):
+        """Testează abonarea, ETag/Last-Modified, 304 și invalidarea doar la modificări relevante"""
+        test_client, headers, session = client
+
+        assert test_client.get('/api/calendar/groups/1/subscription').status_code == 401
+        url = test_client.get('/api/calendar/groups/1/subscription', headers=headers).get_json()['url']
+        assert test_client.get('/api/calendar/groups/1.ics?token=invalid').status_code == 403
+
+        first = test_client.get(url)
+        assert first.status_code == 200 and first.mimetype == 'text/calendar'
+        etag = first.headers['ETag']
+        assert first.headers['Last-Modified']
+
+        assert test_client.get(url, headers={'If-None-Match': etag}).status_code == 304
+        assert test_client.get(url, headers={'If-Modified-Since': first.headers['Last-Modified']}).status_code == 304
+
+        # Modificarea unei planificări a altei grupe nu schimbă feed-ul
+        session.get(Schedule, 2).date = date(2025, 6, 13)
+        session.commit()
+        assert test_client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+        session.get(Schedule, 1).start_time = time(9, 0)
+        session.commit()
+        changed = test_client.get(url, headers={'If-None-Match': etag})
+        assert changed.status_code == 200 and changed.headers['ETag'] != etag
+        assert b"T090000" in changed.data
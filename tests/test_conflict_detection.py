@@ -0,0 +1,154 @@
+import random
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.services import ScheduleService
+from src.common.services.conflict_detection import ScheduleInterval, Conflict, detect_conflicts
+
+def interval(schedule_id, start, end, room_id=1, teacher_ids=(1,), group_id=1, day=date(2025, 6, 10)):
+    return ScheduleInterval(schedule_id, day, time(*start) if start else None, time(*end) if end else None, room_id, teacher_ids, group_id)
+
+def brute_force(intervals):
+    """Implementarea de referință: compară toate perechile"""
+    conflicts = set()
+    for a in intervals:
+        for b in intervals:
+            if a.schedule_id >= b.schedule_id or a.date != b.date:
+                continue
+            if None in (a.start_time, a.end_time, b.start_time, b.end_time):
+                continue
+            if not (a.start_time < b.end_time and b.start_time < a.end_time):
+                continue
+            first, second = a.schedule_id, b.schedule_id
+            if a.room_id is not None and a.room_id == b.room_id:
+                conflicts.add(Conflict('room', a.room_id, a.date, first, second))
+            for teacher_id in set(a.teacher_ids) & set(b.teacher_ids):
+                conflicts.add(Conflict('teacher', teacher_id, a.date, first, second))
+            if a.group_id is not None and a.group_id == b.group_id:
+                conflicts.add(Conflict('group', a.group_id, a.date, first, second))
+    return sorted(conflicts)
+
+class TestDetectConflicts:
+    """Teste pentru detectorul de conflicte cu linie de baleiere"""
+
+    def test_half_open_intervals(self):
+        """Testează că intervalele consecutive nu sunt în conflict"""
+        intervals = [
+            interval(1, (9, 0), (11, 0)),
+            interval(2, (11, 0), (13, 0)),
+            interval(3, (10, 0), (12, 0), teacher_ids=(2,), group_id=2)
+        ]
+
+        conflicts = detect_conflicts(intervals)
+
+        assert conflicts == [
+            Conflict('room', 1, date(2025, 6, 10), 1, 3),
+            Conflict('room', 1, date(2025, 6, 10), 2, 3)
+        ]
+
+    def test_assistants_count_as_teachers(self):
+        """Testează conflictele în care cadrul didactic este asistent"""
+        intervals = [
+            interval(1, (9, 0), (11, 0), room_id=1, teacher_ids=(1, 5), group_id=1),
+            interval(2, (10, 0), (12, 0), room_id=2, teacher_ids=(2, 5), group_id=2),
+            interval(3, (10, 0), (12, 0), room_id=3, teacher_ids=(5,), group_id=3)
+        ]
+
+        conflicts = detect_conflicts(intervals)
+
+        assert {(c.type, c.resource_id, c.schedule_id1, c.schedule_id2) for c in conflicts} == {
+            ('teacher', 5, 1, 2), ('teacher', 5, 1, 3), ('teacher', 5, 2, 3)
+        }
+
+    def test_ignores_incomplete_and_other_days(self):
+        """Testează ignorarea propunerilor fără oră și a zilelor diferite"""
+        intervals = [
+            interval(1, (9, 0), (11, 0)),
+            interval(2, None, None),
+            interval(3, (9, 0), (11, 0), day=date(2025, 6, 11))
+        ]
+
+        assert detect_conflicts(intervals) == []
+
+    def test_resource_filter(self):
+        """Testează restrângerea la o singură resursă"""
+        intervals = [
+            interval(1, (9, 0), (11, 0), room_id=1, teacher_ids=(1,)),
+            interval(2, (10, 0), (12, 0), room_id=1, teacher_ids=(1,))
+        ]
+
+        assert [c.type for c in detect_conflicts(intervals, resources={'teacher': 1})] == ['teacher']
+        assert detect_conflicts(intervals, resources={'room': 2}) == []
+
+    def test_matches_pairwise_reference(self):
+        """Testează echivalența cu compararea tuturor perechilor pe date aleatoare"""
+        rng = random.Random(7)
+        intervals = []
+
+        for schedule_id in range(1, 301):
+            start = rng.randrange(8, 18)
+            teachers = tuple(rng.sample(range(1, 30), rng.randrange(1, 3)))
+            intervals.append(interval(
+                schedule_id, (start, rng.choice((0, 30))), (start + rng.randrange(1, 4), 0),
+                room_id=rng.randrange(1, 15), teacher_ids=teachers, group_id=rng.randrange(1, 40),
+                day=date(2025, 6, rng.randrange(10, 14))
+            ))
+
+        assert detect_conflicts(intervals) == brute_force(intervals)
+
+class TestScheduleServiceConflicts:
+    """Teste pentru check_conflicts și get_conflicts din ScheduleService"""
+
+    @pytest.fixture
+    def db_session(self, tmp_path):
+        """Sesiune pe o bază SQLite cu două examene suprapuse în aceeași sală"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'conflicts.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        subject = Subject(name="Baze de date", short_name="BD", credits=5, semester=1)
+        teacher = Teacher(first_name="Ion", last_name="Popescu", title="Prof. dr.", department="Calculatoare", email="ion.popescu@usv.ro")
+        other_teacher = Teacher(first_name="Ana", last_name="Ionescu", department="Calculatoare", email="ana.ionescu@usv.ro")
+        room = Room(name="C201", short_name="C201", capacity=40, building="C", floor=2)
+        groups = [Group(name=name, study_year=3, specialization="Calculatoare", number_of_students=25) for name in ("3211A", "3212A")]
+        session.add_all([subject, teacher, other_teacher, room, *groups])
+        session.flush()
+
+        first = Schedule(subject_id=subject.id, teacher_id=teacher.id, room_id=room.id, group_id=groups[0].id,
+                         date=date(2025, 6, 10), start_time=time(10, 0), end_time=time(12, 0), status='approved')
+        second = Schedule(subject_id=subject.id, teacher_id=other_teacher.id, room_id=room.id, group_id=groups[1].id,
+                          date=date(2025, 6, 10), start_time=time(11, 0), end_time=time(13, 0), status='approved')
+        # Titularul primului examen este asistent la al doilea
+        second.assistants.append(teacher)
+        session.add_all([first, second])
+        session.commit()
+
+        yield session
+        session.close()
+        engine.dispose()
+
+    def test_check_conflicts_resolves_names(self, db_session):
+        """Testează formatul conflictelor și rezolvarea numelor"""
+        service = ScheduleService(db_session=db_session)
+
+        conflicts = service.check_conflicts(date_val=date(2025, 6, 10))
+
+        by_type = {c['type']: c for c in conflicts}
+        assert set(by_type) == {'room_conflict', 'teacher_conflict'}
+        assert by_type['room_conflict']['room_name'] == "C201"
+        assert by_type['teacher_conflict']['teacher_name'] == "Prof. dr. Ion Popescu"
+        assert by_type['room_conflict']['time_range1'] == "10:00:00-12:00:00"
+
+        assert [c['type'] for c in service.check_conflicts(date_val=date(2025, 6, 10), room_id=1)] == ['room_conflict']
+        assert service.check_conflicts(date_val=date(2025, 6, 11)) == []
+
+    def test_get_conflicts_includes_schedules(self, db_session):
+        """Testează conflictele cu planificările serializate"""
+        conflicts = ScheduleService(db_session=db_session).get_conflicts(start_date=date(2025, 6, 1))
+
+        assert sorted(c['type'] for c in conflicts) == ['room', 'teacher']
+        assert [s['id'] for s in conflicts[0]['schedules']] == [1, 2]
+        assert conflicts[0]['schedules'][1]['assistants'][0]['name'] == "Prof. dr. Ion Popescu"
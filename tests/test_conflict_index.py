@@ -0,0 +1,140 @@
+import random
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule, ScheduleConflict
+from src.common.services import ScheduleService, RoomAvailabilityIndex, rebuild_conflicts, verify_conflicts
+from src.common.services.conflict_index import bucket_lock_key, lock_buckets
+from src.common.services.conflict_index_cli import main
+
+DAYS = [date(2025, 6, 9), date(2025, 6, 10), date(2025, 6, 11)]
+
+class TestConflictIndex:
+    """Teste pentru indexul persistent al conflictelor (schedule_conflicts)"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Bază SQLite cu 3 săli, 4 cadre didactice și 4 grupe, fără planificări"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'conflicts.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add(Subject(name="Baze de date", short_name="BD", credits=5, semester=2))
+        session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(4)])
+        session.add_all([Room(name=f"C20{i}", short_name=f"C20{i}", capacity=40, building="C", floor=2) for i in range(3)])
+        session.add_all([Group(name=f"321{i}A", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(4)])
+        session.commit()
+        session.close()
+
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def service(self, engine):
+        session = sessionmaker(bind=engine)()
+        yield ScheduleService(db_session=session, availability_index=RoomAvailabilityIndex(ttl=3600))
+        session.close()
+
+    def random_slot(self, rng):
+        start = rng.randrange(8, 17)
+        return rng.choice(DAYS), time(start, 0), time(start + rng.choice((1, 2, 3)), 0)
+
+    def test_incremental_updates_match_full_recompute(self, service):
+        """Testează că indexul rămâne identic cu recalcularea completă după scrieri aleatoare"""
+        rng = random.Random(7)
+        session = service.db_session
+        teachers = session.query(Teacher).all()
+
+        for _ in range(150):
+            schedule_ids = [row[0] for row in session.query(Schedule.id)]
+            operation = rng.random() if schedule_ids else 0
+
+            if operation < 0.4:
+                # Planificările sunt adăugate direct în sesiune, deci pot produce conflicte
+                day, start, end = self.random_slot(rng)
+                session.add(Schedule(subject_id=1, teacher_id=rng.randint(1, 4), group_id=rng.randint(1, 4), room_id=rng.randint(1, 3),
+                                     date=day, start_time=start, end_time=end, status='approved'))
+                session.commit()
+            elif operation < 0.6:
+                day, start, end = self.random_slot(rng)
+                schedule = session.get(Schedule, rng.choice(schedule_ids))
+                schedule.date, schedule.start_time, schedule.end_time = day, start, end
+                session.commit()
+            elif operation < 0.75:
+                schedule = session.get(Schedule, rng.choice(schedule_ids))
+                schedule.assistants = rng.sample(teachers, rng.randint(0, 2))
+                session.commit()
+            elif operation < 0.85:
+                service.update_schedule_status(rng.choice(schedule_ids), rng.choice(('approved', 'rejected')))
+            else:
+                assert service.delete_schedule(rng.choice(schedule_ids))
+
+            assert verify_conflicts(session) == ([], [])
+
+        assert session.query(ScheduleConflict).count() > 0
+
+    def test_reads_do_not_scan_schedules(self, engine, service):
+        """Testează că lista conflictelor este citită din index, fără încărcarea planificărilor"""
+        service.create_schedule(subject_id=1, teacher_id=1, group_id=1, room_id=1, date=DAYS[0],
+                                start_time=time(10, 0), end_time=time(12, 0), status='approved')
+        schedule = service.create_schedule(subject_id=1, teacher_id=2, group_id=2, room_id=2, date=DAYS[0],
+                                           start_time=time(11, 0), end_time=time(13, 0), status='approved')
+        service.set_schedule_details(schedule.id, 2, time(11, 0), time(13, 0), [1])
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        conflicts = service.check_conflicts(date_val=DAYS[0])
+
+        assert [(c['type'], c['teacher_id']) for c in conflicts] == [('teacher_conflict', 1)]
+        assert conflicts[0]['time_range2'] == "11:00:00-13:00:00"
+        assert not [s for s in statements if "schedule_assistants" in s]
+
+        service.update_schedule_status(schedule.id, 'rejected')
+        assert service.check_conflicts(date_val=DAYS[0]) == []
+
+    def test_rebuild_and_cli_check(self, engine, service):
+        """Testează verificarea și reconstruirea după scrieri care ocolesc sesiunea"""
+        session = service.db_session
+        session.execute(insert(Schedule), [
+            {'subject_id': 1, 'teacher_id': 1, 'group_id': group_id, 'room_id': 1, 'date': DAYS[1],
+             'start_time': time(10, 0), 'end_time': time(12, 0), 'status': 'approved'}
+            for group_id in (1, 2)
+        ])
+        session.commit()
+
+        missing, stale = verify_conflicts(session)
+        assert [c.type for c in missing] == ['room', 'teacher'] and stale == []
+
+        database_url = str(engine.url)
+        assert main(['check', '--database-url', database_url]) == 1
+        assert main(['rebuild', '--database-url', database_url, '--start-date', '2025-06-10']) == 0
+        assert main(['check', '--database-url', database_url]) == 0
+
+        session.expire_all()
+        assert rebuild_conflicts(session, end_date=DAYS[0]) == 0
+        assert len(service.get_conflicts()) == 2
+
+    def test_locks_buckets_in_key_order(self):
+        """Testează că gălețile sunt blocate o singură dată, în ordinea cheilor, doar în PostgreSQL"""
+        class RecordingConnection:
+            def __init__(self, name):
+                self.dialect = type('Dialect', (), {'name': name})()
+                self.statements = []
+
+            def execute(self, statement):
+                self.statements.append(statement.compile().params)
+
+        buckets = [('room', 1, DAYS[0]), ('teacher', 1, DAYS[0]), ('room', 1, DAYS[1]), ('room', 1, DAYS[0])]
+        keys = sorted({bucket_lock_key(*bucket) for bucket in buckets})
+
+        postgresql = RecordingConnection('postgresql')
+        lock_buckets(postgresql, buckets)
+        assert [list(params.values()) for params in postgresql.statements] == [[key] for key in keys]
+        assert len(keys) == 3 and bucket_lock_key('room', 1, DAYS[0]) == bucket_lock_key('room', 1, DAYS[0])
+
+        sqlite = RecordingConnection('sqlite')
+        lock_buckets(sqlite, buckets)
+        assert sqlite.statements == []
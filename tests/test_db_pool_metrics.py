@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.common.utils import create_pooled_engine, get_pool_status, PoolMetrics
+from fastapi_app.config import Settings
+from fastapi_app.database import create_db_engine, create_async_db_engine
+
+class TestPoolMetrics:
+    """Teste pentru instrumentarea pool-ului de conexiuni"""
+
+    @pytest.fixture
+    def database_url(self, tmp_path):
+        """URL-ul unei baze de date SQLite temporare"""
+        return f"sqlite:///{tmp_path / 'metrics.db'}"
+
+    def test_counts_connect_checkout_checkin(self, database_url):
+        """Testează contoarele de evenimente ale pool-ului"""
+        metrics = PoolMetrics()
+        engine = create_pooled_engine(database_url, pool_size=2, max_overflow=0, metrics=metrics)
+
+        for _ in range(3):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        snapshot = metrics.snapshot()
+
+        # O singură conexiune fizică, refolosită de trei ori
+        assert snapshot["connects"] == 1
+        assert snapshot["checkouts"] == 3
+        assert snapshot["checkins"] == 3
+        assert snapshot["wait_time"]["count"] == 3
+
+        engine.dispose()
+
+    def test_records_pool_timeouts(self, database_url):
+        """Testează înregistrarea așteptărilor care depășesc pool_timeout"""
+        metrics = PoolMetrics()
+        engine = create_pooled_engine(database_url, pool_size=1, max_overflow=0, pool_timeout=0.05, metrics=metrics)
+
+        connection = engine.connect()
+        try:
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        finally:
+            connection.close()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["timeouts"] == 1
+        assert snapshot["wait_time"]["max_ms"] >= 50
+
+        engine.dispose()
+
+    def test_metrics_survive_dispose(self, database_url):
+        """Testează că metricile rămân atașate după recrearea pool-ului"""
+        metrics = PoolMetrics()
+        engine = create_pooled_engine(database_url, metrics=metrics)
+
+        engine.dispose()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        assert metrics.snapshot()["wait_time"]["count"] == 1
+
+        engine.dispose()
+
+    def test_engine_from_settings(self, database_url):
+        """Testează crearea engine-ului din configurarea FastAPI"""
+        settings = Settings(DATABASE_URL=database_url, DB_POOL_SIZE=3, DB_MAX_OVERFLOW=2)
+        engine = create_db_engine(settings)
+
+        status = get_pool_status(engine)
+        assert status["pool_size"] == 3
+
+        engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_counts_async_engine_events(self, database_url):
+        """Testează atașarea metricilor la engine-ul asincron din configurarea FastAPI"""
+        metrics = PoolMetrics()
+        engine = create_async_db_engine(Settings(DATABASE_URL=database_url), metrics=metrics)
+
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+        snapshot = metrics.snapshot()
+        assert (snapshot["connects"], snapshot["checkouts"], snapshot["checkins"]) == (1, 1, 1)
+        assert snapshot["wait_time"]["count"] == 1
+
+        await engine.dispose()
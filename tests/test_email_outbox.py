@@ -0,0 +1,145 @@
+import threading
+import time as timer
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, EmailOutbox, Notification, User
+from src.common.services import NotificationService, EmailOutboxWorker, BatchingEmailSender, EmailDeliveryError, MemoryEmailTransport
+from src.common.services.email_outbox import OUTBOX_DEAD, OUTBOX_PENDING, OUTBOX_SENDING, OUTBOX_SENT, requeue_dead
+
+class TestEmailOutbox:
+    """Teste pentru coada de email-uri a notificărilor și workerul de trimitere"""
+
+    @pytest.fixture
+    def session_factory(self, tmp_path):
+        """Bază SQLite cu 3 șefi de grupă și un cadru didactic"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        for index, role in enumerate(('SG', 'SG', 'SG', 'CD')):
+            user = User(first_name="Ana", last_name=f"Nume{index}", email=f"user{index}@usv.ro", role=role)
+            user.password = "parola"
+            session.add(user)
+        session.commit()
+        session.close()
+
+        yield sessionmaker(bind=engine)
+        engine.dispose()
+
+    @pytest.fixture
+    def session(self, session_factory):
+        session = session_factory()
+        yield session
+        session.close()
+
+    def test_notifications_enqueue_emails_in_same_transaction(self, session):
+        """Testează că notificările și email-urile lor sunt salvate împreună, fără trimitere sincronă"""
+        service = NotificationService(db_session=session)
+
+        notification = service.create_notification(4, "Planificare aprobată", title="Planificare")
+        assert notification is not None
+        assert service.notify_group_leaders("Termen propuneri") == 3
+
+        emails = session.query(EmailOutbox).order_by(EmailOutbox.id).all()
+        assert [email.to_email for email in emails] == ["user3@usv.ro", "user0@usv.ro", "user1@usv.ro", "user2@usv.ro"]
+        assert emails[0].notification_id == notification.id and emails[0].subject == "Planificare"
+        assert {email.status for email in emails} == {OUTBOX_PENDING}
+
+        # O tranzacție anulată nu lasă nici notificarea, nici email-ul
+        service.send_email_notification("user0@usv.ro", "Subiect", "Mesaj")
+        session.add(Notification(user_id=1, title="Anulată", message="Mesaj", type='info'))
+        session.rollback()
+        assert session.query(EmailOutbox).count() == 4
+        assert session.query(Notification).filter(Notification.title == "Anulată").count() == 0
+
+    def test_worker_delivers_with_limited_concurrency(self, session_factory, session):
+        """Testează trimiterea unui lot cu cel mult max_workers cereri simultane"""
+        NotificationService(db_session=session).notify_group_leaders("Termen propuneri")
+        NotificationService(db_session=session).notify_teachers("Termen propuneri")
+
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def slow(email):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            timer.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+        transport = MemoryEmailTransport(fail=slow)
+        # Câte un destinatar pe cerere, ca fiecare email să ocupe un fir de execuție
+        sender = BatchingEmailSender(transport, max_batch=1)
+        worker = EmailOutboxWorker(session_factory, transport, sender=sender, max_workers=2, batch_size=10)
+
+        assert worker.run_once() == 4
+        assert worker.run_once() == 0
+        worker.shutdown()
+
+        assert sorted(email.to_email for email in transport.sent) == ["user0@usv.ro", "user1@usv.ro", "user2@usv.ro", "user3@usv.ro"]
+        assert peak[0] == 2
+        session.expire_all()
+        assert {(email.status, email.attempts) for email in session.query(EmailOutbox)} == {(OUTBOX_SENT, 1)}
+        assert worker.snapshot()['sent'] == 4
+
+    def test_retries_with_backoff_and_dead_letters(self, session_factory, session):
+        """Testează reprogramarea după erori temporare și abandonarea după prea multe încercări"""
+        service = NotificationService(db_session=session)
+        for address in ("temporar@usv.ro", "invalid@usv.ro"):
+            service.send_email_notification(address, "Subiect", "Mesaj")
+        session.commit()
+
+        def fail(email):
+            raise EmailDeliveryError("respins", permanent=email.to_email == "invalid@usv.ro")
+
+        worker = EmailOutboxWorker(session_factory, MemoryEmailTransport(fail=fail), max_workers=1, max_attempts=2)
+
+        assert worker.run_once() == 2
+        session.expire_all()
+        temporary = session.query(EmailOutbox).filter(EmailOutbox.to_email == "temporar@usv.ro").one()
+        invalid = session.query(EmailOutbox).filter(EmailOutbox.to_email == "invalid@usv.ro").one()
+        assert invalid.status == OUTBOX_DEAD and invalid.last_error == "respins"
+        assert temporary.status == OUTBOX_PENDING and temporary.next_attempt_at > datetime.utcnow()
+
+        # Email-ul reprogramat nu este preluat înainte de termen
+        assert worker.run_once() == 0
+
+        temporary.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        session.commit()
+        assert worker.run_once() == 1
+        session.expire_all()
+        assert temporary.status == OUTBOX_DEAD and temporary.attempts == 2
+        assert worker.snapshot()['dead'] == 2
+
+        # Email-urile abandonate pot fi repuse în coadă
+        worker.transport.fail = None
+        assert requeue_dead(session) == 2
+        session.commit()
+        assert worker.run_once() == 2
+        worker.shutdown()
+
+    def test_expired_claim_is_taken_over(self, session_factory, session):
+        """Testează preluarea email-urilor unui worker oprit, după expirarea termenului"""
+        NotificationService(db_session=session).send_email_notification("user0@usv.ro", "Subiect", "Mesaj")
+        session.commit()
+
+        first = EmailOutboxWorker(session_factory, MemoryEmailTransport(), lease=60)
+        second = EmailOutboxWorker(session_factory, MemoryEmailTransport(), lease=60)
+
+        # Primul worker preia email-ul și se oprește înainte de trimitere
+        assert len(first.claim(10)) == 1
+        assert second.run_once() == 0
+
+        email = session.query(EmailOutbox).one()
+        assert email.status == OUTBOX_SENDING
+        email.locked_until = datetime.utcnow() - timedelta(seconds=1)
+        session.commit()
+
+        assert second.run_once() == 1
+        session.expire_all()
+        assert (email.status, email.attempts) == (OUTBOX_SENT, 2)
+        first.shutdown()
+        second.shutdown()
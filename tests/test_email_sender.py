@@ -0,0 +1,143 @@
+import json
+import time
+from src.common.services import BatchingEmailSender, EmailDeliveryError, MemoryEmailTransport, SendGridTransport
+from src.common.services.email_sender import OutgoingEmail, SENDGRID_API_URL
+from src.common.utils import TokenBucket
+
+def outgoing(count, subject="Termen propuneri", start=1):
+    return [OutgoingEmail(start + index, f"user{start + index}@usv.ro", subject, "Mesaj", 1) for index in range(count)]
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None, text=""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+class FakeHttpSession:
+    """Sesiune HTTP care înregistrează cererile și răspunde cu statusurile date"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def post(self, url, json=None, headers=None, timeout=None):
+        self.requests.append((url, json, headers))
+        return self.responses.pop(0) if self.responses else FakeResponse(202)
+
+def sendgrid_error(field, message):
+    """Corpul unui răspuns de eroare SendGrid"""
+    return json.dumps({'errors': [{'field': field, 'message': message, 'help': None}]})
+
+class TestBatchingEmailSender:
+    """Teste pentru trimiterea în loturi și limitarea ratei cererilor"""
+
+    def test_groups_identical_emails(self):
+        """Testează gruparea email-urilor identice în loturi de cel mult max_batch"""
+        sender = BatchingEmailSender(MemoryEmailTransport(), max_batch=3)
+        emails = outgoing(7) + outgoing(2, subject="Planificare aprobată", start=8)
+
+        batches = sender.batches(emails[:4] + emails[7:] + emails[4:7])
+        assert [[email.id for email in batch] for batch in batches] == [[1, 2, 3], [4, 5, 6], [7], [8, 9]]
+
+    def test_sendgrid_personalizations(self):
+        """Testează cererea SendGrid: un singur mesaj, câte o personalizare per destinatar"""
+        http_session = FakeHttpSession()
+        transport = SendGridTransport("cheie", "planificare@fiesc.usv.ro", "Planificare", http_session=http_session)
+        sender = BatchingEmailSender(transport)
+
+        results = sender.send_batch(outgoing(3))
+
+        assert [error for _, error, _ in results] == [None, None, None]
+        (url, payload, headers), = http_session.requests
+        assert url == SENDGRID_API_URL and headers['Authorization'] == "Bearer cheie"
+        assert payload['personalizations'] == [{'to': [{'email': f"user{index}@usv.ro"}]} for index in (1, 2, 3)]
+        assert payload['subject'] == "Termen propuneri" and payload['from'] == {'email': "planificare@fiesc.usv.ro", 'name': "Planificare"}
+        assert sender.snapshot()['requests'] == 1 and sender.snapshot()['sent'] == 3
+
+    def test_rate_limit_and_retry_after(self):
+        """Testează respectarea ratei, amânarea după 429 și contorizarea erorilor"""
+        http_session = FakeHttpSession(FakeResponse(429, {'Retry-After': '1'}), FakeResponse(400, text="adresă invalidă"))
+        transport = SendGridTransport("cheie", "planificare@fiesc.usv.ro", http_session=http_session)
+        sender = BatchingEmailSender(transport, rate_limiter=TokenBucket(rate=20, capacity=1))
+
+        throttled = sender.send_batch(outgoing(2))
+        assert {(error, permanent) for _, error, permanent in throttled} == {("SendGrid 429: limită de cereri depășită", False)}
+
+        # Cererea următoare așteaptă durata din Retry-After
+        started_at = time.monotonic()
+        rejected = sender.send_batch(outgoing(1))
+        assert time.monotonic() - started_at >= 0.9
+        assert rejected[0][2] is True
+
+        # Rata de 20 de cereri pe secundă: 5 cereri durează cel puțin 0.2 secunde
+        started_at = time.monotonic()
+        for _ in range(5):
+            sender.send_batch(outgoing(1))
+        assert time.monotonic() - started_at >= 0.19
+
+        counters = sender.snapshot()
+        assert (counters['requests'], counters['sent'], counters['failed']) == (7, 5, 3)
+        assert counters['request_time']['count'] == 7
+
+    def test_memory_transport_reports_rejected_recipients(self):
+        """Testează că transportul local respinge doar destinatarii indicați"""
+        def fail(email):
+            if email.to_email == "user2@usv.ro":
+                raise EmailDeliveryError("respins", permanent=True)
+
+        transport = MemoryEmailTransport(fail=fail)
+        results = BatchingEmailSender(transport).send_batch(outgoing(3))
+
+        assert [(email.id, error) for email, error, _ in results] == [(1, None), (2, "respins"), (3, None)]
+        assert [email.id for email in transport.sent] == [1, 3] and len(transport.batches) == 1
+
+    def test_rejected_batch_is_split(self):
+        """Testează împărțirea unui lot respins, ca doar adresa invalidă să eșueze definitiv"""
+        class RejectingHttpSession(FakeHttpSession):
+            def post(self, url, json=None, headers=None, timeout=None):
+                self.requests.append((url, json, headers))
+                recipients = [item['to'][0]['email'] for item in json['personalizations']]
+                if "user3@usv.ro" not in recipients:
+                    return FakeResponse(202)
+                field = f"personalizations.{recipients.index('user3@usv.ro')}.to.0.email"
+                return FakeResponse(400, text=sendgrid_error(field, "Does not contain a valid address."))
+
+        http_session = RejectingHttpSession()
+        transport = SendGridTransport("cheie", "planificare@fiesc.usv.ro", http_session=http_session)
+        sender = BatchingEmailSender(transport)
+
+        results = sender.send_batch(outgoing(4))
+
+        assert [(email.id, error is None, permanent) for email, error, permanent in results] == [
+            (1, True, False), (2, True, False), (3, False, True), (4, True, False)
+        ]
+        # 4 destinatari -> [1, 2] [3, 4] -> [3] [4]
+        assert len(http_session.requests) == 5
+        assert (sender.snapshot()['sent'], sender.snapshot()['failed']) == (3, 1)
+
+    def test_payload_errors_are_not_split(self):
+        """Testează că o eroare a cererii (expeditor neverificat) respinge lotul dintr-o singură cerere"""
+        body = sendgrid_error("from", "The from address does not match a verified Sender Identity.")
+        http_session = FakeHttpSession(FakeResponse(400, text=body), FakeResponse(413, text="Payload too large"))
+        transport = SendGridTransport("cheie", "planificare@fiesc.usv.ro", http_session=http_session)
+        sender = BatchingEmailSender(transport)
+
+        for _ in range(2):
+            results = sender.send_batch(outgoing(8))
+            assert [permanent for _, _, permanent in results] == [True] * 8
+        assert len(http_session.requests) == 2
+        assert (sender.snapshot()['sent'], sender.snapshot()['failed']) == (0, 16)
+
+    def test_authorization_errors_are_retried(self):
+        """Testează că 401/403 (cheie API invalidă) nu sunt erori permanente"""
+        http_session = FakeHttpSession(FakeResponse(401), FakeResponse(403))
+        transport = SendGridTransport("cheie", "planificare@fiesc.usv.ro", http_session=http_session)
+        sender = BatchingEmailSender(transport)
+
+        for _ in range(2):
+            results = sender.send_batch(outgoing(2))
+            assert [permanent for _, _, permanent in results] == [False, False]
+        assert len(http_session.requests) == 2
@@ -0,0 +1,86 @@
+import io
+import os
+import random
+import tracemalloc
+import pytest
+from datetime import date, time, timedelta
+from openpyxl import load_workbook
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.services import ExportService, ExportCache, rebuild_listings
+from src.common.services.export_service import EXCEL_COLUMNS
+
+class TestExcelExport:
+    """Teste pentru exportul Excel (ExportService._write_excel și cached_export)"""
+
+    @pytest.fixture
+    def make_session(self, tmp_path):
+        """Creează baze SQLite cu un număr dat de planificări"""
+        engines = []
+
+        def _make_session(count):
+            engine = create_engine(f"sqlite:///{tmp_path / f'export_{count}.db'}")
+            engines.append(engine)
+            Base.metadata.create_all(engine)
+            session = sessionmaker(bind=engine)()
+
+            session.add_all([Subject(name=f"Disciplina {i}", short_name=f"D{i}", credits=5, semester=2) for i in range(20)])
+            session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(20)])
+            session.add_all([Room(name=f"C{i}", short_name=f"C{i}", capacity=40, building="C", floor=2) for i in range(5)])
+            session.add_all([Group(name=f"G{i}", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(20)])
+            session.commit()
+
+            rng = random.Random(count)
+            session.execute(insert(Schedule), [
+                {'subject_id': rng.randint(1, 20), 'teacher_id': rng.randint(1, 20), 'group_id': rng.randint(1, 20),
+                 'room_id': rng.randint(1, 5), 'date': date(2025, 6, 2) + timedelta(days=index % 20),
+                 'start_time': time(8 + index % 8, 0), 'end_time': time(10 + index % 8, 0), 'status': 'approved'}
+                for index in range(count)
+            ])
+            rebuild_listings(session)
+            session.commit()
+            return session
+
+        yield _make_session
+        for engine in engines:
+            engine.dispose()
+
+    def test_export_contains_all_rows(self, make_session, tmp_path):
+        """Testează conținutul fișierului exportat și servirea lui din cache"""
+        session = make_session(250)
+        service = ExportService(db_session=session, cache=ExportCache(str(tmp_path / 'exports')))
+        key = service.export_key('xlsx', group_id=3)
+
+        with service.cached_export('xlsx', key, group_id=3) as export_file:
+            content = export_file.read()
+
+        rows = list(load_workbook(io.BytesIO(content), read_only=True)['Planificare Examene'].values)
+        expected = session.query(Schedule).filter(Schedule.group_id == 3).count()
+
+        assert rows[0] == EXCEL_COLUMNS
+        assert len(rows) == expected + 1
+        assert rows[1][3].startswith("Prenume") and rows[1][9] == 'approved'
+        assert service.export_to_excel(group_id=3)[:2] == b"PK"
+        session.close()
+
+    def test_memory_does_not_grow_with_rows(self, make_session, tmp_path):
+        """Testează că memoria de vârf este aproape aceeași pentru 1 000 și 5 000 de planificări"""
+        peaks = []
+
+        for count in (1000, 5000):
+            session = make_session(count)
+            service = ExportService(db_session=session)
+            path = str(tmp_path / f'export_{count}.xlsx')
+
+            tracemalloc.start()
+            written = service._write_excel(path, service._listings_statement())
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+            assert written == count and os.path.getsize(path) > 0
+            session.close()
+
+        # Un export care ține toate rândurile în memorie ar crește de ~5 ori
+        assert peaks[1] < peaks[0] * 2
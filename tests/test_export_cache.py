@@ -0,0 +1,183 @@
+import io
+import os
+import pytest
+from datetime import date, time
+from openpyxl import load_workbook
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule, User
+from src.common.services import ExportService, ExportCache, ProposalItem, ScheduleService, RoomAvailabilityIndex, data_version
+from src.flask_app.utils import db as flask_db
+from src.flask_app.routes import export as export_routes
+
+class TestExportCache:
+    """Teste pentru cache-ul de exporturi și versiunea datelor planificărilor"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Bază SQLite cu 2 grupe și 4 planificări"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add_all([Subject(name=f"Disciplina {i}", short_name=f"D{i}", credits=5, semester=2) for i in range(2)])
+        session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(2)])
+        session.add(Room(name="C201", short_name="C201", capacity=40, building="C", floor=2))
+        session.add_all([Group(name=f"321{i}A", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(2)])
+        session.flush()
+
+        for index in range(4):
+            session.add(Schedule(subject_id=index % 2 + 1, teacher_id=index % 2 + 1, group_id=index % 2 + 1, room_id=1,
+                                 date=date(2025, 6, 10 + index), start_time=time(8, 0), end_time=time(10, 0),
+                                 status='approved'))
+        session.commit()
+        session.close()
+
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def session(self, engine):
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def test_version_changes_on_schedule_writes(self, session):
+        """Testează incrementarea versiunii la scrieri pe planificări și pe entitățile referite"""
+        service = ScheduleService(db_session=session, availability_index=RoomAvailabilityIndex(ttl=3600))
+        versions = [data_version(session)]
+
+        session.get(Schedule, 1).start_time = time(9, 0)
+        session.commit()
+        versions.append(data_version(session))
+
+        session.get(Teacher, 2).last_name = "Popescu"
+        session.commit()
+        versions.append(data_version(session))
+
+        service.propose_schedules([ProposalItem(1, 1, 1, date(2025, 6, 20))])
+        versions.append(data_version(session))
+
+        assert service.delete_schedule(2)
+        versions.append(data_version(session))
+
+        # Citirile și scrierile fără legătură cu planificările nu schimbă versiunea
+        session.get(Room, 1).capacity = 50
+        session.commit()
+        versions.append(data_version(session))
+
+        assert versions[0] > 0
+        assert versions[:5] == sorted(set(versions[:5]))
+        assert versions[5] == versions[4]
+
+    def test_repeat_export_is_served_from_cache(self, engine, session, tmp_path):
+        """Testează că un export repetat nu mai citește baza de date și că o scriere schimbă cheia"""
+        export_service = ExportService(db_session=session, cache=ExportCache(str(tmp_path / 'exports')))
+
+        key = export_service.export_key('xlsx', group_id=1)
+        assert key == export_service.export_key('xlsx', group_id=1)
+        assert key != export_service.export_key('xlsx', group_id=2)
+        assert key != export_service.export_key('pdf', group_id=1)
+
+        with export_service.cached_export('xlsx', key, group_id=1) as generated:
+            content = generated.read()
+
+        rows = list(load_workbook(io.BytesIO(content), read_only=True)['Planificare Examene'].values)
+        assert [row[0] for row in rows[1:]] == [1, 3]
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        with export_service.cached_export('xlsx', key, group_id=1) as cached:
+            assert cached.read() == content
+        assert statements == []
+
+        session.get(Schedule, 3).status = 'rejected'
+        session.commit()
+        assert export_service.export_key('xlsx', group_id=1) != key
+
+        snapshot = export_service.cache.snapshot()
+        assert (snapshot['files'], snapshot['hits'], snapshot['misses']) == (1, 1, 1)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Testează evacuarea fișierelor folosite cel mai demult la depășirea dimensiunii"""
+        cache = ExportCache(str(tmp_path / 'exports'), max_bytes=250)
+
+        def write(path):
+            with open(path, 'wb') as f:
+                f.write(b"x" * 100)
+
+        for index, key in enumerate(('a' * 64, 'b' * 64)):
+            cache.store(key, write).close()
+            os.utime(os.path.join(cache.directory, key + '.export'), (1000 + index, 1000 + index))
+
+        # Citirea lui "a" îl face cel mai recent folosit
+        cache.open('a' * 64).close()
+        cache.store('c' * 64, write).close()
+
+        assert cache.open('b' * 64) is None
+        kept = cache.open('a' * 64)
+        assert kept is not None
+        kept.close()
+        assert cache.snapshot()['evictions'] == 1
+        assert not [name for name in os.listdir(cache.directory) if name.endswith('.tmp')]
+
+class TestExportRoutes:
+    """Teste pentru servirea exporturilor din cache cu ETag"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        database_url = f"sqlite:///{tmp_path / 'routes.db'}"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        user = User(first_name="Ana", last_name="Popescu", email="sec@usv.ro", role='SEC')
+        user.password = "parola"
+        session.add(user)
+        session.add(Subject(name="Baze de date", short_name="BD", credits=5, semester=2))
+        session.add(Teacher(first_name="Ion", last_name="Ionescu", department="Calculatoare", email="ion@usv.ro"))
+        session.add(Group(name="3211A", study_year=3, specialization="Calculatoare", number_of_students=25))
+        session.flush()
+        session.add(Schedule(subject_id=1, teacher_id=1, group_id=1, date=date(2025, 6, 10), status='approved'))
+        session.commit()
+
+        monkeypatch.setattr(export_routes, 'ExportService',
+                            lambda db_session: ExportService(db_session=db_session, cache=ExportCache(str(tmp_path / 'exports'))))
+
+        app = Flask(__name__)
+        app.config.update(TESTING=True, DATABASE_URL=database_url, JWT_SECRET_KEY='cheie-de-test-' * 3)
+        flask_db.init_db(app)
+        JWTManager(app)
+        app.register_blueprint(export_routes.export_bp, url_prefix='/api/export')
+
+        with app.app_context():
+            token = create_access_token(identity=str(user.id))
+
+        yield app.test_client(), {'Authorization': f'Bearer {token}'}, session
+
+        session.close()
+        flask_db.dispose_engines()
+        engine.dispose()
+
+    def test_etag_and_not_modified(self, client):
+        """Testează ETag-ul, răspunsul 304 și schimbarea ETag-ului după o scriere"""
+        test_client, headers, session = client
+
+        first = test_client.get('/api/export/excel?group_id=1', headers=headers)
+        assert first.status_code == 200
+        etag = first.headers['ETag']
+        assert 'no-cache' in first.headers['Cache-Control']
+
+        repeat = test_client.get('/api/export/excel?group_id=1', headers={**headers, 'If-None-Match': etag})
+        assert repeat.status_code == 304 and repeat.data == b""
+
+        session.get(Schedule, 1).status = 'rejected'
+        session.commit()
+
+        changed = test_client.get('/api/export/excel?group_id=1', headers={**headers, 'If-None-Match': etag})
+        assert changed.status_code == 200
+        assert changed.headers['ETag'] != etag
@@ -0,0 +1,232 @@
+import io
+import os
+import threading
+import time as timer
+import pytest
+from datetime import date, datetime, time, timedelta
+from openpyxl import load_workbook
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+from src.common.models import Base, ExportJob, Group, Room, Subject, Teacher, Schedule, User
+from src.common.services import ExportCache, PdfRendererPool
+from src.common.services.export_jobs import ExportJobService, JOB_FAILED, JOB_QUEUED, JOB_SUCCEEDED
+from src.common.utils import BoundedExecutor, ExecutorSaturatedError
+from src.flask_app.utils import db as flask_db
+from src.flask_app.routes import export as export_routes
+
+class BlockingRenderer:
+    """Renderer de test care așteaptă un semnal înainte de a întoarce PDF-ul"""
+
+    def __init__(self, release: threading.Event):
+        self.release = release
+
+    def render(self, html):
+        self.release.wait(5)
+        return b"%PDF-1.4 test"
+
+def wait_for(service, job_id):
+    """Așteaptă terminarea unei sarcini (cu altă sesiune decât cea a workerului)"""
+    deadline = timer.monotonic() + 5
+    while timer.monotonic() < deadline:
+        service.db_session.expire_all()
+        job = service.get_job(job_id)
+        if job.status in (JOB_SUCCEEDED, JOB_FAILED):
+            return job
+        timer.sleep(0.01)
+    raise AssertionError(f"Sarcina {job_id} nu s-a terminat")
+
+class TestExportJobs:
+    """Teste pentru sarcinile de export asincron"""
+
+    @pytest.fixture
+    def session_factory(self, tmp_path):
+        """Bază SQLite cu 2 grupe și 4 planificări"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add_all([Subject(name=f"Disciplina {i}", short_name=f"D{i}", credits=5, semester=2) for i in range(2)])
+        session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(2)])
+        session.add(Room(name="C201", short_name="C201", capacity=40, building="C", floor=2))
+        session.add_all([Group(name=f"321{i}A", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(2)])
+        session.flush()
+
+        for index in range(4):
+            session.add(Schedule(subject_id=index % 2 + 1, teacher_id=index % 2 + 1, group_id=index % 2 + 1, room_id=1,
+                                 date=date(2025, 6, 10 + index), start_time=time(8, 0), end_time=time(10, 0),
+                                 status='approved'))
+        session.commit()
+        session.close()
+
+        yield sessionmaker(bind=engine)
+        engine.dispose()
+
+    @pytest.fixture
+    def make_service(self, session_factory, tmp_path):
+        sessions, executors = [], []
+
+        def _make_service(max_workers=1, max_queue=5, pdf_renderer=None):
+            session = session_factory()
+            executor = BoundedExecutor('export-test', max_workers, max_queue)
+            sessions.append(session)
+            executors.append(executor)
+            return ExportJobService(
+                db_session=session, session_factory=session_factory, executor=executor,
+                directory=str(tmp_path / 'jobs'), cache=ExportCache(str(tmp_path / 'cache')), pdf_renderer=pdf_renderer
+            )
+
+        yield _make_service
+        for executor in executors:
+            executor.shutdown()
+        for session in sessions:
+            session.close()
+
+    def test_job_runs_in_background_and_is_downloadable(self, make_service):
+        """Testează generarea în fundal, starea sarcinii și fișierul descărcat"""
+        service = make_service()
+
+        job, created = service.submit('xlsx', group_id=2, requested_by=None)
+        assert created and job.status == JOB_QUEUED
+
+        job = wait_for(service, job.id)
+
+        assert job.status == JOB_SUCCEEDED and job.size > 0
+        assert job.expires_at > job.finished_at >= job.started_at
+
+        with service.open_artifact(job) as artifact:
+            rows = list(load_workbook(io.BytesIO(artifact.read()), read_only=True)['Planificare Examene'].values)
+        assert [row[0] for row in rows[1:]] == [2, 4]
+
+    def test_identical_jobs_are_deduplicated(self, make_service):
+        """Testează refolosirea unei sarcini identice în curs și a uneia terminate"""
+        release = threading.Event()
+        pool = PdfRendererPool(max_workers=1, max_queue=1, renderer_factory=lambda: BlockingRenderer(release))
+        service = make_service(pdf_renderer=pool)
+
+        first, created = service.submit('pdf', teacher_id=1)
+        second, second_created = service.submit('pdf', teacher_id=1)
+        other, other_created = service.submit('pdf', teacher_id=2)
+
+        assert created and not second_created and other_created
+        assert second.id == first.id and other.id != first.id
+
+        release.set()
+        wait_for(service, first.id)
+        wait_for(service, other.id)
+        pool.shutdown()
+
+        # Sarcina terminată și neexpirată este refolosită
+        again, again_created = service.submit('pdf', teacher_id=1)
+        assert not again_created and again.id == first.id and again.status == JOB_SUCCEEDED
+
+        # După o modificare a planificărilor, cererea primește o sarcină nouă
+        service.db_session.get(Schedule, 1).status = 'rejected'
+        service.db_session.commit()
+        _, changed_created = service.submit('pdf', teacher_id=1)
+        assert changed_created
+
+    def test_rejected_job_is_not_reused(self, make_service):
+        """Testează că o sarcină respinsă de pool-ul plin este marcată ca eșuată"""
+        release = threading.Event()
+        pool = PdfRendererPool(max_workers=1, max_queue=1, renderer_factory=lambda: BlockingRenderer(release))
+        service = make_service(max_workers=1, max_queue=0, pdf_renderer=pool)
+
+        service.submit('pdf', group_id=1)
+        with pytest.raises(ExecutorSaturatedError):
+            service.submit('pdf', group_id=2)
+
+        rejected = service.db_session.query(ExportJob).filter(ExportJob.group_id == 2).one()
+        assert rejected.status == JOB_FAILED
+
+        release.set()
+        service.executor.shutdown(wait=True)
+        pool.shutdown()
+
+    def test_retention_purges_expired_artifacts(self, make_service):
+        """Testează ștergerea sarcinilor expirate și a fișierelor lor"""
+        service = make_service()
+        job, _ = service.submit('xlsx')
+        job = wait_for(service, job.id)
+
+        job_id = job.id
+        path = os.path.join(service.directory, f"{job_id}.xlsx")
+        assert os.path.exists(path)
+
+        stale = ExportJob(id='0' * 32, format='xlsx', cache_key='0' * 64, status='running',
+                          created_at=datetime.utcnow() - timedelta(days=1))
+        service.db_session.add(stale)
+        job.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        service.db_session.commit()
+
+        assert service.purge_expired() == 1
+        assert not os.path.exists(path)
+        assert service.get_job(job_id) is None
+        assert service.get_job('0' * 32).status == JOB_FAILED
+
+class TestExportJobRoutes:
+    """Teste pentru endpoint-urile sarcinilor de export"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        database_url = f"sqlite:///{tmp_path / 'routes.db'}"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        for role in ('SEC', 'CD'):
+            user = User(first_name="Ana", last_name=role, email=f"{role.lower()}@usv.ro", role=role)
+            user.password = "parola"
+            session.add(user)
+        session.add(Subject(name="Baze de date", short_name="BD", credits=5, semester=2))
+        session.add(Teacher(first_name="Ion", last_name="Ionescu", department="Calculatoare", email="ion@usv.ro"))
+        session.add(Group(name="3211A", study_year=3, specialization="Calculatoare", number_of_students=25))
+        session.flush()
+        session.add(Schedule(subject_id=1, teacher_id=1, group_id=1, date=date(2025, 6, 10), status='approved'))
+        session.commit()
+
+        executor = BoundedExecutor('export-test', 1, 5)
+        original = export_routes.ExportJobService
+        monkeypatch.setattr(export_routes, 'ExportJobService', lambda **kwargs: original(
+            executor=executor, directory=str(tmp_path / 'jobs'), cache=ExportCache(str(tmp_path / 'cache')), **kwargs))
+
+        app = Flask(__name__)
+        app.config.update(TESTING=True, DATABASE_URL=database_url, JWT_SECRET_KEY='cheie-de-test-' * 3)
+        flask_db.init_db(app)
+        JWTManager(app)
+        app.register_blueprint(export_routes.export_bp, url_prefix='/api/export')
+
+        with app.app_context():
+            tokens = {role: create_access_token(identity=str(user_id)) for user_id, role in session.query(User.id, User.role)}
+
+        yield app.test_client(), {role: {'Authorization': f'Bearer {token}'} for role, token in tokens.items()}, executor
+
+        executor.shutdown()
+        session.close()
+        flask_db.dispose_engines()
+        engine.dispose()
+
+    def test_submit_poll_download(self, client):
+        """Testează fluxul complet: creare (202), stare, descărcare"""
+        test_client, headers, executor = client
+
+        assert test_client.post('/api/export/jobs', json={'format': 'xlsx'}, headers=headers['CD']).status_code == 403
+        assert test_client.post('/api/export/jobs', json={'format': 'csv'}, headers=headers['SEC']).status_code == 400
+
+        submitted = test_client.post('/api/export/jobs', json={'format': 'xlsx', 'groupId': 1}, headers=headers['SEC'])
+        assert submitted.status_code == 202
+        status_url = submitted.headers['Location']
+        assert submitted.get_json()['download_url'] is None
+
+        executor.shutdown(wait=True)
+
+        status = test_client.get(status_url, headers=headers['SEC']).get_json()
+        assert status['status'] == JOB_SUCCEEDED
+
+        download = test_client.get(status['download_url'], headers=headers['SEC'])
+        assert download.status_code == 200
+        assert download.data[:2] == b"PK"
+
+        assert test_client.get('/api/export/jobs/inexistent', headers=headers['SEC']).status_code == 404
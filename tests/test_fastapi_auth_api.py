@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 
 from fastapi_app.main import app
 from fastapi_app.dependencies import get_db_session, get_current_user
-from common.models.user import User
+from src.common.models.user import User
 
 class TestFastAPIAuthAPI:
     """Teste pentru API-ul de autentificare FastAPI"""
@@ -7,7 +7,7 @@ from unittest.mock import patch
 from flask import Flask
 from flask_jwt_extended import JWTManager
 
-from common.models.user import User
+from src.common.models.user import User
 from flask_app.routes.auth import auth_bp
 
 class TestFlaskAuthAPI:
@@ -0,0 +1,68 @@
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from src.flask_app.utils import db as flask_db
+
+class TestFlaskDatabasePool:
+    """Teste pentru registrul de engine-uri al aplicației Flask"""
+
+    @pytest.fixture
+    def make_app(self, tmp_path):
+        """Creează aplicații Flask care folosesc aceeași bază de date SQLite"""
+        database_url = f"sqlite:///{tmp_path / 'pool.db'}"
+
+        def _make_app():
+            app = Flask(__name__)
+            app.config['TESTING'] = True
+            app.config['DATABASE_URL'] = database_url
+            app.config['DB_POOL_SIZE'] = 2
+            app.config['DB_MAX_OVERFLOW'] = 1
+            flask_db.init_db(app)
+
+            @app.route('/ping')
+            def ping():
+                db_session = flask_db.get_db_session()
+                value = db_session.execute(text("SELECT 1")).scalar()
+                return {"value": value, "session": id(db_session)}
+
+            return app
+
+        yield _make_app
+        flask_db.dispose_engines()
+
+    def test_engine_is_shared_per_process(self, make_app):
+        """Testează că engine-ul este creat o singură dată per bază de date"""
+        app1 = make_app()
+        app2 = make_app()
+
+        assert flask_db.get_engine(app1) is flask_db.get_engine(app2)
+
+    def test_session_is_checked_out_per_request(self, make_app):
+        """Testează că fiecare cerere primește propria sesiune, pe același engine"""
+        app = make_app()
+        client = app.test_client()
+
+        first = client.get('/ping').get_json()
+        second = client.get('/ping').get_json()
+
+        assert first["value"] == 1
+        assert second["value"] == 1
+
+        # Conexiunea a revenit în pool după teardown
+        status = flask_db.get_pool_status(app)
+        assert status["checked_out"] == 0
+        assert status["checked_in"] == 1
+
+    def test_pool_status_reports_counters(self, make_app):
+        """Testează raportarea stării pool-ului"""
+        app = make_app()
+
+        with app.app_context():
+            db_session = flask_db.get_db_session()
+            db_session.execute(text("SELECT 1"))
+
+            status = flask_db.get_pool_status()
+            assert status["pool_size"] == 2
+            assert status["checked_out"] == 1
+            assert status["overflow"] == -1
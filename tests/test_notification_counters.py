@@ -0,0 +1,131 @@
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+from src.common.models import Base, Notification, NotificationCounter, User
+from src.common.services import NotificationService, UnreadCountCache, unread_count_cache
+from src.flask_app.utils import db as flask_db
+from src.flask_app.routes.notification import notification_bp
+
+def counters(session):
+    """Contoarele salvate și numărul real de notificări necitite, per utilizator"""
+    session.expire_all()
+    stored = {row.user_id: row.unread for row in session.query(NotificationCounter) if row.unread}
+    actual = dict(session.execute(
+        select(Notification.user_id, func.count()).where(Notification.read.is_(None)).group_by(Notification.user_id)
+    ).all())
+    return stored, actual
+
+@pytest.fixture
+def engine(tmp_path):
+    """Bază SQLite cu 2 șefi de grupă și un cadru didactic"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'counters.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    for index, role in enumerate(('SG', 'SG', 'CD')):
+        user = User(first_name="Ana", last_name=f"Nume{index}", email=f"user{index}@usv.ro", role=role)
+        user.password = "parola"
+        session.add(user)
+    session.commit()
+    session.close()
+
+    unread_count_cache.invalidate()
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+class TestNotificationCounters:
+    """Teste pentru contoarele notificărilor necitite"""
+
+    def test_counters_follow_writes(self, session):
+        """Testează actualizarea contoarelor la creare, fan-out, citire și ștergere"""
+        service = NotificationService(db_session=session)
+
+        service.create_notification(3, "Planificare aprobată")
+        service.notify_group_leaders("Termen propuneri")
+        service.send_notification("Anunț", "Sesiune", 'info', recipients=[1, 3])
+        stored, actual = counters(session)
+        assert stored == actual == {1: 2, 2: 1, 3: 2}
+
+        # A doua marcare a aceleiași notificări nu mai scade contorul
+        notification_id = session.query(Notification.id).filter(Notification.user_id == 1).first()[0]
+        assert service.mark_notification_as_read(notification_id, user_id=1) is not None
+        assert service.mark_notification_as_read(notification_id, user_id=1) is not None
+        assert service.mark_notification_as_read(notification_id, user_id=2) is None
+        assert service.mark_all_notifications_as_read(3) == 2
+        stored, actual = counters(session)
+        assert stored == actual == {1: 1, 2: 1}
+
+        # Modificările făcute direct prin sesiune sunt numărate la flush
+        unread = session.query(Notification).filter(Notification.user_id == 2).one()
+        session.delete(unread)
+        session.add(Notification(user_id=3, title="Nouă", message="Mesaj", type='info'))
+        session.commit()
+        read = session.query(Notification).filter(Notification.user_id == 3, Notification.read.isnot(None)).first()
+        read.read = None
+        session.commit()
+        stored, actual = counters(session)
+        assert stored == actual == {1: 1, 3: 2}
+
+    def test_count_served_from_cache(self, engine, session):
+        """Testează citirea contorului fără interogări și invalidarea după commit"""
+        service = NotificationService(db_session=session)
+        service.create_notification(1, "Planificare aprobată")
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        assert service.get_unread_count(1) == 1
+        assert len(statements) == 1 and 'notifications ' not in statements[0]
+        assert service.get_unread_count(1) == 1
+        assert len(statements) == 1
+
+        service.mark_all_notifications_as_read(1)
+        assert service.get_unread_count(1) == 0
+        assert unread_count_cache.snapshot()['hits'] == 1
+
+        # Un rollback nu invalidează contorul
+        service.create_notification(1, "Nouă")
+        assert service.get_unread_count(1) == 1
+        session.add(Notification(user_id=1, title="Anulată", message="Mesaj", type='info'))
+        session.flush()
+        session.rollback()
+        assert unread_count_cache.get(1) == 1
+
+    def test_stale_read_is_not_cached(self):
+        """Testează că o valoare citită înaintea unei invalidări nu ajunge în cache"""
+        cache = UnreadCountCache(max_entries=2)
+        generation = cache.generation
+        cache.invalidate([1])
+        cache.put(1, 5, generation)
+        assert cache.get(1) is None
+
+        for user_id in (1, 2, 3):
+            cache.put(user_id, user_id, cache.generation)
+        assert (cache.get(1), cache.get(3)) == (None, 3)
+
+    def test_unread_count_endpoint(self, tmp_path, engine, session, monkeypatch):
+        """Testează endpoint-ul Flask pentru badge-ul de notificări"""
+        NotificationService(db_session=session).notify_group_leaders("Termen propuneri")
+
+        app = Flask(__name__)
+        app.config.update(TESTING=True, DATABASE_URL=str(engine.url), JWT_SECRET_KEY='cheie-de-test-' * 3)
+        flask_db.init_db(app)
+        JWTManager(app)
+        app.register_blueprint(notification_bp, url_prefix='/api/notifications')
+
+        with app.app_context():
+            headers = {'Authorization': f"Bearer {create_access_token(identity='2')}"}
+
+        client = app.test_client()
+        assert client.get('/api/notifications/unread-count').status_code == 401
+        assert client.get('/api/notifications/unread-count', headers=headers).get_json() == {"unread": 1}
+        flask_db.dispose_engines()
@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, EmailOutbox, Notification, User
+from src.common.services import NotificationService
+
+class TestNotificationFanOut:
+    """Teste pentru trimiterea notificărilor către mai mulți utilizatori"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Bază SQLite cu 50 de șefi de grupă, 2 cadre didactice și un secretar"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'fan_out.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        roles = ['SG'] * 50 + ['CD', 'CD', 'SEC']
+        session.add_all([User(first_name="Ana", last_name=f"Nume{index}", email=f"user{index}@usv.ro", role=role)
+                         for index, role in enumerate(roles)])
+        session.commit()
+        session.close()
+
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def session(self, engine):
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def test_broadcast_is_one_statement_per_table(self, engine, session):
+        """Testează că notificările, contoarele și email-urile sunt inserate fără încărcarea utilizatorilor"""
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        assert NotificationService(db_session=session).notify_group_leaders("Termen propuneri") == 50
+
+        assert len(statements) == 3
+        assert all(statement.lstrip().upper().startswith("INSERT") for statement in statements)
+        assert session.query(Notification).filter(Notification.type == 'info', Notification.read.is_(None)).count() == 50
+        assert session.query(EmailOutbox).filter(EmailOutbox.to_email.like("user%@usv.ro")).count() == 50
+
+    def test_send_notification_to_recipients_and_role(self, session):
+        """Testează selecția destinatarilor după ID-uri și/sau rol, cu email opțional"""
+        service = NotificationService(db_session=session)
+
+        count = service.send_notification("Anunț", "Sesiune", "system", recipients=[1, 53], role='CD', send_email=False)
+        assert count == 4
+        assert sorted(user_id for (user_id,) in session.query(Notification.user_id)) == [1, 51, 52, 53]
+        assert session.query(EmailOutbox).count() == 0
+
+        assert service.send_notification("Anunț", "Sesiune", "system", role='SEC', send_email=True) == 1
+        assert [email.to_email for email in session.query(EmailOutbox)] == ["user52@usv.ro"]
+
+        # Fără criterii de selecție nu este notificat nimeni
+        assert service.send_notification("Anunț", "Sesiune", "system") == 0
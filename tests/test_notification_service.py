@@ -2,9 +2,9 @@ import pytest
 from unittest.mock import MagicMock, patch
 from sqlalchemy.exc import SQLAlchemyError
 
-from common.services.notification_service import NotificationService
-from common.models.notification import Notification
-from common.models.user import User
+from src.common.services.notification_service import NotificationService
+from src.common.models.notification import Notification
+from src.common.models.user import User
 
 class TestNotificationService:
     """Teste pentru NotificationService"""
@@ -176,7 +176,7 @@ class TestNotificationService:
         assert updated_settings["schedule_notifications"] is False
         assert updated_settings["system_notifications"] is True
     
-    @patch("common.services.notification_service.NotificationService._send_email")
+    @patch("src.common.services.notification_service.NotificationService._send_email")
     def test_send_notification(self, mock_send_email, db_session, test_user, test_admin):
         """Testează trimiterea unei notificări"""
         # Inițializăm serviciul de notificări
@@ -237,7 +237,7 @@ class TestNotificationService:
             user = db_session.query(User).filter(User.id == notification.user_id).first()
             assert user.role == "SEC"
     
-    @patch("common.services.notification_service.NotificationService._send_email")
+    @patch("src.common.services.notification_service.NotificationService._send_email")
     def test_send_schedule_notification(self, mock_send_email, db_session, test_schedule):
         """Testează trimiterea unei notificări pentru planificare"""
         # Inițializăm serviciul de notificări
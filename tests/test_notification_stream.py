@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, User
+from src.common.services import NotificationService, MemoryNotificationBroker, BrokerFullError
+from fastapi_app.api.notification import notification_events
+
+@pytest.fixture
+def session(tmp_path):
+    """Bază SQLite cu 2 șefi de grupă și un cadru didactic"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'stream.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    for index, role in enumerate(('SG', 'SG', 'CD')):
+        user = User(first_name="Ana", last_name=f"Nume{index}", email=f"user{index}@usv.ro", role=role)
+        user.password = "parola"
+        session.add(user)
+    session.commit()
+
+    yield session
+    session.close()
+    engine.dispose()
+
+class TestNotificationBroker:
+    """Teste pentru distribuirea notificărilor către clienții conectați"""
+
+    @pytest.mark.asyncio
+    async def test_routes_by_user_and_role(self):
+        """Testează că fiecare client primește doar notificările destinate lui"""
+        broker = MemoryNotificationBroker()
+        leader, other_leader, teacher = broker.subscribe(1, 'SG'), broker.subscribe(2, 'SG'), broker.subscribe(3, 'CD')
+
+        assert broker.publish({'title': "Termen"}, roles=['SG']) == 2
+        assert broker.publish({'title': "Personală"}, user_ids=[3]) == 1
+
+        assert [event.data['title'] for event in await leader.get(0.1)] == ["Termen"]
+        assert [event.data['title'] for event in await other_leader.get(0.1)] == ["Termen"]
+        assert [event.data['title'] for event in await teacher.get(0.1)] == ["Personală"]
+
+        teacher.close()
+        assert broker.publish({'title': "După deconectare"}, user_ids=[3]) == 0
+        assert broker.snapshot() == {'clients': 2, 'published': 3, 'delivered': 3, 'overflowed': 0}
+
+    @pytest.mark.asyncio
+    async def test_publish_from_thread_wakes_client(self):
+        """Testează trezirea clientului de o publicare din alt fir de execuție"""
+        broker = MemoryNotificationBroker()
+        subscription = broker.subscribe(1)
+
+        timer = threading.Timer(0.05, broker.publish, args=({'title': "Nouă"},), kwargs={'user_ids': [1]})
+        timer.start()
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        events = await subscription.get(5)
+        assert [event.data['title'] for event in events] == ["Nouă"]
+        assert loop.time() - started_at < 1
+        timer.join()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_gets_resync(self):
+        """Testează că un client care nu citește nu blochează publicarea și primește 'resync'"""
+        broker = MemoryNotificationBroker(max_queue=3, max_clients=2)
+        slow, fast = broker.subscribe(1), broker.subscribe(2)
+
+        for index in range(5):
+            broker.publish({'index': index}, user_ids=[1, 2])
+            await fast.get(0)
+
+        events = await slow.get(0)
+        assert [event.event for event in events] == ['resync', 'notification']
+        assert events[1].data == {'index': 4}
+        assert broker.snapshot()['overflowed'] == 1
+
+        with pytest.raises(BrokerFullError):
+            broker.subscribe(3)
+
+class TestNotificationStream:
+    """Teste pentru publicarea notificărilor și fluxul Server-Sent Events"""
+
+    @pytest.mark.asyncio
+    async def test_service_publishes_after_commit(self, session):
+        """Testează publicarea notificărilor create de NotificationService"""
+        broker = MemoryNotificationBroker()
+        leader, teacher = broker.subscribe(1, 'SG'), broker.subscribe(3, 'CD')
+        service = NotificationService(db_session=session, broker=broker)
+
+        notification = service.create_notification(3, "Planificare aprobată", title="Planificare")
+        assert service.notify_group_leaders("Termen propuneri") == 2
+
+        (event,) = await teacher.get(0)
+        assert event.data == {'id': notification.id, 'title': "Planificare", 'message': "Planificare aprobată", 'type': 'info'}
+        assert [event.data['message'] for event in await leader.get(0)] == ["Termen propuneri"]
+
+    @pytest.mark.asyncio
+    async def test_event_stream(self):
+        """Testează formatul text/event-stream, heartbeat-ul și eliberarea abonamentului"""
+        broker = MemoryNotificationBroker()
+        stream = notification_events(broker.subscribe(1), heartbeat=0.05, retry_ms=3000)
+
+        assert await stream.__anext__() == "retry: 3000\n\n"
+        assert await stream.__anext__() == ": heartbeat\n\n"
+
+        broker.publish({'id': 7, 'title': "Sală schimbată"}, user_ids=[1])
+        assert await stream.__anext__() == 'id: 1\nevent: notification\ndata: {"id": 7, "title": "Sală schimbată"}\n\n'
+
+        # Deconectarea clientului închide generatorul și abonamentul
+        await stream.aclose()
+        assert broker.snapshot()['clients'] == 0
@@ -0,0 +1,116 @@
+import threading
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.services import ExportService, PdfRendererPool, PdfRenderTimeoutError
+from src.common.utils import ExecutorSaturatedError
+
+class RecordingRenderer:
+    """Renderer de test care reține documentele HTML primite"""
+
+    def __init__(self, release: threading.Event = None):
+        self.release = release
+        self.documents = []
+
+    def render(self, html):
+        if self.release is not None:
+            self.release.wait(5)
+        self.documents.append(html)
+        return b"%PDF-1.4 test"
+
+class TestPdfRendererPool:
+    """Teste pentru pool-ul de renderere PDF"""
+
+    def test_reuses_renderers_and_records_metrics(self):
+        """Testează că fiecare fir își refolosește renderer-ul și că timpii de randare sunt înregistrați"""
+        created = []
+        pool = PdfRendererPool(max_workers=2, max_queue=10, renderer_factory=lambda: created.append(RecordingRenderer()) or created[-1])
+
+        futures = [pool.submit(f"<p>{index}</p>") for index in range(8)]
+        assert [future.result(timeout=5) for future in futures] == [b"%PDF-1.4 test"] * 8
+
+        snapshot = pool.snapshot()
+        assert 1 <= snapshot['renderers'] == len(created) <= 2
+        assert sum(len(renderer.documents) for renderer in created) == 8
+        assert snapshot['completed'] == 8 and snapshot['queue_depth'] == 0
+        assert snapshot['run_time']['count'] == 8
+        pool.shutdown()
+
+    def test_rejects_and_times_out_under_load(self):
+        """Testează respingerea peste limita cozii și eliberarea locului după depășirea timpului"""
+        release = threading.Event()
+        pool = PdfRendererPool(max_workers=1, max_queue=1, renderer_factory=lambda: RecordingRenderer(release))
+
+        running = pool.submit("<p>1</p>")
+        with pytest.raises(PdfRenderTimeoutError):
+            pool.render("<p>2</p>", timeout=0.05)
+
+        # Randarea abandonată nu mai ocupă coada
+        assert pool.snapshot()['queue_depth'] == 0
+
+        queued = pool.submit("<p>3</p>")
+        with pytest.raises(ExecutorSaturatedError):
+            pool.submit("<p>4</p>")
+
+        release.set()
+        assert running.result(timeout=5) == queued.result(timeout=5) == b"%PDF-1.4 test"
+        assert pool.snapshot()['rejected'] == 1
+        pool.shutdown()
+
+class TestExportToPdf:
+    """Teste pentru exportul PDF prin pool-ul de renderere"""
+
+    @pytest.fixture
+    def session(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'pdf.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add_all([Subject(name="Programare <C++>", short_name="PC", credits=5, semester=2),
+                         Subject(name="Baze de date", short_name="BD", credits=5, semester=2)])
+        session.add(Teacher(first_name="Ana", last_name="Popescu & Ionescu", department="Calculatoare", email="ana@usv.ro"))
+        session.add(Room(name="C201", short_name="C201", capacity=40, building="C", floor=2))
+        session.add_all([Group(name="3211A", study_year=3, specialization="Calculatoare", number_of_students=25),
+                         Group(name="3212A", study_year=3, specialization="Calculatoare", number_of_students=25)])
+        session.flush()
+
+        for index in range(6):
+            session.add(Schedule(subject_id=index % 2 + 1, teacher_id=1, group_id=index % 2 + 1, room_id=1,
+                                 date=date(2025, 6, 10 + index), start_time=time(8, 0), end_time=time(10, 0),
+                                 status='approved'))
+        session.commit()
+
+        yield session
+        session.close()
+        engine.dispose()
+
+    def test_renders_escaped_html_in_pool(self, session):
+        """Testează documentul HTML trimis renderer-ului și rezultatul exportului"""
+        renderer = RecordingRenderer()
+        pool = PdfRendererPool(max_workers=1, max_queue=1, renderer_factory=lambda: renderer)
+
+        pdf = ExportService(db_session=session, pdf_renderer=pool).export_to_pdf(group_id=1, start_date=date(2025, 6, 1))
+
+        assert pdf == b"%PDF-1.4 test"
+        html = renderer.documents[0]
+        assert "Filtre aplicate:</strong> Grupa: 3211A, De la: 01.06.2025</p>" in html
+        assert html.count("<td>Programare &lt;C++&gt; (PC)</td>") == 3
+        assert "Baze de date" not in html
+        assert "<td>Ana Popescu &amp; Ionescu</td>" in html and "<td>Aprobat</td>" in html
+        pool.shutdown()
+
+    def test_saturation_is_not_swallowed(self, session):
+        """Testează că respingerea din pool ajunge la apelant (503), nu ca eroare generică"""
+        release = threading.Event()
+        pool = PdfRendererPool(max_workers=1, max_queue=0, renderer_factory=lambda: RecordingRenderer(release))
+        running = pool.submit("<p>1</p>")
+
+        with pytest.raises(ExecutorSaturatedError):
+            ExportService(db_session=session, pdf_renderer=pool).export_to_pdf()
+
+        release.set()
+        running.result(timeout=5)
+        pool.shutdown()
@@ -0,0 +1,126 @@
+import threading
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule, User, AuditLog
+from src.common.services import ScheduleService, ScheduleConflictError, RoomAvailabilityIndex
+from src.common.services.room_availability import Booking
+
+DAY = date(2025, 6, 10)
+
+class TestRoomAvailability:
+    """Teste pentru indexul sălilor libere și actualizarea lui la modificarea planificărilor"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Bază SQLite cu trei săli (30, 60, 60 locuri) și o planificare C201 10:00-12:00"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'rooms.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        subject = Subject(name="Baze de date", short_name="BD", credits=5, semester=1)
+        teachers = [Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(3)]
+        rooms = [
+            Room(name="C201", short_name="C201", capacity=30, building="C", floor=2),
+            Room(name="C301", short_name="C301", capacity=60, building="C", floor=3),
+            Room(name="C302", short_name="C302", capacity=60, building="C", floor=3)
+        ]
+        group = Group(name="3211A", study_year=3, specialization="Calculatoare", number_of_students=25)
+        secretary = User(first_name="Ana", last_name="Secretar", email="secretariat@usv.ro", role='SEC', is_active=True)
+        secretary.password = "parola"
+        session.add_all([subject, *teachers, *rooms, group, secretary])
+        session.flush()
+
+        session.add(Schedule(subject_id=subject.id, teacher_id=teachers[0].id, room_id=rooms[0].id, group_id=group.id,
+                             date=DAY, start_time=time(10, 0), end_time=time(12, 0), status='approved'))
+        session.commit()
+        session.close()
+
+        engine.statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: engine.statements.append(args[2]))
+
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def service(self, engine):
+        session = sessionmaker(bind=engine)()
+        yield ScheduleService(db_session=session, availability_index=RoomAvailabilityIndex(ttl=3600))
+        session.close()
+
+    def free(self, service, start, end, capacity=None):
+        return [room.name for room in service.get_available_rooms(date=DAY, start_time=time(*start), end_time=time(*end), capacity=capacity)]
+
+    def test_half_open_intervals_and_capacity(self, service):
+        """Testează intervalele semi-deschise și filtrul de capacitate"""
+        assert self.free(service, (11, 0), (13, 0)) == ["C301", "C302"]
+        assert self.free(service, (12, 0), (14, 0)) == ["C201", "C301", "C302"]
+        assert self.free(service, (8, 0), (10, 0), capacity=31) == ["C301", "C302"]
+        assert self.free(service, (8, 0), (10, 0), capacity=100) == []
+
+    def test_repeated_queries_use_index(self, engine, service):
+        """Testează că după prima interogare ziua este servită din memorie"""
+        self.free(service, (9, 0), (11, 0))
+        engine.statements.clear()
+
+        for hour in range(8, 18):
+            self.free(service, (hour, 0), (hour + 1, 0), capacity=30)
+
+        assert engine.statements == []
+
+    def test_index_follows_changes(self, engine, service):
+        """Testează actualizarea incrementală la creare, mutare, respingere și ștergere"""
+        assert self.free(service, (14, 0), (16, 0)) == ["C201", "C301", "C302"]
+
+        schedule = service.create_schedule(subject_id=1, teacher_id=2, group_id=1, room_id=2, date=DAY,
+                                           start_time=time(14, 0), end_time=time(16, 0), created_by=1, status='approved')
+        assert self.free(service, (15, 0), (17, 0)) == ["C201", "C302"]
+
+        service.update_schedule(schedule.id, room_id=3, updated_by=1)
+        assert self.free(service, (15, 0), (17, 0)) == ["C201", "C301"]
+
+        service.update_schedule_status(1, 'rejected')
+        assert self.free(service, (10, 0), (12, 0)) == ["C201", "C301", "C302"]
+
+        engine.statements.clear()
+        assert service.delete_schedule(schedule.id, deleted_by=1) is True
+        assert self.free(service, (15, 0), (17, 0)) == ["C201", "C301", "C302"]
+        assert not [s for s in engine.statements if s.startswith("SELECT schedules.id, schedules.room_id")]
+
+        actions = [entry.action for entry in service.db_session.query(AuditLog).order_by(AuditLog.id)]
+        assert actions == ['create', 'update', 'delete']
+
+    def test_loads_outside_lock_and_discards_stale_day(self, engine, service):
+        """Testează că citirea zilei nu ține lock-ul și nu este instalată după o modificare concurentă"""
+        index = service.availability
+        self.free(service, (8, 0), (9, 0))
+        index.invalidate(DAY)
+        changes = []
+
+        def change_during_load(*args):
+            if args[2].startswith("SELECT schedules.id, schedules.room_id") and not changes:
+                # Alt fir modifică ziua în timp ce aceasta este citită
+                writer = threading.Thread(target=index.apply_change, args=(99, None, Booking(DAY, 2, time(8, 0), time(9, 0))))
+                writer.start()
+                writer.join(timeout=5)
+                changes.append(not writer.is_alive())
+
+        event.listen(engine, 'before_cursor_execute', change_during_load)
+        assert self.free(service, (8, 0), (9, 0)) == ["C201", "C301", "C302"]
+        assert changes == [True]
+
+        event.remove(engine, 'before_cursor_execute', change_during_load)
+        engine.statements.clear()
+        self.free(service, (8, 0), (9, 0))
+        assert [s for s in engine.statements if s.startswith("SELECT schedules.id, schedules.room_id")]
+
+    def test_create_rejects_overlap(self, service):
+        """Testează respingerea unei planificări noi în sala ocupată"""
+        with pytest.raises(ScheduleConflictError) as error:
+            service.create_schedule(subject_id=1, teacher_id=2, group_id=1, room_id=1, date=DAY,
+                                    start_time=time(11, 0), end_time=time(13, 0), status='approved')
+
+        assert error.value.conflict_type == 'room'
+        assert self.free(service, (12, 0), (13, 0)) == ["C201", "C301", "C302"]
@@ -0,0 +1,144 @@
+import os
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.models.schedule import SCHEDULE_ROOM_EXCLUSION, SCHEDULE_TEACHER_EXCLUSION
+from src.common.services import ScheduleService, ScheduleConflictError
+from src.common.services.conflict_detection import conflict_from_integrity_error
+
+# Testele pentru constrângerile de excludere rulează doar cu o bază PostgreSQL de test
+POSTGRES_URL = os.environ.get('TEST_POSTGRES_URL')
+
+def seed(session):
+    """Două examene aprobate în aceeași zi: unul cu sală și oră, unul doar aprobat"""
+    subject = Subject(name="Baze de date", short_name="BD", credits=5, semester=1)
+    teacher = Teacher(first_name="Ion", last_name="Popescu", department="Calculatoare", email="ion.popescu@usv.ro")
+    other_teacher = Teacher(first_name="Ana", last_name="Ionescu", department="Calculatoare", email="ana.ionescu@usv.ro")
+    rooms = [Room(name=name, short_name=name, capacity=40, building="C", floor=2) for name in ("C201", "C202")]
+    groups = [Group(name=name, study_year=3, specialization="Calculatoare", number_of_students=25) for name in ("3211A", "3212A")]
+    session.add_all([subject, teacher, other_teacher, *rooms, *groups])
+    session.flush()
+
+    booked = Schedule(subject_id=subject.id, teacher_id=teacher.id, room_id=rooms[0].id, group_id=groups[0].id,
+                      date=date(2025, 6, 10), start_time=time(10, 0), end_time=time(12, 0), status='approved')
+    pending = Schedule(subject_id=subject.id, teacher_id=other_teacher.id, group_id=groups[1].id,
+                       date=date(2025, 6, 10), status='approved')
+    same_teacher = Schedule(subject_id=subject.id, teacher_id=teacher.id, group_id=groups[1].id,
+                            date=date(2025, 6, 10), status='approved')
+    session.add_all([booked, pending, same_teacher])
+    session.commit()
+
+    return booked, pending, same_teacher, rooms
+
+class TestScheduleConflictChecks:
+    """Teste pentru verificarea suprapunerilor la setarea detaliilor unei planificări"""
+
+    @pytest.fixture
+    def db_session(self, tmp_path):
+        """Sesiune pe o bază SQLite temporară (verificarea din aplicație)"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'details.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        engine.dispose()
+
+    def test_sqlite_uses_application_check(self, db_session, monkeypatch):
+        """Testează că modul cu constrângeri nu se activează pe SQLite"""
+        monkeypatch.setenv('SCHEDULE_DB_CONFLICT_CHECKS', 'True')
+
+        assert ScheduleService(db_session=db_session).database_checks_conflicts() is False
+
+    def test_room_conflict_raises_typed_error(self, db_session):
+        """Testează conflictul de sală"""
+        booked, pending, _, rooms = seed(db_session)
+        service = ScheduleService(db_session=db_session)
+
+        with pytest.raises(ScheduleConflictError) as error:
+            service.set_schedule_details(pending.id, rooms[0].id, time(11, 0), time(13, 0), [])
+
+        assert error.value.conflict_type == 'room'
+        assert error.value.conflicting_ids == [booked.id]
+
+        # Intervalele consecutive și sălile diferite sunt permise
+        assert service.set_schedule_details(pending.id, rooms[0].id, time(12, 0), time(14, 0), []).room_id == rooms[0].id
+        assert service.set_schedule_details(pending.id, rooms[1].id, time(10, 0), time(12, 0), []).room_id == rooms[1].id
+
+    def test_teacher_conflict_raises_typed_error(self, db_session):
+        """Testează conflictul de cadru didactic titular"""
+        booked, _, same_teacher, rooms = seed(db_session)
+
+        with pytest.raises(ScheduleConflictError) as error:
+            ScheduleService(db_session=db_session).set_schedule_details(same_teacher.id, rooms[1].id, time(9, 0), time(11, 0), [])
+
+        assert error.value.conflict_type == 'teacher'
+
+    def test_rejected_schedules_do_not_block(self, db_session):
+        """Testează că planificările respinse nu ocupă sala"""
+        booked, pending, _, rooms = seed(db_session)
+        booked.status = 'rejected'
+        db_session.commit()
+
+        schedule = ScheduleService(db_session=db_session).set_schedule_details(pending.id, rooms[0].id, time(10, 0), time(12, 0), [])
+
+        assert schedule.start_time == time(10, 0)
+
+class TestExclusionConstraintErrors:
+    """Teste pentru conversia erorilor de constrângere în ScheduleConflictError"""
+
+    class Diag:
+        def __init__(self, constraint_name):
+            self.constraint_name = constraint_name
+
+    class DriverError(Exception):
+        def __init__(self, message, constraint_name=None):
+            super().__init__(message)
+            if constraint_name:
+                self.diag = TestExclusionConstraintErrors.Diag(constraint_name)
+
+    def test_maps_constraint_names(self):
+        """Testează maparea după numele constrângerii raportat de driver"""
+        room_error = IntegrityError("UPDATE schedules", {}, self.DriverError("conflicting key value", SCHEDULE_ROOM_EXCLUSION))
+        teacher_error = IntegrityError("UPDATE schedules", {}, self.DriverError(f'violates exclusion constraint "{SCHEDULE_TEACHER_EXCLUSION}"'))
+
+        assert conflict_from_integrity_error(room_error, 7).conflict_type == 'room'
+        assert conflict_from_integrity_error(room_error, 7).schedule_id == 7
+        assert conflict_from_integrity_error(teacher_error).conflict_type == 'teacher'
+
+    def test_ignores_other_integrity_errors(self):
+        """Testează că alte erori de integritate nu sunt convertite"""
+        error = IntegrityError("INSERT", {}, self.DriverError("duplicate key", "users_email_key"))
+
+        assert conflict_from_integrity_error(error) is None
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL nu este setat")
+class TestPostgresExclusionConstraints:
+    """Teste pentru constrângerile de excludere pe o bază PostgreSQL reală"""
+
+    @pytest.fixture
+    def db_session(self, monkeypatch):
+        monkeypatch.setenv('SCHEDULE_DB_CONFLICT_CHECKS', 'True')
+        engine = create_engine(POSTGRES_URL)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+    def test_database_rejects_overlap(self, db_session):
+        """Testează respingerea suprapunerii de către constrângerea de sală"""
+        _, pending, _, rooms = seed(db_session)
+        service = ScheduleService(db_session=db_session)
+
+        assert service.database_checks_conflicts() is True
+
+        with pytest.raises(ScheduleConflictError) as error:
+            service.set_schedule_details(pending.id, rooms[0].id, time(11, 0), time(13, 0), [])
+
+        assert error.value.conflict_type == 'room'
@@ -0,0 +1,73 @@
+import pytest
+from datetime import date, time, timedelta
+from sqlalchemy import create_engine, insert, select, text
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.models.schedule import schedule_assistants
+from src.common.services.schedule_service import build_schedules_statement, build_overlap_statement, apply_schedule_cursor
+from src.common.utils import explain_statement, find_full_scans
+
+CHECKED_TABLES = ('schedules', 'schedule_assistants')
+
+class TestScheduleIndexes:
+    """Teste de regresie pentru planurile interogărilor frecvente pe planificări"""
+
+    @pytest.fixture
+    def connection(self, tmp_path):
+        """Conexiune la o bază SQLite cu 2000 de planificări și statistici ANALYZE"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'indexes.db'}")
+        Base.metadata.create_all(engine)
+
+        with engine.begin() as connection:
+            connection.execute(insert(Room), [{'name': f"C{i}", 'short_name': f"C{i}", 'capacity': 40, 'building': "C", 'floor': 1} for i in range(20)])
+            connection.execute(insert(Teacher), [{'first_name': f"P{i}", 'last_name': "Nume", 'department': "Calculatoare", 'email': f"cd{i}@usv.ro"} for i in range(50)])
+            connection.execute(insert(Group), [{'name': f"G{i}", 'study_year': 3, 'specialization': "Calculatoare", 'number_of_students': 25} for i in range(40)])
+            connection.execute(insert(Subject), [{'name': f"D{i}", 'short_name': f"D{i}", 'credits': 5, 'semester': 1} for i in range(40)])
+            connection.execute(insert(Schedule), [
+                {'id': i, 'subject_id': i % 40 + 1, 'teacher_id': i % 50 + 1, 'room_id': i % 20 + 1, 'group_id': i % 40 + 1,
+                 'date': date(2025, 6, 1) + timedelta(days=i % 30), 'start_time': time(8 + i % 10, 0), 'end_time': time(10 + i % 10, 0),
+                 'status': 'proposed' if i % 10 == 0 else 'approved'}
+                for i in range(1, 2001)
+            ])
+            connection.execute(insert(schedule_assistants), [
+                {'schedule_id': i, 'teacher_id': (i + 7) % 50 + 1} for i in range(1, 2001, 2)
+            ])
+            connection.execute(text("ANALYZE"))
+
+        with engine.connect() as connection:
+            yield connection
+        engine.dispose()
+
+    def test_hot_queries_use_indexes(self, connection):
+        """Testează că filtrele frecvente nu parcurg complet tabelele de planificări"""
+        statements = [
+            apply_schedule_cursor(build_schedules_statement(), None).limit(101),
+            apply_schedule_cursor(build_schedules_statement(group_id=3), None).limit(101),
+            apply_schedule_cursor(build_schedules_statement(teacher_id=5), None).limit(101),
+            apply_schedule_cursor(build_schedules_statement(status='proposed'), None).limit(101),
+            build_schedules_statement(start_date=date(2025, 6, 10), end_date=date(2025, 6, 12)),
+            build_overlap_statement(Schedule.room_id, 4, date(2025, 6, 10), time(10, 0), time(12, 0)),
+            select(Schedule.id).where(Schedule.subject_id == 3, Schedule.group_id == 3)
+        ]
+
+        for statement in statements:
+            plan = explain_statement(connection, statement)
+            assert find_full_scans(plan, CHECKED_TABLES) == [], plan
+
+    def test_detects_full_scans(self, connection):
+        """Testează detectarea unei parcurgeri complete (filtru pe o coloană neindexată)"""
+        plan = explain_statement(connection, select(Schedule.id).where(Schedule.end_time == time(12, 0)))
+
+        assert find_full_scans(plan, CHECKED_TABLES) == ['SCAN schedules']
+
+    def test_teacher_filter_includes_assistants(self, connection):
+        """Testează că filtrul după cadru didactic întoarce și planificările în care este asistent"""
+        ids = set(connection.execute(
+            select(Schedule.id).where(Schedule.id.in_(build_schedules_statement(teacher_id=9).with_only_columns(Schedule.id)))
+        ).scalars())
+
+        titular = {i for i in range(1, 2001) if i % 50 + 1 == 9}
+        assistant = {i for i in range(1, 2001, 2) if (i + 7) % 50 + 1 == 9}
+
+        assert ids == titular | assistant
+        assert assistant - titular
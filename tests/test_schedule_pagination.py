@@ -0,0 +1,119 @@
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.services import ScheduleService, AsyncScheduleService
+from src.common.utils import InvalidCursorError, encode_cursor, create_pooled_async_engine, MAX_PAGE_SIZE
+
+class TestSchedulePagination:
+    """Teste pentru paginarea cu cursor a planificărilor"""
+
+    @pytest.fixture
+    def database_url(self, tmp_path):
+        """Bază de date SQLite temporară cu planificări pe aceeași zi și ore egale sau lipsă"""
+        database_url = f"sqlite:///{tmp_path / 'pagination.db'}"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        subject = Subject(name="Baze de date", short_name="BD", credits=5, semester=1)
+        teacher = Teacher(first_name="Ion", last_name="Popescu", department="Calculatoare", email="ion.popescu@usv.ro")
+        room = Room(name="C201", short_name="C201", capacity=40, building="C", floor=2)
+        group = Group(name="3211A", study_year=3, specialization="Calculatoare", number_of_students=25)
+        session.add_all([subject, teacher, room, group])
+        session.flush()
+
+        # 3 zile × (2 propuneri fără oră + 2 la 09:00 + 1 la 12:00)
+        for day in (12, 10, 11):
+            for start_time in (None, time(12, 0), time(9, 0), None, time(9, 0)):
+                session.add(Schedule(
+                    subject_id=subject.id, teacher_id=teacher.id, room_id=room.id, group_id=group.id,
+                    date=date(2025, 6, day), start_time=start_time,
+                    end_time=time(start_time.hour + 2, 0) if start_time else None,
+                    status='approved' if start_time else 'proposed'
+                ))
+
+        session.commit()
+        session.close()
+        engine.dispose()
+
+        return database_url
+
+    @pytest.fixture
+    def db_session(self, database_url):
+        """Sesiune sincronă pe baza de date temporară"""
+        engine = create_engine(database_url)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        engine.dispose()
+
+    def expected_order(self, db_session):
+        schedules = db_session.query(Schedule).all()
+        return [s.id for s in sorted(schedules, key=lambda s: (s.date, s.start_time is not None, s.start_time or time(0), s.id))]
+
+    def test_walks_all_pages_in_order(self, db_session):
+        """Testează parcurgerea tuturor paginilor fără duplicate sau omisiuni"""
+        service = ScheduleService(db_session=db_session)
+        seen = []
+        cursor = None
+        pages = 0
+
+        while True:
+            schedules, cursor = service.get_schedules_page(cursor=cursor, limit=4)
+            seen.extend(schedule.id for schedule in schedules)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert seen == self.expected_order(db_session)
+        assert pages == 4
+
+    def test_filters_apply_to_pages(self, db_session):
+        """Testează combinarea filtrelor cu cursorul"""
+        service = ScheduleService(db_session=db_session)
+
+        first, cursor = service.get_schedules_page(status='approved', start_date=date(2025, 6, 11), limit=3)
+        second, last_cursor = service.get_schedules_page(status='approved', start_date=date(2025, 6, 11), cursor=cursor, limit=3)
+
+        assert [s.date for s in first] == [date(2025, 6, 11)] * 3
+        assert len(second) == 3
+        assert last_cursor is None
+        assert all(s.status == 'approved' for s in first + second)
+
+    def test_rejects_invalid_cursor(self, db_session):
+        """Testează respingerea cursorilor invalizi"""
+        service = ScheduleService(db_session=db_session)
+
+        with pytest.raises(InvalidCursorError):
+            service.get_schedules_page(cursor="nu-este-un-cursor")
+
+        with pytest.raises(InvalidCursorError):
+            service.get_schedules_page(cursor=encode_cursor(["2025-06-10", "ora", 1]))
+
+    def test_caps_page_size(self, db_session):
+        """Testează limitarea dimensiunii paginii"""
+        service = ScheduleService(db_session=db_session)
+
+        schedules, cursor = service.get_schedules_page(limit=MAX_PAGE_SIZE * 10)
+
+        assert len(schedules) == 15
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_async_pages_match_sync(self, database_url, db_session):
+        """Testează că varianta asincronă returnează aceleași pagini"""
+        engine = create_pooled_async_engine(database_url.replace("sqlite://", "sqlite+aiosqlite://"))
+
+        async with AsyncSession(engine) as session:
+            service = AsyncScheduleService(session)
+            first, cursor = await service.get_schedules_page(limit=7)
+            second, last_cursor = await service.get_schedules_page(cursor=cursor, limit=7)
+
+        await engine.dispose()
+
+        assert [s.id for s in first + second] == self.expected_order(db_session)[:14]
+        assert last_cursor is not None
@@ -0,0 +1,103 @@
+import pytest
+from datetime import date, time, timedelta
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule
+from src.common.services import ScheduleService
+
+class TestScheduleQueryCount:
+    """Teste de regresie pentru numărul de interogări la citirea planificărilor"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Engine SQLite temporar cu un contor de interogări"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'queries.db'}")
+        Base.metadata.create_all(engine)
+        engine.statements = []
+
+        @event.listens_for(engine, 'before_cursor_execute')
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            engine.statements.append(statement)
+
+        yield engine
+        engine.dispose()
+
+    def seed(self, engine, count, start=0):
+        """Adaugă `count` planificări, fiecare cu altă disciplină, cadru didactic, sală și grupă"""
+        session = sessionmaker(bind=engine)()
+
+        for index in range(start, start + count):
+            teacher = Teacher(first_name=f"Prenume{index}", last_name="Nume", department="Calculatoare", email=f"cd{index}@usv.ro")
+            assistant = Teacher(first_name=f"Asistent{index}", last_name="Nume", department="Calculatoare", email=f"as{index}@usv.ro")
+            schedule = Schedule(
+                subject=Subject(name=f"Disciplina {index}", short_name=f"D{index}", credits=5, semester=1),
+                teacher=teacher,
+                room=Room(name=f"C{index}", short_name=f"C{index}", capacity=30, building="C", floor=1),
+                group=Group(name=f"32{index}", study_year=3, specialization="Calculatoare", number_of_students=25),
+                date=date(2025, 6, 1) + timedelta(days=index % 20),
+                start_time=time(9, 0),
+                end_time=time(11, 0),
+                status='approved'
+            )
+            schedule.assistants.append(assistant)
+            session.add(schedule)
+
+        session.commit()
+        session.close()
+
+    def count_list_statements(self, engine, load):
+        """Numărul de interogări pentru listarea și serializarea tuturor planificărilor"""
+        session = sessionmaker(bind=engine)()
+        engine.statements.clear()
+
+        schedules = ScheduleService(db_session=session).get_schedules(load=load)
+        data = [schedule.to_dict() for schedule in schedules]
+
+        statements = len(engine.statements)
+        session.close()
+
+        assert all(item['subject_name'] and item['assistants'] for item in data)
+        return len(data), statements
+
+    def test_eager_loading_uses_constant_statements(self, engine):
+        """Testează că numărul de interogări nu depinde de numărul de planificări"""
+        self.seed(engine, 5)
+        small_rows, small_statements = self.count_list_statements(engine, 'eager')
+
+        self.seed(engine, 45, start=5)
+        large_rows, large_statements = self.count_list_statements(engine, 'eager')
+
+        assert (small_rows, large_rows) == (5, 50)
+        # Planificările cu relațiile many-to-one + asistenții
+        assert small_statements == large_statements == 2
+
+    def test_lazy_loading_grows_with_result_size(self, engine):
+        """Testează comportamentul de referință (N+1) al strategiei 'lazy'"""
+        self.seed(engine, 10)
+        rows, statements = self.count_list_statements(engine, 'lazy')
+
+        assert rows == 10
+        assert statements > rows * 4
+
+    def test_get_schedule_by_id_loads_relations(self, engine):
+        """Testează încărcarea relațiilor pentru o singură planificare"""
+        self.seed(engine, 3)
+        session = sessionmaker(bind=engine)()
+        engine.statements.clear()
+
+        schedule = ScheduleService(db_session=session).get_schedule_by_id(2)
+        data = schedule.to_dict()
+
+        assert data['room_name'] == "C1"
+        assert len(engine.statements) == 2
+        session.close()
+
+    def test_rejects_unknown_strategy(self, engine):
+        """Testează validarea strategiei de încărcare"""
+        session = sessionmaker(bind=engine)()
+
+        with pytest.raises(ValueError):
+            ScheduleService(db_session=session).get_schedules(load='subquery')
+
+        session.close()
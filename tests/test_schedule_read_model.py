@@ -0,0 +1,142 @@
+import io
+import pytest
+import pandas as pd
+from datetime import date, time
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule, ScheduleListing
+from src.common.services import ScheduleService, ExportService, RoomAvailabilityIndex, ProposalItem, rebuild_listings, verify_listings, data_version
+from src.common.services.schedule_read_model_cli import main
+
+class TestScheduleReadModel:
+    """Teste pentru modelul de citire al planificărilor (schedule_listings)"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Bază SQLite cu 2 discipline, 3 cadre didactice, 2 săli, 2 grupe și 6 planificări"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'listings.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add_all([Subject(name=f"Disciplina {i}", short_name=f"D{i}", credits=5, semester=2) for i in range(2)])
+        session.add_all([Teacher(first_name=f"Prenume{i}", last_name="Nume", title="Lect.", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(3)])
+        session.add_all([Room(name=f"C20{i}", short_name=f"C20{i}", capacity=40, building="C", floor=2) for i in range(2)])
+        session.add_all([Group(name=f"321{i}A", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(2)])
+        session.flush()
+
+        for index in range(6):
+            start_time = time(8 + index, 0) if index % 3 else None
+            session.add(Schedule(subject_id=index % 2 + 1, teacher_id=index % 3 + 1, group_id=index % 2 + 1,
+                                 room_id=1 if start_time else None, date=date(2025, 6, 10 + index // 2),
+                                 start_time=start_time, end_time=time(9 + index, 0) if start_time else None,
+                                 status='approved' if start_time else 'proposed'))
+        session.commit()
+        session.close()
+
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def service(self, engine):
+        session = sessionmaker(bind=engine)()
+        yield ScheduleService(db_session=session, availability_index=RoomAvailabilityIndex(ttl=3600))
+        session.close()
+
+    def test_writes_keep_listings_in_sync(self, service):
+        """Testează actualizarea rândurilor la scrieri pe planificări și pe entitățile referite"""
+        session = service.db_session
+        assert session.query(ScheduleListing).count() == 6
+
+        schedule = session.get(Schedule, 2)
+        schedule.room_id, schedule.start_time = 2, time(15, 0)
+        schedule.assistants = [session.get(Teacher, 3)]
+        session.commit()
+        assert verify_listings(session) == ([], [])
+
+        session.get(Teacher, 3).title = "Conf."
+        session.get(Subject, 1).name = "Baze de date"
+        session.get(Room, 2).name = "C301"
+        session.commit()
+        assert verify_listings(session) == ([], [])
+
+        listing = session.get(ScheduleListing, 2)
+        assert (listing.room_name, listing.assistants) == ("C301", '[{"id": 3, "name": "Conf. Prenume2 Nume"}]')
+        assert session.get(ScheduleListing, 1).subject_name == "Baze de date"
+
+        assert service.delete_schedule(1)
+        service.propose_schedules([ProposalItem(2, 2, 1, date(2025, 6, 20)), ProposalItem(1, 2, 1, date(2025, 6, 20))])
+        assert verify_listings(session) == ([], [])
+        assert session.query(ScheduleListing).count() == 6
+
+    def test_data_version_bumped_once_just_before_commit(self, engine, service):
+        """Testează că versiunea datelor este incrementată o dată pe tranzacție, ca ultimă scriere"""
+        session = service.db_session
+        version = data_version(session)
+        session.commit()
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        session.get(Schedule, 2).start_time = time(15, 0)
+        session.flush()
+        session.get(Room, 2).name = "C301"
+        session.commit()
+
+        bumps = [s for s in statements if s.startswith("UPDATE schedule_data_version")]
+        assert len(bumps) == 1 and statements[-1] == bumps[0]
+        assert data_version(session) == version + 1
+
+        session.get(Schedule, 3).start_time = time(16, 0)
+        session.flush()
+        session.rollback()
+        session.commit()
+        assert data_version(session) == version + 1
+
+    def test_page_matches_orm_listing_without_joins(self, engine, service):
+        """Testează că paginile din modelul de citire sunt identice cu Schedule.to_dict(), fără JOIN-uri"""
+        session = service.db_session
+        session.get(Schedule, 5).assistants = [session.get(Teacher, 1)]
+        session.commit()
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        listings, cursor = service.get_listings_page(limit=4)
+        rest, last_cursor = service.get_listings_page(cursor=cursor, limit=4)
+
+        assert len(statements) == 2 and not [s for s in statements if "JOIN" in s.upper()]
+        assert last_cursor is None
+
+        schedules, _ = service.get_schedules_page(limit=10)
+        assert listings + rest == [schedule.to_dict() for schedule in schedules]
+
+        teacher_listings, _ = service.get_listings_page(teacher_id=1)
+        teacher_schedules, _ = service.get_schedules_page(teacher_id=1)
+        assert [item['id'] for item in teacher_listings] == [schedule.id for schedule in teacher_schedules]
+
+        assert service.get_listings_refreshed_at() is not None
+
+    def test_export_reads_listings(self, service):
+        """Testează că exportul Excel folosește rândurile modelului de citire"""
+        excel = ExportService(db_session=service.db_session).export_to_excel(group_id=1)
+        frame = pd.read_excel(io.BytesIO(excel))
+
+        assert list(frame['ID']) == [1, 3, 5]
+        assert list(frame['Cadru didactic']) == ["Prenume0 Nume", "Prenume2 Nume", "Prenume1 Nume"]
+
+    def test_cli_detects_and_repairs_bulk_writes(self, engine, service):
+        """Testează verificarea și reconstruirea după scrieri care ocolesc sesiunea"""
+        session = service.db_session
+        session.execute(update(Schedule).where(Schedule.id == 3).values(status='rejected').execution_options(synchronize_session=False))
+        session.commit()
+
+        assert verify_listings(session) == ([3], [])
+
+        database_url = str(engine.url)
+        assert main(['check', '--database-url', database_url]) == 1
+        assert main(['rebuild', '--database-url', database_url]) == 0
+        assert main(['check', '--database-url', database_url]) == 0
+
+        session.expire_all()
+        assert rebuild_listings(session) == 6
@@ -2,8 +2,8 @@ import pytest
 from datetime import datetime, date, time
 from sqlalchemy.exc import SQLAlchemyError
 
-from common.services.schedule_service import ScheduleService
-from common.models.schedule import Schedule
+from src.common.services.schedule_service import ScheduleService
+from src.common.models.schedule import Schedule
 
 class TestScheduleService:
     """Teste pentru ScheduleService"""
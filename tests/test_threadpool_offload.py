@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import pytest
+
+from src.common.utils import BoundedExecutor, ExecutorSaturatedError
+from fastapi_app import concurrency
+
+class TestBoundedExecutor:
+    """Teste pentru pool-ul de fire de execuție cu coadă limitată"""
+
+    def test_rejects_when_saturated(self):
+        """Testează respingerea sarcinilor peste max_workers + max_queue"""
+        executor = BoundedExecutor('test', max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        running = executor.submit(release.wait)
+        queued = executor.submit(release.wait)
+
+        with pytest.raises(ExecutorSaturatedError):
+            executor.submit(release.wait)
+
+        snapshot = executor.snapshot()
+        assert snapshot['queue_depth'] + snapshot['active'] == 2
+        assert snapshot['rejected'] == 1
+
+        release.set()
+        running.result(timeout=5)
+        queued.result(timeout=5)
+
+        # Locurile sunt eliberate după terminarea sarcinilor
+        assert executor.submit(lambda: 42).result(timeout=5) == 42
+        executor.shutdown()
+
+    def test_records_latency_and_failures(self):
+        """Testează metricile de latență și contorul de erori"""
+        executor = BoundedExecutor('test', max_workers=2)
+
+        def fail():
+            raise ValueError("eroare")
+
+        assert executor.submit(sum, [1, 2, 3]).result(timeout=5) == 6
+        with pytest.raises(ValueError):
+            executor.submit(fail).result(timeout=5)
+
+        executor.shutdown()
+        snapshot = executor.snapshot()
+
+        assert snapshot['completed'] == 1
+        assert snapshot['failed'] == 1
+        assert snapshot['queue_depth'] == 0
+        assert snapshot['run_time']['count'] == 2
+        assert snapshot['queue_wait']['count'] == 2
+
+    def test_cancelled_task_releases_slot(self):
+        """Testează eliberarea locului unei sarcini anulate cât timp aștepta în coadă"""
+        executor = BoundedExecutor('test', max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        running = executor.submit(release.wait)
+        queued = executor.submit(release.wait)
+
+        assert queued.cancel()
+        assert executor.snapshot()['queue_depth'] == 0
+
+        replacement = executor.submit(lambda: 42)
+        release.set()
+
+        assert running.result(timeout=5) is True
+        assert replacement.result(timeout=5) == 42
+        executor.shutdown()
+
+class TestRunInPool:
+    """Teste pentru execuția apelurilor sincrone din endpoint-urile async"""
+
+    @pytest.mark.asyncio
+    async def test_does_not_block_event_loop(self):
+        """Testează că event loop-ul rămâne liber în timpul apelului blocant"""
+        release = threading.Event()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not release.is_set():
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker_task = asyncio.create_task(ticker())
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, release.set)
+
+        result = await concurrency.run_in_pool(lambda value: release.wait(5) and value, 'gata')
+        await ticker_task
+
+        assert result == 'gata'
+        assert ticks > 5
+        assert concurrency.get_threadpool_metrics()['db']['completed'] >= 1
+
+    @pytest.mark.asyncio
+    async def test_uses_named_pool(self):
+        """Testează selectarea pool-ului după nume"""
+        thread_name = await concurrency.run_in_pool(lambda: threading.current_thread().name, pool='io')
+
+        assert thread_name.startswith('pool-io')
@@ -0,0 +1,126 @@
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, ExamPeriod, Group, Room, Subject, Teacher, Schedule
+from src.common.services import ScheduleService, RoomAvailabilityIndex
+from src.common.services.conflict_detection import ScheduleInterval
+from src.common.services.timetable_solver import TimetableSolver, ExamRequest, UnplacedExam
+
+DAY = date(2025, 6, 10)
+
+def exam(schedule_id, group_id, students, teacher_ids, day=DAY):
+    return ExamRequest(schedule_id, day, group_id, students, tuple(teacher_ids))
+
+class TestTimetableSolver:
+    """Teste pentru solver-ul de plasare a examenelor"""
+
+    def test_respects_capacity_and_teachers(self):
+        """Testează capacitatea sălilor și disponibilitatea titularilor și asistenților"""
+        solver = TimetableSolver([(1, 30), (2, 60)], [DAY], day_start=time(8, 0), day_end=time(12, 0))
+
+        result = solver.solve([
+            exam(1, 1, 50, [1]),
+            exam(2, 2, 20, [2, 1]),
+            exam(3, 3, 25, [3]),
+            exam(4, 4, 80, [4])
+        ])
+
+        placements = {p.schedule_id: p for p in result.placements}
+        assert placements[1].room_id == 2
+        assert placements[3].room_id == 1
+        # Cadrul didactic 1 este titular la examenul 1 și asistent la examenul 2
+        assert placements[1].start_time != placements[2].start_time
+        assert result.unplaced == [UnplacedExam(4, 'capacity')]
+
+    def test_group_gap_with_flexible_dates(self):
+        """Testează distanța minimă între examenele unei grupe"""
+        days = [date(2025, 6, day) for day in range(9, 14)]
+        solver = TimetableSolver([(1, 30)], days, min_gap_days=2, flexible_dates=True)
+
+        result = solver.solve([exam(i, 1, 20, [i], day=date(2025, 6, 9)) for i in range(1, 4)])
+
+        assert sorted(p.date.day for p in result.placements) == [9, 11, 13]
+
+        fixed = TimetableSolver([(1, 30)], days, min_gap_days=1).solve([exam(1, 1, 20, [1]), exam(2, 1, 20, [2])])
+        assert [u.reason for u in fixed.unplaced] == ['group_gap']
+
+    def test_repair_moves_blocking_exam(self):
+        """Testează repararea: un examen plasat greedy este mutat pentru a face loc altuia"""
+        solver = TimetableSolver([(1, 30), (2, 30)], [DAY], min_gap_days=0, day_start=time(8, 0), day_end=time(12, 0))
+        # Grupa 2 are deja un examen 10:00-12:00
+        solver.block(ScheduleInterval(99, DAY, time(10, 0), time(12, 0), 2, (9,), 2))
+
+        # Examenul 1 (mai mare) ocupă greedy intervalul 08:00, singurul posibil pentru examenul 2
+        result = solver.solve([exam(1, 1, 25, [1]), exam(2, 2, 20, [1])], time_budget=1)
+
+        assert result.unplaced == []
+        assert {(p.schedule_id, p.start_time) for p in result.placements} == {(1, time(10, 0)), (2, time(8, 0))}
+
+    def test_repair_with_titular_listed_as_assistant(self):
+        """Testează mutarea unui examen al cărui titular apare și printre asistenți"""
+        solver = TimetableSolver([(1, 30), (2, 30)], [DAY], min_gap_days=0, day_start=time(8, 0), day_end=time(12, 0))
+        solver.block(ScheduleInterval(99, DAY, time(10, 0), time(12, 0), 2, (9,), 2))
+
+        result = solver.solve([exam(1, 1, 25, [1, 1]), exam(2, 2, 20, [1])], time_budget=1)
+
+        assert result.unplaced == []
+        assert {(p.schedule_id, p.start_time) for p in result.placements} == {(1, time(10, 0)), (2, time(8, 0))}
+
+class TestSolveExamPeriod:
+    """Teste pentru ScheduleService.solve_exam_period"""
+
+    @pytest.fixture
+    def db_session(self, tmp_path):
+        """Perioadă de examinare cu patru examene aprobate neplasate și un examen plasat în afara ei"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'solver.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        period = ExamPeriod(academic_year="2024-2025", semester=2, name="Vară", exam_start_date=date(2025, 6, 9), exam_end_date=date(2025, 6, 14))
+        subject = Subject(name="Baze de date", short_name="BD", credits=5, semester=2)
+        teachers = [Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(3)]
+        rooms = [Room(name="C201", short_name="C201", capacity=30, building="C", floor=2), Room(name="C301", short_name="C301", capacity=60, building="C", floor=3)]
+        groups = [Group(name=f"321{i}A", study_year=3, specialization="Calculatoare", number_of_students=students) for i, students in enumerate((25, 45, 20, 90, 30))]
+        session.add_all([period, subject, *teachers, *rooms, *groups])
+        session.flush()
+
+        # Examen deja plasat, în afara perioadei, al asistentului primului examen
+        session.add(Schedule(subject_id=subject.id, teacher_id=teachers[2].id, group_id=groups[4].id, room_id=rooms[1].id,
+                             date=DAY, start_time=time(8, 0), end_time=time(10, 0), status='approved'))
+        for group, teacher in zip(groups, (teachers[0], teachers[0], teachers[1], teachers[1])):
+            schedule = Schedule(subject_id=subject.id, teacher_id=teacher.id, group_id=group.id, exam_period_id=period.id, date=DAY, status='approved')
+            if group is groups[0]:
+                schedule.assistants.append(teachers[2])
+            session.add(schedule)
+        session.commit()
+
+        yield session
+        session.close()
+        engine.dispose()
+
+    def test_apply_saves_conflict_free_placements(self, db_session):
+        """Testează salvarea plasărilor și actualizarea indexului sălilor libere"""
+        availability = RoomAvailabilityIndex(ttl=3600)
+        service = ScheduleService(db_session=db_session, availability_index=availability)
+        service.get_available_rooms(date=DAY, start_time=time(8, 0), end_time=time(10, 0))
+
+        result = service.solve_exam_period(1, apply=True)
+
+        # Grupa de 90 de studenți nu încape în nicio sală
+        assert result.unplaced == [UnplacedExam(5, 'capacity')]
+        assert len(result.placements) == 3
+        assert service.check_conflicts() == []
+
+        placed = db_session.query(Schedule).filter(Schedule.room_id.isnot(None)).count()
+        assert placed == 4
+
+        busy = {(p.room_id, p.start_time) for p in result.placements}
+        for start in (time(8, 0), time(10, 0)):
+            free = {room.id for room in service.get_available_rooms(date=DAY, start_time=start, end_time=time(start.hour + 2, 0))}
+            assert not free & {room_id for room_id, start_time in busy if start_time == start}
+
+    def test_missing_period(self, db_session):
+        """Testează o perioadă inexistentă"""
+        assert ScheduleService(db_session=db_session).solve_exam_period(42) is None
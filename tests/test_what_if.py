@@ -0,0 +1,111 @@
+import pytest
+from datetime import date, time
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models import Base, Group, Room, Subject, Teacher, Schedule, ScheduleConflict
+from src.common.services import ScheduleService, PlacementCandidate
+from src.common.services.conflict_detection import ScheduleInterval, CandidateConflict, evaluate_candidates
+
+DAY = date(2025, 6, 10)
+
+def interval(schedule_id, start, end, room_id, teacher_ids, group_id, day=DAY):
+    return ScheduleInterval(schedule_id, day, time(start, 0) if start else None, time(end, 0) if end else None, room_id, tuple(teacher_ids), group_id)
+
+def candidate(schedule_id, start, end, room_id, assistant_ids=None, day=DAY):
+    return PlacementCandidate(schedule_id, room_id, day, time(start, 0), time(end, 0), assistant_ids)
+
+class TestEvaluateCandidates:
+    """Teste pentru evaluarea plasărilor de încercare"""
+
+    def test_against_snapshot_and_each_other(self):
+        """Testează conflictele cu ocuparea existentă și între plasări diferite"""
+        intervals = [
+            interval(1, 10, 12, 1, [1], 1),
+            interval(2, None, None, None, [2], 2),
+            interval(3, None, None, None, [3, 1], 3)
+        ]
+
+        results = evaluate_candidates(intervals, [
+            candidate(2, 11, 13, 1),
+            candidate(3, 12, 14, 2),
+            candidate(2, 13, 15, 2)
+        ])
+
+        assert results[0] == [CandidateConflict('room', 1, 1)]
+        # Asistentul 1 al planificării 3 este titular la planificarea 1, care se termină la 12:00;
+        # alternativa 13-15 pentru planificarea 2 se suprapune în sala 2 cu plasarea 1
+        assert results[1] == [CandidateConflict('room', 2, 2, 2)]
+        assert results[2] == [CandidateConflict('room', 2, 3, 1)]
+
+    def test_moved_schedule_frees_its_slot(self):
+        """Testează că o planificare din lot nu mai ocupă poziția curentă"""
+        intervals = [interval(1, 10, 12, 1, [1], 1), interval(2, None, None, None, [2], 2)]
+
+        results = evaluate_candidates(intervals, [candidate(1, 14, 16, 1), candidate(2, 10, 12, 1)])
+
+        assert results == [[], []]
+
+    def test_replaced_assistants(self):
+        """Testează înlocuirea asistenților în plasarea de încercare"""
+        intervals = [interval(1, 10, 12, 1, [1], 1), interval(2, None, None, None, [2, 1], 2)]
+
+        assert evaluate_candidates(intervals, [candidate(2, 10, 12, 2)]) == [[CandidateConflict('teacher', 1, 1)]]
+        assert evaluate_candidates(intervals, [candidate(2, 10, 12, 2, assistant_ids=(3,))]) == [[]]
+
+class TestEvaluatePlacements:
+    """Teste pentru ScheduleService.evaluate_placements"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Un examen plasat în C201 10:00-12:00, unul aprobat fără sală și unul respins în C301"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'what_if.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        subject = Subject(name="Baze de date", short_name="BD", credits=5, semester=2)
+        teachers = [Teacher(first_name=f"Prenume{i}", last_name="Nume", department="Calculatoare", email=f"cd{i}@usv.ro") for i in range(3)]
+        rooms = [Room(name=name, short_name=name, capacity=40, building="C", floor=2) for name in ("C201", "C301")]
+        groups = [Group(name=f"321{i}A", study_year=3, specialization="Calculatoare", number_of_students=25) for i in range(3)]
+        session.add_all([subject, *teachers, *rooms, *groups])
+        session.flush()
+
+        session.add_all([
+            Schedule(subject_id=subject.id, teacher_id=teachers[0].id, group_id=groups[0].id, room_id=rooms[0].id,
+                     date=DAY, start_time=time(10, 0), end_time=time(12, 0), status='approved'),
+            Schedule(subject_id=subject.id, teacher_id=teachers[1].id, group_id=groups[1].id, date=DAY, status='approved'),
+            Schedule(subject_id=subject.id, teacher_id=teachers[2].id, group_id=groups[2].id, room_id=rooms[1].id,
+                     date=DAY, start_time=time(10, 0), end_time=time(12, 0), status='rejected')
+        ])
+        session.commit()
+        session.close()
+
+        yield engine
+        engine.dispose()
+
+    def test_single_read_without_writes(self, engine):
+        """Testează că lotul este evaluat dintr-o singură citire, fără scrieri"""
+        session = sessionmaker(bind=engine)()
+        service = ScheduleService(db_session=session)
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        results = service.evaluate_placements([
+            candidate(2, 11, 13, 1),
+            candidate(2, 11, 13, 2),
+            candidate(2, 9, 11, 2, assistant_ids=(1,))
+        ])
+
+        assert results == [[CandidateConflict('room', 1, 1)], [], [CandidateConflict('teacher', 1, 1)]]
+        assert all(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+        assert len(statements) == 2
+
+        assert session.get(Schedule, 2).room_id is None
+        assert session.query(ScheduleConflict).count() == 0
+        session.close()
+
+    def test_unknown_schedule(self, engine):
+        """Testează o plasare pentru o planificare inexistentă"""
+        session = sessionmaker(bind=engine)()
+        assert ScheduleService(db_session=session).evaluate_placements([candidate(42, 10, 12, 1)]) is None
+        session.close()